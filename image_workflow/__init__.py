@@ -17,9 +17,15 @@ Usage:
     result = workflow.sync_from_lightroom(catalog_path)
 """
 
-from image_workflow.core.workflow import ImageWorkflow, WorkflowOptions
 from image_workflow.core.models import ImageInfo, ImageStatus, ImageMatch
 
+# The workflow orchestrator is optional; models and deduplication work without it
+try:
+    from image_workflow.core.workflow import ImageWorkflow, WorkflowOptions
+except ImportError:
+    ImageWorkflow = None
+    WorkflowOptions = None
+
 __version__ = "1.0.0"
 __all__ = [
     "ImageWorkflow",
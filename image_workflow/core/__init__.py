@@ -7,7 +7,12 @@ from image_workflow.core.models import (
     ImageMetadata,
     SourceLocation,
 )
-from image_workflow.core.workflow import ImageWorkflow, WorkflowOptions
+
+try:
+    from image_workflow.core.workflow import ImageWorkflow, WorkflowOptions
+except ImportError:
+    ImageWorkflow = None
+    WorkflowOptions = None
 
 __all__ = [
     "ImageInfo",
@@ -3,6 +3,8 @@
 Provides fingerprinting and matching capabilities for image deduplication:
 - Content hashing (SHA256) for exact duplicate detection
 - Perceptual hashing (pHash) for visual similarity matching
+- Parallel, resumable fingerprinting of whole libraries
+- Multi-index hashing for sub-quadratic Hamming-radius search
 - Cascade matching strategy aligned with music_workflow patterns
 """
 
@@ -12,6 +14,14 @@ from image_workflow.deduplication.fingerprint import (
     compute_file_hash,
     compute_perceptual_hash,
 )
+from image_workflow.deduplication.fingerprint_pipeline import (
+    FingerprintPipeline,
+    FingerprintStore,
+    PipelineResult,
+    eagle_image_paths,
+    lightroom_image_paths,
+)
+from image_workflow.deduplication.hash_index import HammingIndex, hamming
 from image_workflow.deduplication.matcher import (
     DuplicateGroup,
     ImageMatcher,
@@ -25,6 +35,15 @@ __all__ = [
     "ImageFingerprint",
     "compute_file_hash",
     "compute_perceptual_hash",
+    # Library fingerprinting
+    "FingerprintPipeline",
+    "FingerprintStore",
+    "PipelineResult",
+    "eagle_image_paths",
+    "lightroom_image_paths",
+    # Hamming-radius search
+    "HammingIndex",
+    "hamming",
     # Matching
     "DuplicateGroup",
     "ImageMatcher",
@@ -8,7 +8,7 @@ import hashlib
 import logging
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Union
+from typing import Optional, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
@@ -117,7 +117,8 @@ class FingerprintGenerator:
         self,
         enable_perceptual: bool = True,
         hash_size: int = 8,
-        buffer_size: int = 65536
+        buffer_size: int = 65536,
+        reduced_decode: bool = False
     ):
         """Initialize the fingerprint generator.
 
@@ -125,10 +126,15 @@ class FingerprintGenerator:
             enable_perceptual: Whether to compute perceptual hashes
             hash_size: Size for perceptual hash (8 = 64-bit hash)
             buffer_size: Buffer size for file reading
+            reduced_decode: Decode JPEGs at reduced size (draft mode) for
+                perceptual hashing instead of at full resolution. Faster, but
+                hashes can differ by a few bits from full-decode ones, so do
+                not compare them with fingerprints stored without it
         """
         self.enable_perceptual = enable_perceptual and PIL_AVAILABLE and IMAGEHASH_AVAILABLE
         self.hash_size = hash_size
         self.buffer_size = buffer_size
+        self.reduced_decode = reduced_decode
 
         if enable_perceptual and not self.enable_perceptual:
             logger.warning(
@@ -175,9 +181,8 @@ class FingerprintGenerator:
 
         if include_perceptual and self.enable_perceptual:
             try:
-                perceptual_hash = compute_perceptual_hash(path, self.hash_size)
-                average_hash = _compute_average_hash(path, self.hash_size)
-                difference_hash = _compute_difference_hash(path, self.hash_size)
+                with Image.open(path) as img:
+                    perceptual_hash, average_hash, difference_hash = self._perceptual_hashes(img)
             except Exception as e:
                 logger.warning(f"Failed to compute perceptual hash for {path}: {e}")
 
@@ -207,10 +212,8 @@ class FingerprintGenerator:
         if include_perceptual and self.enable_perceptual:
             try:
                 import io
-                img = Image.open(io.BytesIO(data))
-                perceptual_hash = str(imagehash.phash(img, hash_size=self.hash_size))
-                average_hash = str(imagehash.average_hash(img, hash_size=self.hash_size))
-                difference_hash = str(imagehash.dhash(img, hash_size=self.hash_size))
+                with Image.open(io.BytesIO(data)) as img:
+                    perceptual_hash, average_hash, difference_hash = self._perceptual_hashes(img)
             except Exception as e:
                 logger.warning(f"Failed to compute perceptual hash from bytes: {e}")
 
@@ -222,6 +225,34 @@ class FingerprintGenerator:
             file_size=len(data)
         )
 
+    def _perceptual_hashes(self, img: "Image.Image") -> Tuple[str, str, str]:
+        """Compute (pHash, aHash, dHash) from one decode of an open image."""
+        img = _prepare_for_hashing(img, self.hash_size, self.reduced_decode)
+        return (
+            str(imagehash.phash(img, hash_size=self.hash_size)),
+            str(imagehash.average_hash(img, hash_size=self.hash_size)),
+            str(imagehash.dhash(img, hash_size=self.hash_size)),
+        )
+
+
+def _prepare_for_hashing(img: "Image.Image", hash_size: int, reduced: bool) -> "Image.Image":
+    """Decode an image to grayscale, optionally at reduced size.
+
+    pHash only looks at a ``4 * hash_size`` square, so decoding a 24MP JPEG
+    at full resolution is wasted work. With ``reduced`` the JPEG decoder
+    scales by up to 1/8 in the DCT (``draft``), and any format is then
+    box-reduced to no less than ``8 * hash_size`` pixels on the short side.
+    """
+    target = hash_size * 8
+    if reduced:
+        img.draft('L', (target, target))
+    img = img.convert('L')
+    if reduced:
+        factor = min(img.size) // target
+        if factor >= 2:
+            img = img.reduce(factor)
+    return img
+
 
 def compute_file_hash(
     path: Union[str, Path],
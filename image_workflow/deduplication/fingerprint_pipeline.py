@@ -0,0 +1,445 @@
+"""Parallel, resumable fingerprinting for whole image libraries.
+
+Components:
+- ``FingerprintStore``: persisted ``(path, size, mtime) -> fingerprint``
+  table; an image whose stat signature is unchanged is never re-read, so an
+  interrupted run resumes where it stopped
+- ``FingerprintPipeline``: warm process pool running ``FingerprintGenerator``
+  (SHA256 plus reduced-size decode for perceptual hashes), streaming results
+  into the store in batches and reporting images/second
+- ``eagle_image_paths()`` / ``lightroom_image_paths()``: file paths from the
+  library readers
+
+Usage:
+    from image_workflow.deduplication.fingerprint_pipeline import (
+        FingerprintPipeline,
+        eagle_image_paths,
+    )
+
+    pipeline = FingerprintPipeline(workers=8)
+    for result in pipeline.run(eagle_image_paths(reader)):
+        print(result.path, result.fingerprint, result.cached)
+    print(pipeline.stats["images_per_second"])
+"""
+
+import logging
+import multiprocessing
+import os
+import sqlite3
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from image_workflow.deduplication.fingerprint import FingerprintGenerator, ImageFingerprint
+
+if TYPE_CHECKING:
+    from image_workflow.integrations.eagle import EagleLibraryReader
+    from image_workflow.integrations.lightroom import LightroomCatalogReader
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS image_fingerprints (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    params TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    perceptual_hash TEXT,
+    average_hash TEXT,
+    difference_hash TEXT,
+    fingerprinted_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_image_fingerprints_content ON image_fingerprints(content_hash);
+"""
+
+StatKey = Tuple[int, int]
+
+
+def _stat_key(stat: os.stat_result) -> StatKey:
+    return (int(stat.st_size), int(stat.st_mtime_ns))
+
+
+@dataclass
+class PipelineResult:
+    """Fingerprint of one image, or the error that prevented it."""
+
+    path: str
+    fingerprint: Optional[ImageFingerprint] = None
+    cached: bool = False
+    error: Optional[str] = None
+
+
+class FingerprintStore:
+    """Persisted stat-signature -> image fingerprint table.
+
+    An entry is valid while the file's size and mtime (ns) match the values
+    recorded when it was fingerprinted, and it was computed with the same
+    generator settings (``params``).
+    """
+
+    DEFAULT_PATH = "~/.local/share/image-workflow/fingerprints.sqlite3"
+
+    def __init__(self, path: Optional[Union[str, Path]] = None):
+        """Initialize the store.
+
+        Args:
+            path: SQLite file path. Defaults to $IMAGE_FINGERPRINT_STORE_PATH or
+                ~/.local/share/image-workflow/fingerprints.sqlite3
+        """
+        self.path = Path(path or os.getenv("IMAGE_FINGERPRINT_STORE_PATH") or self.DEFAULT_PATH).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    def lookup_many(self, paths: Iterable[str], params: str) -> Dict[str, Tuple[StatKey, ImageFingerprint]]:
+        """Fetch entries computed with ``params`` for many paths."""
+        paths = list(paths)
+        found: Dict[str, Tuple[StatKey, ImageFingerprint]] = {}
+        with self._lock:
+            for start in range(0, len(paths), 500):
+                chunk = paths[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                for row in self._conn.execute(
+                    "SELECT path, size, mtime_ns, content_hash, perceptual_hash, average_hash, difference_hash "
+                    f"FROM image_fingerprints WHERE params = ? AND path IN ({placeholders})",
+                    [params] + chunk,
+                ):
+                    found[row[0]] = ((row[1], row[2]), ImageFingerprint(
+                        content_hash=row[3],
+                        perceptual_hash=row[4],
+                        average_hash=row[5],
+                        difference_hash=row[6],
+                        file_size=row[1],
+                        file_path=row[0],
+                    ))
+        return found
+
+    def record_many(self, entries: Iterable[Tuple[StatKey, str, ImageFingerprint]]) -> None:
+        """Store (stat key, params, fingerprint) entries."""
+        now = time.time()
+        rows = [
+            (fp.file_path, key[0], key[1], params, fp.content_hash,
+             fp.perceptual_hash, fp.average_hash, fp.difference_hash, now)
+            for key, params, fp in entries
+        ]
+        if not rows:
+            return
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO image_fingerprints (path, size, mtime_ns, params, content_hash, "
+                "perceptual_hash, average_hash, difference_hash, fingerprinted_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.commit()
+
+    def all_fingerprints(self) -> List[ImageFingerprint]:
+        """Every stored fingerprint, e.g. to feed ``ImageMatcher.find_duplicates``."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT path, size, content_hash, perceptual_hash, average_hash, difference_hash "
+                "FROM image_fingerprints ORDER BY path"
+            ).fetchall()
+        return [
+            ImageFingerprint(
+                content_hash=row[2],
+                perceptual_hash=row[3],
+                average_hash=row[4],
+                difference_hash=row[5],
+                file_size=row[1],
+                file_path=row[0],
+            )
+            for row in rows
+        ]
+
+    def prune_missing(self) -> int:
+        """Drop entries whose files no longer exist; returns the number removed."""
+        with self._lock:
+            paths = [row[0] for row in self._conn.execute("SELECT path FROM image_fingerprints")]
+        missing = [(path,) for path in paths if not os.path.exists(path)]
+        if missing:
+            with self._lock:
+                self._conn.executemany("DELETE FROM image_fingerprints WHERE path = ?", missing)
+                self._conn.commit()
+        return len(missing)
+
+    def count(self) -> int:
+        """Number of stored entries."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM image_fingerprints").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+# ----------------------------------------------------------------------
+# Worker side
+# ----------------------------------------------------------------------
+
+_worker_generator: Optional[FingerprintGenerator] = None
+
+
+def _init_worker(settings: Dict[str, Any]) -> None:
+    """Build one FingerprintGenerator per process (imports PIL/imagehash once)."""
+    global _worker_generator
+    _worker_generator = FingerprintGenerator(**settings)
+
+
+def _fingerprint_job(path: str) -> Tuple[Optional[ImageFingerprint], Optional[str]]:
+    """Worker entry point: fingerprint one file."""
+    try:
+        return _worker_generator.generate(path), None
+    except Exception as e:
+        return None, f"{type(e).__name__}: {e}"
+
+
+# ----------------------------------------------------------------------
+# Parent side
+# ----------------------------------------------------------------------
+
+class FingerprintPipeline:
+    """Process-pool image fingerprinting backed by a resumable store.
+
+    Features:
+    - Warm worker processes, each with its own FingerprintGenerator
+    - Reduced-size (JPEG draft) decoding for perceptual hashes
+    - Stat-signature skip via FingerprintStore; results are committed every
+      ``batch_size`` images, so an interrupted run loses at most one batch
+    - Streaming ``run()`` with bounded in-flight work and images/second stats
+    - A worker crash (e.g. a decoder segfault) restarts the pool; only the
+      image that crashes a worker on its own is reported as an error
+    """
+
+    def __init__(
+        self,
+        store: Optional[FingerprintStore] = None,
+        workers: Optional[int] = None,
+        enable_perceptual: bool = True,
+        hash_size: int = 8,
+        reduced_decode: bool = True,
+        use_store: bool = True,
+        start_method: Optional[str] = None,
+    ):
+        """Initialize the pipeline.
+
+        Args:
+            store: Skip table (default: FingerprintStore at its default path)
+            workers: Worker processes ($IMAGE_FINGERPRINT_WORKERS, default CPU
+                count); 0 fingerprints in this process
+            enable_perceptual: Whether to compute perceptual hashes
+            hash_size: Size for perceptual hash (8 = 64-bit hash)
+            reduced_decode: Decode JPEGs at reduced size for perceptual hashes
+                (unlike ``FingerprintGenerator``, on by default; the store keys
+                entries by this setting)
+            use_store: Disable to always fingerprint (and never persist)
+            start_method: multiprocessing start method (default: platform default)
+        """
+        if workers is None:
+            env_workers = os.getenv("IMAGE_FINGERPRINT_WORKERS")
+            workers = int(env_workers) if env_workers else (os.cpu_count() or 1)
+        self.workers = max(0, workers)
+        self.settings = {
+            "enable_perceptual": enable_perceptual,
+            "hash_size": hash_size,
+            "reduced_decode": reduced_decode,
+        }
+        # Entries computed with other settings are recomputed, not reused
+        self.params = f"hash_size={hash_size};perceptual={int(enable_perceptual)};reduced={int(reduced_decode)}"
+        self.store = (store or FingerprintStore()) if use_store else None
+        self.start_method = start_method
+        self.stats: Dict[str, float] = {}
+        self._reset_stats()
+
+    def _reset_stats(self) -> None:
+        self.stats = {
+            "processed": 0,
+            "fingerprinted": 0,
+            "cached": 0,
+            "errors": 0,
+            "elapsed": 0.0,
+            "images_per_second": 0.0,
+        }
+
+    def _tick(self, started: float, result: PipelineResult) -> None:
+        stats = self.stats
+        stats["processed"] += 1
+        if result.error:
+            stats["errors"] += 1
+        elif result.cached:
+            stats["cached"] += 1
+        else:
+            stats["fingerprinted"] += 1
+        stats["elapsed"] = time.perf_counter() - started
+        if stats["elapsed"] > 0:
+            stats["images_per_second"] = stats["processed"] / stats["elapsed"]
+
+    def run(
+        self,
+        paths: Iterable[Union[str, Path]],
+        batch_size: int = 500,
+        progress_every: int = 1000,
+    ) -> Iterator[PipelineResult]:
+        """Stream fingerprints for many images.
+
+        Stored images are yielded immediately; the rest are fingerprinted by
+        the worker pool with at most ``2 * workers`` images in flight, and
+        arrive in submission order.
+
+        Args:
+            paths: Image paths (any iterable, consumed lazily in batches)
+            batch_size: Paths stat'ed and looked up per store query, and
+                new fingerprints committed per store write
+            progress_every: Log throughput every this many images (0 = never)
+
+        Yields:
+            PipelineResult per path
+        """
+        self._reset_stats()
+        started = time.perf_counter()
+        executor = None
+        if self.workers:
+            executor = self._new_executor()
+        else:
+            _init_worker(self.settings)
+
+        max_in_flight = max(1, self.workers * 2)
+        pending: Deque[Tuple[str, StatKey, "Future"]] = deque()
+        to_record: List[Tuple[StatKey, str, ImageFingerprint]] = []
+
+        def finish(result: PipelineResult) -> PipelineResult:
+            self._tick(started, result)
+            processed = self.stats["processed"]
+            if progress_every and processed % progress_every == 0:
+                logger.info(
+                    f"Fingerprinted {processed} images "
+                    f"({self.stats['cached']} cached, {self.stats['errors']} errors) - "
+                    f"{self.stats['images_per_second']:.1f} images/s"
+                )
+            return result
+
+        def restart_pool() -> None:
+            nonlocal executor
+            executor.shutdown(wait=False, cancel_futures=True)
+            executor = self._new_executor()
+
+        def submit(path: str) -> Future:
+            if executor is None:
+                future: Future = Future()
+                future.set_result(_fingerprint_job(path))
+                return future
+            try:
+                return executor.submit(_fingerprint_job, path)
+            except BrokenProcessPool as e:
+                # Handled with the in-flight jobs in finish_oldest()
+                future = Future()
+                future.set_exception(e)
+                return future
+
+        def finish_oldest() -> PipelineResult:
+            path, key, future = pending.popleft()
+            try:
+                fingerprint, error = future.result()
+            except BrokenProcessPool:
+                # Every in-flight job failed with the crashed worker. Retry
+                # this image alone to tell whether it caused the crash, then
+                # resubmit the rest
+                logger.warning(f"Fingerprint worker died; restarting the pool (retrying {path})")
+                restart_pool()
+                try:
+                    fingerprint, error = executor.submit(_fingerprint_job, path).result()
+                except BrokenProcessPool:
+                    fingerprint, error = None, "Worker process crashed while fingerprinting this image"
+                    restart_pool()
+                for index, (other_path, other_key, _) in enumerate(pending):
+                    pending[index] = (other_path, other_key, submit(other_path))
+            if fingerprint is None:
+                return finish(PipelineResult(path=path, error=error))
+            to_record.append((key, self.params, fingerprint))
+            return finish(PipelineResult(path=path, fingerprint=fingerprint))
+
+        def flush() -> None:
+            if self.store is not None and to_record:
+                self.store.record_many(to_record)
+            to_record.clear()
+
+        try:
+            iterator = iter(paths)
+            exhausted = False
+            while not exhausted:
+                batch = []
+                for raw in iterator:
+                    batch.append(str(raw))
+                    if len(batch) >= batch_size:
+                        break
+                else:
+                    exhausted = True
+
+                stored = self.store.lookup_many(batch, self.params) if self.store is not None else {}
+                for path in batch:
+                    try:
+                        key = _stat_key(os.stat(path))
+                    except OSError as e:
+                        yield finish(PipelineResult(path=path, error=str(e)))
+                        continue
+
+                    entry = stored.get(path)
+                    if entry is not None and tuple(entry[0]) == key:
+                        yield finish(PipelineResult(path=path, fingerprint=entry[1], cached=True))
+                        continue
+
+                    pending.append((path, key, submit(path)))
+                    while len(pending) >= max_in_flight:
+                        yield finish_oldest()
+                    if len(to_record) >= batch_size:
+                        flush()
+
+            while pending:
+                yield finish_oldest()
+        finally:
+            # Keep whatever finished, even if the caller stopped early
+            flush()
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
+            if self.stats["processed"]:
+                logger.info(
+                    f"Fingerprinting done: {self.stats['processed']} images in "
+                    f"{self.stats['elapsed']:.1f}s ({self.stats['images_per_second']:.1f} images/s, "
+                    f"{self.stats['cached']} cached, {self.stats['errors']} errors)"
+                )
+
+    def _new_executor(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context(self.start_method),
+            initializer=_init_worker,
+            initargs=(self.settings,),
+        )
+
+    def fingerprint_all(self, paths: Iterable[Union[str, Path]]) -> List[ImageFingerprint]:
+        """Fingerprint many images; returns the successful fingerprints."""
+        return [result.fingerprint for result in self.run(paths) if result.fingerprint is not None]
+
+
+def eagle_image_paths(reader: "EagleLibraryReader") -> Iterator[str]:
+    """File paths of every image in an Eagle library."""
+    for image in reader.iterate_images(include_tags=False):
+        if image.file_path:
+            yield image.file_path
+
+
+def lightroom_image_paths(reader: "LightroomCatalogReader") -> Iterator[str]:
+    """File paths of every master image in a connected Lightroom catalog."""
+    for _, file_path in reader.iterate_file_paths():
+        yield file_path
@@ -0,0 +1,303 @@
+"""Multi-index hashing for Hamming-radius search over perceptual hashes.
+
+The 64-bit aHash/dHash/pHash values from ``fingerprint.py`` are split into
+``chunks`` substrings (4 x 16 bits by default). By the pigeonhole
+principle, two hashes within Hamming distance ``r`` agree to within
+``r // chunks`` bits on at least one substring, so candidates are found by
+probing each substring's hash table with every key within that small
+radius and verified with an integer popcount.
+
+- ``query()`` answers a radius query in time proportional to the number
+  of candidates, not the collection size.
+- ``pairs()`` / ``groups()`` find all pairs within a radius (vectorized
+  with numpy when available) and union them into duplicate groups; on
+  realistic hash sets this is close to O(n).
+"""
+
+import logging
+from itertools import combinations
+from math import comb
+from typing import Dict, Hashable, Iterable, Iterator, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Optional vectorized all-pairs join
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+if hasattr(int, "bit_count"):
+    _popcount = int.bit_count
+else:  # Python < 3.10
+    def _popcount(value: int) -> int:
+        return bin(value).count("1")
+
+
+HashValue = Union[int, str]
+
+
+def hash_to_int(value: HashValue) -> int:
+    """Convert a hex hash string (or int) to an int.
+
+    Raises:
+        ValueError: If the string is not valid hex
+    """
+    if isinstance(value, int):
+        return value
+    return int(value, 16)
+
+
+def hamming(a: int, b: int) -> int:
+    """Hamming distance between two integer hashes."""
+    return _popcount(a ^ b)
+
+
+class _UnionFind:
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+
+    def find(self, x: int) -> int:
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, a: int, b: int) -> None:
+        ra, rb = self.find(a), self.find(b)
+        if ra != rb:
+            if ra < rb:
+                self.parent[rb] = ra
+            else:
+                self.parent[ra] = rb
+
+
+class HammingIndex:
+    """Multi-index hash table over fixed-width integer hashes.
+
+    Usage:
+        index = HammingIndex()
+        for fp in fingerprints:
+            index.add(fp.perceptual_hash, fp.content_hash)
+        index.query(some_hash, radius=8)   # [(item_id, distance), ...]
+        index.groups(radius=8)             # [[item_id, ...], ...]
+    """
+
+    def __init__(self, bits: int = 64, chunks: int = 4):
+        """Initialize the index.
+
+        Args:
+            bits: Hash width in bits (64 for hash_size=8)
+            chunks: Number of substrings; more chunks means smaller tables
+                probed with fewer keys but more candidates per key
+        """
+        if chunks < 1 or chunks > bits:
+            raise ValueError(f"chunks must be between 1 and {bits}")
+        self.bits = bits
+        self.chunks = chunks
+        self._layout = _split(bits, chunks)
+        self._tables: List[Dict[int, List[int]]] = [{} for _ in range(chunks)]
+        self._probe_cache: Dict[Tuple[int, int], List[int]] = {}
+        self.hashes: List[int] = []
+        self.ids: List[Hashable] = []
+
+    def __len__(self) -> int:
+        return len(self.hashes)
+
+    def _substrings(self, value: int) -> Iterator[int]:
+        for shift, width in self._layout:
+            yield (value >> shift) & ((1 << width) - 1)
+
+    def _probes(self, width: int, radius: int) -> List[int]:
+        """XOR masks of up to ``radius`` set bits within ``width`` bits."""
+        key = (width, radius)
+        masks = self._probe_cache.get(key)
+        if masks is None:
+            masks = [0]
+            for r in range(1, min(radius, width) + 1):
+                for bits in combinations(range(width), r):
+                    mask = 0
+                    for bit in bits:
+                        mask |= 1 << bit
+                    masks.append(mask)
+            self._probe_cache[key] = masks
+        return masks
+
+    # ------------------------------------------------------------------
+    # Building
+    # ------------------------------------------------------------------
+
+    def add(self, value: HashValue, item_id: Optional[Hashable] = None) -> int:
+        """Add a hash; returns its position.
+
+        Args:
+            value: Hash as int or hex string
+            item_id: Identifier returned by queries (defaults to position)
+        """
+        h = hash_to_int(value)
+        if h >> self.bits:
+            raise ValueError(f"Hash {value!r} is wider than {self.bits} bits")
+        pos = len(self.hashes)
+        self.hashes.append(h)
+        self.ids.append(pos if item_id is None else item_id)
+        for table, sub in zip(self._tables, self._substrings(h)):
+            table.setdefault(sub, []).append(pos)
+        return pos
+
+    def extend(self, values: Iterable[HashValue], item_ids: Optional[Iterable[Hashable]] = None) -> None:
+        """Add many hashes."""
+        if item_ids is None:
+            for value in values:
+                self.add(value)
+        else:
+            for value, item_id in zip(values, item_ids):
+                self.add(value, item_id)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def query_positions(self, value: HashValue, radius: int) -> List[Tuple[int, int]]:
+        """Positions within ``radius`` of ``value`` as (position, distance)."""
+        h = hash_to_int(value)
+        sub_radius = radius // self.chunks
+        seen = set()
+        found = []
+        hashes = self.hashes
+        for (shift, width), table, sub in zip(self._layout, self._tables, self._substrings(h)):
+            for mask in self._probes(width, sub_radius):
+                for pos in table.get(sub ^ mask, ()):
+                    if pos in seen:
+                        continue
+                    seen.add(pos)
+                    distance = _popcount(h ^ hashes[pos])
+                    if distance <= radius:
+                        found.append((pos, distance))
+        found.sort(key=lambda item: (item[1], item[0]))
+        return found
+
+    def query(self, value: HashValue, radius: int) -> List[Tuple[Hashable, int]]:
+        """Items within ``radius`` of ``value`` as (item_id, distance), nearest first."""
+        return [(self.ids[pos], distance) for pos, distance in self.query_positions(value, radius)]
+
+    def pairs(self, radius: int) -> Iterator[Tuple[int, int, int]]:
+        """All position pairs (i < j) within ``radius``, as (i, j, distance)."""
+        if NUMPY_AVAILABLE and self.bits <= 64 and self.hashes:
+            yield from self._pairs_numpy(radius)
+            return
+        for i, h in enumerate(self.hashes):
+            for j, distance in self.query_positions(h, radius):
+                if j > i:
+                    yield i, j, distance
+
+    def _join_layout(self, n: int, radius: int) -> List[Tuple[int, int]]:
+        """Substring layout for the all-pairs join.
+
+        Unlike the query tables, the join can re-split the hashes for the
+        collection size: each probe pass costs ~n and yields ~n^2 / 2^width
+        candidates, so pick the chunk count with the smallest estimate.
+        Chunks are capped at ``_MAX_JOIN_WIDTH`` bits to keep the dense
+        bucket tables small.
+        """
+        best, best_cost = None, None
+        for chunks in range(-(-self.bits // _MAX_JOIN_WIDTH), self.bits + 1):
+            layout = _split(self.bits, chunks)
+            widest = max(width for _, width in layout)
+            narrowest = min(width for _, width in layout)
+            probes = _probe_count(widest, radius // chunks)
+            cost = chunks * probes * (n + 4.0 * n * n / (1 << narrowest))
+            if best_cost is None or cost < best_cost:
+                best, best_cost = layout, cost
+        return best
+
+    def _pairs_numpy(self, radius: int) -> Iterator[Tuple[int, int, int]]:
+        hashes = np.array(self.hashes, dtype=np.uint64)
+        n = len(hashes)
+        layout = self._join_layout(n, radius)
+        sub_radius = radius // len(layout)
+        for c, (shift, width) in enumerate(layout):
+            keys = ((hashes >> np.uint64(shift)) & np.uint64((1 << width) - 1)).astype(np.int64)
+            # Dense bucket table: bucket k is order[bucket_starts[k]:][:sizes[k]]
+            order = np.argsort(keys, kind="stable")
+            sizes = np.bincount(keys, minlength=1 << width)
+            bucket_starts = np.cumsum(sizes) - sizes
+            for mask in self._probes(width, sub_radius):
+                probe = keys ^ mask
+                counts = sizes[probe]
+                # Most probes land in empty buckets; expand only the hits
+                hit_positions = np.flatnonzero(counts)
+                if not len(hit_positions):
+                    continue
+                counts = counts[hit_positions]
+                lo = bucket_starts[probe[hit_positions]]
+                total = int(counts.sum())
+                left = np.repeat(hit_positions, counts)
+                starts = np.repeat(lo - np.cumsum(counts) + counts, counts)
+                right = order[starts + np.arange(total)]
+                keep = left < right
+                left, right = left[keep], right[keep]
+                xor = hashes[left] ^ hashes[right]
+                distance = _popcount_array(xor)
+                hit = distance <= radius
+                # Report each pair once: at the first substring that finds it
+                for prev_shift, prev_width in layout[:c]:
+                    prev = (xor >> np.uint64(prev_shift)) & np.uint64((1 << prev_width) - 1)
+                    hit &= _popcount_array(prev) > sub_radius
+                for i, j, d in zip(left[hit].tolist(), right[hit].tolist(), distance[hit].tolist()):
+                    yield i, j, d
+
+    def groups(self, radius: int, min_size: int = 2) -> List[List[Hashable]]:
+        """Connected components of the "within ``radius``" graph.
+
+        Args:
+            radius: Maximum Hamming distance linking two hashes
+            min_size: Smallest group to return
+
+        Returns:
+            Groups of item ids, each in insertion order, ordered by first member
+        """
+        uf = _UnionFind(len(self.hashes))
+        for i, j, _ in self.pairs(radius):
+            uf.union(i, j)
+        components: Dict[int, List[int]] = {}
+        for pos in range(len(self.hashes)):
+            components.setdefault(uf.find(pos), []).append(pos)
+        return [
+            [self.ids[pos] for pos in members]
+            for members in components.values()
+            if len(members) >= min_size
+        ]
+
+
+_MAX_JOIN_WIDTH = 24
+
+
+def _split(bits: int, chunks: int) -> List[Tuple[int, int]]:
+    """(shift, width) of each of ``chunks`` near-equal substrings."""
+    base, extra = divmod(bits, chunks)
+    layout = []
+    shift = 0
+    for c in range(chunks):
+        width = base + (1 if c < extra else 0)
+        layout.append((shift, width))
+        shift += width
+    return layout
+
+
+def _probe_count(width: int, radius: int) -> int:
+    """Number of keys within ``radius`` bits of a ``width``-bit key."""
+    return sum(comb(width, r) for r in range(min(radius, width) + 1))
+
+
+def _popcount_array(values: "np.ndarray") -> "np.ndarray":
+    """Per-element popcount of a uint64 array."""
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(values).astype(np.int64)
+    as_bytes = values.view(np.uint8).reshape(-1, 8)
+    return _BYTE_POPCOUNT[as_bytes].sum(axis=1)
+
+
+if NUMPY_AVAILABLE:
+    _BYTE_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.int64)
@@ -16,6 +16,7 @@ from image_workflow.deduplication.fingerprint import (
     FingerprintGenerator,
     ImageFingerprint,
 )
+from image_workflow.deduplication.hash_index import HammingIndex, hamming
 
 logger = logging.getLogger(__name__)
 
@@ -213,6 +214,13 @@ class ImageMatcher:
         metadata = metadata or {}
         groups: List[DuplicateGroup] = []
         processed: set = set()
+        candidate_index = _CandidateIndex(
+            fingerprints,
+            self.perceptual_threshold,
+            perceptual=self.strategy in (MatchStrategy.PERCEPTUAL, MatchStrategy.CASCADE),
+            all_pairs=True,
+        )
+        use_metadata = self.strategy in (MatchStrategy.FUZZY, MatchStrategy.CASCADE)
 
         for i, source in enumerate(fingerprints):
             if source.content_hash in processed:
@@ -225,8 +233,15 @@ class ImageMatcher:
             )
             processed.add(source.content_hash)
 
+            # Metadata matching has no index, so it still needs every candidate
+            if use_metadata and metadata.get(source.content_hash):
+                candidates = range(len(fingerprints))
+            else:
+                candidates = candidate_index.candidates(source, position=i)
+
             # Find all duplicates
-            for j, candidate in enumerate(fingerprints):
+            for j in candidates:
+                candidate = fingerprints[j]
                 if i == j or candidate.content_hash in processed:
                     continue
 
@@ -274,6 +289,15 @@ class ImageMatcher:
         metadata = metadata or {}
         matches = []
 
+        use_metadata = self.strategy in (MatchStrategy.FUZZY, MatchStrategy.CASCADE)
+        if not (use_metadata and metadata.get(source.content_hash)):
+            candidate_index = _CandidateIndex(
+                candidates,
+                self.perceptual_threshold,
+                perceptual=self.strategy in (MatchStrategy.PERCEPTUAL, MatchStrategy.CASCADE),
+            )
+            candidates = [candidates[j] for j in candidate_index.candidates(source)]
+
         for candidate in candidates:
             if source.content_hash == candidate.content_hash:
                 continue
@@ -376,12 +400,91 @@ class ImageMatcher:
         self._fingerprint_cache.clear()
 
 
+class _CandidateIndex:
+    """Narrows match candidates to exact and perceptual neighbours.
+
+    Replaces the all-pairs scan in ``find_duplicates``/``find_matches``:
+    exact candidates come from a content-hash dict and perceptual ones from
+    a ``HammingIndex``. ``compare()`` still makes the final decision, so
+    results are the same as comparing against everything.
+    """
+
+    def __init__(
+        self,
+        fingerprints: List[ImageFingerprint],
+        threshold: int,
+        perceptual: bool = True,
+        all_pairs: bool = False
+    ):
+        """Build the index.
+
+        Args:
+            fingerprints: Fingerprints to index
+            threshold: Max hamming distance for a perceptual candidate
+            perceptual: Whether to index perceptual hashes at all
+            all_pairs: Precompute every neighbour list with one join
+                instead of a radius query per ``candidates()`` call
+        """
+        self.threshold = threshold
+        self._by_content: Dict[str, List[int]] = {}
+        # One index per hex width so mismatched hash sizes never collide
+        self._by_width: Dict[int, HammingIndex] = {}
+        self._neighbours: Optional[Dict[int, List[int]]] = None
+
+        for pos, fp in enumerate(fingerprints):
+            self._by_content.setdefault(fp.content_hash, []).append(pos)
+            value = _perceptual_int(fp) if perceptual else None
+            if value is None:
+                continue
+            width = len(fp.perceptual_hash)
+            index = self._by_width.get(width)
+            if index is None:
+                bits = width * 4
+                index = HammingIndex(bits=bits, chunks=max(1, bits // 16))
+                self._by_width[width] = index
+            index.add(value, pos)
+
+        if all_pairs:
+            self._neighbours = {}
+            for index in self._by_width.values():
+                for i, j, _ in index.pairs(threshold):
+                    a, b = index.ids[i], index.ids[j]
+                    self._neighbours.setdefault(a, []).append(b)
+                    self._neighbours.setdefault(b, []).append(a)
+
+    def candidates(self, source: ImageFingerprint, position: Optional[int] = None) -> List[int]:
+        """Positions that could match ``source``, in input order.
+
+        Args:
+            source: Fingerprint to find candidates for
+            position: Position of ``source`` in the indexed list, used to
+                read precomputed neighbours
+        """
+        found = set(self._by_content.get(source.content_hash, ()))
+        if self._neighbours is not None and position is not None:
+            found.update(self._neighbours.get(position, ()))
+            return sorted(found)
+        index = self._by_width.get(len(source.perceptual_hash or ""))
+        value = _perceptual_int(source)
+        if index is not None and value is not None:
+            found.update(pos for pos, _ in index.query(value, self.threshold))
+        return sorted(found)
+
+
+def _perceptual_int(fingerprint: ImageFingerprint) -> Optional[int]:
+    """Perceptual hash as an int, or None if missing or not hex."""
+    if not fingerprint.perceptual_hash:
+        return None
+    try:
+        return int(fingerprint.perceptual_hash, 16)
+    except ValueError:
+        return None
+
+
 def _calculate_hamming(hash1: str, hash2: str) -> int:
     """Calculate Hamming distance between two hex hash strings."""
     try:
-        int1 = int(hash1, 16)
-        int2 = int(hash2, 16)
-        return bin(int1 ^ int2).count('1')
+        return hamming(int(hash1, 16), int(hash2, 16))
     except (ValueError, TypeError):
         return 64  # Max distance
 
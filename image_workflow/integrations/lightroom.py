@@ -9,7 +9,7 @@ import sqlite3
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 from image_workflow.core.models import ImageInfo, ImageMetadata, SourceLocation, SourceType
 from image_workflow.utils.errors import IntegrationError
@@ -175,6 +175,21 @@ class LightroomCatalogReader:
         )
     """
 
+    # Full paths of every master image in one pass (no per-image queries).
+    # Lightroom stores absolutePath and pathFromRoot with trailing slashes.
+    FILE_PATHS_QUERY = """
+        SELECT
+            ai.id_global,
+            rf.absolutePath || f.pathFromRoot || alf.baseName ||
+                CASE WHEN alf.extension IS NULL OR alf.extension = '' THEN ''
+                     ELSE '.' || alf.extension END as file_path
+        FROM Adobe_images ai
+        JOIN AgLibraryFile alf ON ai.rootFile = alf.id_local
+        JOIN AgLibraryFolder f ON alf.folder = f.id_local
+        JOIN AgLibraryRootFolder rf ON f.rootFolder = rf.id_local
+        WHERE ai.masterImage IS NULL
+    """
+
     def __init__(self, catalog_path: Union[str, Path]):
         """Initialize the catalog reader.
 
@@ -317,6 +332,21 @@ class LightroomCatalogReader:
             offset += batch_size
             logger.debug(f"Processed {min(offset, total)}/{total} images")
 
+    def iterate_file_paths(self) -> Iterator[Tuple[str, str]]:
+        """Iterate (id_global, file path) for every master image.
+
+        One streaming query instead of the per-image metadata lookups of
+        ``iterate_images``; use it when only the files are needed, e.g. for
+        fingerprinting.
+
+        Yields:
+            (id_global, file_path) tuples
+        """
+        cursor = self.connection.execute(self.FILE_PATHS_QUERY)
+        for row in cursor:
+            if row['file_path']:
+                yield row['id_global'], row['file_path']
+
     def get_image_by_id(
         self,
         id_local: int = None,
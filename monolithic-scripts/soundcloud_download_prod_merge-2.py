@@ -521,6 +521,7 @@ import random
 import time
 import concurrent.futures
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 import cProfile
 import tempfile
 import re
@@ -592,6 +593,66 @@ try:
 except ImportError:
     PYLOUDNORM_AVAILABLE = False
 
+# PERFORMANCE: single-decode analysis (one decode per track shared by
+# tempo, key, loudness and normalization)
+try:
+    from shared_core.audio.analysis import (
+        ANALYSIS_SAMPLE_RATE,
+        decode_audio as _decode_audio,
+        estimate_key as _estimate_key,
+        measure_loudness as _measure_loudness,
+    )
+    from shared_core.audio.analysis import spectral_signature as _spectral_signature
+    from shared_core.audio.analysis_cache import get_analysis_cache as _get_shared_analysis_cache
+    from shared_core.audio.worker_pool import AnalysisWorkerPool as _AnalysisWorkerPool
+    SHARED_AUDIO_ANALYSIS_AVAILABLE = True
+except ImportError:
+    ANALYSIS_SAMPLE_RATE = 44100
+    SHARED_AUDIO_ANALYSIS_AVAILABLE = False
+
+# PERFORMANCE: streaming readinto SHA-256 plus a persisted (path, size, mtime,
+# inode) -> hash table so unchanged library files are never rehashed
+try:
+    from shared_core.audio.fingerprint_service import (
+        get_fingerprint_service as _get_fingerprint_service,
+        sha256_file as _sha256_file,
+    )
+    SHARED_FINGERPRINT_SERVICE_AVAILABLE = True
+except ImportError:
+    SHARED_FINGERPRINT_SERVICE_AVAILABLE = False
+
+# PERFORMANCE: process-wide Notion token bucket + shared connection pool
+# (also used by music_workflow, sync_framework and the queue manager, so
+# concurrent clients stop 429-ing each other)
+try:
+    from shared_core.notion.rate_limiter import (
+        create_notion_client as _create_notion_client,
+        get_notion_http_session as _get_notion_http_session,
+    )
+    SHARED_NOTION_RATE_LIMITER_AVAILABLE = True
+except ImportError:
+    SHARED_NOTION_RATE_LIMITER_AVAILABLE = False
+
+# PERFORMANCE: streaming Notion pagination; the next page is requested while
+# the current one is being processed
+try:
+    from shared_core.notion.paginator import iter_paginated as _iter_paginated
+    SHARED_NOTION_PAGINATOR_AVAILABLE = True
+except ImportError:
+    SHARED_NOTION_PAGINATOR_AVAILABLE = False
+
+# PERFORMANCE: local SQLite mirror of the Tracks/Artists/Playlists databases,
+# synced incrementally by last_edited_time; duplicate and name lookups become
+# index queries instead of API queries (disable with NOTION_MIRROR=0)
+try:
+    from shared_core.notion.mirror import (
+        get_notion_mirror as _get_notion_mirror,
+        mirror_enabled as _notion_mirror_enabled,
+    )
+    SHARED_NOTION_MIRROR_AVAILABLE = _notion_mirror_enabled()
+except ImportError:
+    SHARED_NOTION_MIRROR_AVAILABLE = False
+
 # Optional – used only for fast AIFF duration read; falls back to ffprobe
 try:
     import soundfile as sf
@@ -608,6 +669,27 @@ def get_meter(sample_rate: int):
         _meter_cache[sample_rate] = pyln.Meter(sample_rate)
     return _meter_cache[sample_rate]
 
+# PERFORMANCE: content-addressed analysis cache (file SHA-256 + analysis version).
+# Reprocessing unchanged audio skips decode and tempo/key/loudness analysis.
+# Disable with SC_ANALYSIS_CACHE=0.
+_analysis_cache = None
+_analysis_cache_failed = False
+
+def _get_analysis_cache():
+    """Return the shared analysis cache, or None when disabled/unavailable."""
+    global _analysis_cache, _analysis_cache_failed
+    if _analysis_cache is not None or _analysis_cache_failed:
+        return _analysis_cache
+    if not SHARED_AUDIO_ANALYSIS_AVAILABLE or os.getenv("SC_ANALYSIS_CACHE", "1").strip().lower() in ("0", "false", "no"):
+        _analysis_cache_failed = True
+        return None
+    try:
+        _analysis_cache = _get_shared_analysis_cache()
+    except Exception as e:
+        workspace_logger.warning(f"⚠️  Analysis cache unavailable: {e}")
+        _analysis_cache_failed = True
+    return _analysis_cache
+
 def _build_http_session() -> requests.Session:
     """Build a shared HTTP session with connection pooling and retries."""
     session = requests.Session()
@@ -991,7 +1073,8 @@ def apply_loudness_normalization_fallback(audio_samples: np.ndarray, target_lufs
         }
 
 def normalize_audio_platinum_notes_style(audio_samples: np.ndarray, sample_rate: int = 44100,
-                                        target_lufs: float = -8.0, warmth_mode: str = "gentle") -> tuple[np.ndarray, dict]:
+                                        target_lufs: float = -8.0, warmth_mode: str = "gentle",
+                                        initial_analysis: Optional[dict] = None) -> tuple[np.ndarray, dict]:
     """
     FIXED: Complete Platinum Notes-style audio normalization pipeline with proper LUFS measurement.
     This replaces the original function with accurate LUFS processing.
@@ -1003,14 +1086,19 @@ def normalize_audio_platinum_notes_style(audio_samples: np.ndarray, sample_rate:
     4. Apply proper LUFS-based loudness normalization with limiting
     5. Final quality check
     
+    Args:
+        initial_analysis: Loudness already measured on ``audio_samples`` by the
+            analysis stage; skips re-measuring in step 1.
+
     Returns:
         tuple: (normalized_audio_samples, processing_report)
     """
     try:
         workspace_logger.info("🎛️  Starting FIXED Platinum Notes-style audio normalization...")
         
-        # Step 1: Initial analysis with proper LUFS
-        initial_analysis = analyze_audio_loudness(audio_samples, sample_rate)
+        # Step 1: Initial analysis with proper LUFS (reused from the analysis stage when given)
+        if initial_analysis is None:
+            initial_analysis = analyze_audio_loudness(audio_samples, sample_rate)
         workspace_logger.info(f"📊 Initial LUFS: {initial_analysis['lufs_integrated']:.1f} ({initial_analysis['measurement_method']})")
         
         # Step 2: Clipping detection and repair (keep existing function)
@@ -1403,7 +1491,8 @@ def complete_track_notion_update(
     # Attempt update with retry
     for attempt in range(1, 4):
         try:
-            notion_manager.update_page(page_id, properties)
+            # Track completion: sends this patch merged with everything buffered for the page
+            commit_track_page_update(page_id, properties)
             workspace_logger.info(
                 f"✅ Notion updated successfully (attempt {attempt}/3): "
                 f"DL={'True' if dl_was_set else 'NOT SET'}, {path_count} file paths, Eagle ID={'Yes' if eagle_id else 'No'}"
@@ -1769,7 +1858,8 @@ def unified_track_update(
 
         for attempt in range(1, 4):
             try:
-                notion_manager._req("patch", f"/pages/{page_id}", {"properties": properties})
+                # Track completion: sends this patch merged with everything buffered for the page
+                commit_track_page_update(page_id, properties)
                 workspace_logger.info(f"✅ Unified update successful (attempt {attempt}/3)")
                 return True
             except Exception as e:
@@ -2110,8 +2200,12 @@ class NotionManager:
     """Notion API manager following workspace standards"""
     
     def __init__(self, token: str = NOTION_TOKEN):
-        self.client = Client(auth=token)
-        self.session = _build_http_session()
+        if SHARED_NOTION_RATE_LIMITER_AVAILABLE:
+            self.client = _create_notion_client(token)
+            self.session = _get_notion_http_session()
+        else:
+            self.client = Client(auth=token)
+            self.session = _build_http_session()
         self.headers = {
             "Authorization": f"Bearer {token}",
             "Notion-Version": NOTION_VERSION,  # Use the validated version
@@ -2171,7 +2265,9 @@ class NotionManager:
     def update_page(self, page_id: str, properties: dict) -> dict:
         """Update page with workspace-standard error handling"""
         try:
-            return self._req("patch", f"/pages/{page_id}", {"properties": properties})
+            page = self._req("patch", f"/pages/{page_id}", {"properties": properties})
+            _mirror_record(page)
+            return page
         except Exception as exc:
             workspace_logger.error(f"Failed to update page {page_id}: {exc}")
             try:
@@ -2210,6 +2306,99 @@ _notion_query_cache: dict[str, dict] = {}
 _notion_query_cache_ttl = int(os.getenv("NOTION_QUERY_CACHE_TTL", "30"))
 _notion_query_cache_max = int(os.getenv("NOTION_QUERY_CACHE_MAX", "256"))
 
+def _mirror_for(database_id: str):
+    """Return the local Notion mirror, synced for database_id, or None to query the API."""
+    if not SHARED_NOTION_MIRROR_AVAILABLE or not database_id:
+        return None
+    try:
+        mirror = _get_notion_mirror()
+        mirror.ensure_fresh(
+            database_id,
+            lambda db, body: notion_manager._req("post", f"/databases/{db}/query", body),
+        )
+        return mirror
+    except Exception as exc:
+        workspace_logger.debug(f"Notion mirror unavailable for {database_id}, using API: {exc}")
+        return None
+
+
+def _mirror_record(page: Optional[dict]) -> None:
+    """Write a created/updated page through to the local mirror."""
+    if not SHARED_NOTION_MIRROR_AVAILABLE or not page:
+        return
+    try:
+        _get_notion_mirror().upsert_page(page)
+    except Exception as exc:
+        workspace_logger.debug(f"Could not record page in Notion mirror: {exc}")
+
+
+def _mirror_forget(page_id: str) -> None:
+    """Drop an archived page from the local mirror."""
+    if not SHARED_NOTION_MIRROR_AVAILABLE or not page_id:
+        return
+    try:
+        _get_notion_mirror().remove_page(page_id)
+    except Exception as exc:
+        workspace_logger.debug(f"Could not remove page from Notion mirror: {exc}")
+
+# PERFORMANCE: per-page Notion write buffer. Property patches made while a
+# track is processed are merged into one PATCH (multi-select values are
+# unioned) and sent when the track completes (unified/complete update) or
+# when processing exits on failure. Disable with SC_NOTION_WRITE_BUFFER=0.
+from functools import wraps
+
+def _write_track_page_properties(page_id: str, properties: dict) -> dict:
+    """Send one coalesced patch, dropping properties the Tracks DB schema lacks.
+
+    One unknown property would otherwise fail the whole merged request.
+    """
+    prop_types = _get_tracks_db_prop_types()
+    if prop_types:
+        dropped = [name for name, value in properties.items() if prop_types.get(name) not in value]
+        if dropped:
+            workspace_logger.warning(
+                f"⚠️ Dropping properties not in Tracks DB schema (or of a different type) "
+                f"for page {page_id}: {dropped}"
+            )
+            properties = {name: value for name, value in properties.items() if name not in dropped}
+    if not properties:
+        return {}
+    return notion_manager.update_page(page_id, properties)
+
+try:
+    from shared_core.notion.write_buffer import PageWriteBuffer
+    if os.getenv("SC_NOTION_WRITE_BUFFER", "1").strip().lower() in ("0", "false", "no"):
+        notion_write_buffer = None
+    else:
+        notion_write_buffer = PageWriteBuffer(_write_track_page_properties)
+except ImportError:
+    notion_write_buffer = None
+
+def buffer_notion_writes(func):
+    """Coalesce the Tracks DB page writes made during ``func`` (per thread)."""
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        if notion_write_buffer is None:
+            return func(*args, **kwargs)
+        with notion_write_buffer.collect():
+            return func(*args, **kwargs)
+    return wrapper
+
+def stage_track_page_update(page_id: str, properties: dict) -> None:
+    """Patch a track page; held in the write buffer while a track is processing."""
+    if notion_write_buffer is None:
+        notion_manager.update_page(page_id, properties)
+    else:
+        notion_write_buffer.update(page_id, properties)
+
+def commit_track_page_update(page_id: str, properties: dict) -> None:
+    """Patch a track page now, together with anything buffered for it."""
+    if notion_write_buffer is None:
+        notion_manager.update_page(page_id, properties)
+        return
+    notion_write_buffer.stage(page_id, properties)
+    notion_write_buffer.flush(page_id)
+
 # ───────────────────────────────────────────────────────────────
 # Unified State Registry Integration (Phase 1)
 # ───────────────────────────────────────────────────────────────
@@ -2637,6 +2826,7 @@ def _merge_group_into_keeper(keeper: dict, donors: list[dict], dry_run: bool = F
             continue
         try:
             notion_manager._req("patch", f"/pages/{did}", {"archived": True})
+            _mirror_forget(did)
             workspace_logger.info(f"🗄️  Archived duplicate page {did}")
         except Exception as e:
             workspace_logger.warning(f"Could not archive duplicate {did}: {e}")
@@ -2659,6 +2849,13 @@ def _fetch_by_equals(prop_name: str, value: str) -> list[dict]:
         filt = {"property": real, "title": {"equals": value}}
     if not filt:
         return []
+    mirror = _mirror_for(TRACKS_DB_ID)
+    if mirror is not None:
+        found = mirror.find(TRACKS_DB_ID, real, value, limit=SC_NOTION_PAGE_SIZE)
+        if found:
+            return found
+        # A miss may be a page created since the mirror last synced (webhook
+        # server, cron); ask the API before the caller creates a duplicate
     q = {"filter": filt, "page_size": SC_NOTION_PAGE_SIZE}
     res = notion_manager.query_database(TRACKS_DB_ID, q)
     return res.get("results", [])
@@ -4128,18 +4325,18 @@ def find_all_tracks_for_processing(limit: int = 5000) -> List[Dict[str, Any]]:
     query = _build_unprocessed_tracks_query(limit)
 
     try:
-        tracks = query_database_paginated(TRACKS_DB_ID, query, max_items=limit)
-        if SC_DEDUP_PRE_PROCESS == "1" and tracks:
-            merged_list = []
-            seen_ids = set()
-            for p in tracks:
-                kp = try_merge_duplicates_for_page(p, dry_run=(SC_DEDUP_DRY_RUN == "1"))
-                pid = kp.get("id")
-                if pid and pid not in seen_ids:
-                    merged_list.append(kp)
-                    seen_ids.add(pid)
-            tracks = merged_list
-        return tracks
+        if SC_DEDUP_PRE_PROCESS != "1":
+            return query_database_paginated(TRACKS_DB_ID, query, max_items=limit)
+        # Merge duplicates row by row while the next page is being fetched
+        merged_list = []
+        seen_ids = set()
+        for p in iter_database_paginated(TRACKS_DB_ID, query, max_items=limit):
+            kp = try_merge_duplicates_for_page(p, dry_run=(SC_DEDUP_DRY_RUN == "1"))
+            pid = kp.get("id")
+            if pid and pid not in seen_ids:
+                merged_list.append(kp)
+                seen_ids.add(pid)
+        return merged_list
     except Exception as exc:
         workspace_logger.error(f"Failed to query Notion database for batch processing: {exc}")
         return []
@@ -4342,9 +4539,51 @@ def process_track_page_wrapper(page: dict) -> tuple[str, Optional[Exception]]:
         workspace_logger.error(f"❌ Error processing track {track_id}: {e}")
         return track_id, e
 
+# ───────────────────────────────────────────────────────────────
+# PERFORMANCE: process-pool analysis tier for batch modes
+# ───────────────────────────────────────────────────────────────
+# Download/Notion/Eagle I/O stays on threads; download_track() hands the
+# CPU-bound decode + tempo/key/loudness step to warm worker processes while
+# a pool is active. SC_ANALYSIS_WORKERS sets the process count (default:
+# min(CPU count, I/O threads); 0 disables the tier).
+_ANALYSIS_POOL = None
+_ANALYSIS_POOL_LOCK = threading.Lock()
+
+
+@contextmanager
+def batch_analysis_pool(io_workers: int):
+    """Run the enclosed batch with a process-pool analysis tier (nested use is a no-op)."""
+    global _ANALYSIS_POOL
+    try:
+        requested = int(os.getenv("SC_ANALYSIS_WORKERS", "") or min(os.cpu_count() or 1, io_workers))
+    except ValueError:
+        requested = min(os.cpu_count() or 1, io_workers)
+
+    with _ANALYSIS_POOL_LOCK:
+        owner = _ANALYSIS_POOL is None and SHARED_AUDIO_ANALYSIS_AVAILABLE and requested > 0 and io_workers > 1
+        if owner:
+            try:
+                pool = _AnalysisWorkerPool(max_workers=requested)
+                # Start workers before the I/O threads exist
+                started = pool.warm()
+                _ANALYSIS_POOL = pool
+                workspace_logger.info(f"🧮 Analysis process pool started: {started} workers")
+            except Exception as e:
+                workspace_logger.warning(f"⚠️  Analysis process pool unavailable, analyzing in-thread: {e}")
+                owner = False
+    try:
+        yield _ANALYSIS_POOL
+    finally:
+        if owner:
+            with _ANALYSIS_POOL_LOCK:
+                pool, _ANALYSIS_POOL = _ANALYSIS_POOL, None
+            pool.close()
+
+
 def process_pages_parallel(pages: List[Dict[str, Any]], max_workers: int = MAX_CONCURRENT_JOBS) -> int:
     """
     Process multiple pages in parallel using ThreadPoolExecutor.
+    Audio analysis runs in the batch_analysis_pool() worker processes.
     Returns the number of successfully processed pages.
     """
     if not pages:
@@ -4355,7 +4594,7 @@ def process_pages_parallel(pages: List[Dict[str, Any]], max_workers: int = MAX_C
     processed_count = 0
     failed_count = 0
     
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+    with batch_analysis_pool(max_workers), ThreadPoolExecutor(max_workers=max_workers) as executor:
         # Submit all tasks
         futures = [executor.submit(process_track_page_wrapper, page) for page in pages]
         
@@ -4681,18 +4920,22 @@ def find_or_create_artist_page(artist_name: str) -> Optional[str]:
         return _ARTIST_CACHE[cache_key]
 
     try:
-        # Search for existing artist by name
-        query = {
-            "filter": {
-                "property": "Name",
-                "title": {"equals": artist_name}
-            },
-            "page_size": 1
-        }
-
-        result = notion_manager.query_database(_ARTISTS_DB_ID, query)
-        if result and result.get("results"):
-            artist_page_id = result["results"][0]["id"]
+        # Search for existing artist by name (local mirror first; a miss is
+        # confirmed with the API since the mirror may predate the page)
+        mirror = _mirror_for(_ARTISTS_DB_ID)
+        existing = mirror.find(_ARTISTS_DB_ID, "Name", artist_name, limit=1) if mirror is not None else []
+        if not existing:
+            query = {
+                "filter": {
+                    "property": "Name",
+                    "title": {"equals": artist_name}
+                },
+                "page_size": 1
+            }
+            result = notion_manager.query_database(_ARTISTS_DB_ID, query)
+            existing = (result or {}).get("results") or []
+        if existing:
+            artist_page_id = existing[0]["id"]
             _ARTIST_CACHE[cache_key] = artist_page_id
             workspace_logger.debug(f"🎤 Found existing artist: {artist_name} -> {artist_page_id}")
             return artist_page_id
@@ -4711,6 +4954,7 @@ def find_or_create_artist_page(artist_name: str) -> Optional[str]:
         new_page = notion_manager._req("post", "/pages", payload)
 
         if new_page and new_page.get("id"):
+            _mirror_record(new_page)
             artist_page_id = new_page["id"]
             _ARTIST_CACHE[cache_key] = artist_page_id
             workspace_logger.info(f"🎤 Created new artist page: {artist_name} -> {artist_page_id}")
@@ -4852,18 +5096,22 @@ def find_or_create_playlist_page(playlist_name: str, source: str = "SoundCloud")
         return _PLAYLIST_CACHE[cache_key]
 
     try:
-        # Search for existing playlist by name
-        query = {
-            "filter": {
-                "property": "Name",
-                "title": {"equals": playlist_name}
-            },
-            "page_size": 1
-        }
-
-        result = notion_manager.query_database(_PLAYLISTS_DB_ID, query)
-        if result and result.get("results"):
-            playlist_page_id = result["results"][0]["id"]
+        # Search for existing playlist by name (local mirror first; a miss is
+        # confirmed with the API since the mirror may predate the page)
+        mirror = _mirror_for(_PLAYLISTS_DB_ID)
+        existing = mirror.find(_PLAYLISTS_DB_ID, "Name", playlist_name, limit=1) if mirror is not None else []
+        if not existing:
+            query = {
+                "filter": {
+                    "property": "Name",
+                    "title": {"equals": playlist_name}
+                },
+                "page_size": 1
+            }
+            result = notion_manager.query_database(_PLAYLISTS_DB_ID, query)
+            existing = (result or {}).get("results") or []
+        if existing:
+            playlist_page_id = existing[0]["id"]
             _PLAYLIST_CACHE[cache_key] = playlist_page_id
             workspace_logger.debug(f"🎵 Found existing playlist: {playlist_name} -> {playlist_page_id}")
             return playlist_page_id
@@ -4884,6 +5132,7 @@ def find_or_create_playlist_page(playlist_name: str, source: str = "SoundCloud")
         new_page = notion_manager._req("post", "/pages", payload)
 
         if new_page and new_page.get("id"):
+            _mirror_record(new_page)
             playlist_page_id = new_page["id"]
             _PLAYLIST_CACHE[cache_key] = playlist_page_id
             workspace_logger.info(f"🎵 Created new playlist page: {playlist_name} -> {playlist_page_id}")
@@ -5459,6 +5708,7 @@ def upsert_track_page(meta: dict, eagle_item_id: Optional[str] = None) -> str:
         body = {"parent": {"database_id": TRACKS_DB_ID}, "properties": props}
         try:
             page = notion_manager._req("post", "/pages", body)
+            _mirror_record(page)
             workspace_logger.info(f"🆕 Created track page in Notion: {meta['title']}")
             new_page_id = page.get("id", "")
             # Link artist relation (2026-01-15 fix)
@@ -5542,6 +5792,14 @@ def detect_key(wav_path: str, y: Optional[np.ndarray] = None, sr: Optional[int]
         
         workspace_logger.debug(f"✅ Audio loaded for key detection: {len(y)} samples, {sr} Hz")
         
+        if SHARED_AUDIO_ANALYSIS_AVAILABLE:
+            key = _estimate_key(y, sr)
+            if key is None:
+                workspace_logger.error(f"❌ Key detection failed: No chroma features detected - {wav_path}")
+                return "Unknown"
+            workspace_logger.info(f"✅ Key detected: {key}")
+            return key
+
         # Calculate chroma features
         chroma = librosa.feature.chroma_cqt(y=y, sr=sr)
         mean_chroma = np.mean(chroma, axis=1)
@@ -5726,8 +5984,17 @@ def get_playlist_names_from_track(track_info: dict) -> list[str]:
     
     return unique_playlists
 
-def compute_file_fingerprint(file_path: Path, chunk_size: int = 1024 * 1024) -> str:
-    """Compute a stable SHA-256 fingerprint for the provided audio file."""
+def compute_file_fingerprint(file_path: Path, chunk_size: int = 1024 * 1024, use_store: bool = False) -> str:
+    """Compute a stable SHA-256 fingerprint for the provided audio file.
+
+    With ``use_store`` the hash is looked up in (and recorded to) the shared
+    fingerprint store, so an unchanged library file is not read again. Leave
+    it off for temporary files.
+    """
+    if SHARED_FINGERPRINT_SERVICE_AVAILABLE:
+        if use_store:
+            return _get_fingerprint_service().fingerprint(file_path)
+        return _sha256_file(file_path)
     hash_obj = hashlib.sha256()
     with file_path.open("rb") as handle:
         for chunk in iter(lambda: handle.read(chunk_size), b""):
@@ -5860,20 +6127,112 @@ _eagle_items_name_index: Optional[dict[str, list[dict]]] = None  # Pre-indexed b
 _eagle_items_path_index: Optional[dict[str, dict]] = None  # Pre-indexed by path
 _eagle_items_fingerprint_index: Optional[dict[str, list[dict]]] = None  # fingerprint -> items
 
+# Persistent on-disk index (shared_core.eagle) shared with other processes and
+# the smart API / music_workflow clients. When available it replaces the
+# in-memory dict indexes above and is refreshed incrementally instead of
+# re-downloading /api/item/list.
+try:
+    from shared_core.eagle import get_eagle_item_index as _get_eagle_item_index
+except Exception:
+    _get_eagle_item_index = None
+_eagle_item_index = None
+_eagle_items_from_index: bool = False
+
+
+def _get_persistent_eagle_index():
+    """Return the shared persistent Eagle index, or None if unavailable."""
+    global _eagle_item_index, _get_eagle_item_index
+    if _eagle_item_index is None and _get_eagle_item_index is not None:
+        try:
+            _eagle_item_index = _get_eagle_item_index()
+        except Exception as e:
+            workspace_logger.warning(f"⚠️ Persistent Eagle index unavailable, using in-memory cache: {e}")
+            _get_eagle_item_index = None
+    return _eagle_item_index
+
+
+def _refresh_persistent_eagle_index(index) -> None:
+    """
+    Bring the persistent index up to date.
+
+    Reads metadata.json deltas straight from the library folder when it is
+    mounted; otherwise applies the API item list as a delta.
+    """
+    if EAGLE_LIBRARY_PATH and (Path(EAGLE_LIBRARY_PATH) / "images").is_dir():
+        index.refresh_from_library(EAGLE_LIBRARY_PATH)
+        return
+    endpoint = "/api/item/list"
+    if EAGLE_CACHE_LIMIT > 0:
+        endpoint = f"{endpoint}?limit={EAGLE_CACHE_LIMIT}"
+    data = eagle_request("get", endpoint)
+    items = data.get("data", [])
+    # A truncated list must not drop items beyond the limit from the index
+    complete = EAGLE_CACHE_LIMIT <= 0 or len(items) < EAGLE_CACHE_LIMIT
+    index.sync_items(items, complete=complete)
+
+
+def _build_eagle_memory_indexes(items: list[dict]) -> None:
+    """Build in-memory name/path/fingerprint lookups (fallback without persistent index)."""
+    global _eagle_items_name_index, _eagle_items_path_index, _eagle_items_fingerprint_index
+    _eagle_items_name_index = {}
+    _eagle_items_path_index = {}
+    _eagle_items_fingerprint_index = {}
+    for item in items:
+        # Index by lowercase name for fast fuzzy matching
+        name_lower = item.get("name", "").lower()
+        if name_lower:
+            if name_lower not in _eagle_items_name_index:
+                _eagle_items_name_index[name_lower] = []
+            _eagle_items_name_index[name_lower].append(item)
+
+        # Index by path for O(1) path lookups
+        path = item.get("path", "")
+        if path:
+            _eagle_items_path_index[path] = item
+
+        # Index by fingerprint tag for O(1) fingerprint lookups
+        for tag in item.get("tags", []):
+            if not isinstance(tag, str):
+                continue
+            tag_lower = tag.lower()
+            if tag_lower.startswith("fingerprint:"):
+                fingerprint_value = tag_lower.split(":", 1)[1].strip()
+                if fingerprint_value:
+                    _eagle_items_fingerprint_index.setdefault(fingerprint_value, []).append(item)
+
 
 def get_cached_eagle_items(force_refresh: bool = False) -> list[dict]:
     """
     Get Eagle items with caching. Significantly reduces API calls.
 
     Performance impact: Reduces 100+ API calls to 1 per 5-minute window.
+    With the persistent index, a refresh only re-reads items whose
+    metadata changed and a fresh process starts with a warm index.
     """
-    global _eagle_items_cache, _eagle_items_cache_time, _eagle_items_name_index, _eagle_items_path_index, _eagle_items_fingerprint_index
+    global _eagle_items_cache, _eagle_items_cache_time, _eagle_items_from_index
+    global _eagle_items_name_index, _eagle_items_path_index, _eagle_items_fingerprint_index
 
     current_time = time.time()
     cache_expired = (current_time - _eagle_items_cache_time) > _eagle_items_cache_ttl
 
     if force_refresh or _eagle_items_cache is None or cache_expired:
         workspace_logger.info("🔄 Refreshing Eagle items cache...")
+        index = _get_persistent_eagle_index()
+        if index is not None:
+            try:
+                _refresh_persistent_eagle_index(index)
+                _eagle_items_cache = index.all_items()
+                _eagle_items_cache_time = current_time
+                _eagle_items_from_index = True
+                _eagle_items_name_index = None
+                _eagle_items_path_index = None
+                _eagle_items_fingerprint_index = None
+                workspace_logger.info(f"✅ Eagle index refreshed: {len(_eagle_items_cache)} items indexed")
+                return _eagle_items_cache
+            except Exception as e:
+                workspace_logger.warning(f"⚠️ Failed to refresh persistent Eagle index, falling back to API cache: {e}")
+                _eagle_items_from_index = False
+
         try:
             endpoint = "/api/item/list"
             if EAGLE_CACHE_LIMIT > 0:
@@ -5883,31 +6242,7 @@ def get_cached_eagle_items(force_refresh: bool = False) -> list[dict]:
             _eagle_items_cache_time = current_time
 
             # Build pre-indexed lookups for O(1) access
-            _eagle_items_name_index = {}
-            _eagle_items_path_index = {}
-            _eagle_items_fingerprint_index = {}
-            for item in _eagle_items_cache:
-                # Index by lowercase name for fast fuzzy matching
-                name_lower = item.get("name", "").lower()
-                if name_lower:
-                    if name_lower not in _eagle_items_name_index:
-                        _eagle_items_name_index[name_lower] = []
-                    _eagle_items_name_index[name_lower].append(item)
-
-                # Index by path for O(1) path lookups
-                path = item.get("path", "")
-                if path:
-                    _eagle_items_path_index[path] = item
-
-                # Index by fingerprint tag for O(1) fingerprint lookups
-                for tag in item.get("tags", []):
-                    if not isinstance(tag, str):
-                        continue
-                    tag_lower = tag.lower()
-                    if tag_lower.startswith("fingerprint:"):
-                        fingerprint_value = tag_lower.split(":", 1)[1].strip()
-                        if fingerprint_value:
-                            _eagle_items_fingerprint_index.setdefault(fingerprint_value, []).append(item)
+            _build_eagle_memory_indexes(_eagle_items_cache)
 
             workspace_logger.info(f"✅ Eagle cache refreshed: {len(_eagle_items_cache)} items indexed")
         except Exception as e:
@@ -5921,30 +6256,40 @@ def get_cached_eagle_items(force_refresh: bool = False) -> list[dict]:
 def get_eagle_item_by_path(file_path: str) -> Optional[dict]:
     """O(1) lookup of Eagle item by path using pre-built index."""
     global _eagle_items_path_index
-    if _eagle_items_path_index is None:
+    if _eagle_items_cache is None:
         get_cached_eagle_items()  # Initialize cache if needed
+    if _eagle_items_from_index:
+        return _eagle_item_index.get_by_path(file_path)
     return _eagle_items_path_index.get(file_path) if _eagle_items_path_index else None
 
 
 def get_eagle_items_by_name(name: str) -> list[dict]:
     """O(1) lookup of Eagle items by name using pre-built index."""
     global _eagle_items_name_index
-    if _eagle_items_name_index is None:
+    if _eagle_items_cache is None:
         get_cached_eagle_items()  # Initialize cache if needed
+    if _eagle_items_from_index:
+        return _eagle_item_index.get_by_name(name)
     return _eagle_items_name_index.get(name.lower(), []) if _eagle_items_name_index else []
 
 def get_eagle_items_by_fingerprint(fingerprint: str) -> list[dict]:
     """O(1) lookup of Eagle items by fingerprint tag using pre-built index."""
     global _eagle_items_fingerprint_index
-    if _eagle_items_fingerprint_index is None:
+    if _eagle_items_cache is None:
         get_cached_eagle_items()  # Initialize cache if needed
     if not fingerprint:
         return []
+    if _eagle_items_from_index:
+        return _eagle_item_index.get_by_fingerprint(fingerprint)
     return _eagle_items_fingerprint_index.get(fingerprint.lower(), []) if _eagle_items_fingerprint_index else []
 
 
 def invalidate_eagle_cache():
-    """Invalidate the Eagle items cache (call after adding/removing items)."""
+    """
+    Invalidate the Eagle items cache (call after adding/removing items).
+
+    The persistent index is kept; the next access refreshes it incrementally.
+    """
     global _eagle_items_cache, _eagle_items_cache_time, _eagle_items_name_index, _eagle_items_path_index, _eagle_items_fingerprint_index
     _eagle_items_cache = None
     _eagle_items_cache_time = 0.0
@@ -6322,6 +6667,11 @@ def eagle_move_to_trash(item_ids: list[str]) -> bool:
         
         if result and isinstance(result, dict) and result.get("status") == "success":
             workspace_logger.info(f"🗑️  Moved {len(item_ids)} Eagle item(s) to trash")
+            if _eagle_item_index is not None:
+                try:
+                    _eagle_item_index.remove_items(item_ids)
+                except Exception as e:
+                    workspace_logger.debug(f"Could not drop trashed items from Eagle index: {e}")
             return True
         else:
             workspace_logger.warning(f"❌ Failed to move items to trash: {result}")
@@ -6404,12 +6754,30 @@ def _token_suffix_key(normalized: str, token_count: int = 3) -> str:
         return ""
     return " ".join(tokens[-token_count:])
 
+# PERFORMANCE: Blocked/vectorized clustering engine (MinHash/LSH for large buckets)
+try:
+    from shared_core.eagle.near_duplicates import NearDuplicateClusterer as _NearDuplicateClusterer
+except Exception:
+    _NearDuplicateClusterer = None
+
 def _cluster_by_similarity(items: list[dict], min_similarity: float) -> list[list[dict]]:
-    """Cluster items by name similarity using a simple union-find."""
+    """
+    Cluster items by name similarity using union-find.
+
+    PERFORMANCE: Uses the shared near-duplicate engine when available:
+    buckets up to 2000 names are scored all-pairs in vectorized C, larger
+    buckets only compare names sharing a MinHash/LSH band. Falls back to
+    the pairwise SequenceMatcher scan otherwise.
+    """
     if len(items) < 2:
         return []
 
     norms = [_normalize_name_for_dedup(item.get("name", "")) for item in items]
+
+    if _NearDuplicateClusterer is not None:
+        clusterer = _NearDuplicateClusterer(min_similarity=min_similarity)
+        return [[items[idx] for idx in group] for group in clusterer.cluster(norms)]
+
     parent = list(range(len(items)))
 
     def find(idx: int) -> int:
@@ -7418,11 +7786,10 @@ def eagle_validate_tags_applied(eagle_id: str, expected_tags: list[str]) -> bool
 def update_notion_with_eagle_id(page_id: str, eagle_id: str) -> bool:
     """Update Notion page with Eagle File ID for duplicate handling."""
     try:
-        notion = NotionManager()
         eagle_prop = _resolve_prop_name("Eagle File ID") or "Eagle File ID"
         
         # Update the Eagle File ID property
-        notion.update_page(page_id, {
+        stage_track_page_update(page_id, {
             eagle_prop: {"rich_text": [{"text": {"content": eagle_id}}]}
         })
         
@@ -7500,7 +7867,7 @@ def update_audio_processing_status(page_id: str, statuses: List[str]):
         existing = [item.get("name") for item in page.get("properties", {}).get("Audio Processing", {}).get("multi_select", [])]
         merged = list(dict.fromkeys(existing + statuses))
         props = {"Audio Processing": {"multi_select": [{"name": s} for s in merged]}}
-        notion_manager.update_page(page_id, props)
+        stage_track_page_update(page_id, props)
         workspace_logger.info(f"✅ Updated audio processing statuses: {merged}")
         return True
     except Exception as e:
@@ -7585,7 +7952,7 @@ def set_comprehensive_audio_processing_status(page_id: str, processing_data: dic
         props = {
             "Audio Processing": {"multi_select": [{"name": status} for status in completed_status]}
         }
-        notion_manager.update_page(page_id, props)
+        stage_track_page_update(page_id, props)
         
         workspace_logger.info(f"✅ Set comprehensive audio processing status for {page_id}: {completed_status}")
         return True
@@ -8392,7 +8759,7 @@ def update_audio_processing_properties(page_id: str, processing_data: dict, file
         workspace_logger.info(f"📝 Updating Notion properties: {', '.join(update_summary) if update_summary else 'metadata only'}")
 
         # Update the page properties
-        notion_manager._req("patch", f"/pages/{page_id}", {"properties": properties})
+        stage_track_page_update(page_id, properties)
 
         workspace_logger.info(f"✅ Updated {len(properties)} audio processing properties for page {page_id}")
         return True
@@ -8874,7 +9241,7 @@ def efficient_batch_process_tracks(filter_criteria: str = "unprocessed", max_tra
 
         if enable_parallel and MAX_CONCURRENT_JOBS > 1:
             workspace_logger.info(f"🚀 Parallel batch processing enabled: {MAX_CONCURRENT_JOBS} workers")
-            with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_JOBS) as executor:
+            with batch_analysis_pool(MAX_CONCURRENT_JOBS), ThreadPoolExecutor(max_workers=MAX_CONCURRENT_JOBS) as executor:
                 futures = [executor.submit(_process_batch_track_page, page) for page in tracks_to_process]
                 for future in as_completed(futures):
                     track_id, success, title, artist, error = future.result()
@@ -9071,10 +9438,13 @@ def full_library_sync(
             "sorts": [{"timestamp": "created_time", "direction": "ascending"}],
             "page_size": 100,
         }
-        all_tracks = query_database_paginated(TRACKS_DB_ID, query, max_items=max_tracks or 10000)
-
-        results["total_tracks_queried"] = len(all_tracks)
-        workspace_logger.info(f"   ✅ Found {len(all_tracks)} total tracks with downloadable URLs")
+        # Rows stream in page by page; the unprocessed filter verifies file
+        # paths while the next page is being fetched
+        track_stream = iter_database_paginated(TRACKS_DB_ID, query, max_items=max_tracks or 10000)
+        if filter_criteria != "unprocessed":
+            all_tracks = list(track_stream)
+            results["total_tracks_queried"] = len(all_tracks)
+            workspace_logger.info(f"   ✅ Found {len(all_tracks)} total tracks with downloadable URLs")
 
         # Step 3b: Filter based on criteria WITH file path verification
         if filter_criteria == "all":
@@ -9082,13 +9452,15 @@ def full_library_sync(
             workspace_logger.info(f"   📌 Filter 'all': Processing all {len(all_tracks)} tracks")
         elif filter_criteria == "unprocessed":
             # Filter out tracks that have VERIFIED existing files
-            workspace_logger.info(f"\n🔍 Step 3b: Verifying file paths for {len(all_tracks)} tracks...")
+            workspace_logger.info(f"\n🔍 Step 3b: Verifying file paths as tracks arrive...")
             tracks_needing_processing = []
             tracks_with_verified_files = 0
             tracks_with_missing_files = 0
             tracks_with_no_paths = 0
+            tracks_queried = 0
 
-            for idx, track in enumerate(all_tracks):
+            for idx, track in enumerate(track_stream):
+                tracks_queried += 1
                 props = track.get("properties", {})
                 page_id = track.get("id", "")
 
@@ -9124,8 +9496,10 @@ def full_library_sync(
 
                 # Progress logging every 500 tracks
                 if (idx + 1) % 500 == 0:
-                    workspace_logger.info(f"   ... verified {idx + 1}/{len(all_tracks)} tracks")
+                    workspace_logger.info(f"   ... verified {idx + 1} tracks")
 
+            results["total_tracks_queried"] = tracks_queried
+            workspace_logger.info(f"   ✅ Found {tracks_queried} total tracks with downloadable URLs")
             workspace_logger.info(f"\n   📊 File verification results:")
             workspace_logger.info(f"      • No paths set: {tracks_with_no_paths} (need processing)")
             workspace_logger.info(f"      • Paths set, files EXIST: {tracks_with_verified_files} (skip)")
@@ -9514,7 +9888,7 @@ def import_existing_local_file_to_eagle(
     try:
         # Step 1: Compute fingerprint
         workspace_logger.info("🔍 Computing audio fingerprint...")
-        fingerprint = compute_file_fingerprint(file_path_obj)
+        fingerprint = compute_file_fingerprint(file_path_obj, use_store=True)
         if fingerprint:
             workspace_logger.info(f"✅ Fingerprint computed: {fingerprint[:32]}...")
         else:
@@ -9639,6 +10013,7 @@ def check_existing_local_files_for_eagle_import(track_data: dict) -> Optional[st
     return None
 
 
+@buffer_notion_writes
 def process_track(track_page: Dict[str, Any]) -> bool:
     """
     Process a single track through the complete pipeline:
@@ -10935,6 +11310,7 @@ def is_collaboration(title: str) -> bool:
 # ───────────────────────────────────────────────────────────────
 # Main Download Function (adapted from original)
 # ───────────────────────────────────────────────────────────────
+@buffer_notion_writes
 def download_track(
     url: str,
     playlist_dir: Path,
@@ -11484,6 +11860,12 @@ def download_track(
 
         # ── Analysis: duration, BPM, key ────────────────────────
         workspace_logger.info("🎵 Starting audio analysis...")
+        # PERFORMANCE: decoded once at 44.1 kHz mono; the normalizer reuses this buffer
+        analysis_samples = None
+        analysis_loudness = None
+        precomputed_analysis = None
+        analysis_fingerprint = None
+        analysis_cache_hit = False
         
         # Verify WAV file exists and is valid
         if not wav_path_tmp.exists():
@@ -11501,11 +11883,38 @@ def download_track(
                 try:
                     workspace_logger.info("🔄 Loading audio with librosa...")
                     workspace_logger.info("⏳ This may take a moment for large files...")
-                    y, sr = librosa.load(str(wav_path_tmp), sr=None)
-                    workspace_logger.info(f"✅ Audio loaded: {len(y)} samples, {sr} Hz sample rate")
+                    analysis_cache = _get_analysis_cache()
+                    if analysis_cache is not None:
+                        analysis_fingerprint = compute_file_fingerprint(wav_path_tmp)
+                        precomputed_analysis = analysis_cache.get(analysis_fingerprint)
+                        analysis_cache_hit = precomputed_analysis is not None
+                    analysis_pool = _ANALYSIS_POOL
+                    if analysis_cache_hit:
+                        workspace_logger.info(f"♻️  Analysis cache hit ({analysis_fingerprint[:12]}) - skipping decode")
+                        y, sr = None, None
+                    elif analysis_pool is not None:
+                        # PERFORMANCE: batch modes run decode + features in a worker process
+                        precomputed_analysis = analysis_pool.analyze(wav_path_tmp, max_duration=MAX_TRACK_DURATION_SECONDS)
+                        analysis_samples = precomputed_analysis.samples
+                        y, sr = None, None
+                        for step, error in precomputed_analysis.errors.items():
+                            workspace_logger.warning(f"⚠️  Worker {step} analysis failed: {error}")
+                    elif SHARED_AUDIO_ANALYSIS_AVAILABLE:
+                        decoded = _decode_audio(wav_path_tmp, ANALYSIS_SAMPLE_RATE)
+                        analysis_samples = decoded.samples
+                        # Tempo and key run on one cached 22.05 kHz downsample
+                        y, sr = decoded.feature_samples()
+                    else:
+                        analysis_samples, _ = librosa.load(str(wav_path_tmp), sr=ANALYSIS_SAMPLE_RATE, mono=True)
+                        y, sr = analysis_samples, ANALYSIS_SAMPLE_RATE
+                    if analysis_samples is not None:
+                        workspace_logger.info(f"✅ Audio loaded: {len(analysis_samples)} samples, {ANALYSIS_SAMPLE_RATE} Hz sample rate")
                     
                     # Calculate duration
-                    duration = int(librosa.get_duration(y=y, sr=sr))
+                    if analysis_cache_hit:
+                        duration = int(precomputed_analysis.duration)
+                    else:
+                        duration = int(len(analysis_samples) / ANALYSIS_SAMPLE_RATE)
                     workspace_logger.info(f"⏱️  Duration calculated: {duration} seconds")
 
                     # ═══════════════════════════════════════════════════════════════
@@ -11564,46 +11973,97 @@ def download_track(
                     # Detect BPM with optimized method for long files
                     workspace_logger.info("🎵 Detecting BPM...")
                     workspace_logger.info("⏳ BPM analysis in progress...")
-                    try:
-                        # For long files (>5 minutes), use a sample to speed up BPM detection
-                        if duration > 300:  # 5 minutes
-                            workspace_logger.info(f"📊 Long file detected ({duration}s), using optimized BPM detection...")
-                            # Take a representative sample from the middle of the track
-                            start_sample = len(y) // 4  # Start from 25% into the track
-                            end_sample = start_sample + min(len(y) // 2, sr * 120)  # Max 2 minutes sample
-                            y_sample = y[start_sample:end_sample]
-                            workspace_logger.info(f"📊 Using {len(y_sample)/sr:.1f}s sample for BPM detection")
-                        else:
-                            y_sample = y
-                        
-                        tempo, _ = librosa.beat.beat_track(y=y_sample, sr=sr)
-                        tempo_array = np.atleast_1d(tempo)
-                        bpm = int(round(float(tempo_array[0])))
+                    if precomputed_analysis is not None:
+                        bpm = int(round(precomputed_analysis.bpm)) if precomputed_analysis.bpm else 0
                         workspace_logger.info(f"🎵 BPM detected: {bpm}")
-                    except AttributeError as exc:
-                        if "hann" in str(exc):
-                            workspace_logger.warning("⚠️  BPM detection failed due to scipy version issue, using fallback method")
-                            # Fallback: use onset detection and estimate tempo (with same optimization)
-                            try:
-                                onset_env = librosa.onset.onset_strength(y=y_sample, sr=sr)
-                                tempo = estimate_tempo_from_onset(onset_env, sr)
-                                bpm = int(round(float(tempo[0])))
-                                workspace_logger.info(f"🎵 BPM detected (fallback): {bpm}")
-                            except Exception as fallback_exc:
-                                workspace_logger.warning(f"⚠️  BPM fallback detection also failed: {fallback_exc}")
+                    else:
+                        try:
+                            # For long files (>5 minutes), use a sample to speed up BPM detection
+                            if duration > 300:  # 5 minutes
+                                workspace_logger.info(f"📊 Long file detected ({duration}s), using optimized BPM detection...")
+                                # Take a representative sample from the middle of the track
+                                start_sample = len(y) // 4  # Start from 25% into the track
+                                end_sample = start_sample + min(len(y) // 2, sr * 120)  # Max 2 minutes sample
+                                y_sample = y[start_sample:end_sample]
+                                workspace_logger.info(f"📊 Using {len(y_sample)/sr:.1f}s sample for BPM detection")
+                            else:
+                                y_sample = y
+
+                            tempo, _ = librosa.beat.beat_track(y=y_sample, sr=sr)
+                            tempo_array = np.atleast_1d(tempo)
+                            bpm = int(round(float(tempo_array[0])))
+                            workspace_logger.info(f"🎵 BPM detected: {bpm}")
+                        except AttributeError as exc:
+                            if "hann" in str(exc):
+                                workspace_logger.warning("⚠️  BPM detection failed due to scipy version issue, using fallback method")
+                                # Fallback: use onset detection and estimate tempo (with same optimization)
+                                try:
+                                    onset_env = librosa.onset.onset_strength(y=y_sample, sr=sr)
+                                    tempo = estimate_tempo_from_onset(onset_env, sr)
+                                    bpm = int(round(float(tempo[0])))
+                                    workspace_logger.info(f"🎵 BPM detected (fallback): {bpm}")
+                                except Exception as fallback_exc:
+                                    workspace_logger.warning(f"⚠️  BPM fallback detection also failed: {fallback_exc}")
+                                    bpm = 0
+                            else:
+                                workspace_logger.warning(f"⚠️  BPM detection failed: {exc}")
                                 bpm = 0
-                        else:
-                            workspace_logger.warning(f"⚠️  BPM detection failed: {exc}")
-                            bpm = 0
                     
                     # Detect key
                     workspace_logger.info("🎼 Detecting musical key...")
                     workspace_logger.info("⏳ Key analysis in progress...")
-                    trad_key = detect_key(str(wav_path_tmp), y=y, sr=sr)
+                    if precomputed_analysis is not None:
+                        trad_key = precomputed_analysis.key or "Unknown"
+                    else:
+                        trad_key = detect_key(str(wav_path_tmp), y=y, sr=sr)
                     workspace_logger.info(f"🎼 Key detected: {trad_key}")
                     
+                    # Loudness, true peak and clipping from the same buffer
+                    if precomputed_analysis is not None:
+                        analysis_loudness = precomputed_analysis.loudness
+                    elif SHARED_AUDIO_ANALYSIS_AVAILABLE:
+                        try:
+                            analysis_loudness = _measure_loudness(analysis_samples, ANALYSIS_SAMPLE_RATE)
+                            workspace_logger.info(
+                                f"📊 Loudness: {analysis_loudness['lufs_integrated']:.1f} LUFS, "
+                                f"true peak {analysis_loudness['true_peak_db']:.1f} dBTP, "
+                                f"clipping {analysis_loudness['clipping_percentage']:.3f}%"
+                            )
+                        except Exception as loud_exc:
+                            workspace_logger.warning(f"⚠️  Loudness analysis failed: {loud_exc}")
+                    
                     workspace_logger.info(f"🎵 ANALYSIS RESULTS: duration={duration}s, bpm={bpm}, key={trad_key}")
                     
+                    # Only complete results are cached: a cached fallback (BPM 0,
+                    # "Unknown" key, no loudness) would never be retried for this audio
+                    analysis_complete = (
+                        bool(bpm)
+                        and trad_key != "Unknown"
+                        and analysis_loudness is not None
+                        and not (precomputed_analysis is not None and precomputed_analysis.errors)
+                    )
+                    if analysis_cache is not None and not analysis_cache_hit and not analysis_complete:
+                        workspace_logger.info("♻️  Analysis incomplete - not caching so the next run retries")
+                    elif analysis_cache is not None and not analysis_cache_hit:
+                        try:
+                            if precomputed_analysis is not None:
+                                signature = precomputed_analysis.signature
+                                channels = precomputed_analysis.channels
+                            else:
+                                signature = _spectral_signature(y, sr)
+                                channels = decoded.channels
+                            analysis_cache.put(
+                                analysis_fingerprint,
+                                duration=len(analysis_samples) / ANALYSIS_SAMPLE_RATE,
+                                bpm=float(bpm) if bpm else None,
+                                key=trad_key if trad_key != "Unknown" else None,
+                                loudness=analysis_loudness,
+                                signature=signature,
+                                channels=channels,
+                            )
+                        except Exception as cache_exc:
+                            workspace_logger.warning(f"⚠️  Could not cache analysis: {cache_exc}")
+                    
                     # Update audio processing status
                     if track_info.get("page_id"):
                         update_audio_processing_status(track_info["page_id"], ["Audio Analysis Complete"])
@@ -11631,8 +12091,11 @@ def download_track(
             try:
                 workspace_logger.info("🎛️  Starting Platinum Notes-style audio normalization...")
                 
-                # Load audio using librosa
-                audio_samples, sample_rate = librosa.load(str(wav_path_tmp), sr=44100, mono=True)
+                # Reuse the analysis buffer; decode only if analysis did not get that far
+                if analysis_samples is not None:
+                    audio_samples, sample_rate = analysis_samples, ANALYSIS_SAMPLE_RATE
+                else:
+                    audio_samples, sample_rate = librosa.load(str(wav_path_tmp), sr=ANALYSIS_SAMPLE_RATE, mono=True)
                 
                 # Determine normalization settings based on genre
                 target_lufs = -8.0  # Default club-ready target
@@ -11650,7 +12113,8 @@ def download_track(
                     audio_samples,
                     sample_rate,
                     target_lufs,
-                    warmth_mode
+                    warmth_mode,
+                    initial_analysis=analysis_loudness,
                 )
                 
                 if normalization_report['processing_successful']:
@@ -11724,7 +12188,7 @@ def download_track(
                         'crest_factor': initial_analysis.get('crest_factor'),
                         'clipping_percentage': initial_analysis.get('clipping_percentage'),  # From analyze_audio_loudness
                         'warmth_level': 1.0 if normalization_report['warmth_report']['warmth_applied'] else 0.0,  # Warmth enhancement level
-                        'sample_rate': sample_rate,  # From librosa.load at line 11392
+                        'sample_rate': sample_rate,  # Analysis buffer rate
                         'dynamic_range': (initial_analysis.get('true_peak_db', 0) - initial_analysis.get('lufs_integrated', -14)) if initial_analysis else None,
                     }
                     
@@ -11770,7 +12234,10 @@ def download_track(
                 )
 
         normalized_wav_path = Path(normalized_wav_path)
-        fingerprint = compute_file_fingerprint(normalized_wav_path)
+        if analysis_fingerprint and normalized_wav_path == Path(wav_path_tmp):
+            fingerprint = analysis_fingerprint
+        else:
+            fingerprint = compute_file_fingerprint(normalized_wav_path)
         processing_data["fingerprint"] = fingerprint
         track_info["fingerprint"] = fingerprint
 
@@ -12142,7 +12609,7 @@ def download_track(
                             ]
                         }
                     }
-                    notion_manager._req("patch", f"/pages/{track_info['page_id']}", {"properties": summary_properties})
+                    stage_track_page_update(track_info["page_id"], summary_properties)
                 except Exception as summary_err:
                     workspace_logger.debug(f"Could not update summary: {summary_err}")
                 
@@ -12292,51 +12759,63 @@ def _env(key: str, default: Optional[str] = None) -> str:
     """Get environment variable with default."""
     return os.getenv(key, default) if default is not None else os.getenv(key, "")
 
+def iter_database_paginated(database_id: str, base_query: dict, max_items: Optional[int] = 5000) -> Iterator[dict]:
+    """Yield database rows as each page arrives, prefetching the next page.
+
+    Callers can start on the first row after one round-trip instead of
+    waiting for the whole result set. Errors propagate to the caller.
+    """
+    base = {k: v for k, v in base_query.items() if k not in ("page_size", "start_cursor")}
+    page_size = max(1, min(100, int(base_query.get("page_size") or 100)))
+
+    def fetch_page(cursor: Optional[str], page_size: int) -> dict:
+        query = dict(base, page_size=page_size)
+        if cursor:
+            query["start_cursor"] = cursor
+        return notion_manager.query_database(database_id, query)
+
+    if SHARED_NOTION_PAGINATOR_AVAILABLE:
+        yield from _iter_paginated(fetch_page, max_rows=max_items, page_size=page_size)
+        return
+
+    fetched = 0
+    cursor = None
+    while max_items is None or fetched < max_items:
+        response = fetch_page(cursor, page_size if max_items is None else min(page_size, max_items - fetched))
+        results = response.get("results", [])
+        if not results:
+            break
+        for row in results:
+            yield row
+        fetched += len(results)
+        if not response.get("has_more") or not response.get("next_cursor"):
+            break
+        cursor = response.get("next_cursor")
+
 def query_database_paginated(database_id: str, base_query: dict, max_items: int = 5000, log_progress: bool = True) -> list[dict]:
     """Query database with pagination support."""
     try:
         all_results = []
-        start_cursor = None
-        page_count = 0
         start_time = time.time()
 
         if log_progress:
             workspace_logger.info(f"   📥 Starting paginated query (max {max_items} items)...")
 
-        while len(all_results) < max_items:
-            query = dict(base_query)
-            query["page_size"] = min(100, max_items - len(all_results))
-
-            if start_cursor:
-                query["start_cursor"] = start_cursor
-
-            response = notion_manager.query_database(database_id, query)
-            results = response.get("results", [])
-            page_count += 1
-
-            if not results:
-                break
-
-            all_results.extend(results)
+        for row in iter_database_paginated(database_id, base_query, max_items=max_items):
+            all_results.append(row)
 
             # Log progress every 5 pages (500 items) or on first page
-            if log_progress and (page_count == 1 or page_count % 5 == 0):
+            if log_progress and (len(all_results) == 100 or len(all_results) % 500 == 0):
                 elapsed = time.time() - start_time
                 rate = len(all_results) / elapsed if elapsed > 0 else 0
-                workspace_logger.info(f"   📥 Queried {len(all_results)} tracks ({page_count} pages, {rate:.0f} tracks/sec)...")
-
-            # Check if there are more pages
-            has_more = response.get("has_more", False)
-            if not has_more:
-                break
-
-            start_cursor = response.get("next_cursor")
+                workspace_logger.info(f"   📥 Queried {len(all_results)} tracks ({rate:.0f} tracks/sec)...")
 
         elapsed = time.time() - start_time
+        page_count = (len(all_results) + 99) // 100
         if log_progress:
             workspace_logger.info(f"   ✅ Query complete: {len(all_results)} tracks in {elapsed:.1f}s ({page_count} pages)")
 
-        return all_results[:max_items]
+        return all_results
 
     except Exception as e:
         workspace_logger.error(f"Failed to query database with pagination: {e}")
@@ -12495,8 +12974,9 @@ def select_pages(limit: int, mode: str, sort_by_created: bool = True, sort_ascen
     # Get regular SoundCloud tracks
     reprocess = (mode == "reprocess")
     q = build_eligibility_filter(reprocess=reprocess, sort_by_created=sort_by_created, sort_ascending=sort_ascending)
-    data = notion_manager.query_database(TRACKS_DB_ID, q)
-    results = data.get("results", [])
+    # Fetch only as many rows as can be used (one page when unlimited)
+    remaining = limit - len(spotify_tracks) if limit > 0 else 100
+    results = list(iter_database_paginated(TRACKS_DB_ID, q, max_items=remaining)) if remaining > 0 else []
     
     # Combine Spotify and SoundCloud tracks, prioritizing Spotify tracks
     all_tracks = spotify_tracks + results
@@ -190,6 +190,10 @@ class AudioAnalysis:
     loudness: Optional[float] = None  # LUFS
     energy: Optional[float] = None
     confidence: Optional[float] = None  # Analysis confidence 0-1
+    camelot: Optional[str] = None
+    true_peak_db: Optional[float] = None
+    clipping_percentage: Optional[float] = None
+    fingerprint: Optional[str] = None  # Spectral hash of the decoded buffer
 
 
 @dataclass
@@ -1,18 +1,35 @@
 """
 Audio processing logic for music workflow.
 
-This module provides audio analysis (BPM, key detection), normalization,
-and format conversion capabilities.
+This module provides audio analysis (BPM, key detection, loudness,
+fingerprint), normalization, and format conversion capabilities.
 """
 
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, Optional, Any
 
+import numpy as np
+
 from music_workflow.core.models import AudioAnalysis, TrackInfo
 from music_workflow.utils.errors import ProcessingError
 from music_workflow.utils.validators import validate_audio_file, validate_bpm
-from music_workflow.config.constants import DEFAULT_TARGET_LUFS, LOSSLESS_FORMATS
+from music_workflow.config.constants import DEFAULT_TARGET_LUFS, KEY_NOTATION, LOSSLESS_FORMATS
+
+# Shared single-decode analysis helpers (with graceful fallback)
+try:
+    from shared_core.audio.analysis import (
+        ANALYSIS_SAMPLE_RATE,
+        decode_audio,
+        estimate_bpm,
+        measure_loudness,
+        spectral_hash,
+        spectral_signature,
+    )
+    SHARED_ANALYSIS_AVAILABLE = True
+except ImportError:
+    ANALYSIS_SAMPLE_RATE = 44100
+    SHARED_ANALYSIS_AVAILABLE = False
 
 
 @dataclass
@@ -21,6 +38,8 @@ class ProcessingOptions:
     target_lufs: float = DEFAULT_TARGET_LUFS
     analyze_bpm: bool = True
     analyze_key: bool = True
+    analyze_loudness: bool = True
+    fingerprint: bool = True
     preserve_original: bool = True
     output_format: Optional[str] = None
 
@@ -69,7 +88,13 @@ class AudioProcessor:
         return self._mutagen
 
     def analyze(self, file_path: Path) -> AudioAnalysis:
-        """Analyze audio file for BPM, key, duration.
+        """Analyze audio file for BPM, key, loudness and fingerprint.
+
+        Decoding, the 22.05 kHz feature downsample and tempo estimation use
+        the shared helpers in ``shared_core.audio.analysis`` (the download
+        pipeline's analysis stage), so both produce the same values. The
+        file is decoded once; loudness is measured on that buffer and tempo,
+        key and the spectral fingerprint share a single downsample.
 
         Args:
             file_path: Path to audio file
@@ -84,23 +109,35 @@ class AudioProcessor:
         librosa = self._get_librosa()
 
         try:
-            # Load audio
-            y, sr = librosa.load(str(file_path), sr=None)
-            duration = librosa.get_duration(y=y, sr=sr)
+            if SHARED_ANALYSIS_AVAILABLE:
+                decoded = decode_audio(file_path)
+                y, sr, channels = decoded.samples, decoded.sample_rate, decoded.channels
+                y_feat, feat_sr = decoded.feature_samples()
+            else:
+                # Without shared_core: full-rate buffer, no excerpting
+                y, sr = librosa.load(str(file_path), sr=ANALYSIS_SAMPLE_RATE, mono=False)
+                channels = 1 if y.ndim == 1 else y.shape[0]
+                if channels != 1:
+                    y = librosa.to_mono(y)
+                y_feat, feat_sr = y, sr
+            duration = len(y) / float(sr)
 
-            # Detect BPM
             bpm = None
             if self.options.analyze_bpm:
-                tempo, _ = librosa.beat.beat_track(y=y, sr=sr)
-                bpm = float(tempo)
+                if SHARED_ANALYSIS_AVAILABLE:
+                    bpm = estimate_bpm(y_feat, feat_sr)
+                else:
+                    tempo, _ = librosa.beat.beat_track(y=y_feat, sr=feat_sr)
+                    # librosa >= 0.10 returns the tempo as a 1-element array
+                    bpm = float(np.atleast_1d(tempo)[0])
 
             # Detect key (simplified - use Essentia for better results)
             key = None
             if self.options.analyze_key:
-                key = self._detect_key(y, sr)
+                key = self._detect_key(y_feat, feat_sr)
 
-            # Get audio properties
-            channels = 1 if y.ndim == 1 else y.shape[0]
+            loudness = self._measure_loudness(y, sr) if self.options.analyze_loudness else {}
+            fingerprint = self._fingerprint(y_feat, feat_sr) if self.options.fingerprint else None
 
             return AudioAnalysis(
                 bpm=bpm,
@@ -108,6 +145,11 @@ class AudioProcessor:
                 duration=duration,
                 sample_rate=sr,
                 channels=channels,
+                loudness=loudness.get("lufs_integrated"),
+                camelot=self._to_camelot(key),
+                true_peak_db=loudness.get("true_peak_db"),
+                clipping_percentage=loudness.get("clipping_percentage"),
+                fingerprint=fingerprint,
             )
 
         except Exception as e:
@@ -118,6 +160,37 @@ class AudioProcessor:
                 details={"error": str(e)},
             )
 
+    def _measure_loudness(self, y, sr) -> Dict[str, Any]:
+        """Measure LUFS, true peak and clipping on the decoded buffer.
+
+        Returns:
+            Loudness metrics, or an empty dict if unavailable
+        """
+        if not SHARED_ANALYSIS_AVAILABLE:
+            return {}
+        try:
+            return measure_loudness(y, sr)
+        except Exception:
+            return {}
+
+    def _fingerprint(self, y, sr) -> Optional[str]:
+        """Spectral fingerprint hash of the decoded buffer."""
+        if not SHARED_ANALYSIS_AVAILABLE:
+            return None
+        try:
+            return spectral_hash(spectral_signature(y, sr))
+        except Exception:
+            return None
+
+    @staticmethod
+    def _to_camelot(key: Optional[str]) -> Optional[str]:
+        """Map a detected key ("Am", "Db") to its Camelot code."""
+        if not key:
+            return None
+        if key == "Gbm":
+            key = "F#m"
+        return KEY_NOTATION.get(key)
+
     def _detect_key(self, y, sr) -> Optional[str]:
         """Detect musical key using chroma features.
 
@@ -146,7 +219,6 @@ class AudioProcessor:
             best_key = None
             best_corr = -1
 
-            import numpy as np
             for i, key in enumerate(keys):
                 # Rotate chroma to match key
                 rotated = np.roll(chroma_sum, -i)
@@ -86,6 +86,7 @@ class NotionDeduplicator:
         notion_client=None,
         tracks_db_id: Optional[str] = None,
         similarity_threshold: float = 0.85,
+        mirror=None,
     ):
         """Initialize the deduplicator.
 
@@ -93,10 +94,14 @@ class NotionDeduplicator:
             notion_client: Notion API client instance
             tracks_db_id: ID of the tracks database
             similarity_threshold: Minimum similarity for fuzzy matches
+            mirror: Optional shared_core.notion.mirror.NotionMirror; when set,
+                lookups run against the local mirror (synced incrementally)
+                instead of querying the API
         """
         self.notion_client = notion_client
         self.tracks_db_id = tracks_db_id
         self.similarity_threshold = similarity_threshold
+        self.mirror = mirror
         self._property_types_cache: Optional[Dict[str, str]] = None
         self._property_types_cache_initialized = False
 
@@ -274,16 +279,18 @@ class NotionDeduplicator:
                 logger.debug(f"Fingerprint property '{prop_name}' not found in database schema - skipping fingerprint check")
                 return matches
 
-            results = self.notion_client.databases.query(
-                database_id=self.tracks_db_id,
-                filter={
-                    "property": prop_name,
-                    "rich_text": {"equals": fingerprint},
-                },
-                page_size=10,
-            )
+            pages = self._mirror_lookup(prop_name, fingerprint)
+            if pages is None:
+                pages = self.notion_client.databases.query(
+                    database_id=self.tracks_db_id,
+                    filter={
+                        "property": prop_name,
+                        "rich_text": {"equals": fingerprint},
+                    },
+                    page_size=10,
+                ).get("results", [])
 
-            for page in results.get("results", []):
+            for page in pages:
                 page_id = page.get("id")
                 if exclude_page_id and page_id == exclude_page_id:
                     continue
@@ -413,16 +420,27 @@ class NotionDeduplicator:
                 logger.debug("No URL properties found in database schema - skipping URL check")
                 return matches
 
-            # Query Notion for matching URLs
-            results = self.notion_client.databases.query(
-                database_id=self.tracks_db_id,
-                filter={
-                    "or": url_filter_conditions
-                } if len(url_filter_conditions) > 1 else url_filter_conditions[0],
-                page_size=10,
-            )
-
-            result_count = len(results.get("results", []))
+            # Query the mirror (or Notion) for matching URLs
+            pages = None
+            if self.mirror is not None:
+                found: Dict[str, Dict[str, Any]] = {}
+                for condition in url_filter_conditions:
+                    local = self._mirror_lookup(condition["property"], condition["url"]["equals"])
+                    if local is None:
+                        found = None
+                        break
+                    found.update((page["id"], page) for page in local)
+                pages = list(found.values()) if found is not None else None
+            if pages is None:
+                pages = self.notion_client.databases.query(
+                    database_id=self.tracks_db_id,
+                    filter={
+                        "or": url_filter_conditions
+                    } if len(url_filter_conditions) > 1 else url_filter_conditions[0],
+                    page_size=10,
+                ).get("results", [])
+
+            result_count = len(pages)
             # #region agent log
             try:
                 with open(debug_log_path, 'a') as f:
@@ -431,7 +449,7 @@ class NotionDeduplicator:
                 pass
             # #endregion agent log
 
-            for page in results.get("results", []):
+            for page in pages:
                 page_id = page.get("id")
                 if exclude_page_id and page_id == exclude_page_id:
                     continue
@@ -474,16 +492,18 @@ class NotionDeduplicator:
                 logger.debug("Spotify ID property not found in database schema - skipping Spotify ID check")
                 return matches
 
-            results = self.notion_client.databases.query(
-                database_id=self.tracks_db_id,
-                filter={
-                    "property": "Spotify ID",
-                    "rich_text": {"equals": spotify_id},
-                },
-                page_size=10,
-            )
-
-            for page in results.get("results", []):
+            pages = self._mirror_lookup("Spotify ID", spotify_id)
+            if pages is None:
+                pages = self.notion_client.databases.query(
+                    database_id=self.tracks_db_id,
+                    filter={
+                        "property": "Spotify ID",
+                        "rich_text": {"equals": spotify_id},
+                    },
+                    page_size=10,
+                ).get("results", [])
+
+            for page in pages:
                 page_id = page.get("id")
                 if exclude_page_id and page_id == exclude_page_id:
                     continue
@@ -520,16 +540,18 @@ class NotionDeduplicator:
                 return matches
 
             # Search by title
-            results = self.notion_client.databases.query(
-                database_id=self.tracks_db_id,
-                filter={
-                    "property": "Title",
-                    "title": {"contains": self._normalize_title(title)[:50]},
-                },
-                page_size=20,
-            )
-
-            for page in results.get("results", []):
+            pages = self._mirror_lookup("Title", self._normalize_title(title)[:50], contains=True)
+            if pages is None:
+                pages = self.notion_client.databases.query(
+                    database_id=self.tracks_db_id,
+                    filter={
+                        "property": "Title",
+                        "title": {"contains": self._normalize_title(title)[:50]},
+                    },
+                    page_size=20,
+                ).get("results", [])
+
+            for page in pages:
                 page_id = page.get("id")
                 if exclude_page_id and page_id == exclude_page_id:
                     continue
@@ -564,6 +586,26 @@ class NotionDeduplicator:
 
         return matches
 
+    def _mirror_lookup(self, prop_name: str, value: str, contains: bool = False) -> Optional[List[Dict[str, Any]]]:
+        """Look pages up in the local mirror; None means fall back to the API.
+
+        A miss also returns None: the mirror may be up to its staleness
+        window behind, and a page created meanwhile (webhook server, cron)
+        must still be found before the caller creates a duplicate.
+        """
+        if self.mirror is None or not value:
+            return None
+        try:
+            self.mirror.ensure_fresh(self.tracks_db_id, self.notion_client)
+            if contains:
+                pages = self.mirror.search(self.tracks_db_id, prop_name, value, limit=20)
+            else:
+                pages = self.mirror.find(self.tracks_db_id, prop_name, value, limit=10)
+        except Exception as e:
+            logger.warning(f"Notion mirror lookup failed, querying API instead: {e}")
+            return None
+        return pages or None
+
     def _calculate_page_completeness(self, props: Dict[str, Any]) -> Dict[str, Any]:
         """Calculate how complete a Notion page is (for selecting canonical page)."""
         score = 0.0
@@ -683,6 +725,7 @@ def check_notion_duplicate(
     notion_client=None,
     tracks_db_id: Optional[str] = None,
     exclude_page_id: Optional[str] = None,
+    mirror=None,
 ) -> DeduplicationResult:
     """Convenience function to check for Notion duplicates.
 
@@ -691,6 +734,7 @@ def check_notion_duplicate(
         notion_client: Notion API client
         tracks_db_id: Tracks database ID
         exclude_page_id: Page ID to exclude from results (typically the current track)
+        mirror: Optional NotionMirror for local lookups
 
     Returns:
         DeduplicationResult
@@ -698,6 +742,7 @@ def check_notion_duplicate(
     deduplicator = NotionDeduplicator(
         notion_client=notion_client,
         tracks_db_id=tracks_db_id,
+        mirror=mirror,
     )
     return deduplicator.check_duplicate(track, exclude_page_id=exclude_page_id)
 
@@ -706,6 +751,7 @@ def check_notion_duplicate_for_batch(
     tracks: List[Dict[str, Any]],
     notion_client=None,
     tracks_db_id: Optional[str] = None,
+    mirror=None,
 ) -> Dict[str, Any]:
     """Check a batch of tracks for duplicates in Notion.
 
@@ -716,6 +762,8 @@ def check_notion_duplicate_for_batch(
         tracks: List of Notion track page dictionaries
         notion_client: Notion API client
         tracks_db_id: Tracks database ID
+        mirror: Optional NotionMirror; with a batch, one incremental sync
+            replaces several API queries per track
 
     Returns:
         Dict with:
@@ -727,6 +775,7 @@ def check_notion_duplicate_for_batch(
     deduplicator = NotionDeduplicator(
         notion_client=notion_client,
         tracks_db_id=tracks_db_id,
+        mirror=mirror,
     )
 
     result = {
@@ -6,6 +6,7 @@ and managing audio files as assets. Includes file verification
 to ensure all items have valid, non-corrupt files.
 
 Version: 2026-01-18 - Added file verification support
+Version: 2026-10-16 - Fingerprint/tag lookups served from the persistent item index
 """
 
 import json
@@ -32,6 +33,13 @@ try:
 except ImportError:
     FILE_VERIFICATION_AVAILABLE = False
 
+# Import persistent item index (with graceful fallback)
+try:
+    from shared_core.eagle import get_eagle_item_index
+    ITEM_INDEX_AVAILABLE = True
+except ImportError:
+    ITEM_INDEX_AVAILABLE = False
+
 
 @dataclass
 class EagleItem:
@@ -65,6 +73,10 @@ class EagleClient:
     managing tags and folders.
 
     Includes automatic file verification to ensure items have valid files.
+
+    When the library folder is mounted, fingerprint and tag searches are
+    answered from the shared persistent item index (refreshed incrementally
+    from metadata.json changes) instead of listing the library over HTTP.
     """
 
     DEFAULT_PORT = 41595
@@ -75,6 +87,7 @@ class EagleClient:
         port: int = DEFAULT_PORT,
         library_path: Optional[Path] = None,
         verify_files: bool = True,
+        use_index: bool = True,
     ):
         """Initialize the Eagle client.
 
@@ -82,13 +95,17 @@ class EagleClient:
             port: Eagle API port (default 41595)
             library_path: Optional path to Eagle library
             verify_files: Whether to verify file existence by default
+            use_index: Whether to answer lookups from the persistent item index
         """
         self.port = port
         self.base_url = f"{self.BASE_URL}:{port}"
         settings = get_settings()
         self.library_path = library_path or settings.eagle.library_path
         self.verify_files = verify_files
+        self.use_index = use_index
         self._file_verifier: Optional[Any] = None
+        self._item_index: Optional[Any] = None
+        self._index_stale = True
 
     @property
     def file_verifier(self):
@@ -97,6 +114,34 @@ class EagleClient:
             self._file_verifier = get_eagle_file_verifier(self.library_path)
         return self._file_verifier
 
+    @property
+    def item_index(self):
+        """Get the persistent item index, refreshed if stale (None if unavailable)."""
+        if not (self.use_index and ITEM_INDEX_AVAILABLE and self.library_path):
+            return None
+        if not (Path(self.library_path) / "images").is_dir():
+            return None
+        if self._index_stale:
+            self.refresh_index()
+        return self._item_index
+
+    def refresh_index(self) -> Optional[Dict[str, int]]:
+        """Incrementally refresh the persistent item index from the library folder.
+
+        Returns:
+            Refresh statistics, or None if the index is unavailable
+        """
+        try:
+            if self._item_index is None:
+                self._item_index = get_eagle_item_index()
+            stats = self._item_index.refresh_from_library(self.library_path)
+        except Exception:
+            self.use_index = False
+            self._item_index = None
+            return None
+        self._index_stale = False
+        return stats
+
     def _request(
         self,
         endpoint: str,
@@ -245,6 +290,7 @@ class EagleClient:
             data["folderId"] = folder_id
 
         response = self._request("item/addFromPath", method="POST", data=data)
+        self._index_stale = True
 
         if response.get("status") != "success":
             raise EagleIntegrationError(
@@ -286,6 +332,7 @@ class EagleClient:
             data["folderId"] = folder_id
 
         response = self._request("item/addFromURL", method="POST", data=data)
+        self._index_stale = True
 
         if response.get("status") != "success":
             raise EagleIntegrationError(
@@ -319,6 +366,21 @@ class EagleClient:
         Returns:
             List of matching items with file verification status
         """
+        # Tag-only searches are answered from the persistent index
+        if tags and not (keyword or folder_id or ext):
+            tag_list = tags if isinstance(tags, list) else [tags]
+            index = self.item_index
+            if index is not None:
+                matches = None
+                for tag in tag_list:
+                    found = {item["id"]: item for item in index.get_by_tag(tag)}
+                    matches = found if matches is None else {
+                        item_id: item for item_id, item in matches.items() if item_id in found
+                    }
+                items_data = list(matches.values())[:limit] if limit is not None else list(matches.values())
+                do_verify = verify if verify is not None else self.verify_files
+                return self._build_items(items_data, do_verify, skip_missing)
+
         # Eagle search is done via item/list endpoint with filters
         # Note: Eagle API requires GET with query parameters, not POST
         params = {}
@@ -344,8 +406,17 @@ class EagleClient:
         # Determine whether to verify
         do_verify = verify if verify is not None else self.verify_files
 
+        return self._build_items(response.get("data", []), do_verify, skip_missing)
+
+    def _build_items(
+        self,
+        items_data: List[Dict],
+        do_verify: bool,
+        skip_missing: bool = False,
+    ) -> List[EagleItem]:
+        """Convert raw item dicts to EagleItems, resolving and verifying files."""
         items = []
-        for item_data in response.get("data", []):
+        for item_data in items_data:
             item_id = item_data.get("id", "")
             item_ext = item_data.get("ext", "")
             item_name = item_data.get("name", "")
@@ -597,6 +668,7 @@ class EagleClient:
             method="POST",
             data={"id": item_id, "tags": all_tags}
         )
+        self._index_stale = True
 
         return response.get("status") == "success"
 
@@ -647,6 +719,7 @@ class EagleClient:
             method="POST",
             data={"id": item_id, "tags": all_tags}
         )
+        self._index_stale = True
 
         return response.get("status") == "success"
 
@@ -678,6 +751,10 @@ class EagleClient:
         Returns:
             List of matching Eagle items
         """
+        index = self.item_index
+        if index is not None:
+            return self._build_items(index.get_by_fingerprint(fingerprint), self.verify_files)
+
         fp_tag = f"fingerprint:{fingerprint.lower()}"
         return self.search(tags=[fp_tag])
 
@@ -5,12 +5,47 @@ This module provides a Notion client wrapper specifically for music workflow
 operations, building on the shared_core.notion utilities.
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any
 from notion_client import Client
 
 from music_workflow.utils.errors import NotionIntegrationError
 from music_workflow.config.settings import get_settings
 
+try:
+    from shared_core.notion.paginator import iter_database_rows
+except ImportError:
+    def iter_database_rows(
+        client: Any,
+        database_id: str,
+        query: Optional[Dict[str, Any]] = None,
+        max_rows: Optional[int] = None,
+        page_size: int = 100,
+    ) -> Iterator[Dict[str, Any]]:
+        """Sequential fallback for shared_core's prefetching paginator."""
+        fetched = 0
+        cursor = None
+        while max_rows is None or fetched < max_rows:
+            size = page_size if max_rows is None else min(page_size, max_rows - fetched)
+            request = dict(query or {}, page_size=size)
+            if cursor:
+                request["start_cursor"] = cursor
+            response = client.databases.query(database_id=database_id, **request)
+            for row in response.get("results", [])[:size]:
+                fetched += 1
+                yield row
+            cursor = response.get("next_cursor")
+            if not response.get("has_more") or not cursor:
+                return
+
+
+def _create_client(token: str) -> Client:
+    """Create a Notion client on the shared rate-limited pool when available."""
+    try:
+        from shared_core.notion.rate_limiter import create_notion_client
+        return create_notion_client(token)
+    except ImportError:
+        return Client(auth=token)
+
 
 class NotionClient:
     """Wrapper around Notion API for music workflow operations.
@@ -33,7 +68,7 @@ class NotionClient:
         """Get or create the Notion client (lazy loading)."""
         if self._client is None:
             if self._auth_token:
-                self._client = Client(auth=self._auth_token)
+                self._client = _create_client(self._auth_token)
             else:
                 try:
                     from shared_core.notion import get_notion_client
@@ -46,7 +81,7 @@ class NotionClient:
                             "No Notion token available",
                             details={"hint": "Set NOTION_TOKEN environment variable"}
                         )
-                    self._client = Client(auth=token)
+                    self._client = _create_client(token)
         return self._client
 
     def query_database(
@@ -70,30 +105,46 @@ class NotionClient:
         Raises:
             NotionIntegrationError: If query fails
         """
-        client = self._get_client()
+        return list(self.iter_query_database(database_id, filter=filter, sorts=sorts, page_size=page_size))
 
-        try:
-            query_params = {"database_id": database_id, "page_size": page_size}
-            if filter:
-                query_params["filter"] = filter
-            if sorts:
-                query_params["sorts"] = sorts
+    def iter_query_database(
+        self,
+        database_id: str,
+        filter: Optional[Dict] = None,
+        sorts: Optional[List[Dict]] = None,
+        page_size: int = 100,
+        max_rows: Optional[int] = None,
+    ) -> Iterator[Dict]:
+        """Stream rows of a Notion database query.
 
-            results = []
-            has_more = True
-            start_cursor = None
+        Rows are yielded as each page arrives; the next page is requested
+        while the caller works through the current one.
 
-            while has_more:
-                if start_cursor:
-                    query_params["start_cursor"] = start_cursor
+        Args:
+            database_id: The database ID to query
+            filter: Optional filter dictionary
+            sorts: Optional sort specifications
+            page_size: Number of results per page
+            max_rows: Stop after this many rows
+
+        Yields:
+            Page objects
 
-                response = client.databases.query(**query_params)
-                results.extend(response.get("results", []))
-                has_more = response.get("has_more", False)
-                start_cursor = response.get("next_cursor")
+        Raises:
+            NotionIntegrationError: If a page request fails
+        """
+        client = self._get_client()
 
-            return results
+        query = {}
+        if filter:
+            query["filter"] = filter
+        if sorts:
+            query["sorts"] = sorts
 
+        try:
+            yield from iter_database_rows(
+                client, database_id, query, max_rows=max_rows, page_size=page_size
+            )
         except Exception as e:
             raise NotionIntegrationError(
                 f"Database query failed: {e}",
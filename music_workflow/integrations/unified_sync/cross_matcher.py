@@ -22,43 +22,22 @@ Example usage:
 """
 
 import logging
+import os
 from typing import Optional, Dict, List, Set, Tuple, Any
 from dataclasses import dataclass, field
-from difflib import SequenceMatcher
-from pathlib import Path
 from datetime import datetime
 
-logger = logging.getLogger("unified_sync.cross_matcher")
-
-
-@dataclass
-class PlatformTrackRef:
-    """Reference to a track in a specific platform.
+from .fuzzy_index import FuzzyKeyIndex
+from .track_table import (
+    PlatformTrackRef,
+    PlatformTrackTable,
+    StringPool,
+    TrackKeyIndex,
+    pack_ref,
+    unpack_ref,
+)
 
-    Attributes:
-        platform: Platform name (apple_music, rekordbox, djay_pro, notion)
-        platform_id: Platform-specific identifier
-        title: Track title
-        artist: Artist name
-        album: Album name
-        file_path: Local file path (if applicable)
-        bpm: Beats per minute
-        key: Musical key
-        rating: Star rating (0-5)
-        play_count: Number of plays
-        raw_data: Full platform-specific data
-    """
-    platform: str
-    platform_id: str
-    title: str = ""
-    artist: str = ""
-    album: str = ""
-    file_path: Optional[str] = None
-    bpm: Optional[float] = None
-    key: Optional[str] = None
-    rating: Optional[int] = None
-    play_count: int = 0
-    raw_data: Optional[Dict] = None
+logger = logging.getLogger("unified_sync.cross_matcher")
 
 
 @dataclass
@@ -98,6 +77,10 @@ class UnifiedTrackMatch:
     conflicts: List[Dict] = field(default_factory=list)
 
 
+# Notion properties kept per track for platform-ID matching
+NOTION_CROSS_REF_FIELDS = ("apple_music_id", "rekordbox_id", "djay_pro_id")
+
+
 class CrossPlatformMatcher:
     """Match tracks across Apple Music, Rekordbox, djay Pro, and Notion.
 
@@ -125,7 +108,9 @@ class CrossPlatformMatcher:
         self,
         notion_client,
         music_tracks_db_id: str,
-        fuzzy_threshold: float = 0.85
+        fuzzy_threshold: float = 0.85,
+        mirror=None,
+        keep_raw_data: bool = False,
     ):
         """Initialize the cross-platform matcher.
 
@@ -133,24 +118,37 @@ class CrossPlatformMatcher:
             notion_client: Configured Notion API client
             music_tracks_db_id: Notion database ID for Music Tracks
             fuzzy_threshold: Minimum similarity for fuzzy matches
+            mirror: Optional shared_core.notion.mirror.NotionMirror; Notion
+                tracks are then loaded from the local mirror after an
+                incremental sync instead of a full API scan
+            keep_raw_data: Keep the source track objects of Apple Music,
+                Rekordbox and djay Pro so refs expose them as ``raw_data``.
+                Off by default; Notion cross-reference IDs are always kept
         """
         self.notion = notion_client
         self.db_id = music_tracks_db_id
         self.fuzzy_threshold = fuzzy_threshold
+        self.mirror = mirror
+        self.keep_raw_data = keep_raw_data
 
-        # Platform-specific track caches
-        self._notion_tracks: Dict[str, PlatformTrackRef] = {}
-        self._apple_music_tracks: Dict[str, PlatformTrackRef] = {}
-        self._rekordbox_tracks: Dict[str, PlatformTrackRef] = {}
-        self._djay_pro_tracks: Dict[str, PlatformTrackRef] = {}
+        # Platform-specific track caches: columnar tables over one string
+        # pool, mapping platform id -> PlatformTrackRef (built on access)
+        self._strings = StringPool()
+        self._notion_tracks = PlatformTrackTable("notion", self._strings, NOTION_CROSS_REF_FIELDS)
+        self._apple_music_tracks = PlatformTrackTable("apple_music", self._strings)
+        self._rekordbox_tracks = PlatformTrackTable("rekordbox", self._strings)
+        self._djay_pro_tracks = PlatformTrackTable("djay_pro", self._strings)
 
         # Unified index
         self._unified_tracks: Dict[str, UnifiedTrackMatch] = {}
 
-        # Lookup indexes
-        self._path_index: Dict[str, Set[Tuple[str, str]]] = {}  # path -> set of (platform, id)
-        self._filename_index: Dict[str, Set[Tuple[str, str]]] = {}
-        self._title_artist_index: Dict[str, Set[Tuple[str, str]]] = {}
+        # Lookup indexes: normalized key -> packed (platform, row) refs
+        self._path_index = TrackKeyIndex()
+        self._filename_index = TrackKeyIndex()
+        self._title_artist_index = TrackKeyIndex()
+        # Built from the title/artist keys once per build_unified_index;
+        # dropped whenever keys change
+        self._fuzzy_index: Optional[FuzzyKeyIndex] = None
 
         self._caches_loaded = False
 
@@ -164,7 +162,44 @@ class CrossPlatformMatcher:
             return
 
         logger.info("Loading Notion Music Tracks...")
-        self._notion_tracks.clear()
+        self._reset_platform("notion")
+
+        for page in self._iter_notion_pages():
+            page_id = page["id"]
+            props = page.get("properties", {})
+
+            row = self._notion_tracks.add(
+                page_id,
+                title=self._get_title(props) or "",
+                artist=self._get_rich_text(props, "Artist") or "",
+                album=self._get_rich_text(props, "Album") or "",
+                file_path=self._get_rich_text(props, "File Path"),
+                bpm=self._get_number(props, "Tempo"),
+                key=self._get_rich_text(props, "Key"),
+                rating=int(self._get_number(props, "Rating") or 0),
+                raw=(
+                    self._get_rich_text(props, "Apple Music ID"),
+                    self._get_number(props, "Rekordbox ID"),
+                    self._get_rich_text(props, "djay Pro ID"),
+                ),
+            )
+            self._index_row("notion", row)
+
+        logger.info(f"Loaded {len(self._notion_tracks)} Notion tracks")
+
+    def _iter_notion_pages(self):
+        """Yield Music Tracks pages from the local mirror, or page through the API."""
+        if self.mirror is not None:
+            try:
+                self.mirror.ensure_fresh(self.db_id, self.notion)
+                # Read fully before yielding, so a failure part-way falls back
+                # to the API without yielding any page twice
+                pages = list(self.mirror.iter_pages(self.db_id))
+            except Exception as e:
+                logger.warning(f"Notion mirror unavailable, loading tracks from the API: {e}")
+            else:
+                yield from pages
+                return
 
         has_more = True
         start_cursor = None
@@ -175,36 +210,11 @@ class CrossPlatformMatcher:
                 start_cursor=start_cursor,
                 page_size=100,
             )
-
-            for page in response.get("results", []):
-                page_id = page["id"]
-                props = page.get("properties", {})
-
-                ref = PlatformTrackRef(
-                    platform="notion",
-                    platform_id=page_id,
-                    title=self._get_title(props) or "",
-                    artist=self._get_rich_text(props, "Artist") or "",
-                    album=self._get_rich_text(props, "Album") or "",
-                    file_path=self._get_rich_text(props, "File Path"),
-                    bpm=self._get_number(props, "Tempo"),
-                    key=self._get_rich_text(props, "Key"),
-                    rating=int(self._get_number(props, "Rating") or 0),
-                    raw_data={
-                        "apple_music_id": self._get_rich_text(props, "Apple Music ID"),
-                        "rekordbox_id": self._get_number(props, "Rekordbox ID"),
-                        "djay_pro_id": self._get_rich_text(props, "djay Pro ID"),
-                    }
-                )
-
-                self._notion_tracks[page_id] = ref
-                self._index_track("notion", page_id, ref)
+            yield from response.get("results", [])
 
             has_more = response.get("has_more", False)
             start_cursor = response.get("next_cursor")
 
-        logger.info(f"Loaded {len(self._notion_tracks)} Notion tracks")
-
     def load_apple_music_tracks(
         self,
         tracks: List[Any],
@@ -220,12 +230,11 @@ class CrossPlatformMatcher:
             return
 
         logger.info("Loading Apple Music tracks...")
-        self._apple_music_tracks.clear()
+        self._reset_platform("apple_music")
 
         for track in tracks:
-            ref = PlatformTrackRef(
-                platform="apple_music",
-                platform_id=track.persistent_id,
+            row = self._apple_music_tracks.add(
+                track.persistent_id,
                 title=track.name or "",
                 artist=track.artist or "",
                 album=track.album or "",
@@ -233,11 +242,9 @@ class CrossPlatformMatcher:
                 bpm=float(track.bpm) if track.bpm else None,
                 rating=track.rating // 20 if track.rating else None,  # Convert 0-100 to 0-5
                 play_count=track.played_count,
-                raw_data=track.__dict__,
+                raw=track if self.keep_raw_data else None,
             )
-
-            self._apple_music_tracks[track.persistent_id] = ref
-            self._index_track("apple_music", track.persistent_id, ref)
+            self._index_row("apple_music", row)
 
         logger.info(f"Loaded {len(self._apple_music_tracks)} Apple Music tracks")
 
@@ -256,12 +263,11 @@ class CrossPlatformMatcher:
             return
 
         logger.info("Loading Rekordbox tracks...")
-        self._rekordbox_tracks.clear()
+        self._reset_platform("rekordbox")
 
         for track in tracks:
-            ref = PlatformTrackRef(
-                platform="rekordbox",
-                platform_id=str(track.track_id),
+            row = self._rekordbox_tracks.add(
+                str(track.track_id),
                 title=track.title or "",
                 artist=track.artist or "",
                 album=track.album or "",
@@ -270,11 +276,9 @@ class CrossPlatformMatcher:
                 key=track.key,
                 rating=track.rating,
                 play_count=track.play_count,
-                raw_data=track.__dict__ if hasattr(track, '__dict__') else None,
+                raw=track if self.keep_raw_data else None,
             )
-
-            self._rekordbox_tracks[str(track.track_id)] = ref
-            self._index_track("rekordbox", str(track.track_id), ref)
+            self._index_row("rekordbox", row)
 
         logger.info(f"Loaded {len(self._rekordbox_tracks)} Rekordbox tracks")
 
@@ -293,57 +297,89 @@ class CrossPlatformMatcher:
             return
 
         logger.info("Loading djay Pro tracks...")
-        self._djay_pro_tracks.clear()
+        self._reset_platform("djay_pro")
 
         for track in tracks:
             title_id = getattr(track, 'title_id', None) or getattr(track, 'titleID', '')
-            ref = PlatformTrackRef(
-                platform="djay_pro",
-                platform_id=title_id,
+            row = self._djay_pro_tracks.add(
+                title_id,
                 title=getattr(track, 'title', '') or "",
                 artist=getattr(track, 'artist', '') or "",
                 album=getattr(track, 'album', '') or "",
                 file_path=getattr(track, 'file_path', None) or getattr(track, 'filePath', None),
                 bpm=getattr(track, 'bpm', None),
                 key=getattr(track, 'key', None),
-                raw_data=track.__dict__ if hasattr(track, '__dict__') else None,
+                raw=track if self.keep_raw_data else None,
             )
-
-            self._djay_pro_tracks[title_id] = ref
-            self._index_track("djay_pro", title_id, ref)
+            self._index_row("djay_pro", row)
 
         logger.info(f"Loaded {len(self._djay_pro_tracks)} djay Pro tracks")
 
+    def _reset_platform(self, platform: str):
+        """Empty a platform's cache and drop its entries from the indexes."""
+        cache = self._get_platform_cache(platform)
+        if not cache.row_count:
+            return
+        cache.clear()
+        self._fuzzy_index = None
+        for index in (self._path_index, self._filename_index, self._title_artist_index):
+            index.remove_platform(platform)
+
     def _index_track(self, platform: str, platform_id: str, ref: PlatformTrackRef):
         """Add track to lookup indexes.
 
         Args:
             platform: Platform name
             platform_id: Platform-specific ID
-            ref: Track reference
+            ref: Track reference (added to the platform cache if missing)
         """
-        key = (platform, platform_id)
-
+        cache = self._get_platform_cache(platform)
+        row = cache.row_of(platform_id)
+        if row is None:
+            cache[platform_id] = ref
+            row = cache.row_of(platform_id)
+        self._add_index_keys(pack_ref(platform, row), ref.file_path, ref.title, ref.artist)
+
+    def _index_row(self, platform: str, row: int):
+        """Add a cached row to the lookup indexes."""
+        table = self._get_platform_cache(platform)
+        self._add_index_keys(
+            pack_ref(platform, row),
+            table.text("file_path", row),
+            table.text("title", row),
+            table.text("artist", row),
+        )
+
+    def _add_index_keys(self, packed: int, file_path: Optional[str], title: str, artist: str):
         # Path index
-        if ref.file_path:
-            path_key = ref.file_path.lower()
-            if path_key not in self._path_index:
-                self._path_index[path_key] = set()
-            self._path_index[path_key].add(key)
+        if file_path:
+            self._path_index.add(file_path.lower(), packed)
 
             # Filename index
-            filename = Path(ref.file_path).name.lower()
+            filename = self._make_filename_key(file_path)
             if filename:
-                if filename not in self._filename_index:
-                    self._filename_index[filename] = set()
-                self._filename_index[filename].add(key)
+                self._filename_index.add(filename, packed)
 
         # Title + Artist index
-        if ref.title:
-            ta_key = self._make_title_artist_key(ref.title, ref.artist)
-            if ta_key not in self._title_artist_index:
-                self._title_artist_index[ta_key] = set()
-            self._title_artist_index[ta_key].add(key)
+        if title:
+            self._title_artist_index.add(self._make_title_artist_key(title, artist), packed)
+            self._fuzzy_index = None
+
+    def _resolve_refs(self, packed_refs) -> Set[Tuple[str, str]]:
+        """Turn packed index refs into (platform, platform_id) tuples."""
+        resolved = set()
+        for packed in packed_refs:
+            platform, row = unpack_ref(packed)
+            resolved.add((platform, self._get_platform_cache(platform).platform_id_of(row)))
+        return resolved
+
+    def _make_filename_key(self, file_path: str) -> str:
+        """Create normalized key for filename matching.
+
+        Same result as ``Path(file_path).name.lower()`` without building a
+        Path, which dominated index build time.
+        """
+        return os.path.basename(file_path.rstrip("/")).lower()
 
     def _make_title_artist_key(self, title: str, artist: str) -> str:
         """Create normalized key for title/artist matching."""
@@ -362,6 +398,7 @@ class CrossPlatformMatcher:
         """
         logger.info("Building unified track index...")
         self._unified_tracks.clear()
+        self._fuzzy_index = FuzzyKeyIndex(self._title_artist_index.keys())
 
         processed_refs: Set[Tuple[str, str]] = set()
         match_id = 0
@@ -419,29 +456,24 @@ class CrossPlatformMatcher:
         # Match by file path
         if ref.file_path:
             path_key = ref.file_path.lower()
-            if path_key in self._path_index:
-                matches.update(self._path_index[path_key])
+            matches.update(self._resolve_refs(self._path_index.refs(path_key)))
 
             # Also try filename only
-            filename = Path(ref.file_path).name.lower()
-            if filename in self._filename_index:
-                matches.update(self._filename_index[filename])
+            filename = self._make_filename_key(ref.file_path)
+            matches.update(self._resolve_refs(self._filename_index.refs(filename)))
 
         # Match by title + artist (fuzzy)
         if ref.title:
             ta_key = self._make_title_artist_key(ref.title, ref.artist)
 
             # Exact match first
-            if ta_key in self._title_artist_index:
-                matches.update(self._title_artist_index[ta_key])
+            matches.update(self._resolve_refs(self._title_artist_index.refs(ta_key)))
 
-            # Fuzzy match
-            for key, refs in self._title_artist_index.items():
-                if abs(len(ta_key) - len(key)) > max(len(ta_key), len(key)) * 0.5:
-                    continue
-                score = SequenceMatcher(None, ta_key, key).ratio()
-                if score >= self.fuzzy_threshold:
-                    matches.update(refs)
+            # Fuzzy match, over blocked candidates only
+            if self._fuzzy_index is None:
+                self._fuzzy_index = FuzzyKeyIndex(self._title_artist_index.keys())
+            for key in self._fuzzy_index.matches(ta_key, self.fuzzy_threshold):
+                matches.update(self._resolve_refs(self._title_artist_index.refs(key)))
 
         # Match by platform-specific IDs (from Notion cross-references)
         if ref.platform == "notion" and ref.raw_data:
@@ -508,7 +540,7 @@ class CrossPlatformMatcher:
 
         return unified
 
-    def _get_platform_cache(self, platform: str) -> Optional[Dict]:
+    def _get_platform_cache(self, platform: str) -> Optional[PlatformTrackTable]:
         """Get cache for a specific platform."""
         return {
             "notion": self._notion_tracks,
@@ -0,0 +1,176 @@
+"""Candidate-blocked fuzzy lookup over title/artist keys.
+
+``CrossPlatformMatcher`` compared every track's title/artist key with every
+key in the index through ``SequenceMatcher.ratio()``, which made
+``build_unified_index`` quadratic in library size. ``FuzzyKeyIndex`` accepts
+exactly the keys that scan accepted, but scores only a small candidate set:
+
+1. Length band: ``ratio <= 2 * min(la, lb) / (la + lb)``, so only keys whose
+   length can reach the threshold are considered.
+2. Bigram filter: SequenceMatcher's matching blocks are in-order
+   common substrings and adjacent blocks are merged, so ``B`` blocks need
+   at least ``B - 1`` unmatched characters between them. With ``M`` matched
+   characters and ``S = la + lb`` the strings share at least
+   ``M - B >= 3M - S - 1`` bigrams (counted with multiplicity). A match
+   (``M >= t * S / 2``) therefore shares at least ``T = (1.5t - 1) * S - 1``
+   bigrams. With rapidfuzz, a match must then appear in one of the query's
+   ``n - T + 1`` shortest posting lists (prefix filter). Without it, shared
+   counts over all of the query's lists are tallied by ``Counter.update``
+   and compared per key length (count filter).
+3. Verification: rapidfuzz's ``fuzz.ratio`` (``2 * LCS / S``, never below
+   SequenceMatcher's ratio) scores all candidates in one ``process.extract``
+   call, or ``quick_ratio`` rejects cheaply; ``SequenceMatcher.ratio()``
+   then decides as before.
+
+At thresholds of 2/3 or less the bigram bound is empty and a lookup scans
+the length band only.
+
+Example usage:
+    index = FuzzyKeyIndex(["night drive|ana", "night drive (edit)|ana"])
+    index.matches("night drive|ana", 0.85)
+"""
+
+import bisect
+import math
+from array import array
+from collections import Counter
+from difflib import SequenceMatcher
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+try:
+    from rapidfuzz import fuzz, process
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+# Keeps the float bounds conservative; an extra candidate is only extra work
+_EPSILON = 1e-9
+
+
+def _bigram_tokens(text: str) -> List[str]:
+    """Bigrams of ``text``, repeated ones numbered so the list is a set."""
+    seen: Dict[str, int] = {}
+    tokens = []
+    for i in range(len(text) - 1):
+        gram = text[i:i + 2]
+        count = seen.get(gram, 0)
+        seen[gram] = count + 1
+        tokens.append(gram if count == 0 else f"{gram}{count}")
+    return tokens
+
+
+def length_band(length: int, threshold: float) -> Tuple[int, float]:
+    """Lengths a key can have and still reach ``threshold`` against ``length``.
+
+    Also applies the matcher's own gate, which skips pairs whose lengths
+    differ by more than half the longer one.
+    """
+    low = max(math.ceil(length / 2 - _EPSILON), 0)
+    high: float = 2 * length
+    if threshold > 0:
+        low = max(low, math.ceil(threshold * length / (2 - threshold) - _EPSILON))
+        high = min(high, (2 - threshold) * length / threshold + _EPSILON)
+    return low, high
+
+
+def min_shared_bigrams(total_length: int, threshold: float) -> int:
+    """Bigrams two strings of combined ``total_length`` share at ``threshold``."""
+    return math.ceil((1.5 * threshold - 1) * total_length - 1 - _EPSILON)
+
+
+class FuzzyKeyIndex:
+    """Bigram inverted index over a fixed set of keys."""
+
+    def __init__(self, keys: Iterable[str]):
+        self._keys: List[str] = list(keys)
+        self._lengths = array("i", (len(key) for key in self._keys))
+        self._postings: Dict[str, array] = {}
+        for key_id, key in enumerate(self._keys):
+            for token in _bigram_tokens(key):
+                posting = self._postings.get(token)
+                if posting is None:
+                    posting = self._postings[token] = array("i")
+                posting.append(key_id)
+
+        # Key ids ordered by length, for scanning a length band
+        self._by_length = array("i", sorted(range(len(self._keys)), key=self._lengths.__getitem__))
+        self._sorted_lengths = array("i", (self._lengths[key_id] for key_id in self._by_length))
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def matches(self, query: str, threshold: float) -> List[str]:
+        """Keys whose ``SequenceMatcher(None, query, key).ratio()`` reaches
+        ``threshold`` (and that pass the matcher's length gate).
+        """
+        query_length = len(query)
+        low, high = length_band(query_length, threshold)
+        if high < low:
+            return []
+
+        required = min_shared_bigrams(query_length + low, threshold)
+        if required <= 0:
+            start = bisect.bisect_left(self._sorted_lengths, low)
+            stop = bisect.bisect_right(self._sorted_lengths, int(high))
+            candidates = sorted(self._by_length[start:stop])
+        else:
+            tokens = _bigram_tokens(query)
+            if required > len(tokens):
+                return []
+            postings = sorted((self._postings.get(token, ()) for token in tokens), key=len)
+            if RAPIDFUZZ_AVAILABLE:
+                # Prefix filter: a key sharing ``required`` bigrams is in one
+                # of the ``n - required + 1`` shortest lists. Scoring the
+                # union in C is cheaper than counting it in Python
+                candidates = sorted(set().union(*postings[:len(postings) - required + 1]))
+            else:
+                candidates = self._count_filter(postings, query_length, low, high, threshold)
+
+        if RAPIDFUZZ_AVAILABLE and threshold > 0:
+            candidates = self._rapidfuzz_filter(query, candidates, threshold)
+        keys = self._keys
+        return [keys[key_id] for key_id in candidates if self._is_match(query, keys[key_id], threshold)]
+
+    def _count_filter(
+        self,
+        postings: List[Sequence[int]],
+        query_length: int,
+        low: int,
+        high: float,
+        threshold: float,
+    ) -> List[int]:
+        """Key ids in the length band sharing enough bigrams with the query."""
+        shared: Counter = Counter()
+        for posting in postings:
+            shared.update(posting)
+        needed = {
+            length: min_shared_bigrams(query_length + length, threshold)
+            for length in range(low, int(high) + 1)
+        }
+        lengths = self._lengths
+        no_match = len(postings) + 1
+        return sorted(
+            key_id for key_id, count in shared.items()
+            if count >= needed.get(lengths[key_id], no_match)
+        )
+
+    def _rapidfuzz_filter(self, query: str, candidates: List[int], threshold: float) -> List[int]:
+        """Candidates whose rapidfuzz ratio (an upper bound) reaches ``threshold``."""
+        if not candidates:
+            return []
+        scored = process.extract(
+            query,
+            list(map(self._keys.__getitem__, candidates)),
+            scorer=fuzz.ratio,
+            score_cutoff=threshold * 100 - _EPSILON,
+            limit=None,
+        )
+        return sorted(candidates[index] for _, _, index in scored)
+
+    @staticmethod
+    def _is_match(query: str, key: str, threshold: float) -> bool:
+        query_length, key_length = len(query), len(key)
+        if abs(query_length - key_length) > max(query_length, key_length) * 0.5:
+            return False
+        matcher = SequenceMatcher(None, query, key)
+        return matcher.quick_ratio() >= threshold and matcher.ratio() >= threshold
@@ -184,7 +184,8 @@ class UnifiedLibrarySync:
         apple_music_reader=None,
         rekordbox_reader=None,
         djay_pro_reader=None,
-        conflict_resolution: ConflictResolution = ConflictResolution.AUTHORITY
+        conflict_resolution: ConflictResolution = ConflictResolution.AUTHORITY,
+        notion_mirror=None,
     ):
         """Initialize the sync orchestrator.
 
@@ -195,6 +196,7 @@ class UnifiedLibrarySync:
             rekordbox_reader: RekordboxDbReader instance
             djay_pro_reader: DjayProDbReader instance
             conflict_resolution: How to handle conflicts
+            notion_mirror: Optional NotionMirror used to load Notion tracks
         """
         self.notion = notion_client
         self.db_id = music_tracks_db_id
@@ -204,7 +206,7 @@ class UnifiedLibrarySync:
         self.conflict_resolution = conflict_resolution
 
         # Cross-platform matcher
-        self.matcher = CrossPlatformMatcher(notion_client, music_tracks_db_id)
+        self.matcher = CrossPlatformMatcher(notion_client, music_tracks_db_id, mirror=notion_mirror)
 
         # Cached libraries
         self._apple_music_library = None
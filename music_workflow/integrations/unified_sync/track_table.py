@@ -0,0 +1,302 @@
+"""Compact track storage for cross-platform matching.
+
+``CrossPlatformMatcher`` holds every track of every platform plus three
+lookup indexes; with four 30k-track libraries that is 120k+ tracks.
+Storing each as a dataclass with its own attribute dict, its own copies of
+strings that repeat across platforms and a reference to the full source
+object costs far more memory than the matching needs.
+
+Components:
+- ``StringPool``: one shared copy of each distinct string
+- ``PlatformTrackTable``: one platform's tracks as columns (pooled string
+  references; typed ``array`` columns for BPM, rating and play count). It
+  is a mapping of platform id -> ``PlatformTrackRef``; refs are built on
+  access, not stored
+- ``TrackKeyIndex``: normalized key -> packed (platform, row) references,
+  a bare int for the common one-track case
+
+Example usage:
+    pool = StringPool()
+    table = PlatformTrackTable("rekordbox", pool)
+    row = table.add("42", title="Track", artist="Artist", bpm=128.0)
+
+    index = TrackKeyIndex()
+    index.add("track|artist", pack_ref("rekordbox", row))
+    for platform, row in map(unpack_ref, index.refs("track|artist")):
+        print(platform, table.ref(row))
+"""
+
+import math
+from array import array
+from collections.abc import MutableMapping
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, KeysView, List, Optional, Sequence, Tuple, Union
+
+PLATFORMS = ("notion", "apple_music", "rekordbox", "djay_pro")
+_PLATFORM_CODES = {name: code for code, name in enumerate(PLATFORMS)}
+_ROW_BITS = 32
+_ROW_MASK = (1 << _ROW_BITS) - 1
+
+_TEXT_COLUMNS = ("title", "artist", "album", "file_path", "key")
+
+
+@dataclass
+class PlatformTrackRef:
+    """Reference to a track in a specific platform.
+
+    Attributes:
+        platform: Platform name (apple_music, rekordbox, djay_pro, notion)
+        platform_id: Platform-specific identifier
+        title: Track title
+        artist: Artist name
+        album: Album name
+        file_path: Local file path (if applicable)
+        bpm: Beats per minute
+        key: Musical key
+        rating: Star rating (0-5)
+        play_count: Number of plays
+        raw_data: Full platform-specific data
+    """
+    platform: str
+    platform_id: str
+    title: str = ""
+    artist: str = ""
+    album: str = ""
+    file_path: Optional[str] = None
+    bpm: Optional[float] = None
+    key: Optional[str] = None
+    rating: Optional[int] = None
+    play_count: int = 0
+    raw_data: Optional[Dict] = None
+
+
+def pack_ref(platform: str, row: int) -> int:
+    """Pack a (platform, row) reference into one int."""
+    return (_PLATFORM_CODES[platform] << _ROW_BITS) | row
+
+
+def unpack_ref(packed: int) -> Tuple[str, int]:
+    """Inverse of ``pack_ref``."""
+    return PLATFORMS[packed >> _ROW_BITS], packed & _ROW_MASK
+
+
+class StringPool:
+    """One shared copy of each distinct string.
+
+    Like ``sys.intern`` but owned by the matcher, so the strings are freed
+    with it.
+    """
+
+    def __init__(self):
+        self._strings: Dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+    def intern(self, value: Optional[str]) -> Optional[str]:
+        """Return the pooled copy of ``value``, adding it if new."""
+        if value is None:
+            return None
+        return self._strings.setdefault(value, value)
+
+
+class PlatformTrackTable(MutableMapping):
+    """One platform's tracks in typed columns, keyed by platform id.
+
+    Iteration order is insertion order, like the dict it replaces.
+    """
+
+    def __init__(self, platform: str, pool: StringPool, raw_fields: Sequence[str] = ()):
+        """Initialize an empty table.
+
+        Args:
+            platform: Platform name (one of PLATFORMS)
+            pool: String pool shared by all tables
+            raw_fields: Field names of per-track raw values stored as tuples;
+                ``raw_data`` is rebuilt as a dict of these on access
+        """
+        self.platform = platform
+        self.pool = pool
+        self.raw_fields = tuple(raw_fields)
+        self._init_columns()
+
+    def _init_columns(self) -> None:
+        self._rows: Dict[str, int] = {}
+        # Text columns hold pooled strings; 8 bytes per cell, like an id
+        self._ids: List[str] = []
+        self._text: Dict[str, List[Optional[str]]] = {name: [] for name in _TEXT_COLUMNS}
+        self._bpm = array("d")
+        self._rating = array("h")
+        self._play_count = array("q")
+        # Per row: tuple of raw_fields values, a source object, a dict, or None
+        self._raw: List[Any] = []
+
+    def add(
+        self,
+        platform_id: str,
+        title: str = "",
+        artist: str = "",
+        album: str = "",
+        file_path: Optional[str] = None,
+        bpm: Optional[float] = None,
+        key: Optional[str] = None,
+        rating: Optional[int] = None,
+        play_count: int = 0,
+        raw: Any = None,
+    ) -> int:
+        """Add or replace a track. Returns its row.
+
+        ``raw`` is a tuple of ``raw_fields`` values, a source object (whose
+        ``__dict__`` becomes ``raw_data``) or a dict.
+        """
+        intern = self.pool.intern
+        values = (intern(title), intern(artist), intern(album), intern(file_path), intern(key))
+        bpm = math.nan if bpm is None else float(bpm)
+        rating = -1 if rating is None else int(rating)
+        if isinstance(raw, tuple):
+            raw = tuple(intern(value) if isinstance(value, str) else value for value in raw)
+
+        row = self._rows.get(platform_id)
+        if row is None:
+            row = len(self._ids)
+            platform_id = intern(platform_id)
+            self._rows[platform_id] = row
+            self._ids.append(platform_id)
+            for name, value in zip(_TEXT_COLUMNS, values):
+                self._text[name].append(value)
+            self._bpm.append(bpm)
+            self._rating.append(rating)
+            self._play_count.append(play_count or 0)
+            self._raw.append(raw)
+        else:
+            for name, value in zip(_TEXT_COLUMNS, values):
+                self._text[name][row] = value
+            self._bpm[row] = bpm
+            self._rating[row] = rating
+            self._play_count[row] = play_count or 0
+            self._raw[row] = raw
+        return row
+
+    @property
+    def row_count(self) -> int:
+        """Rows allocated, including those of deleted ids."""
+        return len(self._ids)
+
+    # Column access without building a ref
+
+    def row_of(self, platform_id: str) -> Optional[int]:
+        return self._rows.get(platform_id)
+
+    def platform_id_of(self, row: int) -> str:
+        return self._ids[row]
+
+    def text(self, name: str, row: int) -> Optional[str]:
+        """Value of a text column (title, artist, album, file_path, key)."""
+        return self._text[name][row]
+
+    def ref(self, row: int) -> PlatformTrackRef:
+        """Build the ``PlatformTrackRef`` for a row."""
+        text = self._text
+        bpm = self._bpm[row]
+        rating = self._rating[row]
+        return PlatformTrackRef(
+            platform=self.platform,
+            platform_id=self._ids[row],
+            title=text["title"][row],
+            artist=text["artist"][row],
+            album=text["album"][row],
+            file_path=text["file_path"][row],
+            bpm=None if math.isnan(bpm) else bpm,
+            key=text["key"][row],
+            rating=None if rating < 0 else rating,
+            play_count=self._play_count[row],
+            raw_data=self._raw_data(row),
+        )
+
+    def _raw_data(self, row: int) -> Optional[Dict]:
+        raw = self._raw[row]
+        if raw is None or isinstance(raw, dict):
+            return raw
+        if isinstance(raw, tuple) and self.raw_fields:
+            return dict(zip(self.raw_fields, raw))
+        return getattr(raw, "__dict__", None)
+
+    # Mapping protocol (platform id -> PlatformTrackRef)
+
+    def __getitem__(self, platform_id: str) -> PlatformTrackRef:
+        return self.ref(self._rows[platform_id])
+
+    def __setitem__(self, platform_id: str, ref: PlatformTrackRef) -> None:
+        self.add(
+            platform_id,
+            title=ref.title,
+            artist=ref.artist,
+            album=ref.album,
+            file_path=ref.file_path,
+            bpm=ref.bpm,
+            key=ref.key,
+            rating=ref.rating,
+            play_count=ref.play_count,
+            raw=ref.raw_data,
+        )
+
+    def __delitem__(self, platform_id: str) -> None:
+        # The row's column slots stay allocated; only the id lookup goes
+        del self._rows[platform_id]
+
+    def __contains__(self, platform_id: object) -> bool:
+        return platform_id in self._rows
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._rows)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def clear(self) -> None:
+        self._init_columns()
+
+
+class TrackKeyIndex:
+    """Normalized key -> packed (platform, row) track references."""
+
+    def __init__(self):
+        # A bare int for one track (the common case), a tuple for several;
+        # a key rarely holds more than one track per platform
+        self._entries: Dict[str, Union[int, Tuple[int, ...]]] = {}
+
+    def add(self, key: str, packed: int) -> None:
+        current = self._entries.get(key)
+        if current is None:
+            self._entries[key] = packed
+        elif isinstance(current, int):
+            if current != packed:
+                self._entries[key] = (current, packed)
+        elif packed not in current:
+            self._entries[key] = current + (packed,)
+
+    def refs(self, key: str) -> Sequence[int]:
+        """Packed references stored under ``key`` (empty if none)."""
+        current = self._entries.get(key)
+        if current is None:
+            return ()
+        return (current,) if isinstance(current, int) else current
+
+    def remove_platform(self, platform: str) -> None:
+        """Drop every reference to ``platform`` (before reloading it)."""
+        code = _PLATFORM_CODES[platform]
+        for key in list(self._entries):
+            kept = tuple(packed for packed in self.refs(key) if packed >> _ROW_BITS != code)
+            if not kept:
+                del self._entries[key]
+            else:
+                self._entries[key] = kept[0] if len(kept) == 1 else kept
+
+    def keys(self) -> KeysView[str]:
+        return self._entries.keys()
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
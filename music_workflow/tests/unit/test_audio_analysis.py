@@ -0,0 +1,226 @@
+"""
+Unit tests for the single-decode audio analysis stage.
+"""
+
+import numpy as np
+import pytest
+from unittest.mock import patch
+
+import sys
+sys.path.insert(0, '.')
+
+sf = pytest.importorskip("soundfile")
+pytest.importorskip("librosa")
+
+from shared_core.audio import decode_audio, estimate_bpm, measure_loudness
+from music_workflow.core.processor import AudioProcessor
+
+
+def _click_track(sr, seconds, bpm=120.0, channels=2):
+    """Sine bed with a click on every beat."""
+    t = np.arange(int(sr * seconds)) / sr
+    y = 0.2 * np.sin(2 * np.pi * 220.0 * t)
+    period = int(sr * 60.0 / bpm)
+    for start in range(0, len(y), period):
+        y[start:start + 200] += 0.6
+    return np.stack([y] * channels, axis=1).astype(np.float32)
+
+
+@pytest.fixture(scope="module")
+def wav_file(tmp_path_factory):
+    path = tmp_path_factory.mktemp("audio") / "click.wav"
+    sf.write(str(path), _click_track(48000, 12), 48000)
+    return path
+
+
+class TestDecodeAudio:
+    """Test the shared decode."""
+
+    def test_decodes_to_mono_float32_at_target_rate(self, wav_file):
+        decoded = decode_audio(wav_file)
+
+        assert decoded.samples.dtype == np.float32
+        assert decoded.samples.ndim == 1
+        assert decoded.sample_rate == 44100
+        assert decoded.channels == 2
+        assert decoded.duration == pytest.approx(12.0, abs=0.01)
+
+    def test_feature_buffer_is_resampled_once(self, wav_file):
+        decoded = decode_audio(wav_file)
+
+        first = decoded.feature_samples()
+        second = decoded.feature_samples()
+
+        assert first[1] == 22050
+        assert first[0] is second[0]
+
+
+class TestMeasurements:
+    """Test measurements computed from the decoded buffer."""
+
+    def test_bpm(self, wav_file):
+        y, sr = decode_audio(wav_file).feature_samples()
+        assert estimate_bpm(y, sr) == pytest.approx(120.0, rel=0.05)
+
+    def test_loudness_reports_clipping_and_true_peak(self):
+        sr = 44100
+        y = np.clip(1.5 * np.sin(2 * np.pi * 100.0 * np.arange(sr * 2) / sr), -1, 1).astype(np.float32)
+
+        loudness = measure_loudness(y, sr)
+
+        assert loudness["clipping_percentage"] > 10
+        assert loudness["true_peak_db"] >= 20 * np.log10(loudness["peak"]) - 1e-6
+        assert -30 < loudness["lufs_integrated"] < 0
+
+
+class TestAudioProcessorSingleDecode:
+    """Test AudioProcessor.analyze on a real file."""
+
+    def test_analyze_decodes_once(self, wav_file):
+        processor = AudioProcessor()
+        librosa = processor._get_librosa()
+
+        with patch("music_workflow.core.processor.decode_audio", wraps=decode_audio) as decode, \
+             patch.object(librosa, "resample", wraps=librosa.resample) as resample:
+            with patch("music_workflow.core.processor.validate_audio_file"):
+                result = processor.analyze(wav_file)
+
+        assert decode.call_count == 1
+        # 48 kHz -> 44.1 kHz on decode, then one 22.05 kHz feature downsample
+        assert resample.call_count == 2
+        # Same tempo as the download pipeline's shared analysis
+        assert result.bpm == estimate_bpm(*decode_audio(wav_file).feature_samples())
+        assert result.sample_rate == 44100
+        assert result.channels == 2
+        assert result.bpm == pytest.approx(120.0, rel=0.05)
+        assert result.loudness is not None
+        assert result.true_peak_db is not None
+        assert result.clipping_percentage is not None
+        assert len(result.fingerprint) == 64
+
+
+@pytest.fixture(scope="module")
+def pool():
+    from shared_core.audio import AnalysisWorkerPool
+    with AnalysisWorkerPool(max_workers=2) as pool:
+        yield pool
+
+
+class TestAnalysisWorkerPool:
+    """Test the process-pool analysis tier."""
+
+    def test_results_match_in_process_analysis(self, pool, wav_file):
+        decoded = decode_audio(wav_file)
+        y, sr = decoded.feature_samples()
+
+        result = pool.analyze(wav_file)
+
+        assert result.errors == {}
+        np.testing.assert_array_equal(result.samples, decoded.samples)
+        assert result.channels == 2
+        assert result.bpm == pytest.approx(estimate_bpm(y, sr))
+        assert result.loudness["lufs_integrated"] == pytest.approx(
+            measure_loudness(decoded.samples, decoded.sample_rate)["lufs_integrated"]
+        )
+
+    def test_max_duration_skips_features(self, pool, wav_file):
+        result = pool.analyze(wav_file, max_duration=5)
+
+        assert result.duration == pytest.approx(12.0, abs=0.01)
+        assert result.bpm is None
+        assert result.loudness is None
+        assert len(result.samples) == 12 * 44100
+
+
+class TestAnalysisCache:
+    """Test the content-addressed analysis cache."""
+
+    def test_round_trip(self, tmp_path):
+        from shared_core.audio import AnalysisCache
+        cache = AnalysisCache(tmp_path / "cache.sqlite3")
+        loudness = {"lufs_integrated": -9.5, "true_peak_db": -0.4}
+
+        cache.put("ABC", duration=181.2, bpm=126.0, key="A Minor", loudness=loudness, signature=b"\x01\x02", channels=2)
+        entry = cache.get("abc")
+
+        assert entry.bpm == 126.0
+        assert entry.key == "A Minor"
+        assert entry.lufs == -9.5
+        assert entry.loudness == loudness
+        assert entry.signature == b"\x01\x02"
+        assert cache.get_stats()["hits"] == 1
+        cache.close()
+
+    def test_version_change_misses(self, tmp_path):
+        from shared_core.audio import AnalysisCache
+        path = tmp_path / "cache.sqlite3"
+        old = AnalysisCache(path, version="old")
+        old.put("abc", duration=1.0, bpm=100.0)
+        old.close()
+
+        cache = AnalysisCache(path, version="new")
+        assert cache.get("abc") is None
+        cache.close()
+
+    def test_lru_eviction(self, tmp_path):
+        from shared_core.audio import AnalysisCache
+        cache = AnalysisCache(tmp_path / "cache.sqlite3", max_entries=2)
+
+        cache.put("a", duration=1.0)
+        cache.put("b", duration=1.0)
+        cache.get("a")
+        cache.put("c", duration=1.0)
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+        cache.close()
+
+
+class TestFileFingerprintService:
+    """Test stat-cached parallel file fingerprinting."""
+
+    @pytest.fixture
+    def files(self, tmp_path):
+        paths = []
+        for i in range(6):
+            path = tmp_path / f"track_{i}.wav"
+            path.write_bytes(bytes([i]) * (100_000 + i))
+            paths.append(path)
+        return paths
+
+    def test_hash_matches_hashlib(self, files):
+        import hashlib
+        from shared_core.audio import sha256_file
+
+        assert sha256_file(files[0], buffer_size=4096) == hashlib.sha256(files[0].read_bytes()).hexdigest()
+
+    def test_iterator_yields_every_path(self, tmp_path, files):
+        from shared_core.audio import FileFingerprintService, FingerprintStore
+        service = FileFingerprintService(FingerprintStore(tmp_path / "hashes.sqlite3"), workers=2)
+
+        results = list(service.iter_fingerprints(files + [tmp_path / "missing.wav"], batch_size=4))
+
+        assert sorted(r.path for r in results) == sorted(str(p) for p in files + [tmp_path / "missing.wav"])
+        assert sum(1 for r in results if r.error) == 1
+        assert len({r.fingerprint for r in results if r.fingerprint}) == len(files)
+
+    def test_unchanged_files_are_not_rehashed(self, tmp_path, files):
+        import os
+        from shared_core.audio import FileFingerprintService, FingerprintStore
+        from shared_core.audio.fingerprint_service import sha256_file
+        store_path = tmp_path / "hashes.sqlite3"
+        first = FileFingerprintService(FingerprintStore(store_path), workers=2)
+        before = first.fingerprint_many(files)
+        first.store.close()
+
+        service = FileFingerprintService(FingerprintStore(store_path), workers=2)
+        stat = files[0].stat()
+        os.utime(files[0], ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        with patch("shared_core.audio.fingerprint_service.sha256_file", wraps=sha256_file) as hashed:
+            after = service.fingerprint_many(files)
+
+        assert after == before
+        assert hashed.call_count == 1
+        assert service.stats["cached"] == len(files) - 1
+        service.store.close()
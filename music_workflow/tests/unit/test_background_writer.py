@@ -0,0 +1,62 @@
+"""
+Unit tests for the batched background side-effect writer.
+"""
+
+import csv
+import threading
+
+import sys
+sys.path.insert(0, '.')
+
+from shared_core.background_writer import BackgroundWriter
+
+
+class TestBackgroundWriter:
+    """Test CSV batching, calls, error isolation and backpressure."""
+
+    def test_csv_rows_written_with_single_header(self, tmp_path):
+        path = str(tmp_path / "logs" / "events.csv")
+        writer = BackgroundWriter()
+
+        for n in range(5):
+            writer.append_csv(path, ["n", "event"], {"n": n, "event": "page.updated"})
+        assert writer.flush()
+        writer.append_csv(path, ["n", "event"], {"n": 5, "event": "page.created"})
+        assert writer.flush()
+
+        with open(path, newline="") as f:
+            rows = list(csv.DictReader(f))
+        assert [row["n"] for row in rows] == ["0", "1", "2", "3", "4", "5"]
+        assert writer.snapshot()["csv_rows"] == 6
+
+    def test_calls_run_off_thread_and_errors_are_contained(self):
+        writer = BackgroundWriter()
+        threads = []
+
+        def boom():
+            raise RuntimeError("boom")
+
+        writer.submit(boom)
+        writer.submit(lambda: threads.append(threading.current_thread().name))
+        assert writer.flush()
+
+        assert threads == ["background-writer"]
+        assert writer.snapshot()["errors"] == 1
+
+    def test_full_queue_drops_instead_of_blocking(self):
+        writer = BackgroundWriter(max_queue=1)
+        gate = threading.Event()
+        started = threading.Event()
+
+        def block():
+            started.set()
+            gate.wait(5)
+
+        writer.submit(block)
+        assert started.wait(5)
+        assert writer.submit(lambda: None) is True
+        assert writer.submit(lambda: None) is False
+        gate.set()
+        assert writer.flush()
+
+        assert writer.snapshot()["dropped"] == 1
@@ -0,0 +1,178 @@
+"""
+Unit tests for the compact track tables and indexes of CrossPlatformMatcher.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+import sys
+sys.path.insert(0, '.')
+
+from music_workflow.integrations.unified_sync.cross_matcher import CrossPlatformMatcher
+from music_workflow.integrations.unified_sync.track_table import (
+    PlatformTrackRef,
+    PlatformTrackTable,
+    StringPool,
+    TrackKeyIndex,
+    pack_ref,
+    unpack_ref,
+)
+
+
+def _rekordbox(track_id, title, artist, path, bpm=None):
+    return SimpleNamespace(track_id=track_id, title=title, artist=artist, album="",
+                           file_path=path, bpm=bpm, key=None, rating=None, play_count=0)
+
+
+def _apple(persistent_id, name, artist, path):
+    return SimpleNamespace(persistent_id=persistent_id, name=name, artist=artist, album="",
+                           location=path, bpm=None, rating=80, played_count=3)
+
+
+def _notion_page(page_id, title, artist, path=None, rekordbox_id=None):
+    props = {
+        "Title": {"title": [{"plain_text": title}]},
+        "Artist": {"rich_text": [{"plain_text": artist}]},
+    }
+    if path:
+        props["File Path"] = {"rich_text": [{"plain_text": path}]}
+    if rekordbox_id is not None:
+        props["Rekordbox ID"] = {"number": rekordbox_id}
+    return {"id": page_id, "properties": props}
+
+
+@pytest.fixture
+def matcher():
+    notion = Mock()
+    notion.databases.query.return_value = {
+        "results": [
+            _notion_page("page-1", "Night Drive", "Ana", "/Music/night drive.mp3"),
+            _notion_page("page-2", "Sunrise", "Bo", rekordbox_id=7.0),
+        ],
+        "has_more": False,
+    }
+    matcher = CrossPlatformMatcher(notion, "db")
+    matcher.load_notion_tracks()
+    matcher.load_rekordbox_tracks([
+        _rekordbox(1, "night drive", "ana", "/Other/Night Drive.mp3", bpm=124.0),
+        _rekordbox(7, "Untitled", "", None),
+    ])
+    matcher.load_apple_music_tracks([_apple("AM1", "Night Drive", "Ana", "/music/NIGHT DRIVE.mp3")])
+    return matcher
+
+
+class TestPlatformTrackTable:
+    """Test the columnar table behaves like the dict it replaces."""
+
+    def test_round_trip_and_mapping_protocol(self):
+        pool = StringPool()
+        table = PlatformTrackTable("notion", pool, ("apple_music_id", "rekordbox_id"))
+        table.add("p1", title="Song", artist="Artist", file_path=None, bpm=None,
+                  rating=0, raw=("AM1", None))
+        table["p2"] = PlatformTrackRef(platform="notion", platform_id="p2", title="Other", bpm=120.5,
+                                       raw_data={"apple_music_id": None})
+
+        ref = table["p1"]
+        assert (ref.platform, ref.title, ref.artist, ref.album) == ("notion", "Song", "Artist", "")
+        assert ref.file_path is None and ref.bpm is None and ref.key is None
+        assert ref.rating == 0 and ref.play_count == 0
+        assert ref.raw_data == {"apple_music_id": "AM1", "rekordbox_id": None}
+        assert table["p2"].bpm == 120.5 and table["p2"].rating is None
+        assert list(table) == ["p1", "p2"] and len(table) == 2 and "p2" in table
+
+        table.add("p1", title="Renamed")
+        assert len(table) == 2 and table["p1"].title == "Renamed"
+
+        del table["p2"]
+        assert "p2" not in table and table.row_count == 2
+        table.clear()
+        assert not table and table.row_count == 0
+
+    def test_strings_shared_across_tables(self):
+        pool = StringPool()
+        first = PlatformTrackTable("apple_music", pool)
+        second = PlatformTrackTable("rekordbox", pool)
+        first.add("a", title="Same Title", artist="Same Artist")
+        second.add("b", title="Same Title", artist="Same Artist")
+
+        assert len(pool) == 5  # two ids, title, artist and the empty album
+        assert first["a"].title is second["b"].title
+
+    def test_raw_source_object_materialized_on_access(self):
+        table = PlatformTrackTable("djay_pro", StringPool())
+        source = SimpleNamespace(title_id="t1", extra="x")
+        table.add("t1", raw=source)
+        assert table["t1"].raw_data == {"title_id": "t1", "extra": "x"}
+
+
+class TestTrackKeyIndex:
+    """Test packed references and platform removal."""
+
+    def test_add_refs_and_remove_platform(self):
+        index = TrackKeyIndex()
+        index.add("k", pack_ref("notion", 3))
+        index.add("k", pack_ref("notion", 3))
+        assert list(index.refs("k")) == [pack_ref("notion", 3)]
+
+        index.add("k", pack_ref("djay_pro", 5))
+        index.add("only-djay", pack_ref("djay_pro", 1))
+        assert [unpack_ref(p) for p in index.refs("k")] == [("notion", 3), ("djay_pro", 5)]
+
+        index.remove_platform("djay_pro")
+        assert "only-djay" not in index and len(index) == 1
+        assert list(index.refs("k")) == [pack_ref("notion", 3)]
+        assert index.refs("missing") == ()
+
+
+class TestCrossPlatformMatcherTables:
+    """Test matching on top of the compact tables."""
+
+    def test_indexes_and_matches(self, matcher):
+        assert "/music/night drive.mp3" in matcher._path_index
+        assert "night drive.mp3" in matcher._filename_index
+        assert "night drive|ana" in matcher._title_artist_index
+
+        matches = matcher._find_all_matches(matcher._notion_tracks["page-1"])
+        assert matches == {("notion", "page-1"), ("rekordbox", "1"), ("apple_music", "AM1")}
+        assert ("rekordbox", "7") in matcher._find_all_matches(matcher._notion_tracks["page-2"])
+
+    def test_build_unified_index(self, matcher):
+        unified = {track.notion_page_id: track for track in matcher.build_unified_index()}
+
+        night_drive = unified["page-1"]
+        assert night_drive.platforms == {"notion", "rekordbox", "apple_music"}
+        assert night_drive.canonical_bpm == 124.0
+        assert night_drive.platform_refs["apple_music"].rating == 4
+        assert night_drive.platform_refs["apple_music"].raw_data is None
+        assert unified["page-2"].platforms == {"notion", "rekordbox"}
+
+    def test_force_reload_replaces_platform_entries(self, matcher):
+        matcher.load_rekordbox_tracks([_rekordbox(9, "Fresh", "Cy", "/x/fresh.mp3")], force_reload=True)
+
+        assert list(matcher._rekordbox_tracks) == ["9"]
+        assert "/other/night drive.mp3" not in matcher._path_index
+        assert "/music/night drive.mp3" in matcher._path_index
+        assert matcher._find_all_matches(matcher._rekordbox_tracks["9"]) == {("rekordbox", "9")}
+
+    def test_keep_raw_data(self):
+        matcher = CrossPlatformMatcher(Mock(), "db", keep_raw_data=True)
+        track = _apple("AM1", "Song", "Artist", None)
+        matcher.load_apple_music_tracks([track])
+        assert matcher._apple_music_tracks["AM1"].raw_data is track.__dict__
+
+    def test_mirror_failure_mid_iteration_does_not_duplicate_pages(self):
+        pages = [_notion_page("page-1", "Night Drive", "Ana"), _notion_page("page-2", "Sunrise", "Bo")]
+
+        def failing_iter(db_id):
+            yield pages[0]
+            raise RuntimeError("mirror database is locked")
+
+        mirror = Mock()
+        mirror.iter_pages.side_effect = failing_iter
+        notion = Mock()
+        notion.databases.query.return_value = {"results": pages, "has_more": False}
+        matcher = CrossPlatformMatcher(notion, "db", mirror=mirror)
+
+        assert [page["id"] for page in matcher._iter_notion_pages()] == ["page-1", "page-2"]
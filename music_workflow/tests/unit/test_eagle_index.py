@@ -0,0 +1,192 @@
+"""
+Unit tests for the persistent Eagle item index and its use by EagleClient.
+"""
+
+import json
+import os
+import shutil
+
+import pytest
+
+import sys
+sys.path.insert(0, '.')
+
+from shared_core.eagle import EagleItemIndex, extract_fingerprint_tags
+from music_workflow.integrations.eagle.client import EagleClient
+
+
+def _write_item(library, item_id, name, tags, stamp, ext="m4a"):
+    item_dir = library / "images" / f"{item_id}.info"
+    item_dir.mkdir(parents=True, exist_ok=True)
+    metadata = {
+        "id": item_id,
+        "name": name,
+        "ext": ext,
+        "tags": tags,
+        "modificationTime": stamp,
+        "lastModified": stamp,
+    }
+    metadata_file = item_dir / "metadata.json"
+    metadata_file.write_text(json.dumps(metadata))
+    # Force a distinct stat mtime so the change is picked up
+    os.utime(metadata_file, ns=(stamp * 1_000_000, stamp * 1_000_000))
+
+
+@pytest.fixture
+def library(tmp_path):
+    """Provide a small on-disk Eagle library."""
+    lib = tmp_path / "Music.library"
+    _write_item(lib, "ITEM1", "Track One", ["House", "fingerprint:AAA111"], 1000)
+    _write_item(lib, "ITEM2", "Track Two", ["Techno", "fingerprint:bbb222"], 1001)
+    _write_item(lib, "ITEM3", "Track Three", ["House"], 1002)
+    return lib
+
+
+@pytest.fixture
+def index(tmp_path):
+    idx = EagleItemIndex(tmp_path / "index.sqlite3")
+    yield idx
+    idx.close()
+
+
+class TestExtractFingerprintTags:
+    """Test fingerprint tag parsing."""
+
+    def test_extracts_lowercase_values(self):
+        tags = ["House", "Fingerprint:ABC", "fingerprint: def ", 42, "fingerprint:"]
+        assert extract_fingerprint_tags(tags) == ["abc", "def"]
+
+
+class TestEagleItemIndex:
+    """Test EagleItemIndex refresh and lookups."""
+
+    def test_initial_refresh_indexes_all_items(self, index, library):
+        stats = index.refresh_from_library(library)
+
+        assert stats["updated"] == 3
+        assert index.count() == 3
+        assert index.get_by_name("track one")[0]["id"] == "ITEM1"
+        assert index.get_by_fingerprint("aaa111")[0]["id"] == "ITEM1"
+        assert {i["id"] for i in index.get_by_tag("house")} == {"ITEM1", "ITEM3"}
+
+        expected_path = os.path.join(str(library / "images" / "ITEM2.info"), "Track Two.m4a")
+        assert index.get_by_path(expected_path)["id"] == "ITEM2"
+
+    def test_unchanged_library_is_not_reparsed(self, index, library):
+        index.refresh_from_library(library)
+        generation = index.generation
+
+        stats = index.refresh_from_library(library)
+
+        assert stats["updated"] == 0
+        assert stats["unchanged"] == 3
+        assert index.generation == generation
+
+    def test_incremental_update_and_removal(self, index, library):
+        index.refresh_from_library(library)
+
+        _write_item(library, "ITEM1", "Renamed", ["fingerprint:ccc333"], 2000)
+        shutil.rmtree(library / "images" / "ITEM2.info")
+        stats = index.refresh_from_library(library)
+
+        assert stats == {"scanned": 2, "updated": 1, "removed": 1, "unchanged": 1}
+        assert index.get_by_name("track one") == []
+        assert index.get_by_fingerprint("aaa111") == []
+        assert index.get_by_fingerprint("ccc333")[0]["name"] == "Renamed"
+        assert index.get_by_id("ITEM2") is None
+
+    def test_trashed_items_are_dropped(self, index, library):
+        index.refresh_from_library(library)
+
+        metadata_file = library / "images" / "ITEM3.info" / "metadata.json"
+        data = json.loads(metadata_file.read_text())
+        data["isDeleted"] = True
+        data["lastModified"] = 3000
+        metadata_file.write_text(json.dumps(data))
+        os.utime(metadata_file, ns=(3_000_000_000, 3_000_000_000))
+        index.refresh_from_library(library)
+
+        assert index.get_by_id("ITEM3") is None
+
+    def test_sync_items_applies_delta(self, index):
+        items = [
+            {"id": "A", "name": "Alpha", "tags": ["fingerprint:f1"], "lastModified": 1},
+            {"id": "B", "name": "Beta", "tags": [], "lastModified": 1},
+        ]
+        assert index.sync_items(items)["updated"] == 2
+
+        items[0] = {"id": "A", "name": "Alpha", "tags": ["fingerprint:f2"], "lastModified": 2}
+        stats = index.sync_items(items)
+
+        assert stats["updated"] == 1
+        assert stats["unchanged"] == 1
+        assert index.get_by_fingerprint("f1") == []
+        assert index.get_by_fingerprint("F2")[0]["id"] == "A"
+
+    def test_partial_sync_keeps_other_items(self, index):
+        index.sync_items([{"id": "A", "name": "Alpha"}, {"id": "B", "name": "Beta"}])
+        index.sync_items([{"id": "C", "name": "Gamma"}], complete=False)
+
+        assert index.count() == 3
+
+    def test_refresh_fills_paths_of_synced_items(self, index, library):
+        index.sync_items([
+            {"id": "ITEM1", "name": "Track One", "ext": "m4a", "lastModified": 1000,
+             "modificationTime": 1000},
+        ])
+        assert index.get_by_id("ITEM1")["id"] == "ITEM1"
+
+        stats = index.refresh_from_library(library)
+
+        assert stats["updated"] == 3
+        assert stats["unchanged"] == 0
+        path = str(library / "images" / "ITEM1.info" / "Track One.m4a")
+        assert index.get_by_path(path)["id"] == "ITEM1"
+        assert index.refresh_from_library(library)["unchanged"] == 3
+
+    def test_index_is_shared_between_connections(self, tmp_path, library):
+        path = tmp_path / "shared.sqlite3"
+        writer = EagleItemIndex(path)
+        writer.refresh_from_library(library)
+
+        reader = EagleItemIndex(path)
+        assert len(reader.all_items()) == 3
+        assert reader.refresh_from_library(library)["updated"] == 0
+
+        writer.close()
+        reader.close()
+
+
+class TestEagleClientIndexLookups:
+    """Test EagleClient lookups backed by the persistent index."""
+
+    def test_search_by_fingerprint_uses_index(self, index, library, monkeypatch):
+        monkeypatch.setattr(
+            "music_workflow.integrations.eagle.client.get_eagle_item_index",
+            lambda: index,
+        )
+        client = EagleClient(library_path=library, verify_files=False)
+        monkeypatch.setattr(client, "_request", lambda *a, **k: pytest.fail("API called"))
+
+        items = client.search_by_fingerprint("AAA111")
+
+        assert [item.id for item in items] == ["ITEM1"]
+        assert items[0].path.endswith("Track One.m4a")
+
+    def test_tag_search_intersects_tags(self, index, library, monkeypatch):
+        monkeypatch.setattr(
+            "music_workflow.integrations.eagle.client.get_eagle_item_index",
+            lambda: index,
+        )
+        client = EagleClient(library_path=library, verify_files=False)
+        monkeypatch.setattr(client, "_request", lambda *a, **k: pytest.fail("API called"))
+
+        items = client.search(tags=["House", "fingerprint:aaa111"])
+
+        assert [item.id for item in items] == ["ITEM1"]
+
+    def test_falls_back_to_api_without_library(self, tmp_path, monkeypatch):
+        client = EagleClient(library_path=tmp_path / "missing.library", verify_files=False)
+        monkeypatch.setattr(client, "_request", lambda *a, **k: {"data": [{"id": "X", "name": "x"}]})
+
+        assert [item.id for item in client.search_by_fingerprint("abc")] == ["X"]
@@ -0,0 +1,172 @@
+"""
+Unit tests for sync framework file verification levels, caching and
+parallel batches.
+"""
+
+import hashlib
+import os
+
+import pytest
+
+import sys
+sys.path.insert(0, '.')
+
+from sync_framework.core import file_verification
+from sync_framework.core.file_verification import (
+    EagleFileVerifier,
+    FileStatus,
+    FileVerifier,
+    VerificationCache,
+    VerificationLevel,
+    storage_type,
+)
+
+JPEG = b"\xff\xd8\xff\xe0" + b"\x00" * 2000
+
+
+@pytest.fixture
+def files(tmp_path):
+    good = tmp_path / "good.jpg"
+    good.write_bytes(JPEG)
+    bad = tmp_path / "bad.jpg"
+    bad.write_bytes(b"not a jpeg" * 200)
+    empty = tmp_path / "empty.jpg"
+    empty.write_bytes(b"")
+    return {"good": good, "bad": bad, "empty": empty, "missing": tmp_path / "missing.jpg"}
+
+
+class TestVerificationLevels:
+    """Test how much each level checks."""
+
+    def test_stat_level_skips_header(self, files):
+        stat_only = FileVerifier(level=VerificationLevel.STAT)
+        header = FileVerifier(level=VerificationLevel.HEADER)
+
+        assert stat_only.verify_file(files["bad"]).status == FileStatus.VALID
+        assert header.verify_file(files["bad"]).status == FileStatus.CORRUPT
+        assert header.verify_file(files["empty"]).status == FileStatus.EMPTY
+        assert header.verify_file(files["missing"]).status == FileStatus.MISSING
+        assert header.verify_file(files["good"].parent).status == FileStatus.CORRUPT
+
+    def test_legacy_flags_map_to_levels(self):
+        assert FileVerifier().level == VerificationLevel.HEADER
+        assert FileVerifier(check_headers=False).level == VerificationLevel.STAT
+        assert FileVerifier(compute_hash=True).level == VerificationLevel.FULL_HASH
+
+    def test_full_hash_with_small_buffer(self, tmp_path):
+        path = tmp_path / "data.bin"
+        data = os.urandom(10_000)
+        path.write_bytes(data)
+
+        verifier = FileVerifier(level=VerificationLevel.FULL_HASH, hash_buffer_size=4096)
+        assert verifier.verify_file(path).content_hash == hashlib.md5(data).hexdigest()
+
+
+class TestVerificationCache:
+    """Test unchanged files are not re-read across runs."""
+
+    def test_reuses_results_until_file_changes(self, tmp_path, files):
+        cache_path = tmp_path / "cache.sqlite3"
+        first = FileVerifier(cache=VerificationCache(cache_path))
+        assert not first.verify_file(files["good"]).cached
+
+        second = FileVerifier(cache=VerificationCache(cache_path))
+        result = second.verify_file(files["good"])
+        assert result.cached and result.status == FileStatus.VALID
+
+        os.utime(files["good"], ns=(0, 1))
+        assert not second.verify_file(files["good"]).cached
+
+    def test_shallower_entry_does_not_answer_deeper_check(self, tmp_path, files):
+        cache = VerificationCache(tmp_path / "cache.sqlite3")
+        FileVerifier(level=VerificationLevel.HEADER, cache=cache).verify_file(files["good"])
+
+        full = FileVerifier(level=VerificationLevel.FULL_HASH, cache=cache)
+        result = full.verify_file(files["good"])
+        assert not result.cached
+        assert result.content_hash == hashlib.md5(JPEG).hexdigest()
+
+        # A full-hash entry answers a header-level check
+        assert FileVerifier(level=VerificationLevel.HEADER, cache=cache).verify_file(files["good"]).cached
+
+    def test_entry_answers_only_the_same_min_size_setting(self, tmp_path, files):
+        small = tmp_path / "small.jpg"
+        small.write_bytes(JPEG[:50])
+        cache = VerificationCache(tmp_path / "cache.sqlite3")
+
+        lenient = FileVerifier(min_size_check=False, cache=cache)
+        assert lenient.verify_file(small).status == FileStatus.VALID
+
+        result = FileVerifier(cache=cache).verify_file(small)
+        assert not result.cached
+        assert result.status == FileStatus.CORRUPT
+
+    def test_shared_eagle_verifier_cache_is_opt_in(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(file_verification, "_eagle_verifier", None)
+        monkeypatch.delenv("FILE_VERIFICATION_CACHE_PATH", raising=False)
+        assert file_verification.get_eagle_file_verifier(tmp_path / "A.library").cache is None
+
+        monkeypatch.setenv("FILE_VERIFICATION_CACHE_PATH", str(tmp_path / "cache.sqlite3"))
+        verifier = file_verification.get_eagle_file_verifier(tmp_path / "B.library")
+        assert verifier.cache.path == tmp_path / "cache.sqlite3"
+        verifier.cache.close()
+
+    def test_header_failures_are_not_cached(self, tmp_path, files):
+        cache = VerificationCache(tmp_path / "cache.sqlite3")
+        verifier = FileVerifier(cache=cache)
+        verifier.verify_file(files["bad"])
+        verifier.verify_file(files["empty"])
+
+        assert not verifier.verify_file(files["bad"]).cached
+        assert verifier.verify_file(files["empty"]).cached
+
+
+class TestParallelBatch:
+    """Test threaded batches match inline ones."""
+
+    def test_verify_batch_order_and_counts(self, tmp_path, files):
+        items = [{"id": f"{name}-{i}", "file_path": str(path)}
+                 for i in range(10) for name, path in files.items()]
+        items.append({"id": "no-path"})
+
+        inline = FileVerifier(workers=1).verify_batch(items)
+        parallel = FileVerifier(workers=8, cache=VerificationCache(tmp_path / "c.sqlite3"))
+        report = parallel.verify_batch(items)
+
+        assert list(report.results) == list(inline.results)
+        assert [r.status for r in report.results.values()] == [r.status for r in inline.results.values()]
+        assert (report.valid_count, report.missing_count, report.corrupt_count, report.empty_count) == \
+            (10, 11, 10, 10)
+
+        # Good and empty files come back from the cache on the next run
+        assert parallel.verify_batch(items).cached_count == 20
+
+    def test_verify_eagle_items(self, tmp_path):
+        library = tmp_path / "Photos.library"
+        for i in range(5):
+            info = library / "images" / f"ITEM{i}.info"
+            info.mkdir(parents=True)
+            (info / "metadata.json").write_text("{}")
+            (info / f"photo{i}.jpg").write_bytes(JPEG)
+        items = [{"id": f"ITEM{i}", "ext": "jpg"} for i in range(6)]
+
+        verifier = EagleFileVerifier(library_path=library, workers=4,
+                                     cache=VerificationCache(tmp_path / "c.sqlite3"))
+        report = verifier.verify_eagle_items(items)
+
+        assert report.valid_count == 5 and report.missing_count == 1
+        assert items[2]["file_path"].endswith("ITEM2.info/photo2.jpg")
+        assert verifier.verify_eagle_items(items).cached_count == 5
+
+
+class TestStorageType:
+    """Test mount-table lookup."""
+
+    def test_longest_mount_point_wins(self, monkeypatch):
+        mounts = (("/Volumes/NAS/local", "apfs"), ("/Volumes/NAS", "smbfs"), ("/", "apfs"))
+        monkeypatch.setattr(file_verification, "_mount_table", lambda: mounts)
+
+        assert storage_type("/Volumes/NAS/Eagle.library/images") == "network"
+        assert storage_type("/Volumes/NAS/local/x") == "local"
+        assert storage_type("/Volumes/NASX/x") == "local"
+        assert file_verification.default_verify_workers("/Volumes/NAS/a") == 32
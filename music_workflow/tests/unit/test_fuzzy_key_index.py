@@ -0,0 +1,74 @@
+"""
+Unit tests for the candidate-blocked fuzzy index used by CrossPlatformMatcher.
+"""
+
+import random
+from difflib import SequenceMatcher
+
+import pytest
+
+import sys
+sys.path.insert(0, '.')
+
+from music_workflow.integrations.unified_sync import fuzzy_index
+from music_workflow.integrations.unified_sync.fuzzy_index import FuzzyKeyIndex
+
+WORDS = ["night", "drive", "sun", "rise", "deep", "house", "echo", "blue", "dance", "remix", "(edit)", "feat."]
+
+
+def _brute_force(query, keys, threshold):
+    """The scan FuzzyKeyIndex replaces."""
+    matches = []
+    for key in keys:
+        if abs(len(query) - len(key)) > max(len(query), len(key)) * 0.5:
+            continue
+        if SequenceMatcher(None, query, key).ratio() >= threshold:
+            matches.append(key)
+    return matches
+
+
+def _mutate(rng, text):
+    chars = list(text)
+    for _ in range(rng.randint(0, 3)):
+        position = rng.randrange(len(chars))
+        operation = rng.choice("sdi")
+        if operation == "s":
+            chars[position] = rng.choice("aeiou ")
+        elif operation == "d" and len(chars) > 1:
+            del chars[position]
+        else:
+            chars.insert(position, rng.choice("xyz-"))
+    return "".join(chars)
+
+
+@pytest.fixture(scope="module")
+def keys():
+    rng = random.Random(7)
+    base = [
+        " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 4))) + f"|artist {rng.randint(0, 9)}"
+        for _ in range(150)
+    ]
+    keys = set(base) | {_mutate(rng, key) for key in base} | {"a|b", "ab|", "|", "x" * 60}
+    return sorted(keys)
+
+
+class TestFuzzyKeyIndex:
+    """Test the blocked lookup returns exactly what the full scan does."""
+
+    @pytest.mark.parametrize("threshold", [0.5, 0.7, 0.85, 0.95, 1.0])
+    @pytest.mark.parametrize("use_rapidfuzz", [True, False])
+    def test_matches_brute_force(self, keys, threshold, use_rapidfuzz, monkeypatch):
+        if use_rapidfuzz and not fuzzy_index.RAPIDFUZZ_AVAILABLE:
+            pytest.skip("rapidfuzz not installed")
+        monkeypatch.setattr(fuzzy_index, "RAPIDFUZZ_AVAILABLE", use_rapidfuzz)
+        index = FuzzyKeyIndex(keys)
+
+        queries = keys[::3] + ["night drive|artist 1", "zzzz|q"]
+        for query in queries:
+            assert index.matches(query, threshold) == _brute_force(query, keys, threshold), query
+
+    def test_bounds(self):
+        assert fuzzy_index.length_band(20, 0.85) == (15, pytest.approx(27.06, abs=0.01))
+        assert fuzzy_index.min_shared_bigrams(40, 0.85) == 10
+        assert fuzzy_index.min_shared_bigrams(40, 0.6) <= 0
+        assert fuzzy_index._bigram_tokens("aaab") == ["aa", "aa1", "ab"]
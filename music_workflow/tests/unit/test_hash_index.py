@@ -0,0 +1,144 @@
+"""
+Unit tests for the perceptual-hash multi-index and indexed image matching.
+"""
+
+import itertools
+import random
+
+import pytest
+
+import sys
+sys.path.insert(0, '.')
+
+from image_workflow.deduplication import hash_index
+from image_workflow.deduplication.fingerprint import ImageFingerprint
+from image_workflow.deduplication.hash_index import HammingIndex, hamming
+from image_workflow.deduplication.matcher import ImageMatcher, MatchStrategy
+
+
+def _synthetic_hashes(seed=11, bases=120, variants=3, max_flips=10):
+    """Random 64-bit hashes plus near-duplicates a few bit flips away."""
+    rng = random.Random(seed)
+    hashes = []
+    for _ in range(bases):
+        base = rng.getrandbits(64)
+        hashes.append(base)
+        for _ in range(rng.randint(0, variants)):
+            value = base
+            for bit in rng.sample(range(64), rng.randint(0, max_flips)):
+                value ^= 1 << bit
+            hashes.append(value)
+    return hashes
+
+
+def _brute_pairs(hashes, radius):
+    return {
+        (i, j)
+        for i, j in itertools.combinations(range(len(hashes)), 2)
+        if hamming(hashes[i], hashes[j]) <= radius
+    }
+
+
+@pytest.fixture(scope="module")
+def hashes():
+    return _synthetic_hashes()
+
+
+class TestHammingIndex:
+    """Test radius queries and all-pairs joins against brute force."""
+
+    @pytest.mark.parametrize("radius", [0, 3, 8, 12])
+    def test_query_matches_brute_force(self, hashes, radius):
+        index = HammingIndex()
+        index.extend(hashes)
+        for h in hashes[:40]:
+            expected = sorted(
+                (hamming(h, other), pos) for pos, other in enumerate(hashes)
+                if hamming(h, other) <= radius
+            )
+            assert [(d, pos) for pos, d in index.query(h, radius)] == expected
+
+    @pytest.mark.parametrize("radius", [0, 5, 8, 11])
+    def test_pairs_match_brute_force(self, hashes, radius):
+        index = HammingIndex()
+        index.extend(hashes)
+        found = [(i, j) for i, j, _ in index.pairs(radius)]
+        assert len(found) == len(set(found))
+        assert set(found) == _brute_pairs(hashes, radius)
+
+    def test_pure_python_pairs_match_brute_force(self, hashes, monkeypatch):
+        monkeypatch.setattr(hash_index, "NUMPY_AVAILABLE", False)
+        index = HammingIndex(chunks=8)
+        index.extend(hashes)
+        found = {(i, j) for i, j, _ in index.pairs(8)}
+        assert found == _brute_pairs(hashes, 8)
+
+    def test_hex_strings_and_item_ids(self):
+        index = HammingIndex()
+        index.add("ffff0000ffff0000", "a")
+        index.add("ffff0000ffff0001", "b")
+        index.add("0000ffff0000ffff", "c")
+
+        assert index.query("ffff0000ffff0000", radius=2) == [("a", 0), ("b", 1)]
+        assert index.groups(radius=2) == [["a", "b"]]
+        assert index.groups(radius=2, min_size=1) == [["a", "b"], ["c"]]
+
+    def test_rejects_wide_hash(self):
+        with pytest.raises(ValueError):
+            HammingIndex(bits=16).add(1 << 16)
+
+
+class TestIndexedMatcher:
+    """Test ImageMatcher still agrees with the all-pairs scan."""
+
+    def _fingerprints(self, hashes):
+        fps = [
+            ImageFingerprint(content_hash=f"c{pos}", perceptual_hash=f"{h:016x}")
+            for pos, h in enumerate(hashes)
+        ]
+        # A couple of exact duplicates without perceptual hashes
+        fps.append(ImageFingerprint(content_hash="c0"))
+        fps.append(ImageFingerprint(content_hash="dup"))
+        fps.append(ImageFingerprint(content_hash="dup"))
+        return fps
+
+    def _legacy_groups(self, matcher, fingerprints):
+        groups = []
+        processed = set()
+        for i, source in enumerate(fingerprints):
+            if source.content_hash in processed:
+                continue
+            processed.add(source.content_hash)
+            members = [source.content_hash]
+            for j, candidate in enumerate(fingerprints):
+                if i == j or candidate.content_hash in processed:
+                    continue
+                if matcher.compare(source, candidate).is_match:
+                    members.append(candidate.content_hash)
+                    processed.add(candidate.content_hash)
+            if len(members) > 1:
+                groups.append(members)
+        return groups
+
+    @pytest.mark.parametrize("strategy", [MatchStrategy.CASCADE, MatchStrategy.EXACT_ONLY])
+    def test_find_duplicates_matches_legacy_scan(self, hashes, strategy):
+        matcher = ImageMatcher(strategy=strategy, perceptual_threshold=8)
+        fingerprints = self._fingerprints(hashes)
+
+        groups = matcher.find_duplicates(fingerprints)
+
+        assert [[m.content_hash for m in g.members] for g in groups] == \
+            self._legacy_groups(matcher, fingerprints)
+
+    def test_find_matches_uses_index(self, hashes):
+        matcher = ImageMatcher(strategy=MatchStrategy.PERCEPTUAL, perceptual_threshold=6)
+        fingerprints = self._fingerprints(hashes)
+        source = fingerprints[0]
+
+        matches = matcher.find_matches(source, fingerprints)
+
+        expected = {
+            fp.content_hash for fp in fingerprints
+            if fp.content_hash != source.content_hash and matcher.compare(source, fp).is_match
+        }
+        assert {m.candidate.content_hash for m in matches} == expected
@@ -0,0 +1,151 @@
+"""
+Unit tests for the parallel, resumable image fingerprint pipeline.
+"""
+
+import hashlib
+import multiprocessing
+import os
+import sqlite3
+
+import pytest
+
+import sys
+sys.path.insert(0, '.')
+
+from image_workflow.deduplication import fingerprint as fingerprint_module
+from image_workflow.deduplication.fingerprint import FingerprintGenerator
+from image_workflow.deduplication.fingerprint_pipeline import (
+    FingerprintPipeline,
+    FingerprintStore,
+    lightroom_image_paths,
+)
+from image_workflow.integrations.lightroom import LightroomCatalogReader
+
+
+@pytest.fixture
+def images(tmp_path):
+    paths = []
+    for i in range(6):
+        path = tmp_path / f"img_{i}.bin"
+        path.write_bytes(f"image-{i}".encode() * 100)
+        paths.append(str(path))
+    return paths
+
+
+def _pipeline(tmp_path, **kwargs):
+    kwargs.setdefault("workers", 0)
+    kwargs.setdefault("enable_perceptual", False)
+    return FingerprintPipeline(store=FingerprintStore(tmp_path / "fp.sqlite3"), **kwargs)
+
+
+class TestFingerprintPipeline:
+    """Test streaming, resume and stat-based skipping."""
+
+    def test_fingerprints_and_stats(self, tmp_path, images):
+        pipeline = _pipeline(tmp_path)
+        results = list(pipeline.run(images + [str(tmp_path / "missing.jpg")]))
+
+        assert [r.path for r in results[:-1]] == images
+        assert results[0].fingerprint.content_hash == hashlib.sha256(b"image-0" * 100).hexdigest()
+        assert results[-1].error
+        assert pipeline.stats["fingerprinted"] == 6
+        assert pipeline.stats["errors"] == 1
+        assert pipeline.stats["images_per_second"] > 0
+
+    def test_resume_skips_unchanged_files(self, tmp_path, images):
+        first = _pipeline(tmp_path)
+        # Stop partway through, as an interrupted run would
+        for result in first.run(images, batch_size=2):
+            if first.stats["processed"] == 3:
+                break
+        assert first.store.count() == 3
+
+        second = _pipeline(tmp_path)
+        results = list(second.run(images))
+        assert [r.cached for r in results] == [True] * 3 + [False] * 3
+
+        os.utime(images[0], ns=(0, 1))
+        third = _pipeline(tmp_path)
+        results = list(third.run(images))
+        assert [r.cached for r in results] == [False] + [True] * 5
+
+    def test_changed_settings_are_recomputed(self, tmp_path, images):
+        list(_pipeline(tmp_path).run(images))
+        pipeline = _pipeline(tmp_path, hash_size=16)
+        assert not any(r.cached for r in pipeline.run(images))
+
+    def test_process_pool_matches_inline(self, tmp_path, images):
+        inline = _pipeline(tmp_path, use_store=False).fingerprint_all(images)
+        pooled = _pipeline(tmp_path, workers=2, use_store=False).fingerprint_all(images)
+        assert [fp.content_hash for fp in pooled] == [fp.content_hash for fp in inline]
+
+    def test_worker_crash_only_fails_the_crashing_image(self, tmp_path, images, monkeypatch):
+        if "fork" not in multiprocessing.get_all_start_methods():
+            pytest.skip("needs the fork start method")
+        generate = FingerprintGenerator.generate
+
+        def crash_on_poison(self, source, include_perceptual=True):
+            if str(source).endswith("img_2.bin"):
+                os._exit(1)
+            return generate(self, source, include_perceptual)
+
+        monkeypatch.setattr(FingerprintGenerator, "generate", crash_on_poison)
+        pipeline = _pipeline(tmp_path, workers=2, start_method="fork")
+        results = list(pipeline.run(images))
+
+        assert [r.path for r in results] == images
+        assert [r.path for r in results if r.error] == [images[2]]
+        assert pipeline.stats["fingerprinted"] == 5
+        assert pipeline.store.count() == 5
+
+
+class TestReducedDecode:
+    """Test draft-mode decoding keeps perceptual hashes stable."""
+
+    def test_reduced_decode_matches_full_decode(self, tmp_path):
+        if not (fingerprint_module.PIL_AVAILABLE and fingerprint_module.IMAGEHASH_AVAILABLE):
+            pytest.skip("Pillow/imagehash not installed")
+        from PIL import Image
+
+        img = Image.new("RGB", (2400, 1600))
+        for x in range(0, 2400, 300):
+            img.paste((x % 255, 80, 200), (x, 0, x + 150, 1600))
+        path = tmp_path / "photo.jpg"
+        img.save(path, quality=90)
+
+        assert FingerprintGenerator().reduced_decode is False
+        assert FingerprintPipeline(workers=0, use_store=False).settings["reduced_decode"] is True
+
+        full = FingerprintGenerator().generate(path)
+        reduced = FingerprintGenerator(reduced_decode=True).generate(path)
+
+        assert reduced.content_hash == full.content_hash
+        distance = bin(int(full.perceptual_hash, 16) ^ int(reduced.perceptual_hash, 16)).count("1")
+        assert distance <= 4
+
+
+class TestLightroomFilePaths:
+    """Test the single-query Lightroom path listing."""
+
+    def test_iterate_file_paths(self, tmp_path):
+        catalog = tmp_path / "test.lrcat"
+        conn = sqlite3.connect(catalog)
+        conn.executescript("""
+            CREATE TABLE Adobe_images (id_local INTEGER, id_global TEXT, rootFile INTEGER, masterImage INTEGER);
+            CREATE TABLE AgLibraryFile (id_local INTEGER, baseName TEXT, extension TEXT, folder INTEGER);
+            CREATE TABLE AgLibraryFolder (id_local INTEGER, pathFromRoot TEXT, rootFolder INTEGER);
+            CREATE TABLE AgLibraryRootFolder (id_local INTEGER, absolutePath TEXT);
+            INSERT INTO AgLibraryRootFolder VALUES (1, '/photos/');
+            INSERT INTO AgLibraryFolder VALUES (1, '2024/trip/', 1);
+            INSERT INTO AgLibraryFile VALUES (1, 'IMG_0001', 'CR3', 1), (2, 'IMG_0002', 'jpg', 1);
+            INSERT INTO Adobe_images VALUES (10, 'A', 1, NULL), (11, 'B', 2, NULL), (12, 'C', 2, 11);
+        """)
+        conn.commit()
+        conn.close()
+
+        with LightroomCatalogReader(catalog) as reader:
+            assert sorted(reader.iterate_file_paths()) == [
+                ("A", "/photos/2024/trip/IMG_0001.CR3"),
+                ("B", "/photos/2024/trip/IMG_0002.jpg"),
+            ]
+            assert len(list(lightroom_image_paths(reader))) == 2
@@ -0,0 +1,91 @@
+"""
+Unit tests for the background log file writer and bounded UnifiedLogger history.
+"""
+
+import json
+import subprocess
+import textwrap
+
+import sys
+sys.path.insert(0, '.')
+
+from shared_core.logging import DEFAULT_CONFIG, UnifiedLogger
+from shared_core.logging.writer import LogFileWriter
+
+
+def _entry(n):
+    return {"timestamp": f"t{n}", "level": "INFO", "message": f"message {n}", "context": {"n": n}}
+
+
+class TestLogFileWriter:
+    """Test background encoding, rotation and renaming."""
+
+    def test_entries_written_to_both_files(self, tmp_path):
+        writer = LogFileWriter(tmp_path / "run.jsonl", tmp_path / "run.log")
+        for n in range(50):
+            writer.write(_entry(n))
+        assert writer.flush()
+
+        lines = (tmp_path / "run.jsonl").read_text().splitlines()
+        assert [json.loads(line)["context"]["n"] for line in lines] == list(range(50))
+        assert (tmp_path / "run.log").read_text().splitlines()[0] == 't0 | INFO | message 0 | {"n": 0}'
+        writer.close()
+        assert writer.snapshot()["entries"] == 50
+
+    def test_queued_entries_written_at_exit_without_close(self, tmp_path):
+        script = textwrap.dedent(f"""
+            import sys
+            sys.path.insert(0, '.')
+            from shared_core.logging.writer import LogFileWriter
+
+            writer = LogFileWriter({str(tmp_path / "run.jsonl")!r}, None, flush_ms=60000)
+            for n in range(1000):
+                writer.write({{"timestamp": "t", "level": "INFO", "message": str(n)}})
+        """)
+        subprocess.run([sys.executable, "-c", script], check=True, timeout=60)
+
+        lines = (tmp_path / "run.jsonl").read_text().splitlines()
+        assert len(lines) == 1000
+
+    def test_size_rotation_and_rename_cover_all_segments(self, tmp_path):
+        writer = LogFileWriter(tmp_path / "job — Running (x).jsonl", None, max_bytes=400)
+        for n in range(30):
+            writer.write(_entry(n))
+        assert writer.flush()
+        assert writer.snapshot()["rotations"] >= 2
+
+        writer.rename(lambda name: name.replace(" — Running ", " — Completed "))
+        writer.close()
+
+        files = sorted(tmp_path.iterdir())
+        assert all("Completed" in f.name for f in files)
+        assert all(f.stat().st_size <= 400 for f in files)
+        ns = sorted(json.loads(line)["context"]["n"] for f in files for line in f.read_text().splitlines())
+        assert ns == list(range(30))
+
+
+class TestUnifiedLoggerFileLogging:
+    """Test UnifiedLogger wiring of the writer and ring buffers."""
+
+    def test_history_is_bounded_and_metrics_incremental(self, tmp_path, monkeypatch):
+        monkeypatch.setitem(DEFAULT_CONFIG, "MAX_RETAINED_ENTRIES", 10)
+        monkeypatch.setitem(DEFAULT_CONFIG, "MAX_RETAINED_MESSAGES", 3)
+        logger = UnifiedLogger("writer_test", enable_file_logging=True, log_root=tmp_path)
+
+        for n in range(25):
+            logger.info(f"step {n}", {"n": n})
+        for n in range(5):
+            logger.error(f"failure {n}")
+
+        assert len(logger._log_entries) == 10
+        assert len(logger._error_messages) == 3
+        metrics = logger.get_metrics()
+        assert metrics["entry_count"] == 30
+        assert metrics["level_counts"] == {"INFO": 25, "ERROR": 5}
+
+        logger.finalize(ok=False)
+        logger.close()
+        jsonl = logger.get_metrics()["log_files"]["jsonl"]
+        assert "Failed" in jsonl
+        with open(jsonl) as f:
+            assert len(f.read().splitlines()) == 31
@@ -0,0 +1,125 @@
+"""
+Unit tests for the blocked near-duplicate name clustering engine.
+"""
+
+import difflib
+import itertools
+import random
+
+import pytest
+
+import sys
+sys.path.insert(0, '.')
+
+from shared_core.eagle.near_duplicates import (
+    NearDuplicateClusterer,
+    cluster_similar_names,
+    token_prefix_key,
+    token_suffix_key,
+)
+
+
+def _brute_force(names, min_similarity):
+    """Reference: legacy pairwise SequenceMatcher union-find."""
+    parent = list(range(len(names)))
+
+    def find(i):
+        while parent[i] != i:
+            i = parent[i]
+        return i
+
+    for i, j in itertools.combinations(range(len(names)), 2):
+        a, b = names[i], names[j]
+        if not a or not b:
+            continue
+        if abs(len(a) - len(b)) > max(len(a), len(b)) * 0.5:
+            continue
+        if difflib.SequenceMatcher(None, a, b).ratio() >= min_similarity:
+            parent[find(j)] = find(i)
+
+    clusters = {}
+    for idx in range(len(names)):
+        if names[idx]:
+            clusters.setdefault(find(idx), []).append(idx)
+    return sorted(group for group in clusters.values() if len(group) > 1)
+
+
+def _pairs(groups):
+    return {(a, b) for group in groups for a in group for b in group if a < b}
+
+
+@pytest.fixture(scope="module")
+def names():
+    rng = random.Random(3)
+    words = ["".join(rng.choice("abcdefghij") for _ in range(rng.randint(3, 7))) for _ in range(200)]
+    result = []
+    for _ in range(150):
+        name = " ".join(rng.choice(words) for _ in range(rng.randint(2, 5)))
+        result.append(name)
+        if rng.random() < 0.3:
+            chars = list(name)
+            chars[rng.randrange(len(chars))] = "z"
+            result.append("".join(chars))
+    return result
+
+
+@pytest.fixture(scope="module")
+def expected(names):
+    return _brute_force(names, 0.75)
+
+
+class TestBlockingKeys:
+    """Test token blocking keys."""
+
+    def test_prefix_and_suffix_keys(self):
+        assert token_prefix_key("a b c d e") == "a b c"
+        assert token_suffix_key("a b c d e") == "c d e"
+        assert token_prefix_key("") == ""
+
+
+class TestNearDuplicateClusterer:
+    """Test clustering output against the legacy all-pairs scan."""
+
+    def test_output_contract(self):
+        groups = cluster_similar_names(["artist track", "other thing", "artist track 1", ""], 0.75)
+        assert groups == [[0, 2]]
+
+    def test_identical_names_always_grouped(self):
+        groups = cluster_similar_names(["same", "x", "same", "same"], 0.99)
+        assert groups == [[0, 2, 3]]
+
+    def test_single_block_matches_brute_force(self, names, expected):
+        groups = NearDuplicateClusterer(min_similarity=0.75).cluster(names)
+        assert _pairs(groups) == _pairs(expected)
+
+    def test_upper_bound_scores_are_confirmed(self):
+        # fuzz.ratio (LCS) gives this pair 0.75; SequenceMatcher gives 0.625
+        clusterer = NearDuplicateClusterer(min_similarity=0.75)
+        assert clusterer.score("b ab c ", " a b bac ") == 0.0
+        assert clusterer.cluster(["b ab c ", " a b bac "]) == []
+
+    def test_lsh_path_recall(self, names, expected):
+        expected = _pairs(expected)
+        clusterer = NearDuplicateClusterer(min_similarity=0.75, brute_force_limit=10)
+        found = _pairs(clusterer.cluster(names))
+
+        assert clusterer.stats["lsh_candidates"] < len(names) * (len(names) - 1) // 2
+        assert len(expected & found) / len(expected) >= 0.95
+        assert found <= expected
+
+    def test_blocked_library_wide_mode(self, names, expected):
+        expected = _pairs(expected)
+        clusterer = NearDuplicateClusterer(
+            min_similarity=0.75,
+            block_keys=[token_prefix_key, token_suffix_key],
+        )
+        found = _pairs(clusterer.cluster(names))
+
+        assert len(expected & found) / len(expected) >= 0.95
+        assert found <= expected
+
+    def test_signatures_are_deterministic(self):
+        a = NearDuplicateClusterer().minhash_signatures(["abc def", "xyz"])
+        b = NearDuplicateClusterer().minhash_signatures(["abc def", "xyz"])
+        assert (a == b).all()
+        assert a.shape == (2, 96)
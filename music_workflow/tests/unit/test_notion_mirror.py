@@ -0,0 +1,157 @@
+"""
+Unit tests for the local Notion database mirror.
+"""
+
+import pytest
+
+import sys
+sys.path.insert(0, '.')
+
+from shared_core.notion.mirror import NotionMirror, TITLE_ARTIST_KEY, normalize_text
+
+
+def _text(kind, value):
+    return {"type": kind, kind: [{"plain_text": value}]}
+
+
+def _page(page_id, title, artist="", edited="2026-10-01T10:00:00.000Z", **extra):
+    properties = {"Title": _text("title", title), "Artist Name": _text("rich_text", artist)}
+    for name, value in extra.items():
+        name = name.replace("_", " ")
+        properties[name] = {"type": "url", "url": value} if name.endswith("URL") else _text("rich_text", value)
+    return {"id": page_id, "last_edited_time": edited, "properties": properties}
+
+
+class FakeDatabase:
+    """Query function serving pages, honouring the last_edited_time filter."""
+
+    def __init__(self, pages):
+        self.pages = list(pages)
+        self.bodies = []
+
+    def __call__(self, database_id, body):
+        self.bodies.append(body)
+        rows = sorted(self.pages, key=lambda p: p["last_edited_time"])
+        cutoff = (body.get("filter") or {}).get("last_edited_time", {}).get("on_or_after")
+        if cutoff:
+            rows = [p for p in rows if p["last_edited_time"] >= cutoff]
+        start = int(body.get("start_cursor") or 0)
+        end = start + body["page_size"]
+        return {
+            "results": rows[start:end],
+            "has_more": end < len(rows),
+            "next_cursor": str(end) if end < len(rows) else None,
+        }
+
+
+@pytest.fixture
+def mirror(tmp_path):
+    mirror = NotionMirror(tmp_path / "mirror.sqlite3", max_staleness=0, full_sync_interval=3600)
+    yield mirror
+    mirror.close()
+
+
+class TestNotionMirror:
+    """Test sync and lookups."""
+
+    def test_lookups_by_property_and_normalized_title_artist(self, mirror):
+        db = FakeDatabase([
+            _page("a", "Strobe (Original Mix)", "deadmau5", Spotify_ID="SPOT1", AIFF_Fingerprint="abc123"),
+            _page("b", "Ghosts 'n' Stuff", "Deadmau5", SoundCloud_URL="https://soundcloud.com/x/ghosts"),
+        ])
+        assert mirror.sync("db-1", db) == 2
+
+        assert [p["id"] for p in mirror.find("db-1", "Spotify ID", "SPOT1")] == ["a"]
+        assert [p["id"] for p in mirror.find("db-1", "AIFF Fingerprint", "ABC123")] == ["a"]
+        assert [p["id"] for p in mirror.find("db-1", "SoundCloud URL", "https://soundcloud.com/x/ghosts")] == ["b"]
+        assert [p["id"] for p in mirror.find_title_artist("db-1", "GHOSTS N STUFF", "deadmau5")] == ["b"]
+        assert [p["id"] for p in mirror.search("db-1", "Title", "strobe")] == ["a"]
+        assert mirror.find("db-1", TITLE_ARTIST_KEY, normalize_text("Strobe (Original Mix)") + "|deadmau5")
+        assert mirror.find("other-db", "Spotify ID", "SPOT1") == []
+
+    def test_incremental_sync_uses_watermark(self, mirror):
+        db = FakeDatabase([_page("a", "One", edited="2026-10-01T10:00:00.000Z")])
+        mirror.sync("db-1", db)
+
+        db.pages.append(_page("b", "Two", edited="2026-10-02T10:00:00.000Z"))
+        db.pages[0] = _page("a", "One (renamed)", edited="2026-10-03T10:00:00.000Z")
+        assert mirror.sync("db-1", db) == 2
+
+        assert db.bodies[-1]["filter"]["last_edited_time"] == {"on_or_after": "2026-10-01T10:00:00.000Z"}
+        assert mirror.count("db-1") == 2
+        assert mirror.search("db-1", "Title", "renamed")
+        assert mirror.sync_state("db-1")["watermark"] == "2026-10-03T10:00:00.000Z"
+
+    def test_full_sync_drops_pages_gone_from_api(self, mirror):
+        db = FakeDatabase([_page("a", "One"), _page("b", "Two")])
+        mirror.sync("db-1", db)
+        db.pages.pop()
+
+        mirror.sync("db-1", db, full=True)
+
+        assert mirror.get_page("b") is None
+        assert mirror.count("db-1") == 1
+
+    def test_write_through_and_archive(self, mirror):
+        mirror.sync("db-1", FakeDatabase([]))
+        created = dict(_page("c", "Fresh", Spotify_ID="NEW"), parent={"database_id": "db-1"})
+
+        assert mirror.upsert_page(created)
+        assert mirror.find("db-1", "Spotify ID", "NEW")
+        assert not mirror.upsert_page(dict(created, parent={"database_id": "never-synced"}))
+
+        mirror.upsert_page(dict(created, archived=True))
+        assert mirror.find("db-1", "Spotify ID", "NEW") == []
+
+    def test_ensure_fresh_respects_staleness(self, tmp_path):
+        mirror = NotionMirror(tmp_path / "m.sqlite3", max_staleness=3600)
+        db = FakeDatabase([_page("a", "One")])
+
+        assert mirror.ensure_fresh("db-1", db) is True
+        assert mirror.ensure_fresh("db-1", db) is False
+        assert len(db.bodies) == 1
+        mirror.close()
+
+    def test_deduplicator_checks_spotify_id_locally(self, mirror):
+        from unittest.mock import Mock
+        from music_workflow.deduplication.notion_dedup import NotionDeduplicator
+
+        db = FakeDatabase([_page("a", "Strobe", "deadmau5", Spotify_ID="SPOT1")])
+        client = Mock()
+        client.databases.query.side_effect = lambda database_id, **body: db(database_id, body)
+        client.databases.retrieve.return_value = {"properties": {"Spotify ID": {"type": "rich_text"}}}
+        dedup = NotionDeduplicator(notion_client=client, tracks_db_id="db-1", mirror=mirror)
+
+        matches = dedup._check_by_spotify_id("SPOT1")
+        matches += dedup._check_by_spotify_id("SPOT1")
+
+        assert [m.page_id for m in matches] == ["a", "a"]
+        assert all("filter" not in body or "timestamp" in body["filter"] for body in db.bodies)
+
+    def test_deduplicator_confirms_mirror_miss_with_api(self, tmp_path):
+        from unittest.mock import Mock
+        from music_workflow.deduplication.notion_dedup import NotionDeduplicator
+
+        mirror = NotionMirror(tmp_path / "m.sqlite3", max_staleness=3600)
+        db = FakeDatabase([_page("a", "Strobe", "deadmau5", Spotify_ID="SPOT1")])
+        mirror.ensure_fresh("db-1", db)
+        # Created elsewhere after the mirror synced
+        db.pages.append(_page("b", "Ghosts", "deadmau5", Spotify_ID="SPOT2"))
+
+        def query(database_id, **body):
+            equals = (body.get("filter") or {}).get("rich_text", {}).get("equals")
+            result = db(database_id, body)
+            if equals:
+                result["results"] = [
+                    p for p in result["results"]
+                    if p["properties"]["Spotify ID"]["rich_text"][0]["plain_text"] == equals
+                ]
+            return result
+
+        client = Mock()
+        client.databases.query.side_effect = query
+        client.databases.retrieve.return_value = {"properties": {"Spotify ID": {"type": "rich_text"}}}
+        dedup = NotionDeduplicator(notion_client=client, tracks_db_id="db-1", mirror=mirror)
+
+        assert [m.page_id for m in dedup._check_by_spotify_id("SPOT2")] == ["b"]
+        mirror.close()
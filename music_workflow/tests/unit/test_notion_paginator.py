@@ -0,0 +1,117 @@
+"""
+Unit tests for the streaming Notion paginator.
+"""
+
+import asyncio
+import threading
+from unittest.mock import MagicMock
+
+import sys
+sys.path.insert(0, '.')
+
+from shared_core.notion.paginator import aiter_paginated, iter_database_rows, iter_paginated
+
+
+def _fake_database(total):
+    """Fetch function over `total` rows, recording (cursor, page_size) calls."""
+    calls = []
+
+    def fetch_page(cursor, page_size):
+        start = int(cursor or 0)
+        calls.append((cursor, page_size))
+        end = min(total, start + page_size)
+        return {
+            "results": [{"id": str(i)} for i in range(start, end)],
+            "has_more": end < total,
+            "next_cursor": str(end) if end < total else None,
+        }
+
+    return fetch_page, calls
+
+
+class TestIterPaginated:
+    """Test the synchronous paginator."""
+
+    def test_yields_all_rows_in_order(self):
+        fetch_page, calls = _fake_database(250)
+
+        rows = list(iter_paginated(fetch_page))
+
+        assert [row["id"] for row in rows] == [str(i) for i in range(250)]
+        assert calls == [(None, 100), ("100", 100), ("200", 100)]
+
+    def test_max_rows_limits_requests(self):
+        fetch_page, calls = _fake_database(1000)
+
+        rows = list(iter_paginated(fetch_page, max_rows=130))
+
+        assert len(rows) == 130
+        assert calls == [(None, 100), ("100", 30)]
+
+    def test_small_budget_fetches_small_page(self):
+        fetch_page, calls = _fake_database(1000)
+
+        assert len(list(iter_paginated(fetch_page, max_rows=1))) == 1
+        assert calls == [(None, 1)]
+
+    def test_next_page_is_prefetched_during_consumption(self):
+        fetch_page, calls = _fake_database(200)
+        second_requested = threading.Event()
+
+        def tracking_fetch(cursor, page_size):
+            response = fetch_page(cursor, page_size)
+            if cursor:
+                second_requested.set()
+            return response
+
+        rows = iter_paginated(tracking_fetch)
+        next(rows)
+
+        assert second_requested.wait(timeout=2)
+        assert len(list(rows)) == 199
+
+    def test_without_prefetch(self):
+        fetch_page, calls = _fake_database(150)
+
+        rows = iter_paginated(fetch_page, prefetch=False)
+        next(rows)
+
+        assert calls == [(None, 100)]
+        assert len(list(rows)) == 149
+
+    def test_empty_result(self):
+        fetch_page, calls = _fake_database(0)
+        assert list(iter_paginated(fetch_page)) == []
+
+
+class TestAsyncPaginator:
+    """Test the asyncio paginator."""
+
+    def test_yields_rows_with_budget(self):
+        fetch_page, calls = _fake_database(300)
+
+        async def collect():
+            return [row async for row in aiter_paginated(fetch_page, max_rows=205)]
+
+        rows = asyncio.run(collect())
+
+        assert len(rows) == 205
+        assert calls == [(None, 100), ("100", 100), ("200", 5)]
+
+
+class TestIterDatabaseRows:
+    """Test the notion_client adapter."""
+
+    def test_passes_query_and_cursor(self):
+        fetch_page, _ = _fake_database(120)
+        client = MagicMock()
+        client.databases.query.side_effect = (
+            lambda database_id, page_size, start_cursor=None, **body: fetch_page(start_cursor, page_size)
+        )
+
+        rows = list(iter_database_rows(client, "db", {"filter": {"x": 1}, "page_size": 50}))
+
+        assert len(rows) == 120
+        first_call = client.databases.query.call_args_list[0].kwargs
+        assert first_call == {"database_id": "db", "page_size": 100, "filter": {"x": 1}}
+        assert client.databases.query.call_args_list[1].kwargs["start_cursor"] == "100"
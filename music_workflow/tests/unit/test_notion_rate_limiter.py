@@ -0,0 +1,101 @@
+"""
+Unit tests for the shared Notion token bucket and rate-limited transport.
+"""
+
+import time
+
+import pytest
+
+import sys
+sys.path.insert(0, '.')
+
+from shared_core.notion.rate_limiter import TokenBucket, parse_retry_after
+
+
+class TestTokenBucket:
+    """Test pacing and adaptive backoff."""
+
+    def test_burst_then_paced(self):
+        bucket = TokenBucket(rate=20.0, burst=2)
+
+        start = time.time()
+        for _ in range(4):
+            bucket.acquire()
+        elapsed = time.time() - start
+
+        # 2 from the burst, then 2 more at 20/s
+        assert 0.08 <= elapsed < 0.5
+
+    def test_timeout(self):
+        bucket = TokenBucket(rate=1.0, burst=1)
+        assert bucket.acquire(timeout=0.1)
+        assert not bucket.acquire(timeout=0.1)
+
+    def test_penalize_blocks_and_halves_rate(self):
+        bucket = TokenBucket(rate=10.0, burst=1)
+        bucket.penalize(0.2)
+
+        assert bucket.current_rate() == pytest.approx(5.0)
+        start = time.time()
+        bucket.acquire()
+        assert time.time() - start >= 0.15
+
+    def test_success_recovers_rate(self):
+        bucket = TokenBucket(rate=10.0, burst=1)
+        bucket.penalize(0.0)
+        for _ in range(20):
+            bucket.record_success()
+        assert bucket.current_rate() == pytest.approx(10.0)
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="fcntl file lock")
+    def test_file_state_shared_between_buckets(self, tmp_path):
+        path = tmp_path / "notion.rate"
+        first = TokenBucket(rate=1.0, burst=1, state_path=path)
+        second = TokenBucket(rate=1.0, burst=1, state_path=path)
+
+        assert first.acquire(timeout=0.1)
+        assert not second.acquire(timeout=0.1)
+
+    def test_parse_retry_after(self):
+        assert parse_retry_after("2") == 2.0
+        assert parse_retry_after(None, 1.5) == 1.5
+        assert parse_retry_after("soon") == 1.0
+
+
+class TestRateLimitedTransport:
+    """Test 429 handling in the httpx transport."""
+
+    def test_retries_429_and_penalizes(self):
+        httpx = pytest.importorskip("httpx")
+        from shared_core.notion.rate_limiter import RateLimitedTransport
+
+        calls = []
+
+        def handler(request):
+            calls.append(request.url.path)
+            if len(calls) == 1:
+                return httpx.Response(429, headers={"Retry-After": "0"}, json={"code": "rate_limited"})
+            return httpx.Response(200, json={"ok": True})
+
+        bucket = TokenBucket(rate=100.0, burst=5)
+        transport = RateLimitedTransport(bucket, transport=httpx.MockTransport(handler))
+        client = httpx.Client(transport=transport)
+
+        response = client.get("https://api.notion.com/v1/pages/abc")
+
+        assert response.status_code == 200
+        assert len(calls) == 2
+        assert bucket.stats["throttled"] == 1
+        assert bucket.stats["acquired"] == 2
+
+    def test_closing_a_client_keeps_shared_pool(self):
+        httpx = pytest.importorskip("httpx")
+        from shared_core.notion.rate_limiter import RateLimitedTransport
+
+        transport = RateLimitedTransport(
+            TokenBucket(rate=100.0, burst=5),
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, json={})),
+        )
+        httpx.Client(transport=transport).close()
+
+        assert httpx.Client(transport=transport).get("https://api.notion.com/v1/users").status_code == 200
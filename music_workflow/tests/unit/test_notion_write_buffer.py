@@ -0,0 +1,128 @@
+"""
+Unit tests for the coalescing Notion page write buffer.
+"""
+
+import pytest
+
+import sys
+sys.path.insert(0, '.')
+
+from shared_core.notion.write_buffer import PageWriteBuffer, merge_properties
+
+
+def _multi(*names):
+    return {"multi_select": [{"name": name} for name in names]}
+
+
+class TestMergeProperties:
+    """Test per-property merge rules."""
+
+    def test_multi_select_union_keeps_order(self):
+        merged = merge_properties(
+            {"Audio Processing": _multi("Audio Analysis Complete", "Loudness Measured")},
+            {"Audio Processing": _multi("Loudness Measured", "Eagle Import Complete")},
+        )
+
+        assert merged["Audio Processing"] == _multi(
+            "Audio Analysis Complete", "Loudness Measured", "Eagle Import Complete"
+        )
+
+    def test_empty_multi_select_clears(self):
+        merged = merge_properties({"Tags": _multi("a")}, {"Tags": _multi()})
+        assert merged["Tags"] == _multi()
+
+    def test_status_precedence(self):
+        done = {"Status": {"status": {"name": "Done"}}}
+        in_progress = {"Status": {"status": {"name": "In Progress"}}}
+        failed = {"Status": {"status": {"name": "Failed"}}}
+
+        assert merge_properties(done, in_progress)["Status"] == done["Status"]
+        assert merge_properties(done, failed)["Status"] == failed["Status"]
+        assert merge_properties(failed, in_progress)["Status"] == failed["Status"]
+
+    def test_unranked_select_last_write_wins(self):
+        merged = merge_properties(
+            {"Compression Mode Used": {"select": {"name": "PRESERVE"}}},
+            {"Compression Mode Used": {"select": {"name": "LOSSLESS"}}},
+        )
+        assert merged["Compression Mode Used"] == {"select": {"name": "LOSSLESS"}}
+
+    def test_scalars_last_write_wins(self):
+        merged = merge_properties({"Tempo": {"number": 120}}, {"Tempo": {"number": 128}, "DL": {"checkbox": True}})
+        assert merged == {"Tempo": {"number": 128}, "DL": {"checkbox": True}}
+
+
+class TestPageWriteBuffer:
+    """Test buffering and flushing."""
+
+    @pytest.fixture
+    def sent(self):
+        return []
+
+    @pytest.fixture
+    def buffer(self, sent):
+        return PageWriteBuffer(lambda page_id, props: sent.append((page_id, props)))
+
+    def test_writes_through_outside_scope(self, buffer, sent):
+        buffer.update("page", {"Tempo": {"number": 128}})
+        assert sent == [("page", {"Tempo": {"number": 128}})]
+
+    def test_scope_coalesces_into_one_request_per_page(self, buffer, sent):
+        with buffer.collect():
+            buffer.update("page", {"Audio Processing": _multi("Audio Analysis Complete")})
+            buffer.update("page", {"Tempo": {"number": 128}})
+            buffer.update("other", {"DL": {"checkbox": True}})
+            buffer.update("page", {"Audio Processing": _multi("Eagle Import Complete")})
+            assert sent == []
+
+        assert sent == [
+            ("page", {
+                "Audio Processing": _multi("Audio Analysis Complete", "Eagle Import Complete"),
+                "Tempo": {"number": 128},
+            }),
+            ("other", {"DL": {"checkbox": True}}),
+        ]
+        assert buffer.stats["requests"] == 2
+
+    def test_retry_success_overrides_earlier_failure(self, buffer, sent):
+        with buffer.collect():
+            buffer.update("p1", {"Status": {"status": {"name": "Failed"}}})
+            buffer.update("p1", {"Status": {"status": {"name": "In Progress"}}})
+            buffer.update("p1", {"Status": {"status": {"name": "Done"}}})
+
+        assert sent == [("p1", {"Status": {"status": {"name": "Done"}}})]
+
+    def test_scope_flushes_on_failure(self, buffer, sent):
+        with pytest.raises(RuntimeError):
+            with buffer.collect():
+                buffer.update("page", {"Audio Processing": _multi("Error Occurred During Processing")})
+                raise RuntimeError("download failed")
+
+        assert sent == [("page", {"Audio Processing": _multi("Error Occurred During Processing")})]
+
+    def test_explicit_flush_inside_scope(self, buffer, sent):
+        with buffer.collect():
+            buffer.update("page", {"Tempo": {"number": 128}})
+            buffer.stage("page", {"DL": {"checkbox": True}})
+            buffer.flush("page")
+            assert len(sent) == 1
+
+        assert sent == [("page", {"Tempo": {"number": 128}, "DL": {"checkbox": True}})]
+
+    def test_failed_flush_keeps_patch_for_retry(self):
+        attempts = []
+
+        def flaky(page_id, props):
+            attempts.append(props)
+            if len(attempts) == 1:
+                raise RuntimeError("429")
+
+        buffer = PageWriteBuffer(flaky)
+        buffer.stage("page", {"Tempo": {"number": 128}})
+        with pytest.raises(RuntimeError):
+            buffer.flush("page")
+        buffer.stage("page", {"DL": {"checkbox": True}})
+        buffer.flush("page")
+
+        assert attempts[-1] == {"Tempo": {"number": 128}, "DL": {"checkbox": True}}
+        assert buffer.pending("page") == {}
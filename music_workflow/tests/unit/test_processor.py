@@ -2,6 +2,7 @@
 Unit tests for the audio processor module.
 """
 
+import numpy as np
 import pytest
 from pathlib import Path
 from unittest.mock import patch, MagicMock, PropertyMock
@@ -17,6 +18,14 @@ from music_workflow.core.models import AudioAnalysis
 from music_workflow.utils.errors import ProcessingError
 
 
+def _decoded(seconds=180, sample_rate=44100):
+    """Stand-in for shared_core's DecodedAudio (silent buffer)."""
+    decoded = MagicMock(samples=np.zeros(seconds * sample_rate, dtype=np.float32),
+                        sample_rate=sample_rate, channels=2)
+    decoded.feature_samples.return_value = (np.zeros(seconds * 22050, dtype=np.float32), 22050)
+    return decoded
+
+
 class TestProcessingOptions:
     """Test ProcessingOptions dataclass."""
 
@@ -87,17 +96,12 @@ class TestAudioProcessor:
     def test_analyze_with_mock_librosa(self, mock_validate):
         """Test analyze method with mocked librosa."""
         processor = AudioProcessor()
+        processor._librosa = MagicMock()
 
-        # Create mock librosa module
-        mock_librosa = MagicMock()
-        mock_librosa.load.return_value = (MagicMock(), 44100)
-        mock_librosa.get_duration.return_value = 180.0
-        mock_librosa.beat.beat_track.return_value = (128.0, MagicMock())
-
-        processor._librosa = mock_librosa
-
-        # Mock the key detection
-        with patch.object(processor, '_detect_key', return_value="Am"):
+        # Mock the shared decode/tempo helpers and the key detection
+        with patch('music_workflow.core.processor.decode_audio', return_value=_decoded()), \
+             patch('music_workflow.core.processor.estimate_bpm', return_value=128.0), \
+             patch.object(processor, '_detect_key', return_value="Am"):
             result = processor.analyze(Path("/test/file.m4a"))
 
         assert isinstance(result, AudioAnalysis)
@@ -111,18 +115,15 @@ class TestAudioProcessor:
         options = ProcessingOptions(analyze_bpm=False, analyze_key=False)
         processor = AudioProcessor(options=options)
 
-        mock_librosa = MagicMock()
-        mock_librosa.load.return_value = (MagicMock(), 44100)
-        mock_librosa.get_duration.return_value = 180.0
+        processor._librosa = MagicMock()
 
-        processor._librosa = mock_librosa
-
-        result = processor.analyze(Path("/test/file.m4a"))
+        with patch('music_workflow.core.processor.decode_audio', return_value=_decoded()), \
+             patch('music_workflow.core.processor.estimate_bpm') as estimate_bpm:
+            result = processor.analyze(Path("/test/file.m4a"))
 
         # BPM should be None when disabled
         assert result.bpm is None
-        # beat_track should not be called
-        mock_librosa.beat.beat_track.assert_not_called()
+        estimate_bpm.assert_not_called()
 
     def test_get_export_params_lossless(self):
         """Test export params for lossless formats."""
@@ -0,0 +1,112 @@
+"""
+Unit tests for the sync framework destination index.
+"""
+
+import random
+
+import pytest
+
+import sys
+sys.path.insert(0, '.')
+
+from sync_framework.core import destination_index
+from sync_framework.core.deduplication import DeduplicationEngine
+from sync_framework.core.destination_index import DestinationIndex
+from sync_framework.core.sync_orchestrator import SyncOrchestrator
+
+
+def _existing(n=300, seed=5):
+    rng = random.Random(seed)
+    words = ["alpha", "beta", "gamma", "delta", "omega", "sigma", "kappa", "theta"]
+    items = []
+    for i in range(n):
+        title = " ".join(rng.choice(words) for _ in range(3)) + f" {i % 40}"
+        items.append({
+            "id": f"page-{i}",
+            "title": title,
+            "name": title.upper() if i % 3 else None,
+            "fingerprint": f"fp{i % 50}",
+            "source": "notion",
+        })
+    return items
+
+
+class TestDestinationIndex:
+    """Test index lookups."""
+
+    def test_exact_probes(self, tmp_path):
+        index = DestinationIndex([
+            {"id": "a", "title": " Sunset ", "fingerprint": "f1", "file_path": str(tmp_path / "x.jpg")},
+            {"id": "b", "title": "sunrise", "fingerprint_hash": "f2"},
+        ])
+
+        assert [i["id"] for i in index.fingerprint_candidates("f2")] == ["b"]
+        assert [i["id"] for i in index.fingerprint_candidates(None, tmp_path / "x.jpg")] == ["a"]
+        assert [i["id"] for i in index.value_candidates({"title": "sunset"})] == ["a"]
+        assert index.value_candidates({"title": "moon"}) == []
+
+        index.add({"id": "c", "title": "Sunset"})
+        assert [i["id"] for i in index.value_candidates({"title": "sunset"})] == ["a", "c"]
+
+    def test_fuzzy_without_rapidfuzz_returns_all_valued(self, monkeypatch):
+        monkeypatch.setattr(destination_index, "RAPIDFUZZ_AVAILABLE", False)
+        index = DestinationIndex([{"title": "a"}, {"name": "b"}, {"title": "c"}])
+        assert len(index.value_candidates({"title": "zzz"}, 0.8)) == 2
+
+
+class TestIndexedDeduplication:
+    """Test indexed dedup agrees with the list scan."""
+
+    @pytest.mark.parametrize("item_type", ["Documents", "Generic Items"])
+    def test_matches_list_scan(self, item_type):
+        engine = DeduplicationEngine(item_type, {})
+        existing = _existing()
+        index = engine.build_index(existing)
+        probes = existing[::7] + [
+            {"title": "alpha beta gamma 3"},
+            {"title": "nothing like it"},
+            {"name": "ALPHA ALPHA ALPHA 1"},
+        ]
+
+        for item in probes:
+            item = {k: v for k, v in item.items() if k != "id"}
+            expected = engine.find_duplicates(item, existing)
+            found = engine.find_duplicates(item, index)
+            assert [(m.item_id, m.match_type, m.similarity_score) for m in found] == \
+                [(m.item_id, m.match_type, m.similarity_score) for m in expected]
+
+
+class _Destination:
+    def __init__(self, existing):
+        self.existing = existing
+        self.fetches = 0
+        self.created = []
+
+    def get_existing_items(self, item_type):
+        self.fetches += 1
+        return list(self.existing)
+
+    def create_or_update_item(self, item, database_id, item_type):
+        self.created.append(item)
+        return {"created": True, "item_id": f"new-{len(self.created)}"}
+
+
+class TestOrchestratorIndex:
+    """Test the orchestrator loads the destination once per run."""
+
+    def test_single_fetch_and_created_items_indexed(self):
+        destination = _Destination([{"id": "p1", "title": "Existing Song", "source": "notion"}])
+        orchestrator = SyncOrchestrator("Generic Items", None, destination, verify_files=False)
+        orchestrator.database_router.route_item = lambda item, item_type, file_path: ["db"]
+
+        result = orchestrator.sync(items=[
+            {"id": "1", "title": "existing song"},
+            {"id": "2", "title": "Fresh Song"},
+            {"id": "3", "title": "fresh song"},
+            {"id": "4", "title": "Another"},
+        ])
+
+        assert destination.fetches == 1
+        assert [item["title"] for item in destination.created] == ["Fresh Song", "Another"]
+        assert result.items_created == 2
+        assert result.items_skipped == 2
@@ -0,0 +1,101 @@
+"""
+Unit tests for the pipelined sync orchestrator.
+"""
+
+import asyncio
+import os
+
+import pytest
+
+import sys
+sys.path.insert(0, '.')
+
+from sync_framework.core.sync_orchestrator import SyncOrchestrator
+from sync_framework.core.sync_pipeline import PipelineConfig
+
+
+class _Destination:
+    def __init__(self, existing=(), fail_titles=()):
+        self.existing = list(existing)
+        self.fail_titles = set(fail_titles)
+        self.created = []
+
+    def get_existing_items(self, item_type):
+        return list(self.existing)
+
+    def create_or_update_item(self, item, database_id, item_type):
+        if item["title"] in self.fail_titles:
+            self.fail_titles.discard(item["title"])
+            raise RuntimeError(f"write failed: {item['title']}")
+        self.created.append(item["title"])
+        return {"created": True, "item_id": f"new-{item['title']}"}
+
+
+class _AsyncDestination(_Destination):
+    async def acreate_or_update_item(self, item, database_id, item_type):
+        await asyncio.sleep(0)
+        return self.create_or_update_item(item, database_id, item_type)
+
+
+TITLES = [
+    "amber", "basalt", "cobalt", "driftwood", "echo", "fjord", "granite", "harbor",
+    "indigo", "juniper", "kestrel", "lagoon", "meadow", "nectar", "obsidian",
+]
+
+
+@pytest.fixture
+def items(tmp_path):
+    result = []
+    for i in range(40):
+        path = tmp_path / f"file_{i}.txt"
+        path.write_bytes(os.urandom(512))
+        result.append({"id": str(i), "title": TITLES[i % 15], "file_path": str(path)})
+    result.append({"id": "missing", "title": "gone", "file_path": str(tmp_path / "gone.txt")})
+    return result
+
+
+def _sync(items, destination, config=None):
+    orchestrator = SyncOrchestrator("Generic Items", None, destination, pipeline_config=config)
+    orchestrator.database_router.route_item = lambda item, item_type, file_path: ["db"]
+    return orchestrator.sync(items=[dict(item) for item in items])
+
+
+class TestSyncPipeline:
+    """Test the staged sync against a serial run."""
+
+    @pytest.mark.parametrize("processes", [False, True])
+    def test_matches_serial_run(self, items, processes):
+        existing = [{"id": "p1", "title": "driftwood", "source": "notion"}]
+        serial_destination = _Destination(existing)
+        serial = _sync(items, serial_destination)
+
+        destination = _Destination(existing)
+        config = PipelineConfig(queue_size=4, verify_workers=3, fingerprint_workers=2,
+                                fingerprint_processes=processes, write_concurrency=3)
+        piped = _sync(items, destination, config)
+
+        assert sorted(destination.created) == sorted(serial_destination.created)
+        for field in ("items_processed", "items_created", "items_skipped",
+                      "items_failed", "items_verified", "items_missing_files"):
+            assert getattr(piped, field) == getattr(serial, field)
+        assert piped.items_created == 14
+        assert piped.stage_metrics["write"]["processed"] == 14
+        assert piped.stage_metrics["verify"]["max_queue_depth"] <= 4
+        assert serial.stage_metrics is None
+
+    def test_failed_write_does_not_shadow_later_copy(self, items):
+        destination = _Destination(fail_titles={"amber"})
+        result = _sync(items, destination, PipelineConfig(fingerprint_processes=False,
+                                                          write_concurrency=1))
+
+        assert result.items_failed == 1
+        assert "write failed: amber" in result.errors
+        assert destination.created.count("amber") == 1
+        assert not result.success
+
+    def test_async_adapter(self, items):
+        destination = _AsyncDestination()
+        result = _sync(items, destination, PipelineConfig(fingerprint_processes=False))
+
+        assert result.items_created == 15
+        assert len(set(destination.created)) == 15
@@ -0,0 +1,130 @@
+"""
+Unit tests for the memory-mapped task vector store.
+"""
+
+import json
+
+import numpy as np
+import pytest
+
+import sys
+sys.path.insert(0, '.')
+
+from shared_core.local_llm.vector_store import SimpleVectorStore
+
+
+def _store(tmp_path, **kwargs):
+    return SimpleVectorStore(str(tmp_path / "tasks.json"), **kwargs)
+
+
+class TestSimpleVectorStore:
+    """Test persistence, compaction and exact/approximate search."""
+
+    def test_search_ranks_by_cosine_and_survives_reload(self, tmp_path):
+        store = _store(tmp_path)
+        store.add("a", [1.0, 0.0, 0.0], {"title": "A"})
+        store.add("b", [0.9, 0.1, 0.0], {"title": "B"})
+        store.add("c", [0.0, 1.0, 0.0], {"title": "C"})
+        store.add("zero", [0.0, 0.0, 0.0])
+
+        results = store.search([2.0, 0.0, 0.0], threshold=0.5)
+        assert [r["task_id"] for r in results] == ["a", "b"]
+        assert results[0]["similarity"] == 1.0 and results[0]["title"] == "A"
+        assert [r["task_id"] for r in store.search([1, 0, 0], threshold=0.5, exclude_ids=["a"])] == ["b"]
+        store.close()
+
+        reloaded = _store(tmp_path)
+        assert reloaded.count() == 4
+        assert [r["task_id"] for r in reloaded.search([1, 0, 0], threshold=0.5)] == ["a", "b"]
+        assert reloaded.get("c")["metadata"] == {"title": "C"}
+
+    def test_replace_remove_and_compaction(self, tmp_path):
+        store = _store(tmp_path)
+        store.add_many([f"t{i}" for i in range(100)], np.eye(100, dtype=np.float32))
+        store.add("t0", np.eye(100)[1])
+        for i in range(2, 70):
+            assert store.remove(f"t{i}")
+        assert not store.remove("missing")
+
+        # Crossing 64 dead rows triggered an automatic compaction
+        assert store.count() == 32
+        assert store._rows < 101
+        store.compact()
+        assert store._rows == 32
+        assert len(store.meta_path.read_text().splitlines()) == 33
+        assert {r["task_id"] for r in store.search(np.eye(100)[1], threshold=0.99)} == {"t0", "t1"}
+
+        reloaded = _store(tmp_path)
+        assert reloaded.count() == 32
+        assert reloaded.get("t5") is None
+
+    def test_interrupted_compaction_keeps_matrix_and_sidecar_paired(self, tmp_path, monkeypatch):
+        store = _store(tmp_path)
+        store.add_many([f"t{i}" for i in range(10)], np.eye(10, dtype=np.float32))
+        for i in range(5):
+            store.remove(f"t{i}")
+        store.flush()
+
+        def crash(src, dst):
+            raise OSError("simulated crash before the sidecar swap")
+
+        monkeypatch.setattr("shared_core.local_llm.vector_store.os.replace", crash)
+        with pytest.raises(OSError):
+            store.compact()
+        monkeypatch.undo()
+
+        reloaded = _store(tmp_path)
+        assert reloaded.count() == 5
+        assert [r["task_id"] for r in reloaded.search(np.eye(10)[7], threshold=0.99)] == ["t7"]
+        assert sorted(p.name for p in tmp_path.glob("*.npy")) == ["tasks.npy"]
+
+        reloaded.compact()
+        assert reloaded.matrix_path.name == "tasks.1.npy"
+        again = _store(tmp_path)
+        assert [r["task_id"] for r in again.search(np.eye(10)[7], threshold=0.99)] == ["t7"]
+        assert sorted(p.name for p in tmp_path.glob("*.npy")) == ["tasks.1.npy"]
+
+    def test_legacy_json_store_is_imported(self, tmp_path):
+        legacy = {"old": {"embedding": [0.0, 3.0], "metadata": {"title": "Old"}, "added_at": "2026-01-19T00:00:00"}}
+        (tmp_path / "tasks.json").write_text(json.dumps(legacy))
+
+        store = _store(tmp_path)
+
+        assert store.search([0.0, 1.0], threshold=0.9)[0]["title"] == "Old"
+        assert store.get("old")["added_at"] == "2026-01-19T00:00:00"
+        assert store.matrix_path.exists() and store.meta_path.exists()
+
+    def test_ivf_index_matches_exact_search(self, tmp_path):
+        rng = np.random.default_rng(1)
+        centers = rng.normal(size=(20, 32))
+        vectors = (centers[rng.integers(0, 20, 3000)] + 0.3 * rng.normal(size=(3000, 32))).astype(np.float32)
+        store = _store(tmp_path, ann_min_rows=1000, nprobe=4)
+        store.add_many([f"t{i}" for i in range(3000)], vectors)
+
+        for query in vectors[:20]:
+            approx = store.search(query, threshold=0.9, top_k=3)
+            exact = store.search(query, threshold=0.9, top_k=3, exact=True)
+            assert approx[0]["task_id"] == exact[0]["task_id"]
+        assert store._index is not None
+
+    def test_ann_is_opt_in(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("VECTOR_STORE_ANN_MIN_ROWS", raising=False)
+        store = _store(tmp_path)
+        store.add_many([f"t{i}" for i in range(50)], np.eye(50, dtype=np.float32))
+
+        store.search(np.eye(50)[0], threshold=0.9)
+        assert store.ann_min_rows == 0 and store._index is None
+
+    def test_corrupt_sidecar_and_matrix_do_not_fail_startup(self, tmp_path):
+        store = _store(tmp_path)
+        store.add("a", [1.0, 0.0])
+        store.close()
+        with open(store.meta_path, "a", encoding="utf-8") as f:
+            f.write('{"op": "add", "id": "b", "row": "x"}\n[1, 2]\n{"op": "dim"}\n')
+
+        reloaded = _store(tmp_path)
+        assert reloaded.count() == 1
+        reloaded.close()
+
+        store.matrix_path.write_bytes(b"not a numpy file")
+        assert _store(tmp_path).count() == 0
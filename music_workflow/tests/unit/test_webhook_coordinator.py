@@ -0,0 +1,118 @@
+"""
+Unit tests for load-aware multi-node webhook scheduling.
+"""
+
+import time
+
+import pytest
+
+import sys
+sys.path.insert(0, '.')
+sys.path.insert(0, 'services/webhook_server')
+
+from coordinator import HealthMonitor, LoadBalancer, NodeRegistry
+
+
+@pytest.fixture
+def registry():
+    registry = NodeRegistry(failure_threshold=2, cooldown_s=60)
+    for node_id in ("a", "b", "c"):
+        registry.register_or_update(node_id=node_id, base_url=f"http://{node_id}.local", role="worker")
+        registry.set_health(node_id, healthy=True, checked_at="now", ok_at="now", error=None)
+    return registry
+
+
+class TestLoadBalancer:
+    """Test strategies, sticky routing and circuit breaking."""
+
+    def test_least_outstanding_prefers_lowest_reported_and_local_load(self, registry):
+        registry.update_load("a", {"queue_depth": 5, "in_flight": 2, "latency_ms": 40})
+        registry.update_load("b", {"queue_depth": 1, "in_flight": 1, "latency_ms": 40})
+        registry.update_load("c", {"queue_depth": 0, "in_flight": 1, "latency_ms": 10})
+        balancer = LoadBalancer("least_outstanding_requests", sticky=False)
+
+        assert balancer.select_node(registry.healthy_nodes()).node_id == "c"
+        registry.begin("c")
+        registry.begin("c")
+        assert balancer.select_node(registry.healthy_nodes()).node_id == "b"
+
+    def test_power_of_two_never_picks_the_most_loaded(self, registry):
+        registry.update_load("a", {"queue_depth": 100})
+        registry.update_load("b", {"queue_depth": 1})
+        registry.update_load("c", {"queue_depth": 2})
+        balancer = LoadBalancer("p2c", sticky=False)
+
+        picks = {balancer.select_node(registry.healthy_nodes()).node_id for _ in range(200)}
+
+        assert picks == {"b", "c"}
+
+    def test_sticky_routing_is_stable_and_queues_when_owner_unavailable(self, registry):
+        balancer = LoadBalancer("least_outstanding", sticky=True, sticky_max_load=10)
+        nodes = registry.list_nodes()
+        owner = balancer.select_node(nodes, key="page-1").node_id
+
+        assert {balancer.select_node(nodes, key="page-1").node_id for _ in range(20)} == {owner}
+        # Removing another node does not move the key
+        others = [n for n in nodes if n.node_id != owner]
+        assert balancer.select_node([n for n in nodes if n.node_id != others[0].node_id], key="page-1").node_id == owner
+
+        # An overloaded or failing owner keeps its keys rather than spilling them
+        registry.update_load(owner, {"queue_depth": 50})
+        assert balancer.select_node(registry.list_nodes(), key="page-1") is None
+        registry.update_load(owner, {"queue_depth": 0})
+        registry.set_health(owner, healthy=False, checked_at="later", ok_at=None, error="down")
+        assert balancer.select_node(registry.list_nodes(), key="page-1") is None
+        # Keyless jobs still go to the available nodes
+        assert balancer.select_node(registry.list_nodes()).node_id != owner
+
+    def test_circuit_closes_only_after_a_successful_forward(self, registry):
+        registry.begin("a")
+        registry.end("a", ok=False)
+        assert "a" in [n.node_id for n in registry.healthy_nodes()]
+        registry.begin("a")
+        registry.end("a", ok=False)
+        assert "a" not in [n.node_id for n in registry.healthy_nodes()]
+
+        # /health still answers while forwards fail: the circuit stays open
+        registry.set_health("a", healthy=True, checked_at="later", ok_at="later", error=None)
+        assert "a" not in [n.node_id for n in registry.healthy_nodes()]
+
+        # After the cooldown a forward is retried and its success closes the circuit
+        node = registry.list_nodes()[0]
+        node.circuit_open_until = time.time() - 1
+        registry.begin("a")
+        registry.end("a", ok=True)
+        assert "a" in [n.node_id for n in registry.healthy_nodes()]
+        assert node.consecutive_failures == 0
+        assert node.outstanding == 0
+
+
+class TestHealthMonitor:
+    """Test concurrent probing."""
+
+    def test_nodes_are_probed_concurrently(self, registry, monkeypatch):
+        monitor = HealthMonitor(registry)
+        probed = []
+
+        def slow_probe(node):
+            time.sleep(0.2)
+            probed.append(node.node_id)
+
+        monkeypatch.setattr(monitor, "_check_node", slow_probe)
+        started = time.monotonic()
+        monitor.check_all()
+
+        assert sorted(probed) == ["a", "b", "c"]
+        assert time.monotonic() - started < 0.5
+
+
+@pytest.mark.slow
+def test_harness_routes_around_slow_worker():
+    sys.path.insert(0, 'services/webhook_server/scripts')
+    from simulate_worker_nodes import WorkerSpec, simulate
+
+    specs = [WorkerSpec(service_ms=50, threads=1), WorkerSpec(service_ms=5, threads=2)]
+    result = simulate("least_outstanding", specs, jobs=80, rate=100, concurrency=4)
+
+    assert sum(result["jobs"].values()) == 80
+    assert result["jobs"]["worker-0"] < result["jobs"]["worker-1"]
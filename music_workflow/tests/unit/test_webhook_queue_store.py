@@ -0,0 +1,100 @@
+"""
+Unit tests for the durable webhook queue store.
+"""
+
+import time
+
+import pytest
+
+import sys
+sys.path.insert(0, '.')
+
+from shared_core.webhook_queue_store import DEAD, DONE, PENDING, WebhookQueueStore, main
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = WebhookQueueStore(tmp_path / "queue.sqlite3", max_attempts=2, retry_backoff=0)
+    yield store
+    store.close()
+
+
+class TestWebhookQueueStore:
+    """Test persistence, acks, retries, dead-lettering and replay."""
+
+    def test_unacked_jobs_survive_restart(self, tmp_path):
+        path = tmp_path / "queue.sqlite3"
+        first = WebhookQueueStore(path)
+        done_id = first.enqueue({"type": "page.updated"}, request_id="r1")
+        lost_id = first.enqueue({"type": "page.created"}, request_id="r2", lane=1, entity_key="abc")
+        first.claim(done_id)
+        first.claim(lost_id)
+        first.ack(done_id)
+        first.close()
+
+        second = WebhookQueueStore(path)
+        assert second.due() == []  # lost_id is still claimed
+        assert second.release_all() == 1
+        jobs = second.due()
+        second.close()
+
+        assert [(job.id, job.lane, job.entity_key, job.attempts) for job in jobs] == [(lost_id, 1, "abc", 1)]
+        assert jobs[0].payload == {"type": "page.created"}
+
+    def test_acks_are_group_committed(self, store):
+        job_id = store.enqueue({"n": 1})
+        store.ack(job_id)
+
+        deadline = time.monotonic() + 2
+        while store._buffer and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert not store._buffer
+        assert store.counts()[DONE] == 1
+
+    def test_failures_retry_then_dead_letter_and_replay(self, store):
+        job_id = store.enqueue({"n": 1})
+
+        store.claim(job_id)
+        assert store.nack(job_id, "timeout") == PENDING
+        assert [job.id for job in store.due()] == [job_id]
+
+        store.claim(job_id)
+        assert store.nack(job_id, "timeout again") == DEAD
+        assert store.due() == []
+        dead = store.jobs(state=DEAD)
+        assert dead[0].last_error == "timeout again"
+
+        assert store.replay(dead=True) == 1
+        job = store.due()[0]
+        assert (job.id, job.attempts) == (job_id, 0)
+
+    def test_due_skips_jobs_in_memory_and_expired_claims_reappear(self, store):
+        first = store.enqueue({"n": 1})
+        second = store.enqueue({"n": 2})
+
+        assert [job.id for job in store.due(exclude={first})] == [second]
+
+        store.claim(second, visibility_timeout=0)
+        time.sleep(0.01)
+        assert store.expired_claims() == [second]
+        assert second in [job.id for job in store.due()]
+
+    def test_cli_replays_and_purges(self, tmp_path, capsys):
+        path = tmp_path / "queue.sqlite3"
+        store = WebhookQueueStore(path, max_attempts=1)
+        dead_id = store.enqueue({"type": "page.updated"})
+        store.claim(dead_id)
+        store.nack(dead_id, "boom")
+        done_id = store.enqueue({"type": "page.created"})
+        store.ack(done_id)
+        store.close()
+
+        assert main(["replay", "--path", str(path), "--id", str(dead_id)]) == 0
+        assert main(["purge", "--path", str(path), "--days", "0"]) == 0
+        assert main(["replay", "--path", str(path)]) == 1
+
+        store = WebhookQueueStore(path)
+        assert store.counts() == {PENDING: 1, DONE: 0, DEAD: 0}
+        store.close()
+        assert "Re-queued 1 job(s)" in capsys.readouterr().out
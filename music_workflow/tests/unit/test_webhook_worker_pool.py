@@ -0,0 +1,150 @@
+"""
+Unit tests for the concurrent webhook worker pool.
+"""
+
+import threading
+import time
+
+import sys
+sys.path.insert(0, '.')
+
+from shared_core.webhook_worker_pool import (
+    COALESCED,
+    QUEUED,
+    REJECTED,
+    WebhookLane,
+    WebhookWorkerPool,
+)
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met in time")
+        time.sleep(0.005)
+
+
+class TestWebhookWorkerPool:
+    """Test ordering, parallelism, priority, coalescing and backpressure."""
+
+    def test_same_key_serialized_different_keys_parallel(self):
+        lock = threading.Lock()
+        running = {}
+        overlap = {"same_key": False, "max_parallel": 0}
+        done = []
+
+        def handler(item):
+            key, n = item
+            with lock:
+                if running.get(key):
+                    overlap["same_key"] = True
+                running[key] = True
+                overlap["max_parallel"] = max(overlap["max_parallel"], sum(running.values()))
+            time.sleep(0.02)
+            with lock:
+                running[key] = False
+                done.append(item)
+
+        pool = WebhookWorkerPool(handler, workers=4)
+        pool.start()
+        for n in range(3):
+            for key in ("page-a", "page-b", "page-c"):
+                pool.submit((key, n), key=key)
+        _wait_for(lambda: len(done) == 9)
+        pool.stop()
+
+        assert not overlap["same_key"]
+        assert overlap["max_parallel"] > 1
+        for key in ("page-a", "page-b", "page-c"):
+            assert [n for k, n in done if k == key] == [0, 1, 2]
+
+    def test_control_lane_runs_first(self):
+        order = []
+        pool = WebhookWorkerPool(order.append, workers=1)
+        pool.submit("legacy", lane=WebhookLane.LEGACY)
+        pool.submit("workflow", lane=WebhookLane.WORKFLOW)
+        pool.submit("challenge", lane=WebhookLane.CONTROL)
+
+        pool.start()
+        _wait_for(lambda: len(order) == 3)
+        pool.stop()
+
+        assert order == ["challenge", "workflow", "legacy"]
+
+    def test_queued_event_for_same_entity_is_coalesced(self):
+        seen = []
+        pool = WebhookWorkerPool(seen.append, workers=1)
+
+        assert pool.submit("v1", key="page", coalesce_key="updated:page") == QUEUED
+        assert pool.submit("v2", key="page", coalesce_key="updated:page") == COALESCED
+        assert pool.submit("deleted", key="page", coalesce_key="deleted:page") == QUEUED
+
+        pool.start()
+        _wait_for(lambda: len(seen) == 2)
+        pool.stop()
+
+        assert seen == ["v2", "deleted"]
+        assert pool.snapshot()["coalesced"] == 1
+
+    def test_coalesced_event_keeps_per_key_order(self):
+        seen = []
+        pool = WebhookWorkerPool(seen.append, workers=1)
+
+        pool.submit("v1", key="page", coalesce_key="updated:page")
+        pool.submit("other", key="other-page", lane=WebhookLane.WORKFLOW)
+        pool.submit("moved", key="page", coalesce_key="moved:page")
+        assert pool.submit("v2", key="page", coalesce_key="updated:page") == COALESCED
+
+        metrics = pool.snapshot()
+        assert metrics["queued"] == 3
+        assert metrics["lanes"]["legacy"] == 2
+
+        pool.start()
+        _wait_for(lambda: len(seen) == 3)
+        pool.stop()
+
+        # v2 runs after the event that arrived between v1 and v2
+        assert seen == ["other", "moved", "v2"]
+        assert pool.pending() == 0
+
+    def test_bounded_queue_rejects_but_accepts_control(self):
+        pool = WebhookWorkerPool(lambda item: None, workers=1, max_queue=2)
+
+        assert pool.submit("a") == QUEUED
+        assert pool.submit("b") == QUEUED
+        assert pool.submit("c") == REJECTED
+        assert pool.submit("challenge", lane=WebhookLane.CONTROL) == QUEUED
+
+        metrics = pool.snapshot()
+        assert metrics["rejected"] == 1
+        assert metrics["queued"] == 3
+        assert metrics["lanes"]["control"] == 1
+
+    def test_handler_errors_are_reported_and_do_not_stop_workers(self):
+        errors = []
+        seen = []
+
+        def handler(item):
+            if item == "bad":
+                raise RuntimeError("boom")
+            seen.append(item)
+
+        pool = WebhookWorkerPool(handler, workers=1, on_error=lambda item, e: errors.append((item, str(e))))
+        pool.start()
+        pool.submit("bad")
+        pool.submit("good")
+        _wait_for(lambda: seen == ["good"])
+        pool.stop()
+
+        assert errors == [("bad", "boom")]
+        assert pool.snapshot()["failed"] == 1
+
+    def test_on_coalesce_reports_superseded_item(self):
+        replaced = []
+        pool = WebhookWorkerPool(lambda item: None, workers=1, on_coalesce=lambda old, new: replaced.append((old, new)))
+
+        pool.submit("v1", key="page", coalesce_key="updated:page")
+        pool.submit("v2", key="page", coalesce_key="updated:page")
+
+        assert replaced == [("v1", "v2")]
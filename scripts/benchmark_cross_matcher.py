@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Benchmark blocked vs brute-force fuzzy matching in ``CrossPlatformMatcher``.
+
+Loads synthetic libraries into all four platforms (titles varied per
+platform: case, mix suffixes, typos), then for a sample of title/artist
+keys compares ``FuzzyKeyIndex.matches`` with the full ``SequenceMatcher``
+scan it replaced. Prints recall, extra matches and per-lookup latency of
+both, and the wall time of ``build_unified_index``.
+
+Usage:
+    python scripts/benchmark_cross_matcher.py
+    python scripts/benchmark_cross_matcher.py --tracks 30000 --queries 20 --threshold 0.85
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from difflib import SequenceMatcher
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from music_workflow.integrations.unified_sync.cross_matcher import CrossPlatformMatcher
+from music_workflow.integrations.unified_sync.fuzzy_index import FuzzyKeyIndex
+
+SYLLABLES = "ka lo mi ra ne su ti vo da re shi an el or um in ta be no ly".split()
+SUFFIXES = ["", "", "", " (Original Mix)", " (Extended Mix)", " - Radio Edit", " (feat. MC)"]
+
+
+class StaticNotion:
+    """Notion client stand-in returning one page of preloaded results."""
+
+    def __init__(self, pages: List[Dict[str, Any]]):
+        self.databases = SimpleNamespace(query=lambda **kwargs: {"results": pages, "has_more": False})
+
+
+def _vary(rng: random.Random, title: str) -> str:
+    title = title + rng.choice(SUFFIXES)
+    if rng.random() < 0.3:
+        title = title.upper() if rng.random() < 0.5 else title.title()
+    if rng.random() < 0.2:
+        position = rng.randrange(len(title))
+        title = title[:position] + title[position + 1:]
+    return title
+
+
+def build_matcher(tracks: int, threshold: float, seed: int = 1) -> CrossPlatformMatcher:
+    rng = random.Random(seed)
+    words = ["".join(rng.choice(SYLLABLES) for _ in range(rng.randint(1, 3))) for _ in range(3000)]
+    artists = [" ".join(rng.sample(words, rng.randint(1, 2))).title() for _ in range(max(tracks // 10, 1))]
+    songs = [
+        (" ".join(rng.choice(words) for _ in range(rng.randint(1, 4))), rng.choice(artists))
+        for _ in range(tracks)
+    ]
+
+    pages = [
+        {"id": f"page-{i}", "properties": {
+            "Title": {"title": [{"plain_text": _vary(rng, title)}]},
+            "Artist": {"rich_text": [{"plain_text": artist}]},
+        }}
+        for i, (title, artist) in enumerate(songs)
+    ]
+    matcher = CrossPlatformMatcher(StaticNotion(pages), "benchmark", fuzzy_threshold=threshold)
+    matcher.load_notion_tracks()
+    matcher.load_apple_music_tracks([
+        SimpleNamespace(persistent_id=f"AM{i}", name=_vary(rng, title), artist=artist, album="",
+                        location=None, bpm=None, rating=None, played_count=0)
+        for i, (title, artist) in enumerate(songs)
+    ])
+    matcher.load_rekordbox_tracks([
+        SimpleNamespace(track_id=i, title=_vary(rng, title), artist=artist, album="", file_path=None,
+                        bpm=None, key=None, rating=None, play_count=0)
+        for i, (title, artist) in enumerate(songs)
+    ])
+    matcher.load_djay_pro_tracks([
+        SimpleNamespace(title_id=f"dj{i}", title=_vary(rng, title), artist=artist)
+        for i, (title, artist) in enumerate(songs)
+    ])
+    return matcher
+
+
+def brute_force(query: str, keys: List[str], threshold: float) -> List[str]:
+    """The scan ``_find_all_matches`` used before blocking."""
+    matches = []
+    for key in keys:
+        if abs(len(query) - len(key)) > max(len(query), len(key)) * 0.5:
+            continue
+        if SequenceMatcher(None, query, key).ratio() >= threshold:
+            matches.append(key)
+    return matches
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark blocked vs brute-force fuzzy matching")
+    parser.add_argument("--tracks", type=int, default=5000, help="tracks per platform")
+    parser.add_argument("--queries", type=int, default=50, help="keys compared against brute force")
+    parser.add_argument("--threshold", type=float, default=0.85)
+    args = parser.parse_args()
+
+    matcher = build_matcher(args.tracks, args.threshold)
+    keys = list(matcher._title_artist_index.keys())
+
+    start = time.perf_counter()
+    index = FuzzyKeyIndex(keys)
+    index_time = time.perf_counter() - start
+
+    sample = random.Random(2).sample(keys, min(args.queries, len(keys)))
+    expected = found = extra = 0
+    brute_time = blocked_time = 0.0
+    for query in sample:
+        start = time.perf_counter()
+        reference = set(brute_force(query, keys, args.threshold))
+        brute_time += time.perf_counter() - start
+
+        start = time.perf_counter()
+        result = set(index.matches(query, args.threshold))
+        blocked_time += time.perf_counter() - start
+
+        expected += len(reference)
+        found += len(reference & result)
+        extra += len(result - reference)
+
+    print(f"{args.tracks} tracks x 4 platforms, {len(keys)} title/artist keys, threshold {args.threshold}")
+    print(f"  index build:  {index_time:7.2f}s")
+    print(f"  recall:       {found / max(expected, 1):.2%} ({found}/{expected}), extra matches: {extra}")
+    print(f"  brute force:  {brute_time / len(sample) * 1000:9.2f} ms/lookup")
+    print(f"  blocked:      {blocked_time / len(sample) * 1000:9.2f} ms/lookup "
+          f"({brute_time / max(blocked_time, 1e-9):.0f}x)")
+
+    start = time.perf_counter()
+    unified = matcher.build_unified_index()
+    build_time = time.perf_counter() - start
+    lookups = 4 * args.tracks
+    print(f"  build_unified_index: {build_time:7.2f}s for {len(unified)} unified tracks "
+          f"(brute force est. {brute_time / len(sample) * lookups:.0f}s for {lookups} lookups)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Benchmark Eagle near-duplicate name clustering.
+
+Compares the legacy pairwise ``SequenceMatcher`` clustering used by
+``eagle_library_deduplication()`` against ``shared_core.eagle.near_duplicates``
+on synthetic libraries. Both paths run the same prefix-bucket and
+suffix-bucket passes; only the per-bucket clustering differs. Recall and
+precision are measured on grouped pairs against the legacy result, since
+extra groups feed a destructive merge. The engine's library-wide mode
+(blocking + cross-block LSH) is reported as well.
+
+Usage:
+    python scripts/benchmark_eagle_near_duplicates.py
+    python scripts/benchmark_eagle_near_duplicates.py --sizes 10000 50000 100000 --baseline-limit 50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import difflib
+import random
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Sequence, Set, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from shared_core.eagle.near_duplicates import (
+    NearDuplicateClusterer,
+    token_prefix_key,
+    token_suffix_key,
+)
+
+ClusterFn = Callable[[List[str], float], List[List[int]]]
+
+_SYLLABLES = ["ka", "lo", "mi", "ne", "ra", "tu", "vex", "dor", "syn", "bel", "qua", "zen", "po", "fi", "sha"]
+_MIX_SUFFIXES = ["original mix", "extended mix", "radio edit", "remix", "dub", "vip", "club mix"]
+
+
+def _normalize(name: str) -> str:
+    """Same normalization as the monolith's _sanitize_match_string."""
+    return re.sub(r"[^a-z0-9]+", " ", name.lower()).strip()
+
+
+def _word(rng: random.Random) -> str:
+    return "".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(1, 3)))
+
+
+def _variant(name: str, rng: random.Random) -> str:
+    """Produce a near-duplicate of a name the way libraries accumulate them."""
+    kind = rng.randrange(5)
+    if kind == 0:
+        return f"{name} (1)"
+    if kind == 1:
+        chars = list(name)
+        pos = rng.randrange(len(chars))
+        chars[pos] = rng.choice("abcdefghijklmnopqrstuvwxyz")
+        return "".join(chars)
+    if kind == 2:
+        return name.replace(" - ", " _ ").upper()
+    if kind == 3:
+        return f"{name} copy"
+    return name.rsplit(" ", 1)[0] if " " in name else name + "x"
+
+
+def synthetic_library(size: int, seed: int = 7, duplicate_rate: float = 0.15) -> List[str]:
+    """
+    Build a synthetic Eagle name list.
+
+    Artist popularity is Zipf-like, so the biggest artists produce the
+    large prefix buckets that make the pairwise scan slow on real libraries.
+    """
+    rng = random.Random(seed)
+    artist_count = max(10, size // 40)
+    artists = [" ".join(_word(rng) for _ in range(rng.randint(1, 3))) for _ in range(artist_count)]
+    weights = [1.0 / (rank + 1) for rank in range(artist_count)]
+
+    names: List[str] = []
+    while len(names) < size:
+        artist = rng.choices(artists, weights=weights)[0]
+        title = " ".join(_word(rng) for _ in range(rng.randint(1, 4)))
+        if rng.random() < 0.4:
+            title = f"{title} ({rng.choice(_MIX_SUFFIXES)})"
+        name = f"{artist} - {title}"
+        names.append(name)
+        if rng.random() < duplicate_rate and len(names) < size:
+            names.append(_variant(name, rng))
+    rng.shuffle(names)
+    return names[:size]
+
+
+def legacy_cluster(norms: List[str], min_similarity: float) -> List[List[int]]:
+    """Legacy all-pairs SequenceMatcher clustering (copy of the monolith's original)."""
+    if len(norms) < 2:
+        return []
+    parent = list(range(len(norms)))
+
+    def find(idx: int) -> int:
+        while parent[idx] != idx:
+            parent[idx] = parent[parent[idx]]
+            idx = parent[idx]
+        return idx
+
+    for i in range(len(norms)):
+        name_i = norms[i]
+        if not name_i:
+            continue
+        for j in range(i + 1, len(norms)):
+            name_j = norms[j]
+            if not name_j:
+                continue
+            if abs(len(name_i) - len(name_j)) > max(len(name_i), len(name_j)) * 0.5:
+                continue
+            if difflib.SequenceMatcher(None, name_i, name_j).ratio() >= min_similarity:
+                ra, rb = find(i), find(j)
+                if ra != rb:
+                    parent[rb] = ra
+
+    clusters: Dict[int, List[int]] = {}
+    for idx in range(len(norms)):
+        clusters.setdefault(find(idx), []).append(idx)
+    return [group for group in clusters.values() if len(group) > 1]
+
+
+def engine_cluster(norms: List[str], min_similarity: float) -> List[List[int]]:
+    return NearDuplicateClusterer(min_similarity=min_similarity).cluster(norms)
+
+
+def bucketed_passes(norms: Sequence[str], cluster_fn: ClusterFn, min_similarity: float) -> List[List[int]]:
+    """Run the prefix-bucket then suffix-bucket passes of eagle_library_deduplication()."""
+    used: Set[int] = set()
+    groups: List[List[int]] = []
+    for key_fn in (token_prefix_key, token_suffix_key):
+        buckets: Dict[str, List[int]] = {}
+        for idx, norm in enumerate(norms):
+            if norm and idx not in used:
+                buckets.setdefault(key_fn(norm), []).append(idx)
+        for members in buckets.values():
+            if len(members) < 2:
+                continue
+            for group in cluster_fn([norms[i] for i in members], min_similarity):
+                group = [members[i] for i in group if members[i] not in used]
+                if len(group) >= 2:
+                    used.update(group)
+                    groups.append(group)
+    return groups
+
+
+def bucket_pair_count(norms: Sequence[str]) -> int:
+    """Pairs the legacy prefix pass compares (used to extrapolate its runtime)."""
+    buckets: Dict[str, int] = {}
+    for norm in norms:
+        if norm:
+            key = token_prefix_key(norm)
+            buckets[key] = buckets.get(key, 0) + 1
+    return sum(k * (k - 1) // 2 for k in buckets.values())
+
+
+def _pairs(groups: List[List[int]]) -> Set[Tuple[int, int]]:
+    return {(a, b) for group in groups for a in group for b in group if a < b}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark Eagle near-duplicate clustering")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 50000, 100000])
+    parser.add_argument("--min-similarity", type=float, default=0.75)
+    parser.add_argument("--baseline-limit", type=int, default=10000,
+                        help="Largest library the legacy path is actually run on; larger ones are extrapolated")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    print(f"{'names':>8} {'legacy s':>12} {'engine s':>9} {'speedup':>9} {'recall':>7} {'precision':>9} "
+          f"{'groups':>7} {'lib-wide s':>11}")
+    seconds_per_pair = None
+    for size in args.sizes:
+        norms = [_normalize(name) for name in synthetic_library(size, seed=args.seed)]
+
+        start = time.perf_counter()
+        engine_groups = bucketed_passes(norms, engine_cluster, args.min_similarity)
+        engine_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        NearDuplicateClusterer(
+            min_similarity=args.min_similarity,
+            block_keys=[token_prefix_key, token_suffix_key],
+        ).cluster(norms)
+        library_wide_s = time.perf_counter() - start
+
+        recall = precision = "n/a"
+        if size <= args.baseline_limit:
+            start = time.perf_counter()
+            legacy_groups = bucketed_passes(norms, legacy_cluster, args.min_similarity)
+            legacy_s = time.perf_counter() - start
+            seconds_per_pair = legacy_s / max(1, bucket_pair_count(norms))
+            legacy_pairs = _pairs(legacy_groups)
+            engine_pairs = _pairs(engine_groups)
+            found = legacy_pairs & engine_pairs
+            recall = f"{len(found) / len(legacy_pairs):.3f}" if legacy_pairs else "1.000"
+            precision = f"{len(found) / len(engine_pairs):.3f}" if engine_pairs else "1.000"
+            legacy_label = f"{legacy_s:.1f}"
+        elif seconds_per_pair is not None:
+            legacy_s = seconds_per_pair * bucket_pair_count(norms)
+            legacy_label = f"~{legacy_s:.0f} (est)"
+        else:
+            legacy_s = float("nan")
+            legacy_label = "skipped"
+
+        speedup = legacy_s / engine_s if engine_s else float("inf")
+        print(f"{size:>8} {legacy_label:>12} {engine_s:>9.2f} {speedup:>8.0f}x {recall:>7} {precision:>9} "
+              f"{len(engine_groups):>7} {library_wide_s:>11.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
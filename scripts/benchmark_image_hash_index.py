@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Benchmark perceptual-hash duplicate search.
+
+Compares the legacy all-pairs hex-string Hamming scan that
+``ImageMatcher.find_duplicates()`` used to run against
+``image_workflow.deduplication.hash_index.HammingIndex`` on synthetic
+64-bit hash sets: random base hashes plus near-duplicates a few bit flips
+away, the way re-exports and light edits show up in Lightroom + Eagle.
+
+Usage:
+    python scripts/benchmark_image_hash_index.py
+    python scripts/benchmark_image_hash_index.py --sizes 50000 200000 --radius 8 --baseline-limit 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import List, Set, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from image_workflow.deduplication.hash_index import NUMPY_AVAILABLE, HammingIndex
+
+
+def synthetic_hashes(size: int, seed: int = 7, duplicate_rate: float = 0.2, max_flips: int = 10) -> List[str]:
+    """Build ``size`` hex hashes, ~``duplicate_rate`` of them near-duplicates."""
+    rng = random.Random(seed)
+    hashes: List[str] = []
+    while len(hashes) < size:
+        base = rng.getrandbits(64)
+        hashes.append(f"{base:016x}")
+        while rng.random() < duplicate_rate and len(hashes) < size:
+            value = base
+            for bit in rng.sample(range(64), rng.randint(0, max_flips)):
+                value ^= 1 << bit
+            hashes.append(f"{value:016x}")
+    rng.shuffle(hashes)
+    return hashes
+
+
+def legacy_pairs(hashes: List[str], radius: int) -> Set[Tuple[int, int]]:
+    """All-pairs scan on hex strings (the pre-index find_duplicates inner loop)."""
+    found = set()
+    for i in range(len(hashes)):
+        for j in range(i + 1, len(hashes)):
+            if bin(int(hashes[i], 16) ^ int(hashes[j], 16)).count("1") <= radius:
+                found.add((i, j))
+    return found
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark perceptual-hash duplicate search")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 50000, 200000])
+    parser.add_argument("--radius", type=int, default=8)
+    parser.add_argument("--chunks", type=int, default=4)
+    parser.add_argument("--baseline-limit", type=int, default=5000,
+                        help="Largest set the legacy scan is actually run on; larger ones are extrapolated")
+    parser.add_argument("--queries", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    print(f"numpy join: {'yes' if NUMPY_AVAILABLE else 'no'}; radius={args.radius}, chunks={args.chunks}")
+    print(f"{'hashes':>8} {'legacy s':>12} {'build s':>8} {'pairs s':>8} {'speedup':>9} "
+          f"{'pairs':>8} {'groups':>7} {'query ms':>9} {'exact':>6}")
+    seconds_per_pair = None
+    for size in args.sizes:
+        hashes = synthetic_hashes(size, seed=args.seed)
+
+        start = time.perf_counter()
+        index = HammingIndex(chunks=args.chunks)
+        index.extend(hashes)
+        build_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        pairs = {(i, j) for i, j, _ in index.pairs(args.radius)}
+        groups = index.groups(args.radius)
+        pairs_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for h in hashes[:args.queries]:
+            index.query(h, args.radius)
+        query_ms = (time.perf_counter() - start) * 1000 / max(1, min(args.queries, size))
+
+        exact = "n/a"
+        if size <= args.baseline_limit:
+            start = time.perf_counter()
+            expected = legacy_pairs(hashes, args.radius)
+            legacy_s = time.perf_counter() - start
+            seconds_per_pair = legacy_s / max(1, size * (size - 1) // 2)
+            exact = "yes" if expected == pairs else "NO"
+            legacy_label = f"{legacy_s:.1f}"
+        elif seconds_per_pair is not None:
+            legacy_s = seconds_per_pair * size * (size - 1) // 2
+            legacy_label = f"~{legacy_s:.0f} (est)"
+        else:
+            legacy_s = float("nan")
+            legacy_label = "skipped"
+
+        total_s = build_s + pairs_s
+        speedup = legacy_s / total_s if total_s else float("inf")
+        print(f"{size:>8} {legacy_label:>12} {build_s:>8.2f} {pairs_s:>8.2f} {speedup:>8.0f}x "
+              f"{len(pairs):>8} {len(groups):>7} {query_ms:>9.3f} {exact:>6}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -79,6 +79,8 @@ EAGLE_CACHE_TTL = float(os.getenv("EAGLE_CACHE_TTL", "300"))  # 5 minutes
 EAGLE_RETRY_MAX = int(os.getenv("EAGLE_RETRY_MAX", "3"))
 EAGLE_REQUEST_TIMEOUT = int(os.getenv("EAGLE_REQUEST_TIMEOUT", "30"))
 EAGLE_CONNECTION_TIMEOUT = int(os.getenv("EAGLE_CONNECTION_TIMEOUT", "10"))
+# Back item lookups with the persistent shared_core.eagle index (set to 0 to disable)
+EAGLE_PERSISTENT_INDEX = os.getenv("EAGLE_PERSISTENT_INDEX", "1").lower() not in ("0", "false", "no")
 
 # State file location
 STATE_FILE_PATH = Path(os.getenv(
@@ -149,17 +151,21 @@ class QueryCache:
     - Hit/miss statistics
     - Memory-efficient with size limits
     - Thread-safe operations
+    - Optional persistent item index shared across processes
     """
     
     def __init__(
         self,
         default_ttl: float = EAGLE_CACHE_TTL,
         max_entries: int = 1000,
-        name: str = "eagle_cache"
+        name: str = "eagle_cache",
+        item_index: Optional[Any] = None
     ):
         self.default_ttl = default_ttl
         self.max_entries = max_entries
         self.name = name
+        self._item_index = item_index
+        self._indexes_ready = False
         self._cache: Dict[str, CacheEntry] = {}
         self._lock = threading.RLock()
         self._stats = {
@@ -231,6 +237,7 @@ class QueryCache:
                 self._path_index.clear()
                 self._fingerprint_index.clear()
                 self._id_index.clear()
+                self._indexes_ready = False
                 _log("debug", f"🔄 {self.name}: Cache fully invalidated")
             elif key in self._cache:
                 del self._cache[key]
@@ -251,13 +258,30 @@ class QueryCache:
             }
     
     def build_indexes(self, items: List[Dict]) -> None:
-        """Build pre-indexed lookups for O(1) access."""
+        """
+        Build pre-indexed lookups for O(1) access.
+        
+        With a persistent item index, the list is applied to it as a delta
+        (only changed items are rewritten) instead of rebuilding dicts.
+        """
         with self._lock:
             self._name_index.clear()
             self._path_index.clear()
             self._fingerprint_index.clear()
             self._id_index.clear()
             
+            if self._item_index is not None:
+                try:
+                    # The list may be partial or filtered; never prune from it
+                    stats = self._item_index.sync_items(items, complete=False)
+                    self._indexes_ready = True
+                    _log("debug", f"✅ {self.name}: Persistent index synced "
+                         f"({stats['updated']} updated, {stats['removed']} removed)")
+                    return
+                except Exception as e:
+                    _log("warning", f"⚠️  {self.name}: Persistent index sync failed, using memory: {e}")
+                    self._item_index = None
+            
             for item in items:
                 # Index by ID
                 item_id = item.get("id")
@@ -281,28 +305,63 @@ class QueryCache:
                         if fp_value:
                             self._fingerprint_index.setdefault(fp_value, []).append(item)
             
+            self._indexes_ready = True
             _log("debug", f"✅ {self.name}: Indexed {len(items)} items "
                  f"(names: {len(self._name_index)}, paths: {len(self._path_index)}, "
                  f"fingerprints: {len(self._fingerprint_index)})")
     
+    def refresh_from_library(self, library_path: str) -> bool:
+        """
+        Refresh the persistent item index from the library folder on disk.
+        
+        Only metadata.json files changed since the last refresh are re-read.
+        
+        Returns:
+            True if the index is ready, False if unavailable (no persistent
+            index or library not mounted)
+        """
+        with self._lock:
+            if self._item_index is None or not library_path:
+                return False
+            try:
+                self._item_index.refresh_from_library(library_path)
+            except Exception as e:
+                _log("debug", f"{self.name}: Library refresh unavailable: {e}")
+                return False
+            self._indexes_ready = True
+            return True
+    
+    def has_indexes(self) -> bool:
+        """Whether item lookups have been populated since the last invalidation."""
+        with self._lock:
+            return self._indexes_ready
+    
     def get_by_id(self, item_id: str) -> Optional[Dict]:
         """O(1) lookup by Eagle item ID."""
         with self._lock:
+            if self._item_index is not None:
+                return self._item_index.get_by_id(item_id)
             return self._id_index.get(item_id)
     
     def get_by_name(self, name: str) -> List[Dict]:
         """O(1) lookup by item name."""
         with self._lock:
+            if self._item_index is not None:
+                return self._item_index.get_by_name(name)
             return self._name_index.get(name.lower(), [])
     
     def get_by_path(self, path: str) -> Optional[Dict]:
         """O(1) lookup by file path."""
         with self._lock:
+            if self._item_index is not None:
+                return self._item_index.get_by_path(path)
             return self._path_index.get(path)
     
     def get_by_fingerprint(self, fingerprint: str) -> List[Dict]:
         """O(1) lookup by fingerprint tag."""
         with self._lock:
+            if self._item_index is not None:
+                return self._item_index.get_by_fingerprint(fingerprint)
             return self._fingerprint_index.get(fingerprint.lower(), [])
 
 
@@ -362,8 +421,20 @@ class NotionQueryCache(QueryCache):
                 self._database_results.clear()
 
 
+def _open_persistent_item_index() -> Optional[Any]:
+    """Open the shared persistent Eagle item index if available."""
+    if not EAGLE_PERSISTENT_INDEX:
+        return None
+    try:
+        from shared_core.eagle import get_eagle_item_index
+        return get_eagle_item_index()
+    except Exception as e:
+        _log("debug", f"Persistent Eagle index unavailable: {e}")
+        return None
+
+
 # Global cache instances
-query_cache = QueryCache(name="eagle_items_cache")
+query_cache = QueryCache(name="eagle_items_cache", item_index=_open_persistent_item_index())
 notion_query_cache = NotionQueryCache(name="notion_tracks_cache")
 
 
@@ -1437,29 +1508,32 @@ def get_eagle_library_info() -> Optional[Dict]:
     return None
 
 
+def _ensure_item_indexes() -> None:
+    """Populate item lookups, preferring an incremental on-disk refresh."""
+    if query_cache.has_indexes():
+        return
+    if query_cache.refresh_from_library(EAGLE_LIBRARY_PATH):
+        return
+    get_eagle_items()
+
+
 def find_eagle_items_by_name(name: str) -> List[Dict]:
     """Find Eagle items by name using cached index."""
-    # Ensure cache is populated
-    if not query_cache._name_index:
-        get_eagle_items()
+    _ensure_item_indexes()
     
     return query_cache.get_by_name(name)
 
 
 def find_eagle_items_by_path(path: str) -> Optional[Dict]:
     """Find Eagle item by path using cached index."""
-    # Ensure cache is populated
-    if not query_cache._path_index:
-        get_eagle_items()
+    _ensure_item_indexes()
     
     return query_cache.get_by_path(path)
 
 
 def find_eagle_items_by_fingerprint(fingerprint: str) -> List[Dict]:
     """Find Eagle items by fingerprint tag using cached index."""
-    # Ensure cache is populated
-    if not query_cache._fingerprint_index:
-        get_eagle_items()
+    _ensure_item_indexes()
     
     return query_cache.get_by_fingerprint(fingerprint)
 
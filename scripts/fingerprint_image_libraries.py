@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Fingerprint every image in Eagle libraries and Lightroom catalogs.
+
+Runs ``image_workflow.deduplication.FingerprintPipeline`` over the given
+libraries. Results go into the persistent fingerprint store, so re-running
+after an interruption only processes new or changed files.
+
+Usage:
+    python scripts/fingerprint_image_libraries.py --eagle ~/Photos.library --lightroom ~/Catalog.lrcat
+    python scripts/fingerprint_image_libraries.py --eagle ~/Photos.library --workers 8 --store /tmp/fp.sqlite3
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import logging
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from image_workflow.deduplication.fingerprint_pipeline import (
+    FingerprintPipeline,
+    FingerprintStore,
+    eagle_image_paths,
+    lightroom_image_paths,
+)
+from image_workflow.integrations.eagle import EagleLibraryReader
+from image_workflow.integrations.lightroom import LightroomCatalogReader
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Fingerprint Eagle and Lightroom images")
+    parser.add_argument("--eagle", nargs="*", default=[], help="Eagle .library folders")
+    parser.add_argument("--lightroom", nargs="*", default=[], help="Lightroom .lrcat catalogs")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Worker processes (default: $IMAGE_FINGERPRINT_WORKERS or CPU count)")
+    parser.add_argument("--store", default=None, help="Fingerprint store path")
+    parser.add_argument("--full-decode", action="store_true",
+                        help="Decode images at full size for perceptual hashes")
+    parser.add_argument("--progress-every", type=int, default=1000)
+    args = parser.parse_args()
+
+    if not args.eagle and not args.lightroom:
+        parser.error("Give at least one --eagle library or --lightroom catalog")
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+    pipeline = FingerprintPipeline(
+        store=FingerprintStore(args.store) if args.store else None,
+        workers=args.workers,
+        reduced_decode=not args.full_decode,
+    )
+
+    sources = [eagle_image_paths(EagleLibraryReader(path)) for path in args.eagle]
+    readers = [LightroomCatalogReader(path) for path in args.lightroom]
+    for reader in readers:
+        reader.connect()
+        sources.append(lightroom_image_paths(reader))
+
+    try:
+        for _ in pipeline.run(itertools.chain(*sources), progress_every=args.progress_every):
+            pass
+    finally:
+        for reader in readers:
+            reader.close()
+
+    stats = pipeline.stats
+    print(f"{stats['processed']} images in {stats['elapsed']:.1f}s "
+          f"({stats['images_per_second']:.1f} images/s): "
+          f"{stats['fingerprinted']} fingerprinted, {stats['cached']} cached, {stats['errors']} errors")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
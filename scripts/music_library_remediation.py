@@ -65,6 +65,13 @@ try:
 except ImportError:
     MUTAGEN_AVAILABLE = False
 
+# Parallel, stat-cached SHA-256 fingerprinting
+try:
+    from shared_core.audio.fingerprint_service import get_fingerprint_service
+    FINGERPRINT_SERVICE_AVAILABLE = True
+except ImportError:
+    FINGERPRINT_SERVICE_AVAILABLE = False
+
 MUSIC_EXTENSIONS = {".aiff", ".aif", ".wav", ".m4a", ".mp3", ".flac", ".alac"}
 EXTENSION_PRIORITY = {
     ".wav": 5,
@@ -209,7 +216,13 @@ def compute_file_hash(path: Path, fast: bool = False) -> Optional[str]:
 
 
 def compute_file_fingerprint(file_path: Path, chunk_size: int = 1024 * 1024) -> str:
-    """Compute a stable SHA-256 fingerprint for the provided audio file."""
+    """Compute a stable SHA-256 fingerprint for the provided audio file.
+
+    Unchanged files (same size, mtime and inode) reuse the hash recorded by
+    the shared fingerprint store instead of being read again.
+    """
+    if FINGERPRINT_SERVICE_AVAILABLE:
+        return get_fingerprint_service().fingerprint(file_path)
     hash_obj = hashlib.sha256()
     with file_path.open("rb") as handle:
         for chunk in iter(lambda: handle.read(chunk_size), b""):
@@ -531,7 +544,10 @@ def scan_directories(
                 artist, title = parse_filename_for_artist_title(stem)
                 clean_title = clean_title_advanced(title)
                 clean_artist = clean_artist_name(artist) if artist else None
-                file_hash = compute_file_hash(path, fast=fast_hash) if with_hash else None
+                # Full hashes are streamed through the fingerprint service after the walk
+                file_hash = None
+                if with_hash and (fast_hash or not FINGERPRINT_SERVICE_AVAILABLE):
+                    file_hash = compute_file_hash(path, fast=fast_hash)
 
                 # Validate integrity if requested
                 is_valid = True
@@ -552,6 +568,15 @@ def scan_directories(
                         is_valid=is_valid,
                     )
                 )
+    if with_hash and not fast_hash and FINGERPRINT_SERVICE_AVAILABLE and records:
+        by_path = {record.path: record for record in records}
+        reused = 0
+        for result in get_fingerprint_service().iter_fingerprints(by_path):
+            if result.error:
+                logger.warning(f"Failed to compute hash for {result.path}: {result.error}")
+            by_path[result.path].file_hash = result.fingerprint
+            reused += int(result.cached)
+        logger.info(f"Hashed {len(records) - reused} files, reused {reused} stored hashes")
     logger.info(f"Scanned {len(records)} files across {len(paths) - len(missing_paths)} directories")
     return records, missing_paths
 
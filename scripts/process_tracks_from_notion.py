@@ -42,6 +42,13 @@ except ImportError:
     check_notion_duplicate = None
     log_notion_dedup_check = None
 
+# Local Notion mirror: duplicate checks become index lookups
+try:
+    from shared_core.notion.mirror import get_notion_mirror, mirror_enabled
+    NOTION_MIRROR_AVAILABLE = mirror_enabled()
+except ImportError:
+    NOTION_MIRROR_AVAILABLE = False
+
 # Import full production workflow from monolithic script
 try:
     import importlib.util
@@ -133,6 +140,7 @@ def process_tracks_from_notion(
             notion_client=notion,
             tracks_db_id=tracks_db_id,
             similarity_threshold=0.85,
+            mirror=get_notion_mirror() if NOTION_MIRROR_AVAILABLE else None,
         )
         logger.info("🔍 NOTION DEDUP: Deduplicator initialized - will check for duplicates before processing")
 
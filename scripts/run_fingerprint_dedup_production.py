@@ -1324,6 +1324,14 @@ def run_eagle_first_processing(
         logger.warning("Notion deduplication module not available - dedup checks will be skipped")
         NOTION_DEDUP_AVAILABLE = False
 
+    notion_mirror = None
+    try:
+        from shared_core.notion.mirror import get_notion_mirror, mirror_enabled
+        if mirror_enabled():
+            notion_mirror = get_notion_mirror()
+    except ImportError:
+        pass
+
     notion = None
     try:
         notion = get_notion_client()
@@ -1347,6 +1355,7 @@ def run_eagle_first_processing(
             notion_client=notion,
             tracks_db_id=tracks_db_id,
             similarity_threshold=0.85,
+            mirror=notion_mirror,
         )
         logger.info("🔍 NOTION DEDUP: Deduplicator initialized for Eagle-first mode")
 
@@ -90,7 +90,11 @@ class NotionQueue(SharedQueueManager):
     ):
         from notion_client import Client  # local import to keep optional
 
-        self.notion = Client(auth=notion_token)
+        try:
+            from shared_core.notion.rate_limiter import create_notion_client
+            self.notion = create_notion_client(notion_token)
+        except ImportError:
+            self.notion = Client(auth=notion_token)
         self.database_id = database_id
 
         self.status_pending = status_pending
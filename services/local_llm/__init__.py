@@ -6,7 +6,7 @@ A lightweight gateway service for routing requests to local LLM backends.
 Designed for M2 Pro 16GB unified memory constraints.
 
 Key Features:
-- Single-model-at-a-time enforcement (16GB guardrails)
+- Memory-budgeted multi-model residency (16GB guardrails)
 - Consistent API for text, vision, OCR, transcription, and RAG
 - Centralized prompt templates and output schemas
 - OpenAI-compatible-ish interface for internal use
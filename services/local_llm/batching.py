@@ -0,0 +1,158 @@
+"""
+Request Batching
+================
+
+Micro-batch scheduler and embedding cache for the Local LLM Gateway.
+
+``MicroBatcher`` collects items submitted by concurrent callers under the
+same key (e.g. embedding model + normalize flag) for up to ``max_wait_ms``
+and hands them to the backend as one batch of at most ``max_size`` items.
+A batch is dispatched early as soon as ``max_size`` items are waiting.
+
+``EmbeddingCache`` is a thread-safe LRU keyed by (model, normalize, text
+hash).
+"""
+
+import asyncio
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+BatchFn = Callable[[Hashable, List[Any]], Awaitable[List[Any]]]
+
+
+@dataclass
+class _PendingRequest:
+    items: List[Any]
+    future: "asyncio.Future[List[Any]]"
+
+
+@dataclass
+class _Queue:
+    requests: List[_PendingRequest] = field(default_factory=list)
+    size: int = 0
+    timer: Optional[asyncio.TimerHandle] = None
+
+
+class MicroBatcher:
+    """
+    Coalesce concurrent requests into backend batches.
+
+    Usage:
+        batcher = MicroBatcher(embed_batch, max_size=64, max_wait_ms=5)
+        vectors = await batcher.submit(("bge-m3", True), ["text1", "text2"])
+    """
+
+    def __init__(self, process: BatchFn, max_size: int = 64, max_wait_ms: float = 5.0):
+        """
+        Args:
+            process: ``async process(key, items) -> results`` (one result per item)
+            max_size: Maximum items per backend call
+            max_wait_ms: How long the first request waits for others to join
+        """
+        self.process = process
+        self.max_size = max(1, max_size)
+        self.max_wait_ms = max(0.0, max_wait_ms)
+        # Keyed by (event loop, key): futures belong to the loop that made them
+        self._queues: Dict[Tuple[asyncio.AbstractEventLoop, Hashable], _Queue] = {}
+        self.stats = {"requests": 0, "items": 0, "batches": 0}
+
+    async def submit(self, key: Hashable, items: Sequence[Any]) -> List[Any]:
+        """
+        Queue ``items`` for the next batch under ``key`` and wait for results.
+
+        Returns:
+            Results in the same order as ``items``
+        """
+        if not items:
+            return []
+        loop = asyncio.get_running_loop()
+        queue = self._queues.setdefault((loop, key), _Queue())
+        request = _PendingRequest(list(items), loop.create_future())
+        queue.requests.append(request)
+        queue.size += len(request.items)
+        self.stats["requests"] += 1
+
+        if queue.size >= self.max_size:
+            self._dispatch(loop, key)
+        elif queue.timer is None:
+            queue.timer = loop.call_later(self.max_wait_ms / 1000.0, self._dispatch, loop, key)
+        return await request.future
+
+    def _dispatch(self, loop: asyncio.AbstractEventLoop, key: Hashable) -> None:
+        queue = self._queues.pop((loop, key), None)
+        if queue is None:
+            return
+        if queue.timer is not None:
+            queue.timer.cancel()
+        loop.create_task(self._run(key, queue.requests))
+
+    async def _run(self, key: Hashable, requests: List[_PendingRequest]) -> None:
+        items = [item for request in requests for item in request.items]
+        try:
+            results: List[Any] = []
+            for start in range(0, len(items), self.max_size):
+                chunk = items[start:start + self.max_size]
+                chunk_results = await self.process(key, chunk)
+                if len(chunk_results) != len(chunk):
+                    raise RuntimeError(f"Batch returned {len(chunk_results)} results for {len(chunk)} items")
+                results.extend(chunk_results)
+                self.stats["batches"] += 1
+            self.stats["items"] += len(items)
+        except Exception as e:
+            for request in requests:
+                if not request.future.done():
+                    request.future.set_exception(e)
+            return
+        offset = 0
+        for request in requests:
+            count = len(request.items)
+            if not request.future.done():
+                request.future.set_result(results[offset:offset + count])
+            offset += count
+
+
+class EmbeddingCache:
+    """Thread-safe LRU cache of embedding vectors."""
+
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max(0, max_entries)
+        self._entries: "OrderedDict[Tuple[str, bool, str], List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(model_id: str, normalize: bool, text: str) -> Tuple[str, bool, str]:
+        return (model_id, normalize, hashlib.sha1(text.encode("utf-8")).hexdigest())
+
+    def get(self, key: Tuple[str, bool, str]) -> Optional[List[float]]:
+        with self._lock:
+            vector = self._entries.get(key)
+            if vector is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return vector
+
+    def put(self, key: Tuple[str, bool, str], vector: List[float]) -> None:
+        if not self.max_entries:
+            return
+        with self._lock:
+            self._entries[key] = vector
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def snapshot(self) -> Dict[str, int]:
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
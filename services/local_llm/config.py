@@ -153,12 +153,18 @@ class LLMConfig:
 
     # Memory constraints (16GB unified memory)
     max_memory_gb: float = 12.0  # Reserve 4GB for system
-    max_concurrent_models: int = 1  # Single model at a time for safety
+    # Models kept resident at once within max_memory_gb (LRU/size eviction)
+    max_concurrent_models: int = field(default_factory=lambda: int(os.getenv("SEREN_LLM_MAX_RESIDENT_MODELS", "4")))
 
     # Server settings
     llama_server_port: int = 8080
     llama_server_host: str = "127.0.0.1"
 
+    # Request batching (embed/rerank) and embedding cache
+    batch_max_size: int = field(default_factory=lambda: int(os.getenv("SEREN_LLM_BATCH_MAX_SIZE", "64")))
+    batch_max_wait_ms: float = field(default_factory=lambda: float(os.getenv("SEREN_LLM_BATCH_WAIT_MS", "5")))
+    embedding_cache_size: int = field(default_factory=lambda: int(os.getenv("SEREN_LLM_EMBED_CACHE_SIZE", "10000")))
+
     # Logging
     log_dir: Path = field(default_factory=lambda: Path(
         os.getenv("SEREN_LLM_ROOT",
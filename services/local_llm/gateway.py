@@ -6,15 +6,17 @@ Main gateway class for routing requests to local LLM backends.
 Enforces 16GB memory guardrails and provides consistent API.
 """
 
-import asyncio
 import logging
 import subprocess
 import time
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
 
+from services.local_llm.batching import EmbeddingCache, MicroBatcher
 from services.local_llm.config import LLMConfig, ModelSpec, ModelType
+from services.local_llm.residency import ModelResidencyManager
 from services.local_llm.models import (
     CompletionRequest,
     CompletionResponse,
@@ -50,10 +52,15 @@ class LocalLLMGateway:
     Gateway for local LLM inference.
 
     Features:
-    - Single-model-at-a-time enforcement (16GB guardrails)
-    - Automatic model loading/unloading
+    - Memory-budgeted residency: several models stay loaded (16GB
+      guardrails via max_memory_gb / max_concurrent_models) and are
+      evicted by recency, load cost and size
+    - Automatic model loading/unloading, with preloading of models that
+      queued requests will need
     - Consistent API across model types
     - Safety checks before output
+    - Micro-batching of concurrent embed/rerank requests and an
+      embedding cache keyed by (model, text hash)
 
     Usage:
         gateway = LocalLLMGateway()
@@ -69,6 +76,7 @@ class LocalLLMGateway:
 
         # Embeddings
         embeddings = await gateway.embed(["text1", "text2"])
+        vectors = await gateway.embed_many(thousands_of_texts)
 
         # Transcription
         transcript = await gateway.transcribe("/path/to/audio.mp3")
@@ -79,10 +87,23 @@ class LocalLLMGateway:
 
     def __init__(self, config: Optional[LLMConfig] = None):
         self.config = config or LLMConfig()
-        self._loaded_model: Optional[LoadedModel] = None
-        self._lock = asyncio.Lock()
+        self._residency = ModelResidencyManager(
+            budget_gb=self.config.max_memory_gb,
+            max_models=self.config.max_concurrent_models,
+            load=self._load_model,
+            unload=self._unload_model,
+        )
         self._initialized = False
 
+        # Concurrent embed/rerank calls are coalesced into backend batches
+        self._embed_cache = EmbeddingCache(self.config.embedding_cache_size)
+        self._embed_batcher = MicroBatcher(
+            self._embed_batch, self.config.batch_max_size, self.config.batch_max_wait_ms
+        )
+        self._rerank_batcher = MicroBatcher(
+            self._rerank_batch, self.config.batch_max_size, self.config.batch_max_wait_ms
+        )
+
     async def initialize(self) -> None:
         """Initialize the gateway and create required directories."""
         if self._initialized:
@@ -96,7 +117,7 @@ class LocalLLMGateway:
 
     async def shutdown(self) -> None:
         """Shutdown the gateway and unload any loaded models."""
-        await self._unload_current_model()
+        await self._residency.unload_all()
         logger.info("LocalLLMGateway shutdown complete")
 
     # =========================================================================
@@ -188,12 +209,14 @@ class LocalLLMGateway:
         if not model_spec:
             raise ValueError(f"Unknown model: {model_id}")
 
-        # Ensure model is loaded
-        await self._ensure_model_loaded(model_spec)
+        # The safety check follows; start loading its model meanwhile
+        if request.check_safety:
+            self._residency.preload(self.config.get_default_model(ModelType.SAFETY))
 
-        # TODO: Actually call llama-server API
-        # For now, return a placeholder indicating the model would be called
-        content = f"[PLACEHOLDER] Would call {model_spec.display_name} with prompt"
+        async with self._residency.use(model_spec):
+            # TODO: Actually call llama-server API
+            # For now, return a placeholder indicating the model would be called
+            content = f"[PLACEHOLDER] Would call {model_spec.display_name} with prompt"
 
         latency_ms = (time.time() - start_time) * 1000
 
@@ -239,6 +262,31 @@ class LocalLLMGateway:
         request = EmbeddingRequest(texts=texts, model=model, normalize=normalize)
         return await self._embed_internal(request)
 
+    async def embed_many(
+        self,
+        texts: List[str],
+        model: Optional[str] = None,
+        normalize: bool = True,
+    ) -> List[List[float]]:
+        """
+        Embed a large list of texts (e.g. every task for dedup).
+
+        Repeated texts are embedded once, cached texts are not re-embedded,
+        and the rest go to the backend in ``batch_max_size`` batches.
+
+        Args:
+            texts: Texts to embed
+            model: Model ID (uses default embedding model if not specified)
+            normalize: Whether to normalize embeddings
+
+        Returns:
+            One embedding vector per text, in order
+        """
+        response = await self._embed_internal(
+            EmbeddingRequest(texts=list(texts), model=model, normalize=normalize)
+        )
+        return response.embeddings
+
     async def _embed_internal(self, request: EmbeddingRequest) -> EmbeddingResponse:
         """Internal embedding implementation."""
         await self.initialize()
@@ -256,19 +304,54 @@ class LocalLLMGateway:
         if not model_spec:
             raise ValueError(f"Unknown model: {model_id}")
 
-        # TODO: Actually call embedding model
-        # For now, return placeholder embeddings
-        embeddings = [[0.0] * 1024 for _ in request.texts]
-
+        # Serve cached texts, embed each distinct uncached text once
+        keys = [EmbeddingCache.key(model_id, request.normalize, text) for text in request.texts]
+        found: Dict[Any, List[float]] = {}
+        missing: Dict[Any, str] = {}
+        for key, text in zip(keys, request.texts):
+            if key in found or key in missing:
+                continue
+            vector = self._embed_cache.get(key)
+            if vector is None:
+                missing[key] = text
+            else:
+                found[key] = vector
+
+        if missing:
+            # Load the model while the micro-batch fills
+            self._residency.preload(model_spec)
+            vectors = await self._embed_batcher.submit(
+                (model_id, request.normalize), list(missing.values())
+            )
+            for key, vector in zip(missing, vectors):
+                self._embed_cache.put(key, vector)
+                found[key] = vector
+
+        embeddings = [list(found[key]) for key in keys]
         latency_ms = (time.time() - start_time) * 1000
 
         return EmbeddingResponse(
             embeddings=embeddings,
             model=model_id,
-            dimensions=1024,
+            dimensions=len(embeddings[0]) if embeddings else 0,
             latency_ms=latency_ms,
         )
 
+    async def _embed_batch(self, key: Any, texts: List[str]) -> List[List[float]]:
+        """Run one micro-batch of texts through the embedding backend."""
+        model_id, normalize = key
+        model_spec = self.config.get_model(model_id)
+        async with self._residency.use(model_spec):
+            return await self._embed_backend(model_spec, texts, normalize)
+
+    async def _embed_backend(
+        self, model_spec: ModelSpec, texts: List[str], normalize: bool
+    ) -> List[List[float]]:
+        """Embed one batch of texts with the backend model."""
+        # TODO: Actually call embedding model
+        # For now, return placeholder embeddings
+        return [[0.0] * 1024 for _ in texts]
+
     # =========================================================================
     # Reranking
     # =========================================================================
@@ -310,11 +393,15 @@ class LocalLLMGateway:
                 raise ValueError("No default reranker model configured")
             model_id = default_model.model_id
 
-        # TODO: Actually call reranker
-        # For now, return documents in original order with placeholder scores
+        # Query/document pairs from concurrent calls share backend batches
+        self._residency.preload(self.config.get_model(model_id))
+        scores = await self._rerank_batcher.submit(
+            model_id, [(request.query, doc) for doc in request.documents]
+        )
+        ranked = sorted(range(len(scores)), key=lambda i: scores[i], reverse=True)
         results = [
-            RerankResult(document=doc, score=1.0 - (i * 0.1), index=i)
-            for i, doc in enumerate(request.documents[: request.top_k])
+            RerankResult(document=request.documents[i], score=scores[i], index=i)
+            for i in ranked[: request.top_k]
         ]
 
         latency_ms = (time.time() - start_time) * 1000
@@ -325,6 +412,28 @@ class LocalLLMGateway:
             latency_ms=latency_ms,
         )
 
+    async def _rerank_batch(self, model_id: Any, pairs: List[Any]) -> List[float]:
+        """Run one micro-batch of (query, document) pairs through the reranker."""
+        model_spec = self.config.get_model(model_id)
+        if model_spec is None:
+            return await self._rerank_backend(model_id, pairs)
+        async with self._residency.use(model_spec):
+            return await self._rerank_backend(model_id, pairs)
+
+    async def _rerank_backend(self, model_id: str, pairs: List[Any]) -> List[float]:
+        """Score one batch of (query, document) pairs with the backend model."""
+        # TODO: Actually call reranker
+        # For now, return placeholder scores (keeps original document order)
+        return [0.0 for _ in pairs]
+
+    def get_batching_stats(self) -> Dict[str, Any]:
+        """Micro-batching and embedding cache counters."""
+        return {
+            "embed": dict(self._embed_batcher.stats),
+            "rerank": dict(self._rerank_batcher.stats),
+            "embedding_cache": self._embed_cache.snapshot(),
+        }
+
     # =========================================================================
     # Transcription
     # =========================================================================
@@ -429,9 +538,10 @@ class LocalLLMGateway:
                 raise ValueError("No default OCR model configured")
             model_id = default_model.model_id
 
-        # TODO: Actually call Florence-2
-        # For now, return placeholder
-        text = f"[PLACEHOLDER] Would OCR {request.image_path or 'base64 image'}"
+        async with self._use_model(self.config.get_model(model_id)):
+            # TODO: Actually call Florence-2
+            # For now, return placeholder
+            text = f"[PLACEHOLDER] Would OCR {request.image_path or 'base64 image'}"
 
         latency_ms = (time.time() - start_time) * 1000
 
@@ -486,8 +596,11 @@ class LocalLLMGateway:
                     latency_ms=0,
                 )
 
-        # TODO: Actually call Llama Guard
-        # For now, assume safe
+        async with self._use_model(self.config.get_model(model_id)):
+            # TODO: Actually call Llama Guard
+            # For now, assume safe
+            pass
+
         latency_ms = (time.time() - start_time) * 1000
 
         return SafetyCheckResponse(
@@ -501,31 +614,20 @@ class LocalLLMGateway:
     # Model Management
     # =========================================================================
 
-    async def _ensure_model_loaded(self, model_spec: ModelSpec) -> None:
-        """Ensure a model is loaded, unloading current if necessary."""
-        async with self._lock:
-            # Check if already loaded
-            if (
-                self._loaded_model
-                and self._loaded_model.spec.model_id == model_spec.model_id
-            ):
-                self._loaded_model.last_used = time.time()
-                return
-
-            # Check memory constraints
-            if not self.config.can_load_model(model_spec):
-                raise MemoryError(
-                    f"Model {model_spec.model_id} requires {model_spec.memory_gb}GB, "
-                    f"but max is {self.config.max_memory_gb}GB"
-                )
-
-            # Unload current model
-            await self._unload_current_model()
+    @asynccontextmanager
+    async def _use_model(self, model_spec: Optional[ModelSpec]) -> AsyncIterator[None]:
+        """Pin a configured model for a request; unconfigured ones are skipped."""
+        if model_spec is None:
+            yield
+            return
+        async with self._residency.use(model_spec):
+            yield
 
-            # Load new model
-            await self._load_model(model_spec)
+    async def _ensure_model_loaded(self, model_spec: ModelSpec) -> None:
+        """Ensure a model is resident, evicting idle models if necessary."""
+        await self._residency.acquire(model_spec)
 
-    async def _load_model(self, model_spec: ModelSpec) -> None:
+    async def _load_model(self, model_spec: ModelSpec) -> LoadedModel:
         """Load a model into memory."""
         logger.info(f"Loading model: {model_spec.display_name}")
 
@@ -536,38 +638,49 @@ class LocalLLMGateway:
         # - OCR: Load Florence-2
         # - SAFETY: Load Llama Guard
 
-        self._loaded_model = LoadedModel(
+        loaded = LoadedModel(
             spec=model_spec,
             loaded_at=time.time(),
             last_used=time.time(),
         )
 
         logger.info(f"Model loaded: {model_spec.display_name}")
+        return loaded
 
-    async def _unload_current_model(self) -> None:
-        """Unload the currently loaded model."""
-        if not self._loaded_model:
-            return
-
-        logger.info(f"Unloading model: {self._loaded_model.spec.display_name}")
+    async def _unload_model(self, loaded: LoadedModel) -> None:
+        """Unload a resident model."""
+        logger.info(f"Unloading model: {loaded.spec.display_name}")
 
         # Kill process if running
-        if self._loaded_model.process:
-            self._loaded_model.process.terminate()
+        if loaded.process:
+            loaded.process.terminate()
             try:
-                self._loaded_model.process.wait(timeout=5)
+                loaded.process.wait(timeout=5)
             except subprocess.TimeoutExpired:
-                self._loaded_model.process.kill()
+                loaded.process.kill()
 
-        self._loaded_model = None
         logger.info("Model unloaded")
 
+    @property
+    def _loaded_model(self) -> Optional[LoadedModel]:
+        """Most recently used resident model."""
+        resident = self._residency.resident_models()
+        return self._residency.get(resident[0].model_id) if resident else None
+
     def get_loaded_model(self) -> Optional[ModelSpec]:
-        """Get the currently loaded model spec."""
+        """Get the most recently used resident model spec."""
         if self._loaded_model:
             return self._loaded_model.spec
         return None
 
+    def get_resident_models(self) -> List[ModelSpec]:
+        """Resident model specs, most recently used first."""
+        return self._residency.resident_models()
+
+    def get_residency_stats(self) -> Dict[str, Any]:
+        """Memory budget usage and per-model load-time / hit-rate metrics."""
+        return self._residency.snapshot()
+
     def list_available_models(self) -> List[ModelSpec]:
         """List all configured models."""
         return list(self.config.models.values())
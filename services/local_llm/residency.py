@@ -0,0 +1,321 @@
+"""
+Model Residency
+===============
+
+Keeps several models loaded within a memory budget.
+
+- Models stay resident until room is needed; a request for a resident
+  model is a hit and costs nothing.
+- Eviction is GreedyDual-Size: each resident model has a priority
+  ``H = L + load_cost / memory_gb`` refreshed on every use; the lowest
+  ``H`` is evicted and ``L`` rises to it. Recently used models, models that
+  are slow to load and small models stay longest; among equals the least
+  recently used goes first.
+- Models in use (``use()``) are never evicted; a load that cannot fit waits
+  until one is released.
+- Loads run outside the manager's lock with their memory reserved, so a
+  slow load does not block requests for resident models; concurrent
+  requests for a model that is loading wait for that one load.
+- ``preload()`` starts loading a model in the background when a related
+  request is queued, if it fits without evicting anything.
+- Per-model metrics: loads, hits, misses, hit rate, load time, evictions.
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from services.local_llm.config import ModelSpec
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ModelStats:
+    """Residency counters for one model."""
+    loads: int = 0
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    preloads: int = 0
+    total_load_s: float = 0.0
+    last_load_ms: float = 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        requests = self.hits + self.misses
+        return self.hits / requests if requests else 0.0
+
+    @property
+    def avg_load_ms(self) -> float:
+        return self.total_load_s * 1000 / self.loads if self.loads else 0.0
+
+
+@dataclass
+class _Resident:
+    loaded: Any
+    spec: ModelSpec
+    priority: float = 0.0
+    last_used: float = 0.0
+    in_use: int = 0
+
+
+class ModelResidencyManager:
+    """
+    LRU/size-aware pool of loaded models.
+
+    Usage:
+        residency = ModelResidencyManager(12.0, 4, load=load_fn, unload=unload_fn)
+        async with residency.use(spec) as loaded:
+            ...
+    """
+
+    def __init__(
+        self,
+        budget_gb: float,
+        max_models: int,
+        load: Callable[[ModelSpec], Awaitable[Any]],
+        unload: Callable[[Any], Awaitable[None]],
+    ):
+        """
+        Args:
+            budget_gb: Memory budget for all resident models
+            max_models: Maximum resident models
+            load: ``async load(spec) -> loaded``
+            unload: ``async unload(loaded)``
+        """
+        self.budget_gb = budget_gb
+        self.max_models = max(1, max_models)
+        self._load = load
+        self._unload = unload
+        self._resident: Dict[str, _Resident] = {}
+        self._inflation = 0.0  # GreedyDual-Size "L"
+        self._condition: Optional[asyncio.Condition] = None
+        # Loads in progress: model_id -> (spec, future resolved when resident)
+        self._loading: Dict[str, Tuple[ModelSpec, "asyncio.Future[None]"]] = {}
+        self._preloads: Dict[str, "asyncio.Task[None]"] = {}
+        self.stats: Dict[str, ModelStats] = {}
+
+    def _cond(self) -> asyncio.Condition:
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+
+    def _stats(self, model_id: str) -> ModelStats:
+        return self.stats.setdefault(model_id, ModelStats())
+
+    def _touch(self, resident: _Resident) -> None:
+        stats = self._stats(resident.spec.model_id)
+        cost = stats.avg_load_ms / 1000 if stats.loads else 1.0
+        resident.priority = self._inflation + max(cost, 1e-3) / max(resident.spec.memory_gb, 0.1)
+        resident.last_used = time.monotonic()
+
+    @property
+    def used_gb(self) -> float:
+        return sum(r.spec.memory_gb for r in self._resident.values())
+
+    def resident_models(self) -> List[ModelSpec]:
+        """Resident model specs, most recently used first."""
+        return [r.spec for r in sorted(self._resident.values(), key=lambda r: r.last_used, reverse=True)]
+
+    def get(self, model_id: str) -> Optional[Any]:
+        resident = self._resident.get(model_id)
+        return resident.loaded if resident else None
+
+    # ------------------------------------------------------------------
+    # Acquire / release
+    # ------------------------------------------------------------------
+
+    def _fits(self, spec: ModelSpec) -> bool:
+        # Models being loaded already hold their share of the budget
+        reserved_gb = sum(loading_spec.memory_gb for loading_spec, _ in self._loading.values())
+        return (
+            len(self._resident) + len(self._loading) < self.max_models
+            and self.used_gb + reserved_gb + spec.memory_gb <= self.budget_gb
+        )
+
+    def _victim(self) -> Optional[_Resident]:
+        idle = [r for r in self._resident.values() if not r.in_use]
+        return min(idle, key=lambda r: (r.priority, r.last_used)) if idle else None
+
+    async def _evict(self, resident: _Resident) -> None:
+        model_id = resident.spec.model_id
+        del self._resident[model_id]
+        self._inflation = max(self._inflation, resident.priority)
+        self._stats(model_id).evictions += 1
+        logger.info(f"Evicting model: {resident.spec.display_name}")
+        await self._unload(resident.loaded)
+
+    async def acquire(self, spec: ModelSpec, *, pin: bool = False, preload: bool = False) -> Any:
+        """
+        Make ``spec`` resident, evicting idle models as needed.
+
+        Args:
+            spec: Model to load
+            pin: Count the model as in use (release with ``release()``)
+            preload: Background preload (not counted as a hit or miss)
+
+        Raises:
+            MemoryError: The model alone exceeds the memory budget
+        """
+        if spec.memory_gb > self.budget_gb:
+            raise MemoryError(
+                f"Model {spec.model_id} requires {spec.memory_gb}GB, "
+                f"but max is {self.budget_gb}GB"
+            )
+        stats = self._stats(spec.model_id)
+        pending = self._preloads.get(spec.model_id)
+        if pending is not None and not preload and spec.model_id not in self._resident:
+            await asyncio.shield(pending)
+
+        cond = self._cond()
+        while True:
+            resident = self._resident.get(spec.model_id)
+            if resident is not None:
+                if not preload:
+                    stats.hits += 1
+                self._touch(resident)
+                resident.in_use += pin
+                return resident.loaded
+
+            loading = self._loading.get(spec.model_id)
+            if loading is not None:
+                try:
+                    await asyncio.shield(loading[1])
+                except asyncio.CancelledError:
+                    if not loading[1].cancelled():
+                        raise
+                    # The loading request was cancelled; load it ourselves
+                continue
+
+            # Reserve room under the lock, evicting idle models as needed
+            async with cond:
+                while spec.model_id not in self._resident and spec.model_id not in self._loading:
+                    if self._fits(spec):
+                        break
+                    victim = self._victim()
+                    if victim is not None:
+                        await self._evict(victim)
+                    else:
+                        await cond.wait()
+                else:
+                    continue
+                if not preload:
+                    stats.misses += 1
+                future = asyncio.get_running_loop().create_future()
+                self._loading[spec.model_id] = (spec, future)
+
+            # Load outside the lock so requests for resident models proceed
+            try:
+                started = time.perf_counter()
+                loaded = await self._load(spec)
+                elapsed = time.perf_counter() - started
+            except BaseException as e:
+                async with cond:
+                    del self._loading[spec.model_id]
+                    cond.notify_all()
+                if isinstance(e, asyncio.CancelledError):
+                    future.cancel()
+                else:
+                    future.set_exception(e)
+                    future.exception()  # Retrieved here; waiters re-raise it
+                raise
+
+            stats.loads += 1
+            stats.total_load_s += elapsed
+            stats.last_load_ms = elapsed * 1000
+            stats.preloads += preload
+            resident = _Resident(loaded=loaded, spec=spec)
+            async with cond:
+                del self._loading[spec.model_id]
+                self._resident[spec.model_id] = resident
+                self._touch(resident)
+                resident.in_use += pin
+                cond.notify_all()
+            future.set_result(None)
+            return resident.loaded
+
+    async def release(self, spec: ModelSpec) -> None:
+        """Release a model pinned by ``acquire(pin=True)``."""
+        resident = self._resident.get(spec.model_id)
+        if resident is not None and resident.in_use:
+            resident.in_use -= 1
+            if not resident.in_use:
+                cond = self._cond()
+                async with cond:
+                    cond.notify_all()
+
+    @asynccontextmanager
+    async def use(self, spec: ModelSpec) -> AsyncIterator[Any]:
+        """Pin ``spec`` as resident for the duration of a request."""
+        loaded = await self.acquire(spec, pin=True)
+        try:
+            yield loaded
+        finally:
+            await self.release(spec)
+
+    def preload(self, spec: Optional[ModelSpec]) -> None:
+        """
+        Start loading ``spec`` in the background if it fits without evicting.
+
+        Called when a request for the model is queued so loading overlaps
+        the queue wait. Errors are logged, not raised.
+        """
+        if spec is None or spec.model_id in self._resident or spec.model_id in self._preloads:
+            return
+        if not self._fits(spec):
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+
+        async def _run() -> None:
+            try:
+                await self.acquire(spec, preload=True)
+            except Exception as e:
+                logger.warning(f"Preload of {spec.model_id} failed: {e}")
+            finally:
+                self._preloads.pop(spec.model_id, None)
+
+        self._preloads[spec.model_id] = loop.create_task(_run())
+
+    async def unload_all(self) -> None:
+        """Unload every resident model (in use or not)."""
+        for task in list(self._preloads.values()):
+            task.cancel()
+        self._preloads.clear()
+        for resident in list(self._resident.values()):
+            del self._resident[resident.spec.model_id]
+            await self._unload(resident.loaded)
+        self._inflation = 0.0
+
+    # ------------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------------
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Budget usage and per-model residency metrics."""
+        return {
+            "budget_gb": self.budget_gb,
+            "used_gb": round(self.used_gb, 2),
+            "max_models": self.max_models,
+            "resident": [spec.model_id for spec in self.resident_models()],
+            "models": {
+                model_id: {
+                    "resident": model_id in self._resident,
+                    "loads": s.loads,
+                    "preloads": s.preloads,
+                    "hits": s.hits,
+                    "misses": s.misses,
+                    "hit_rate": round(s.hit_rate, 3),
+                    "evictions": s.evictions,
+                    "avg_load_ms": round(s.avg_load_ms, 2),
+                    "last_load_ms": round(s.last_load_ms, 2),
+                }
+                for model_id, s in self.stats.items()
+            },
+        }
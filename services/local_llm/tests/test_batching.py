@@ -0,0 +1,118 @@
+"""Tests for embed/rerank micro-batching and the embedding cache."""
+
+import asyncio
+import threading
+
+import pytest
+
+from services.local_llm.batching import EmbeddingCache, MicroBatcher
+from services.local_llm.config import LLMConfig
+from services.local_llm.gateway import LocalLLMGateway
+
+
+@pytest.fixture
+def gateway():
+    """Gateway with a recording embedding backend."""
+    gateway = LocalLLMGateway(LLMConfig(batch_max_size=4, batch_max_wait_ms=20))
+    gateway.backend_calls = []
+
+    async def backend(model_spec, texts, normalize):
+        gateway.backend_calls.append(list(texts))
+        return [[float(len(text)), 1.0] for text in texts]
+
+    gateway._embed_backend = backend
+    return gateway
+
+
+class TestMicroBatching:
+    """Tests for coalescing concurrent requests."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_embeds_share_one_backend_call(self, gateway):
+        responses = await asyncio.gather(
+            gateway.embed("a"), gateway.embed("bb"), gateway.embed(["ccc"])
+        )
+
+        assert gateway.backend_calls == [["a", "bb", "ccc"]]
+        assert [r.embeddings for r in responses] == [[[1.0, 1.0]], [[2.0, 1.0]], [[3.0, 1.0]]]
+
+    @pytest.mark.asyncio
+    async def test_batches_are_capped_and_dispatched_when_full(self, gateway):
+        vectors = await gateway.embed_many([f"text-{i}" for i in range(10)])
+
+        assert len(vectors) == 10
+        assert [len(call) for call in gateway.backend_calls] == [4, 4, 2]
+
+    @pytest.mark.asyncio
+    async def test_backend_errors_reach_every_waiting_caller(self):
+        async def failing(key, items):
+            raise RuntimeError("backend down")
+
+        batcher = MicroBatcher(failing, max_size=8, max_wait_ms=5)
+        results = await asyncio.gather(
+            batcher.submit("k", [1]), batcher.submit("k", [2]), return_exceptions=True
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_reranks_are_batched_and_sorted(self, gateway):
+        calls = []
+
+        async def backend(model_id, pairs):
+            calls.append(list(pairs))
+            return [float(len(doc)) for _, doc in pairs]
+
+        gateway._rerank_backend = backend
+        first, second = await asyncio.gather(
+            gateway.rerank("q1", ["x", "xxx", "xx"], top_k=2),
+            gateway.rerank("q2", ["yy", "y"]),
+        )
+
+        assert len(calls) == 2  # 5 pairs with batch_max_size=4
+        assert [r.index for r in first.results] == [1, 2]
+        assert [r.document for r in second.results] == ["yy", "y"]
+
+
+class TestEmbeddingCache:
+    """Tests for the (model, text hash) cache."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_and_cached_texts_are_not_re_embedded(self, gateway):
+        await gateway.embed_many(["same", "same", "other"])
+        await gateway.embed(["same", "new"])
+
+        assert sorted(sum(gateway.backend_calls, [])) == ["new", "other", "same"]
+        assert gateway.get_batching_stats()["embedding_cache"]["entries"] == 3
+
+    def test_lru_eviction(self):
+        cache = EmbeddingCache(max_entries=2)
+        keys = [EmbeddingCache.key("m", True, text) for text in ("a", "b", "c")]
+        cache.put(keys[0], [0.0])
+        cache.put(keys[1], [1.0])
+        cache.get(keys[0])
+        cache.put(keys[2], [2.0])
+
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[0]) == [0.0]
+
+
+def test_sync_wrappers_from_threads_are_batched(gateway, monkeypatch):
+    import shared_core.local_llm as local_llm
+
+    monkeypatch.setattr(local_llm, "_gateway_instance", gateway)
+    barrier = threading.Barrier(3)
+    results = {}
+
+    def worker(text):
+        barrier.wait()
+        results[text] = local_llm.embed(text)
+
+    threads = [threading.Thread(target=worker, args=(t,)) for t in ("a", "bb", "ccc")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    assert results == {"a": [[1.0, 1.0]], "bb": [[2.0, 1.0]], "ccc": [[3.0, 1.0]]}
+    assert len(gateway.backend_calls) == 1
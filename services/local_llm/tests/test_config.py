@@ -57,7 +57,7 @@ class TestLLMConfig:
         """Test default configuration values."""
         config = LLMConfig()
         assert config.max_memory_gb == 12.0
-        assert config.max_concurrent_models == 1
+        assert config.max_concurrent_models == 4
         assert config.llama_server_port == 8080
         assert len(config.models) > 0
 
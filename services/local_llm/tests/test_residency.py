@@ -0,0 +1,167 @@
+"""Tests for multi-model residency in the Local LLM Gateway."""
+
+import asyncio
+
+import pytest
+
+from services.local_llm.config import LLMConfig, ModelSpec, ModelType
+from services.local_llm.gateway import LocalLLMGateway
+from services.local_llm.residency import ModelResidencyManager
+
+
+def _spec(model_id, memory_gb):
+    return ModelSpec(model_id=model_id, model_type=ModelType.TEXT, display_name=model_id, memory_gb=memory_gb)
+
+
+@pytest.fixture
+def manager():
+    """Manager with a 6GB budget that records loads/unloads."""
+    events = []
+
+    async def load(spec):
+        events.append(("load", spec.model_id))
+        return spec.model_id
+
+    async def unload(loaded):
+        events.append(("unload", loaded))
+
+    manager = ModelResidencyManager(budget_gb=6.0, max_models=3, load=load, unload=unload)
+    manager.events = events
+    return manager
+
+
+class TestModelResidencyManager:
+    """Tests for budgeted residency and eviction."""
+
+    @pytest.mark.asyncio
+    async def test_models_stay_resident_within_budget(self, manager):
+        a, b = _spec("a", 2.0), _spec("b", 2.0)
+        for _ in range(3):
+            await manager.acquire(a)
+            await manager.acquire(b)
+
+        assert manager.events == [("load", "a"), ("load", "b")]
+        stats = manager.snapshot()["models"]["a"]
+        assert (stats["loads"], stats["hits"], stats["misses"]) == (1, 2, 1)
+        assert stats["hit_rate"] == pytest.approx(0.667, abs=1e-3)
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_is_evicted_first(self, manager):
+        a, b, c = _spec("a", 2.0), _spec("b", 2.0), _spec("c", 2.0)
+        await manager.acquire(a)
+        await manager.acquire(b)
+        await manager.acquire(c)
+        await manager.acquire(a)
+        await manager.acquire(_spec("d", 2.0))
+
+        assert ("unload", "b") in manager.events
+        assert {s.model_id for s in manager.resident_models()} == {"a", "c", "d"}
+
+    @pytest.mark.asyncio
+    async def test_in_use_models_are_not_evicted(self, manager):
+        big, other = _spec("big", 4.0), _spec("other", 4.0)
+
+        async with manager.use(big):
+            waiter = asyncio.ensure_future(manager.acquire(other))
+            await asyncio.sleep(0.01)
+            assert not waiter.done()
+            assert manager.get("big") == "big"
+
+        assert await asyncio.wait_for(waiter, 1) == "other"
+        assert manager.get("big") is None
+
+    @pytest.mark.asyncio
+    async def test_slow_load_does_not_block_other_requests(self):
+        release_load = asyncio.Event()
+        loads = []
+
+        async def load(spec):
+            loads.append(spec.model_id)
+            if spec.model_id == "slow":
+                await release_load.wait()
+            return spec.model_id
+
+        async def unload(loaded):
+            pass
+
+        manager = ModelResidencyManager(budget_gb=6.0, max_models=3, load=load, unload=unload)
+        fast, slow = _spec("fast", 2.0), _spec("slow", 2.0)
+        await manager.acquire(fast)
+
+        first = asyncio.ensure_future(manager.acquire(slow))
+        second = asyncio.ensure_future(manager.acquire(slow))
+        await asyncio.sleep(0.01)
+        assert await asyncio.wait_for(manager.acquire(fast), 1) == "fast"
+        assert await asyncio.wait_for(manager.acquire(_spec("other", 1.0)), 1) == "other"
+        assert not first.done() and not second.done()
+
+        release_load.set()
+        assert await asyncio.wait_for(asyncio.gather(first, second), 1) == ["slow", "slow"]
+        assert loads == ["fast", "slow", "other"]
+
+    @pytest.mark.asyncio
+    async def test_failed_load_releases_its_reservation(self, manager):
+        async def failing_load(spec):
+            raise RuntimeError("load failed")
+
+        load = manager._load
+        manager._load = failing_load
+        with pytest.raises(RuntimeError):
+            await manager.acquire(_spec("broken", 6.0))
+        manager._load = load
+
+        assert await asyncio.wait_for(manager.acquire(_spec("a", 6.0)), 1) == "a"
+
+    @pytest.mark.asyncio
+    async def test_model_larger_than_budget_is_rejected(self, manager):
+        with pytest.raises(MemoryError):
+            await manager.acquire(_spec("huge", 10.0))
+
+
+class TestGatewayResidency:
+    """Tests for gateway use of the residency manager."""
+
+    @pytest.mark.asyncio
+    async def test_alternating_workloads_do_not_reload_models(self):
+        gateway = LocalLLMGateway(LLMConfig(batch_max_wait_ms=1))
+        for i in range(3):
+            await gateway.embed(f"text {i}")
+            await gateway.complete("prompt", check_safety=False)
+            await gateway.rerank("query", ["doc"])
+
+        models = gateway.get_residency_stats()["models"]
+        assert {m: s["loads"] for m, s in models.items()} == {
+            "bge-m3": 1, "phi-4-mini-q4": 1, "bge-reranker-v2-m3": 1,
+        }
+        assert models["phi-4-mini-q4"]["hits"] == 2
+        await gateway.shutdown()
+        assert gateway.get_resident_models() == []
+
+    @pytest.mark.asyncio
+    async def test_completion_preloads_safety_model(self):
+        gateway = LocalLLMGateway()
+        await gateway.complete("prompt", check_safety=True)
+
+        safety = gateway.get_residency_stats()["models"]["llama-guard-3-1b"]
+        assert safety["preloads"] == 1
+        assert safety["misses"] == 0
+
+    @pytest.mark.asyncio
+    async def test_ocr_and_safety_pin_their_models(self):
+        gateway = LocalLLMGateway()
+        pinned = []
+        use = gateway._residency.use
+
+        def recording_use(spec):
+            pinned.append(spec.model_id)
+            return use(spec)
+
+        gateway._residency.use = recording_use
+        await gateway.ocr(image_path="/tmp/scan.png")
+        await gateway.check_safety("text")
+
+        assert pinned == [
+            gateway.config.get_default_model(ModelType.OCR).model_id,
+            gateway.config.get_default_model(ModelType.SAFETY).model_id,
+        ]
+        assert all(not r.in_use for r in gateway._residency._resident.values())
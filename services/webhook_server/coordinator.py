@@ -2,19 +2,52 @@
 Multi-node coordinator utilities (MM1 ↔ MM2)
 ============================================
 
-Duplicate of `webhook-server/coordinator.py` to keep `from coordinator import ...`
-imports working in this mirrored server directory.
+Started as a copy of `webhook-server/coordinator.py` (kept importable as
+`from coordinator import ...` from this server directory). That legacy
+copy is deprecated and does not have the load-aware scheduling, sticky
+routing or circuit breaking below; this module is the maintained one.
+
+Load-aware scheduling:
+- Workers report ``load`` (queue depth, in-flight count, rolling latency)
+  on ``/health``; the coordinator adds its own count of outstanding
+  forwards per node, which is current between health probes.
+- ``LoadBalancer`` strategies: ``round_robin``, ``least_outstanding``
+  (lowest load score) and ``p2c`` (power of two random choices).
+- Sticky routing: events with a key (Notion entity ID) go to the same node
+  via rendezvous hashing over all registered nodes. While that node is
+  overloaded, unhealthy or its circuit is open, the event is not sent
+  elsewhere (``select_node`` returns ``None``) so the caller keeps it in
+  its own queue and per-entity ordering holds.
+- Circuit breaking: a node with ``failure_threshold`` consecutive failed
+  forwards/probes is skipped for ``cooldown_s`` seconds, then retried.
+  Only a successful forward closes the circuit; a passing health probe
+  does not, since the node may answer ``/health`` and still fail work.
+- ``HealthMonitor`` probes all nodes concurrently; forward responses that
+  carry ``load`` refresh it between probes (``NodeRegistry.update_load``).
+
+A local multi-process harness lives in ``scripts/simulate_worker_nodes.py``.
 """
 
 from __future__ import annotations
 
+import hashlib
 import json
+import random
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 from urllib.request import Request as UrlRequest, urlopen
 
+STRATEGIES = ("round_robin", "least_outstanding", "p2c")
+_STRATEGY_ALIASES = {
+    "least_outstanding_requests": "least_outstanding",
+    "least_connections": "least_outstanding",
+    "power_of_two": "p2c",
+    "power_of_two_choices": "p2c",
+}
+
 
 @dataclass
 class Node:
@@ -26,6 +59,25 @@ class Node:
     last_checked_at: Optional[str] = None
     last_ok_at: Optional[str] = None
     last_error: Optional[str] = None
+    # Reported by the node on /health
+    queue_depth: int = 0
+    in_flight: int = 0
+    latency_ms: float = 0.0
+    # Tracked by the coordinator
+    outstanding: int = 0
+    consecutive_failures: int = 0
+    circuit_open_until: float = 0.0
+
+    def load_score(self) -> float:
+        """Work ahead of a new job on this node (lower is better)."""
+        return self.outstanding + self.queue_depth + self.in_flight
+
+    def circuit_open(self, now: Optional[float] = None) -> bool:
+        return (now or time.time()) < self.circuit_open_until
+
+    def available(self, now: Optional[float] = None) -> bool:
+        """Healthy and not skipped by the circuit breaker."""
+        return self.healthy and not self.circuit_open(now)
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -37,13 +89,21 @@ class Node:
             "last_checked_at": self.last_checked_at,
             "last_ok_at": self.last_ok_at,
             "last_error": self.last_error,
+            "queue_depth": self.queue_depth,
+            "in_flight": self.in_flight,
+            "latency_ms": self.latency_ms,
+            "outstanding": self.outstanding,
+            "consecutive_failures": self.consecutive_failures,
+            "circuit_open": self.circuit_open(),
         }
 
 
 class NodeRegistry:
-    def __init__(self):
+    def __init__(self, *, failure_threshold: int = 3, cooldown_s: float = 30.0):
         self._lock = threading.Lock()
         self._nodes: Dict[str, Node] = {}
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.cooldown_s = max(0.0, float(cooldown_s))
 
     def register_or_update(self, *, node_id: str, base_url: str, role: str = "worker", meta: Optional[Dict[str, Any]] = None) -> None:
         if not node_id:
@@ -61,18 +121,29 @@ class NodeRegistry:
             else:
                 self._nodes[node_id] = Node(node_id=node_id, base_url=base_url, role=role, meta=meta or {})
 
-    def list_nodes(self) -> List[Node]:
+    def list_nodes(self, *, role: Optional[str] = None) -> List[Node]:
         with self._lock:
-            return list(self._nodes.values())
+            return [n for n in self._nodes.values() if not role or n.role == role]
 
     def healthy_nodes(self, *, role: Optional[str] = None) -> List[Node]:
+        """Healthy nodes whose circuit is closed (or whose cooldown has passed)."""
+        now = time.time()
         with self._lock:
-            nodes = [n for n in self._nodes.values() if n.healthy]
+            nodes = [n for n in self._nodes.values() if n.available(now)]
             if role:
                 nodes = [n for n in nodes if n.role == role]
             return nodes
 
-    def set_health(self, node_id: str, *, healthy: bool, checked_at: str, ok_at: Optional[str], error: Optional[str]) -> None:
+    def set_health(
+        self,
+        node_id: str,
+        *,
+        healthy: bool,
+        checked_at: str,
+        ok_at: Optional[str],
+        error: Optional[str],
+        load: Optional[Dict[str, Any]] = None,
+    ) -> None:
         with self._lock:
             n = self._nodes.get(node_id)
             if not n:
@@ -81,17 +152,99 @@ class NodeRegistry:
             n.last_checked_at = checked_at
             n.last_ok_at = ok_at if healthy else n.last_ok_at
             n.last_error = error
+            self._apply_load(n, load)
+            if not healthy:
+                # A failed probe counts against the circuit; a passing one
+                # does not close it (only a successful forward does).
+                self._record(n, False)
+
+    def update_load(self, node_id: str, load: Optional[Dict[str, Any]]) -> None:
+        """Apply a load report piggybacked on a forward response (fresher than /health)."""
+        with self._lock:
+            n = self._nodes.get(node_id)
+            if n:
+                self._apply_load(n, load)
+
+    @staticmethod
+    def _apply_load(n: Node, load: Optional[Dict[str, Any]]) -> None:
+        if isinstance(load, dict):
+            n.queue_depth = int(load.get("queue_depth") or 0)
+            n.in_flight = int(load.get("in_flight") or 0)
+            n.latency_ms = float(load.get("latency_ms") or 0.0)
+
+    def begin(self, node_id: str) -> None:
+        """Count a forward to the node as outstanding."""
+        with self._lock:
+            n = self._nodes.get(node_id)
+            if n:
+                n.outstanding += 1
+
+    def end(self, node_id: str, *, ok: bool) -> None:
+        """Finish a forward started with ``begin()`` and feed the circuit breaker."""
+        with self._lock:
+            n = self._nodes.get(node_id)
+            if n:
+                n.outstanding = max(0, n.outstanding - 1)
+                self._record(n, ok)
+
+    def _record(self, n: Node, ok: bool) -> None:
+        if ok:
+            n.consecutive_failures = 0
+            n.circuit_open_until = 0.0
+            return
+        n.consecutive_failures += 1
+        if n.consecutive_failures >= self.failure_threshold:
+            n.circuit_open_until = time.time() + self.cooldown_s
 
 
 class LoadBalancer:
-    def __init__(self, strategy: str = "round_robin"):
-        self.strategy = (strategy or "round_robin").strip().lower()
+    def __init__(self, strategy: str = "round_robin", *, sticky: bool = True, sticky_max_load: float = 50.0):
+        strategy = (strategy or "round_robin").strip().lower()
+        self.strategy = _STRATEGY_ALIASES.get(strategy, strategy)
+        self.sticky = sticky
+        self.sticky_max_load = sticky_max_load
         self._lock = threading.Lock()
         self._rr_idx = 0
+        self._random = random.Random()
+
+    @staticmethod
+    def _rendezvous(nodes: List[Node], key: str) -> Node:
+        # Highest-random-weight hashing: only keys of a node that leaves move.
+        return max(nodes, key=lambda n: hashlib.blake2b(f"{n.node_id}:{key}".encode(), digest_size=8).digest())
 
-    def select_node(self, nodes: List[Node]) -> Optional[Node]:
+    def select_node(self, nodes: List[Node], key: Optional[str] = None) -> Optional[Node]:
+        """
+        Pick a node for a job.
+
+        Args:
+            nodes: Registered nodes; unhealthy nodes and nodes whose circuit
+                is open are never picked
+            key: Optional routing key; with sticky routing, the same key maps
+                to the same node, and ``None`` is returned while that node is
+                unavailable or at ``sticky_max_load`` so the caller can queue
+                the job instead of reordering it onto another node
+        """
         if not nodes:
             return None
+        if key and self.sticky:
+            # Hash over every node so a key's owner does not change while
+            # that node is briefly down.
+            preferred = self._rendezvous(nodes, key)
+            if preferred.available() and preferred.load_score() < self.sticky_max_load:
+                return preferred
+            return None
+        now = time.time()
+        nodes = [n for n in nodes if n.available(now)]
+        if not nodes:
+            return None
+        if self.strategy == "least_outstanding":
+            return min(nodes, key=lambda n: (n.load_score(), n.latency_ms))
+        if self.strategy == "p2c":
+            if len(nodes) == 1:
+                return nodes[0]
+            with self._lock:
+                a, b = self._random.sample(nodes, 2)
+            return a if (a.load_score(), a.latency_ms) <= (b.load_score(), b.latency_ms) else b
         if self.strategy == "round_robin":
             with self._lock:
                 idx = self._rr_idx % len(nodes)
@@ -101,10 +254,11 @@ class LoadBalancer:
 
 
 class HealthMonitor:
-    def __init__(self, registry: NodeRegistry, *, interval_s: int = 30, timeout_s: int = 5):
+    def __init__(self, registry: NodeRegistry, *, interval_s: int = 30, timeout_s: int = 5, max_parallel: int = 16):
         self.registry = registry
         self.interval_s = max(1, int(interval_s))
         self.timeout_s = max(1, int(timeout_s))
+        self.max_parallel = max(1, int(max_parallel))
         self._stop = threading.Event()
         self._thread: Optional[threading.Thread] = None
 
@@ -132,14 +286,20 @@ class HealthMonitor:
             except Exception:
                 parsed = {}
             ok = isinstance(parsed, dict) and parsed.get("status") == "healthy"
-            self.registry.set_health(node.node_id, healthy=bool(ok), checked_at=checked_at, ok_at=checked_at if ok else None, error=None if ok else "unhealthy")
+            load = parsed.get("load") if isinstance(parsed, dict) else None
+            self.registry.set_health(node.node_id, healthy=bool(ok), checked_at=checked_at, ok_at=checked_at if ok else None, error=None if ok else "unhealthy", load=load)
         except Exception as e:
             self.registry.set_health(node.node_id, healthy=False, checked_at=checked_at, ok_at=None, error=str(e))
 
+    def check_all(self) -> None:
+        """Probe every registered node concurrently; one slow node does not delay the rest."""
+        nodes = self.registry.list_nodes()
+        if not nodes:
+            return
+        with ThreadPoolExecutor(max_workers=min(self.max_parallel, len(nodes)), thread_name_prefix="HealthProbe") as pool:
+            list(pool.map(self._check_node, nodes))
+
     def _run(self) -> None:
         while not self._stop.is_set():
-            nodes = self.registry.list_nodes()
-            for n in nodes:
-                self._check_node(n)
+            self.check_all()
             self._stop.wait(self.interval_s)
-
@@ -17,7 +17,7 @@ Key Features:
 - Health monitoring
 - Automated logging
 - Public exposure via Cloudflare Tunnel (permanent URL)
-- Queue-based processing (one webhook at a time)
+- Queue-based processing (worker pool; per-entity ordering, priority lanes)
 - Google OAuth2 authentication
 
 PUBLIC WEBHOOK URL: https://webhook.vibevessel.space/webhook (permanent - never changes)
@@ -44,7 +44,6 @@ Author: Seren Development • v1.0.0 • 2025-07-26
 # Standard library imports
 import asyncio
 import base64
-import csv
 import hashlib
 import hmac
 import json
@@ -77,7 +76,7 @@ except Exception:
 
 # Third-party imports
 from fastapi import FastAPI, HTTPException, Query, Request
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse
 from notion_client import Client
 import uvicorn
 
@@ -92,6 +91,22 @@ from shared_core.notifications import (
 # Unified logging import
 from shared_core.logging import setup_logging, UnifiedLogger
 
+# Concurrent webhook execution (per-entity ordering, priority lanes)
+from shared_core.webhook_worker_pool import COALESCED, REJECTED, WebhookLane, WebhookWorkerPool
+
+# Durable write-ahead queue (crash recovery, retries, dead-lettering)
+from shared_core.webhook_queue_store import DEAD, WebhookQueueStore, get_webhook_queue_store
+
+# Batched off-request-path side effects (CSV audit rows, notifications)
+from shared_core.background_writer import BackgroundWriter, get_background_writer
+
+# PERFORMANCE: pooled async HTTP client for worker forwarding
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
 # Initialize unified logger for webhook server
 # This replaces all print() statements with structured logging
 webhook_logger = setup_logging(
@@ -207,6 +222,16 @@ except ImportError as e:
 
 # Notification manager (global)
 notification_manager = NotificationManager()
+
+# Request handlers only enqueue; CSV rows and notifications are written here.
+side_effect_writer = get_background_writer()
+# Database discovery makes Notion API calls; its own thread keeps it from
+# delaying CSV rows and notifications queued behind it.
+discovery_writer = BackgroundWriter(name="database-discovery")
+
+# Webhooks now run on several worker threads; desktop automation (clipboard,
+# keystrokes into Cursor/Claude) must still happen one submission at a time.
+_desktop_automation_lock = threading.RLock()
 LOG_PATH = Path(__file__).parent / "webhook_server.log"
 
 
@@ -216,14 +241,15 @@ def _log_event_line(message: str) -> None:
     webhook_logger.info(message)
 
 
+def _deliver_notification(event: NotificationEvent, channels: Optional[List[str]] = None) -> None:
+    asyncio.run(notification_manager.send(event, channels=channels))
+
+
 def _emit_notification(event: NotificationEvent, channels: Optional[List[str]] = None) -> None:
-    """Send notification asynchronously when possible."""
-    try:
-        loop = asyncio.get_running_loop()
-        loop.create_task(notification_manager.send(event, channels=channels))
-    except RuntimeError:
-        # No running loop; fall back to blocking send
-        asyncio.run(notification_manager.send(event, channels=channels))
+    """Queue a notification on the background writer (never blocks the caller)."""
+    # NotificationManager.send shells out to osascript, which would stall the
+    # event loop even when scheduled as a task.
+    side_effect_writer.submit(_deliver_notification, event, channels)
 
 
 def _safe_id(val: Any) -> str:
@@ -349,7 +375,8 @@ class FourAgentRouter:
         """Submit task to Cursor IDE"""
         try:
             if self.cursor_submitter:
-                success = self.cursor_submitter.submit_with_retry(prompt)
+                with _desktop_automation_lock:
+                    success = self.cursor_submitter.submit_with_retry(prompt)
                 
                 if success and page_id:
                     # Update Notion page with completion status
@@ -383,8 +410,9 @@ class FourAgentRouter:
             end tell
             '''
             
-            result = subprocess.run(['osascript', '-e', script], 
-                                  capture_output=True, text=True)
+            with _desktop_automation_lock:
+                result = subprocess.run(['osascript', '-e', script],
+                                        capture_output=True, text=True)
             
             success = result.returncode == 0
             
@@ -462,93 +490,308 @@ class WebhookItem:
     payload: Dict[str, Any]
     timestamp: datetime
     request_id: str
+    job_id: Optional[int] = None
+
+def _compact_id(value: Any) -> str:
+    return str(value or "").replace("-", "").lower()
+
+
+def _classify_webhook(payload: Dict[str, Any]) -> tuple:
+    """
+    Return (lane, ordering key, coalesce key) for a queued webhook.
+
+    The ordering key is the Notion entity, so events for one page run in
+    order; the lane comes from the parent database when the event carries it.
+    """
+    if "challenge" in payload or "verification_token" in payload:
+        return WebhookLane.CONTROL, None, None
+    if payload.get("__source") == "slack_event_subscriptions":
+        return WebhookLane.LEGACY, None, None
+
+    entity = payload.get("entity") if isinstance(payload.get("entity"), dict) else {}
+    data = payload.get("data") if isinstance(payload.get("data"), dict) else {}
+    entity_id = entity.get("id") or data.get("id")
+    if not entity_id:
+        return WebhookLane.LEGACY, None, None
+
+    parent = data.get("parent") if isinstance(data.get("parent"), dict) else {}
+    parent_id = _compact_id(parent.get("id") or parent.get("database_id"))
+    if parent_id and parent_id == _compact_id(SCRIPT_ROUTER_DB_ID):
+        lane = WebhookLane.SCRIPT_SYNC
+    elif parent_id and parent_id in {
+        _compact_id(WORKFLOWS_ROUTER_DB_ID),
+        _compact_id(PROMPTS_DB_ID),
+        _compact_id(AGENT_TASKS_DB_ID),
+    }:
+        lane = WebhookLane.WORKFLOW
+    else:
+        lane = WebhookLane.LEGACY
+
+    key = _compact_id(entity_id)
+    # Handlers re-fetch the entity, so a queued event of the same type for
+    # the same entity is redundant once a newer one arrives.
+    return lane, key, f"{payload.get('type', 'automation')}:{key}"
+
+
+# add_webhook() status: the webhook is persisted and the reaper dispatches it
+# once the queue drains (the pool was full, or an earlier event for the same
+# entity is still waiting in the store)
+DEFERRED = "deferred"
+
+
+def _durable_queue_enabled() -> bool:
+    """Whether webhooks are persisted before processing ($WEBHOOK_QUEUE_DURABLE, default on)."""
+    return os.getenv("WEBHOOK_QUEUE_DURABLE", "1").strip().lower() not in ("0", "false", "no", "off")
+
 
 class WebhookQueue:
-    """Thread-safe queue for processing webhooks one at a time."""
-    
-    def __init__(self):
-        self.queue = deque()
-        self.processing = False
-        self.lock = threading.Lock()
-        self.processing_thread = None
-        self.stop_event = threading.Event()
-        
-    def add_webhook(self, payload: Dict[str, Any], request_id: str = None) -> None:
-        """Add a webhook to the queue."""
+    """
+    Webhook queue backed by a priority-aware worker pool.
+
+    Webhooks for the same Notion entity are processed one at a time in
+    arrival order; different entities run in parallel on WEBHOOK_WORKERS
+    threads. Repeated events for an entity that is still queued are
+    coalesced, and once WEBHOOK_QUEUE_MAX webhooks are waiting new ones
+    are deferred to the durable store, or rejected without it (see
+    /queue-status for depth and backpressure metrics). While an entity has
+    a deferred webhook, its later webhooks are deferred behind it so they
+    cannot overtake it; a failed webhook retried with backoff does run
+    after newer events for its entity.
+
+    With the durable store enabled, every accepted webhook is written to
+    disk before the sender gets a response. Jobs are acked when processed,
+    failed jobs are retried with backoff until they are dead-lettered, and
+    jobs left unfinished by a crash or restart are recovered on startup
+    (replay dead letters with ``python -m shared_core.webhook_queue_store``).
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        max_queue: Optional[int] = None,
+        store: Optional[WebhookQueueStore] = None,
+    ):
+        self.pool = WebhookWorkerPool(
+            self._run_webhook,
+            workers=workers,
+            max_queue=max_queue,
+            on_error=self._on_webhook_error,
+            on_coalesce=self._on_webhook_coalesced,
+            name="webhook-worker",
+        )
+        if store is None and _durable_queue_enabled():
+            try:
+                store = get_webhook_queue_store()
+            except Exception as e:
+                webhook_logger.warning(f"Durable webhook queue unavailable, using memory only: {e}")
+        self.store = store
+        self.reap_interval = float(os.getenv("WEBHOOK_QUEUE_REAP_INTERVAL", "5"))
+        self._dispatched: set = set()
+        # Entity key -> newest stored job deferred for that entity
+        self._deferred: Dict[str, int] = {}
+        self._dispatched_lock = threading.Lock()
+        self._reaper: Optional[threading.Thread] = None
+        self._reaper_stop = threading.Event()
+
+    @property
+    def processing(self) -> bool:
+        """Whether any webhook is being processed right now."""
+        return self.pool.in_flight() > 0
+
+    def add_webhook(self, payload: Dict[str, Any], request_id: str = None) -> str:
+        """
+        Add a webhook to the queue.
+
+        Returns:
+            "queued", "coalesced", "deferred" (queue full, kept in the durable
+            store) or "rejected" (queue full and not persisted)
+        """
         if request_id is None:
             request_id = f"webhook_{int(time.time() * 1000)}"
-            
+
+        lane, key, coalesce_key = _classify_webhook(payload)
+        job_id = None
+        if self.store is not None:
+            try:
+                with self._dispatched_lock:
+                    job_id = self.store.enqueue(
+                        payload, request_id=request_id, lane=lane, entity_key=key, coalesce_key=coalesce_key
+                    )
+                    self._dispatched.add(job_id)
+            except Exception as e:
+                webhook_logger.error(f"Failed to persist webhook {request_id}: {e}")
+
         webhook_item = WebhookItem(
             payload=payload,
             timestamp=datetime.now(timezone.utc),
-            request_id=request_id
+            request_id=request_id,
+            job_id=job_id,
         )
-        
-        with self.lock:
-            self.queue.append(webhook_item)
-            webhook_logger.info("Received: Webhook queued: {request_id} (Queue size: {len(self.queue)})")
-            
+
+        with self._dispatched_lock:
+            behind_deferred = job_id is not None and key is not None and key in self._deferred
+            if behind_deferred:
+                self._deferred[key] = job_id
+        if behind_deferred:
+            # An earlier event for this entity is waiting in the store; queue
+            # behind it so recover() dispatches both in arrival order
+            self._release(webhook_item)
+            status = DEFERRED
+            webhook_logger.info(f"Webhook deferred behind a stored event for {key}: {request_id}")
+        else:
+            status = self._dispatch(webhook_item, lane, key, coalesce_key)
+
+        if status == REJECTED and job_id is not None:
+            # Notion does not redeliver, so keep the stored copy; recover()
+            # dispatches it once the pool has room
+            status = DEFERRED
+            if key is not None:
+                with self._dispatched_lock:
+                    self._deferred[key] = job_id
+            webhook_logger.warning(
+                f"Webhook queue full, deferred to the durable queue: {request_id}",
+                {"queued": self.pool.pending(), "max_queue": self.pool.max_queue},
+            )
+        elif status == REJECTED:
+            webhook_logger.warning(
+                f"Webhook queue full, rejected: {request_id}",
+                {"queued": self.pool.pending(), "max_queue": self.pool.max_queue},
+            )
+        elif status == COALESCED:
+            webhook_logger.info(f"Webhook coalesced with queued event for {key}: {request_id}")
+        else:
+            webhook_logger.info(f"Received: Webhook queued: {request_id} (lane={lane.name.lower()}, queue size: {self.pool.pending()})")
+
         # Start processing if not already running
-        if not self.processing:
+        if not self.pool.running:
             self.start_processing()
-    
+        return status
+
+    def _dispatch(self, webhook_item: WebhookItem, lane: WebhookLane, key: Optional[str], coalesce_key: Optional[str]) -> str:
+        """Hand an item to the worker pool; a rejected stored job is no longer in memory."""
+        status = self.pool.submit(webhook_item, lane=lane, key=key, coalesce_key=coalesce_key)
+        if status == REJECTED:
+            self._release(webhook_item)
+        return status
+
+    def _release(self, webhook_item: WebhookItem) -> None:
+        if webhook_item.job_id is not None:
+            with self._dispatched_lock:
+                self._dispatched.discard(webhook_item.job_id)
+
     def start_processing(self) -> None:
-        """Start the processing thread."""
-        with self.lock:
-            if self.processing:
-                return
-            self.processing = True
-            
-        self.processing_thread = threading.Thread(target=self._process_queue, daemon=True)
-        self.processing_thread.start()
+        """Start the worker threads and, with the durable store, recovery of stored jobs."""
+        self.pool.start()
+        if self.store is not None and (self._reaper is None or not self._reaper.is_alive()):
+            released = self.store.release_all()
+            if released:
+                webhook_logger.info(f"Recovered {released} webhook(s) left in flight by the previous run")
+            self._reaper_stop.clear()
+            self._reaper = threading.Thread(target=self._reap_loop, name="webhook-queue-reaper", daemon=True)
+            self._reaper.start()
         webhook_logger.info("Processing: Webhook queue processing started")
-    
+
     def stop_processing(self) -> None:
-        """Stop the processing thread."""
-        self.stop_event.set()
-        if self.processing_thread:
-            self.processing_thread.join(timeout=5)
+        """Stop the worker threads; unfinished stored jobs are recovered on the next start."""
+        self._reaper_stop.set()
+        if self._reaper is not None:
+            self._reaper.join(timeout=5)
+        self.pool.stop(timeout=5)
+        if self.store is not None:
+            self.store.flush()
         webhook_logger.info("Stopped: Webhook queue processing stopped")
-    
-    def _process_queue(self) -> None:
-        """Process webhooks from the queue one at a time."""
-        while not self.stop_event.is_set():
-            webhook_item = None
-            
-            # Get next webhook from queue
-            with self.lock:
-                if self.queue:
-                    webhook_item = self.queue.popleft()
-                    webhook_logger.info("Processing: Processing webhook: {webhook_item.request_id}")
-                else:
-                    self.processing = False
-                    break
-            
-            if webhook_item:
-                try:
-                    # Process the webhook
-                    self._process_single_webhook(webhook_item)
-                    webhook_logger.info("Webhook processed: {webhook_item.request_id}")
-                    
-                    # Pause for 1 second before processing next webhook
-                    time.sleep(1)
-                    
-                except Exception as e:
-                    webhook_logger.error("Error processing webhook {webhook_item.request_id}: {str(e)}")
-                    _emit_notification(
-                        NotificationEvent(
-                            run_id=webhook_item.request_id,
-                            script_name="notion_webhook_server",
-                            event_type="webhook_error",
-                            severity=EventSeverity.ERROR,
-                            phase="processing",
-                            status=EventStatus.ERROR,
-                            summary="Error processing webhook",
-                            details={"error": str(e)},
-                        )
-                    )
-                    # Continue processing other webhooks even if one fails
-    
+
+    def recover(self) -> int:
+        """
+        Dispatch stored jobs that are due (new, retried or replayed) and not in memory.
+
+        Returns:
+            Number of jobs handed to the worker pool
+        """
+        if self.store is None:
+            return 0
+        with self._dispatched_lock:
+            jobs = self.store.due(exclude=self._dispatched, limit=self.pool.max_queue)
+            self._dispatched.update(job.id for job in jobs)
+        dispatched = 0
+        for index, job in enumerate(jobs):
+            webhook_item = WebhookItem(
+                payload=job.payload,
+                timestamp=datetime.fromtimestamp(job.enqueued_at, timezone.utc),
+                request_id=job.request_id or f"webhook_job_{job.id}",
+                job_id=job.id,
+            )
+            if self._dispatch(webhook_item, WebhookLane(job.lane), job.entity_key, job.coalesce_key) == REJECTED:
+                with self._dispatched_lock:
+                    self._dispatched.difference_update(later.id for later in jobs[index:])
+                break
+            dispatched += 1
+        with self._dispatched_lock:
+            # An entity's later events go straight to the pool again once its
+            # newest deferred job has been handed over
+            for job in jobs[:dispatched]:
+                if job.entity_key is not None and self._deferred.get(job.entity_key) == job.id:
+                    del self._deferred[job.entity_key]
+        return dispatched
+
+    def _reap_loop(self) -> None:
+        while not self._reaper_stop.is_set():
+            try:
+                recovered = self.recover()
+                if recovered:
+                    webhook_logger.info(f"Dispatched {recovered} stored webhook(s) (retries/recovery)")
+                for job_id in self.store.expired_claims():
+                    webhook_logger.warning(f"Webhook job {job_id} exceeded its visibility timeout")
+            except Exception as e:
+                webhook_logger.error(f"Webhook queue recovery failed: {e}")
+            self._reaper_stop.wait(self.reap_interval)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Queue depth, lane and backpressure metrics."""
+        metrics = self.pool.snapshot()
+        if self.store is not None:
+            metrics["durable"] = self.store.counts()
+        return metrics
+
+    def _run_webhook(self, webhook_item: WebhookItem) -> None:
+        webhook_logger.info(f"Processing: Processing webhook: {webhook_item.request_id}")
+        if webhook_item.job_id is not None:
+            self.store.claim(webhook_item.job_id)
+        self._process_single_webhook(webhook_item)
+        if webhook_item.job_id is not None:
+            self.store.ack(webhook_item.job_id)
+            self._release(webhook_item)
+        webhook_logger.info(f"Webhook processed: {webhook_item.request_id}")
+
+    def _on_webhook_coalesced(self, replaced: WebhookItem, webhook_item: WebhookItem) -> None:
+        # The newer event supersedes the stored one; nothing left to deliver.
+        if replaced.job_id is not None:
+            self.store.ack(replaced.job_id)
+            self._release(replaced)
+
+    def _on_webhook_error(self, webhook_item: WebhookItem, e: BaseException) -> None:
+        webhook_logger.error(f"Error processing webhook {webhook_item.request_id}: {str(e)}")
+        summary = "Error processing webhook"
+        if webhook_item.job_id is not None:
+            state = self.store.nack(webhook_item.job_id, str(e))
+            self._release(webhook_item)
+            if state == DEAD:
+                summary = f"Webhook dead-lettered after {self.store.max_attempts} attempts (job {webhook_item.job_id})"
+            else:
+                summary = "Error processing webhook, will retry"
+        _emit_notification(
+            NotificationEvent(
+                run_id=webhook_item.request_id,
+                script_name="notion_webhook_server",
+                event_type="webhook_error",
+                severity=EventSeverity.ERROR,
+                phase="processing",
+                status=EventStatus.ERROR,
+                summary=summary,
+                details={"error": str(e), "job_id": webhook_item.job_id},
+            )
+        )
+
     def _process_single_webhook(self, webhook_item: WebhookItem) -> None:
         """Process a single webhook item."""
         payload = webhook_item.payload
@@ -621,7 +864,8 @@ class WebhookQueue:
             except Exception as e:
                 webhook_logger.error("Failed to fetch entity for webhook {webhook_item.request_id}: {str(e)}")
                 status_summary = f"Failed to fetch entity: {e}"
-                return
+                # Transient API failure: raise so the durable queue retries it.
+                raise
 
             # 3b Loop-guard: prevent circular flows between Google Workspace sync and Notion webhooks.
             if entity.get("type") == "page" and isinstance(full, dict) and full:
@@ -1103,8 +1347,14 @@ health_monitor = None
 
 if MULTI_NODE_COORDINATOR_AVAILABLE:
     try:
-        node_registry = NodeRegistry()
-        load_balancer = LoadBalancer(strategy=WEBHOOK_LOAD_BALANCER_STRATEGY)
+        node_registry = NodeRegistry(
+            failure_threshold=int(os.getenv("WEBHOOK_NODE_FAILURE_THRESHOLD", "3") or 3),
+            cooldown_s=float(os.getenv("WEBHOOK_NODE_COOLDOWN_SECONDS", "30") or 30),
+        )
+        load_balancer = LoadBalancer(
+            strategy=WEBHOOK_LOAD_BALANCER_STRATEGY,
+            sticky=_strtobool(os.getenv("WEBHOOK_STICKY_ROUTING", "true")),
+        )
         health_monitor = HealthMonitor(
             node_registry,
             interval_s=int(os.getenv("WEBHOOK_NODE_HEALTH_INTERVAL_SECONDS", "30") or 30),
@@ -1213,8 +1463,6 @@ def _post_dashboard_event(event: Dict[str, Any]) -> None:
 def log_slack_event_to_csv(payload: Dict[str, Any], processing_result: Dict[str, Any] | None = None) -> None:
     """Log Slack event subscription payloads to a CSV file."""
     try:
-        os.makedirs(SLACK_EVENTS_CSV_DIR, exist_ok=True)
-
         today = datetime.now().strftime("%Y-%m-%d")
         csv_filename = f"slack_event_subscriptions_{today}.csv"
         csv_path = os.path.join(SLACK_EVENTS_CSV_DIR, csv_filename)
@@ -1251,13 +1499,7 @@ def log_slack_event_to_csv(payload: Dict[str, Any], processing_result: Dict[str,
             "payload": json.dumps(payload, default=str),
         }
 
-        file_exists = os.path.exists(csv_path)
-        with open(csv_path, "a", newline="", encoding="utf-8") as csvfile:
-            fieldnames = list(row_data.keys())
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            if not file_exists:
-                writer.writeheader()
-            writer.writerow(row_data)
+        side_effect_writer.append_csv(csv_path, list(row_data.keys()), row_data)
     except Exception:
         return
 
@@ -1377,6 +1619,17 @@ def _should_ignore_notion_webhook(payload: Dict[str, Any], full: Dict[str, Any])
         webhook_logger.warning("Loop guard failed, proceeding", {"error": str(e)})
         return ""
 
+def _load_report() -> Dict[str, Any]:
+    """Queue depth, in-flight count and rolling latency for the coordinator."""
+    pool = webhook_queue.pool
+    return {
+        "queue_depth": pool.pending(),
+        "in_flight": pool.in_flight(),
+        "latency_ms": round(pool.stats["latency_ms"], 1),
+        "workers": pool.workers,
+    }
+
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
@@ -1407,6 +1660,9 @@ async def health_check():
         "enhanced_logging": ENHANCED_LOGGING_AVAILABLE
     }
 
+    # Load report used by the coordinator's load-aware scheduling
+    status["load"] = _load_report()
+
     # Multi-node coordinator status (optional)
     status["multi_node"] = {
         "enabled": MULTI_NODE_ENABLED,
@@ -1433,38 +1689,82 @@ async def health_check():
     return status
 
 
-def _try_forward_to_worker(payload: Dict[str, Any], *, run_id: str) -> Optional[Dict[str, Any]]:
+_forward_client: Optional["httpx.AsyncClient"] = None
+
+
+def _get_forward_client() -> "httpx.AsyncClient":
+    """Keep-alive client shared by all forwards (created on the server's event loop)."""
+    global _forward_client
+    if _forward_client is None:
+        _forward_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(float(os.getenv("WEBHOOK_FORWARD_TIMEOUT", "3"))),
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+            headers={"Accept": "application/json"},
+        )
+    return _forward_client
+
+
+def _post_to_worker_blocking(url: str, payload: Dict[str, Any]) -> str:
+    req = UrlRequest(
+        url,
+        data=json.dumps(payload).encode("utf-8"),
+        headers={"Content-Type": "application/json", "Accept": "application/json"},
+        method="POST",
+    )
+    with urlopen(req, timeout=3) as resp:
+        return resp.read().decode("utf-8", errors="replace")
+
+
+async def _try_forward_to_worker(payload: Dict[str, Any], *, run_id: str) -> Optional[Dict[str, Any]]:
     """
     Best-effort forward to a healthy worker node (MM2).
     If forwarding fails, return None so the coordinator can fall back to local queue.
+
+    Uses the pooled async client, so a slow worker only delays this request
+    rather than the event loop.
     """
     if not MULTI_NODE_ENABLED or node_registry is None or load_balancer is None:
         return None
 
-    workers = node_registry.healthy_nodes(role="worker")
+    workers = node_registry.list_nodes(role="worker")
     if not workers:
         return None
 
-    target = load_balancer.select_node(workers)
+    # Sticky by Notion entity so one page's events land on one worker in order;
+    # while that worker is down or overloaded the event stays in the local queue.
+    _, entity_key, _ = _classify_webhook(payload)
+    target = load_balancer.select_node(workers, key=entity_key)
     if not target:
         return None
 
     # Forward to worker's /webhook/process endpoint.
     url = target.base_url.rstrip("/") + "/webhook/process"
+    # Outstanding forwards count toward the node's load; failures feed its circuit breaker.
+    node_registry.begin(target.node_id)
+    reachable = False
     try:
-        req = UrlRequest(
-            url,
-            data=json.dumps(payload).encode("utf-8"),
-            headers={"Content-Type": "application/json", "Accept": "application/json"},
-            method="POST",
-        )
-        with urlopen(req, timeout=3) as resp:
-            body = resp.read().decode("utf-8", errors="replace")
+        if HTTPX_AVAILABLE:
+            resp = await _get_forward_client().post(url, json=payload)
+            resp.raise_for_status()
+            body = resp.text
+        else:
+            body = await asyncio.to_thread(_post_to_worker_blocking, url, payload)
+        reachable = True
         try:
             parsed = json.loads(body)
         except Exception:
             parsed = {"text": body[:5000]}
 
+        if isinstance(parsed, dict):
+            node_registry.update_load(target.node_id, parsed.get("load"))
+        if isinstance(parsed, dict) and parsed.get("ok") is False:
+            # Worker refused (e.g. its queue is full); keep the event here.
+            webhook_logger.warning(
+                "Multi-node: worker refused webhook; falling back to local queue",
+                {"run_id": run_id, "worker": target.node_id, "status": parsed.get("status")},
+            )
+            return None
+
         return {
             "status": "forwarded",
             "run_id": run_id,
@@ -1478,6 +1778,8 @@ def _try_forward_to_worker(payload: Dict[str, Any], *, run_id: str) -> Optional[
             {"run_id": run_id, "worker": getattr(target, "node_id", "unknown"), "error": str(e)},
         )
         return None
+    finally:
+        node_registry.end(target.node_id, ok=reachable)
 
 
 @app.post("/coordinator/register")
@@ -1518,7 +1820,7 @@ async def coordinator_assign(job: Dict[str, Any]):
     run_id = str(job.get("run_id") or f"assign-{int(time.time() * 1000)}")
     job["run_id"] = run_id
 
-    resp = _try_forward_to_worker(job, run_id=run_id)
+    resp = await _try_forward_to_worker(job, run_id=run_id)
     if resp:
         return {"ok": True, **resp}
     return {"ok": False, "status": "no_worker_available", "run_id": run_id}
@@ -1539,12 +1841,13 @@ if STATUS_MONITOR_AVAILABLE:
 @app.get("/queue-status")
 async def queue_status():
     """Get the current status of the webhook queue."""
-    with webhook_queue.lock:
-        queue_size = len(webhook_queue.queue)
-        processing = webhook_queue.processing
+    metrics = webhook_queue.snapshot()
     return {
-        "queue_size": queue_size,
-        "processing": processing,
+        "queue_size": metrics["queued"],
+        "processing": metrics["in_flight"] > 0,
+        "pool": metrics,
+        "side_effects": side_effect_writer.snapshot(),
+        "database_discovery": discovery_writer.snapshot(),
         "timestamp": datetime.now().isoformat()
     }
 
@@ -2131,9 +2434,6 @@ def activate_app(bundle_id: str) -> None:
 def log_webhook_to_csv(payload: Dict[str, Any], event_type: str = "unknown", processing_result: Dict[str, Any] = None) -> None:
     """Log webhook data to CSV file in Google Drive directory with comprehensive information."""
     try:
-        # Ensure the directory exists
-        os.makedirs(WEBHOOK_CSV_DIR, exist_ok=True)
-        
         # Create filename with current date
         today = datetime.now().strftime("%Y-%m-%d")
         csv_filename = f"notion_database_webhooks_{today}.csv"
@@ -2220,26 +2520,13 @@ def log_webhook_to_csv(payload: Dict[str, Any], event_type: str = "unknown", pro
             "payload": payload_str
         }
         
-        # Check if file exists to determine if we need to write headers
-        file_exists = os.path.exists(csv_path)
-        
-        # Write to CSV
-        with open(csv_path, 'a', newline='', encoding='utf-8') as csvfile:
-            fieldnames = [
-                "timestamp", "event_type", "entity_id", "entity_type", "database_id",
-                "name", "file_path", "actions_relation", "processing_status",
-                "actions_processed", "error_message", "payload"
-            ]
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            
-            # Write header if file is new
-            if not file_exists:
-                writer.writeheader()
-            
-            # Write the row
-            writer.writerow(row_data)
-        
-        webhook_logger.info("Webhook logged to CSV: {csv_path}")
+        # Written (with a header for new files) by the background writer
+        fieldnames = [
+            "timestamp", "event_type", "entity_id", "entity_type", "database_id",
+            "name", "file_path", "actions_relation", "processing_status",
+            "actions_processed", "error_message", "payload"
+        ]
+        side_effect_writer.append_csv(csv_path, fieldnames, row_data)
         
     except Exception as e:
         webhook_logger.error("Error logging webhook to CSV: {e}")
@@ -2281,20 +2568,21 @@ def _submit_to_cursor_basic(message: str) -> None:
     Basic Cursor submission method as fallback.
     """
     try:
-        # 1. Activate Cursor application
-        activate_app("com.todesktop.230313mzl4w4u92")
-        time.sleep(1)
-        
-        # 2. Set the message to clipboard
-        subprocess.run(["pbcopy"], input=message.encode(), check=True)
-        time.sleep(0.5)
-        
-        # 3. Paste the message (Cmd+V)
-        paste_clipboard()
-        time.sleep(0.5)
-        
-        # 4. Press Cmd+Enter for stop & send
-        press_stop_and_send()
+        with _desktop_automation_lock:
+            # 1. Activate Cursor application
+            activate_app("com.todesktop.230313mzl4w4u92")
+            time.sleep(1)
+
+            # 2. Set the message to clipboard
+            subprocess.run(["pbcopy"], input=message.encode(), check=True)
+            time.sleep(0.5)
+
+            # 3. Paste the message (Cmd+V)
+            paste_clipboard()
+            time.sleep(0.5)
+
+            # 4. Press Cmd+Enter for stop & send
+            press_stop_and_send()
         
         webhook_logger.info("Message submitted to Cursor via basic method: {message[:50]}...")
         
@@ -3521,7 +3809,8 @@ async def slack_events(req: Request):
     log_slack_event_to_csv(slack_payload, {"status": "received"})
 
     # Queue for controlled background processing
-    webhook_queue.add_webhook(slack_payload, request_id=run_id)
+    if webhook_queue.add_webhook(slack_payload, request_id=run_id) == REJECTED:
+        return _queue_full_response(run_id)
 
     _emit_notification(
         NotificationEvent(
@@ -3538,6 +3827,21 @@ async def slack_events(req: Request):
 
     return {"ok": True, "run_id": run_id, "event_type": event_type, "status": "queued"}
 
+def _queue_full_response(run_id: str) -> JSONResponse:
+    """
+    503 + Retry-After so the sender redelivers once the queue drains.
+
+    Only returned when the queue is full and the webhook could not be
+    persisted (durable queue disabled or unavailable); senders that do not
+    retry, such as Notion automations, lose that event.
+    """
+    return JSONResponse(
+        status_code=503,
+        content={"status": "queue_full", "run_id": run_id, "node_id": WORKSPACE_EVENTS_NODE_ID},
+        headers={"Retry-After": os.getenv("WEBHOOK_RETRY_AFTER_SECONDS", "30")},
+    )
+
+
 @app.post("/webhook")
 async def receive_webhook(req: Request):
     """
@@ -3547,7 +3851,10 @@ async def receive_webhook(req: Request):
     1. Notion Event Subscriptions: {"type": "...", "entity": {...}}
     2. Notion Automations: Direct property payload (e.g., {"Task Name": {...}, ...})
     
-    Always returns 200 OK to prevent 503 errors. Errors are logged but not returned as HTTP errors.
+    Returns 200 OK, including when processing fails (errors are logged, not
+    returned as HTTP errors). When the worker queue is full the webhook is
+    deferred to the durable queue; only if it cannot be persisted is a 503
+    with Retry-After returned.
     """
     try:
         run_id = f"notion-webhook-{int(time.time() * 1000)}"
@@ -3639,38 +3946,43 @@ async def receive_webhook(req: Request):
             webhook_logger.info("Received: Received Notion Automation webhook with {len(payload)} properties")
             log_webhook_to_csv(payload, "automation", {"status": "automation_webhook", "property_count": len(payload)})
             # Best-effort forward to worker node (MM2) for parallelism; fall back to local queue.
-            forwarded = _try_forward_to_worker(payload, run_id=run_id)
+            forwarded = await _try_forward_to_worker(payload, run_id=run_id)
             if forwarded:
                 return forwarded
 
             # Queue automation webhooks for local processing (can be extended with automation-specific handlers)
-            webhook_queue.add_webhook(payload, request_id=run_id)
+            if webhook_queue.add_webhook(payload, request_id=run_id) == REJECTED:
+                return _queue_full_response(run_id)
             return {"status": "webhook queued", "format": "automation", "node_id": WORKSPACE_EVENTS_NODE_ID}
         elif is_event_subscription:
             # Notion Event Subscription format - existing processing
             webhook_logger.info("Received: Received Notion Event Subscription webhook: {payload.get('type', 'unknown')}")
             log_webhook_to_csv(payload, "event_subscription", {"status": "webhook_queued", "event_type": payload.get('type', 'unknown')})
-            # Discover database from webhook for dynamic database management
+            # Discover database from webhook for dynamic database management (off the request path)
             try:
-                discover_database_from_webhook(payload)
+                # Build the coroutine on the writer thread: a dropped job
+                # must not leave a never-awaited coroutine behind
+                discovery_writer.submit(lambda: asyncio.run(discover_database_from_webhook(payload)))
             except Exception as e:
                 webhook_logger.warning("Failed to discover database from webhook: {e}")
             # Best-effort forward to worker node (MM2) for parallelism; fall back to local queue.
-            forwarded = _try_forward_to_worker(payload, run_id=run_id)
+            forwarded = await _try_forward_to_worker(payload, run_id=run_id)
             if forwarded:
                 return forwarded
 
             # Add all other webhooks to the local queue
-            webhook_queue.add_webhook(payload, request_id=run_id)
+            if webhook_queue.add_webhook(payload, request_id=run_id) == REJECTED:
+                return _queue_full_response(run_id)
             return {"status": "webhook queued", "format": "event_subscription", "node_id": WORKSPACE_EVENTS_NODE_ID}
         else:
             # Unknown format - log and queue anyway
             webhook_logger.warning("Unknown webhook format received: {list(payload.keys())[:5]}")
             log_webhook_to_csv(payload, "unknown", {"status": "unknown_format", "keys": list(payload.keys())[:5]})
-            forwarded = _try_forward_to_worker(payload, run_id=run_id)
+            forwarded = await _try_forward_to_worker(payload, run_id=run_id)
             if forwarded:
                 return forwarded
-            webhook_queue.add_webhook(payload, request_id=run_id)
+            if webhook_queue.add_webhook(payload, request_id=run_id) == REJECTED:
+                return _queue_full_response(run_id)
             return {"status": "webhook queued", "format": "unknown", "node_id": WORKSPACE_EVENTS_NODE_ID}
             
     except Exception as e:
@@ -3719,8 +4031,15 @@ async def worker_process_webhook(req: Request):
     payload["__forwarded_at"] = datetime.now(timezone.utc).isoformat()
 
     try:
-        webhook_queue.add_webhook(payload, request_id=run_id)
-        return {"ok": True, "status": "queued", "run_id": run_id, "node_id": os.getenv("WORKSPACE_EVENTS_NODE_ID", "local")}
+        if webhook_queue.add_webhook(payload, request_id=run_id) == REJECTED:
+            return {"ok": False, "status": "queue_full", "run_id": run_id, "error": "worker queue full"}
+        return {
+            "ok": True,
+            "status": "queued",
+            "run_id": run_id,
+            "node_id": os.getenv("WORKSPACE_EVENTS_NODE_ID", "local"),
+            "load": _load_report(),
+        }
     except Exception as e:
         return {"ok": False, "status": "error", "run_id": run_id, "error": str(e)}
 
@@ -3835,6 +4154,9 @@ _script_registry_id = None
 async def startup_event():
     """Handle startup - create execution log and link to script registry."""
     global _startup_log_id, _script_registry_id
+
+    # Resume webhooks persisted by a previous run
+    webhook_queue.start_processing()
     
     try:
         # Import execution log utilities
@@ -3945,6 +4267,13 @@ async def shutdown_event():
     webhook_logger.info("Processing: Shutting down webhook queue...")
     webhook_queue.stop_processing()
     webhook_logger.info("Webhook queue shutdown complete")
+
+    global _forward_client
+    if _forward_client is not None:
+        await _forward_client.aclose()
+        _forward_client = None
+    side_effect_writer.flush()
+    discovery_writer.flush()
     
     # Shutdown Google Workspace Events API service
     if WORKSPACE_EVENTS_INTEGRATION_AVAILABLE:
@@ -3986,7 +4315,7 @@ if __name__ == "__main__":
     webhook_logger.info(f"   • Workflows: {WORKFLOWS_DB_ID}")
     webhook_logger.info(f"   • Functions: {FUNCTIONS_DB_ID}")
     webhook_logger.info(f"   • Prompts: {PROMPTS_DB_ID}")
-    webhook_logger.info("Processing: Queue-based processing: ✅ Enabled (1-second pause between webhooks)")
+    webhook_logger.info(f"Processing: Queue-based processing: ✅ Enabled ({webhook_queue.pool.workers} workers, per-entity ordering)")
     
     try:
         uvicorn.run(app, host=FASTAPI_HOST, port=FASTAPI_PORT)
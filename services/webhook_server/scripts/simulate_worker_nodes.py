@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""
+Local multi-node scheduling harness.
+
+Spawns 1-4 simulated worker nodes as separate processes. Each one serves
+``/health`` (with a ``load`` report) and ``/webhook/process`` like a real
+MM2 worker, processing jobs on a fixed number of threads with a
+configurable service time. The harness then drives the coordinator's
+``NodeRegistry`` / ``LoadBalancer`` / ``HealthMonitor`` against them and
+reports per-node job counts and end-to-end latency for each strategy.
+
+Usage:
+    python services/webhook_server/scripts/simulate_worker_nodes.py
+    python services/webhook_server/scripts/simulate_worker_nodes.py --workers 3 --slow 0:5 --jobs 400
+    python services/webhook_server/scripts/simulate_worker_nodes.py --workers 2 --failing 1 --strategies p2c
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import queue
+import random
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+from urllib.request import Request as UrlRequest, urlopen
+
+SERVER_DIR = Path(__file__).resolve().parent.parent
+if str(SERVER_DIR) not in sys.path:
+    sys.path.insert(0, str(SERVER_DIR))
+
+from coordinator import STRATEGIES, HealthMonitor, LoadBalancer, NodeRegistry
+
+
+@dataclass
+class WorkerSpec:
+    """Behaviour of one simulated worker node."""
+
+    service_ms: float = 10.0
+    threads: int = 2
+    max_queue: int = 1000
+    failing: bool = False
+
+
+# ----------------------------------------------------------------------
+# Worker process
+# ----------------------------------------------------------------------
+
+def _worker_main(index: int, spec: WorkerSpec, ports: "multiprocessing.Queue") -> None:
+    jobs: "queue.Queue[float]" = queue.Queue()
+    lock = threading.Lock()
+    state: Dict[str, Any] = {"in_flight": 0, "latency_ms": 0.0, "latencies": []}
+
+    def load() -> Dict[str, Any]:
+        with lock:
+            return {
+                "queue_depth": jobs.qsize(),
+                "in_flight": state["in_flight"],
+                "latency_ms": round(state["latency_ms"], 1),
+            }
+
+    def run() -> None:
+        while True:
+            received = jobs.get()
+            with lock:
+                state["in_flight"] += 1
+            time.sleep(spec.service_ms / 1000.0)
+            latency = (time.monotonic() - received) * 1000
+            with lock:
+                state["in_flight"] -= 1
+                state["latencies"].append(latency)
+                previous = state["latency_ms"]
+                state["latency_ms"] = latency if not previous else previous + 0.2 * (latency - previous)
+
+    for _ in range(spec.threads):
+        threading.Thread(target=run, daemon=True).start()
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args: Any) -> None:
+            return
+
+        def _reply(self, status: int, body: Dict[str, Any]) -> None:
+            data = json.dumps(body).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self) -> None:
+            if spec.failing:
+                self._reply(500, {"status": "error"})
+            elif self.path == "/health":
+                self._reply(200, {"status": "healthy", "load": load()})
+            elif self.path == "/stats":
+                with lock:
+                    self._reply(200, {"latencies": list(state["latencies"])})
+            else:
+                self._reply(404, {})
+
+        def do_POST(self) -> None:
+            self.rfile.read(int(self.headers.get("Content-Length") or 0))
+            if spec.failing:
+                self._reply(500, {"ok": False, "status": "error"})
+            elif jobs.qsize() >= spec.max_queue:
+                self._reply(200, {"ok": False, "status": "queue_full", "load": load()})
+            else:
+                jobs.put(time.monotonic())
+                self._reply(200, {"ok": True, "status": "queued", "load": load()})
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    ports.put((index, server.server_address[1]))
+    server.serve_forever()
+
+
+def _get_json(url: str, timeout: float = 5.0) -> Dict[str, Any]:
+    with urlopen(UrlRequest(url, headers={"Accept": "application/json"}), timeout=timeout) as resp:
+        return json.loads(resp.read().decode("utf-8"))
+
+
+def _post_json(url: str, payload: Dict[str, Any], timeout: float = 5.0) -> Dict[str, Any]:
+    req = UrlRequest(
+        url,
+        data=json.dumps(payload).encode("utf-8"),
+        headers={"Content-Type": "application/json", "Accept": "application/json"},
+        method="POST",
+    )
+    with urlopen(req, timeout=timeout) as resp:
+        return json.loads(resp.read().decode("utf-8"))
+
+
+def _percentile(values: Sequence[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))]
+
+
+# ----------------------------------------------------------------------
+# Simulation
+# ----------------------------------------------------------------------
+
+def simulate(
+    strategy: str,
+    specs: Sequence[WorkerSpec],
+    *,
+    jobs: int = 200,
+    rate: float = 0.0,
+    concurrency: int = 8,
+    keys: int = 0,
+    sticky: bool = False,
+    failure_threshold: int = 3,
+    seed: int = 7,
+) -> Dict[str, Any]:
+    """
+    Run one scheduling simulation against freshly spawned worker processes.
+
+    Args:
+        strategy: LoadBalancer strategy
+        specs: One WorkerSpec per worker node (1-4)
+        jobs: Jobs to dispatch
+        rate: Arrivals per second (0 = one burst)
+        concurrency: Concurrent coordinator forwards
+        keys: Distinct routing keys (0 = no key per job)
+        sticky: Enable sticky routing by key
+        failure_threshold: Consecutive failures that open a node's circuit
+        seed: Random seed for key assignment
+
+    Returns:
+        Per-node job counts, routing failures and latency percentiles
+    """
+    ctx = multiprocessing.get_context("spawn")
+    ports: "multiprocessing.Queue" = ctx.Queue()
+    processes = [
+        ctx.Process(target=_worker_main, args=(i, spec, ports), daemon=True) for i, spec in enumerate(specs)
+    ]
+    for process in processes:
+        process.start()
+    try:
+        bound = dict(ports.get(timeout=30) for _ in processes)
+        urls = [f"http://127.0.0.1:{bound[i]}" for i in range(len(specs))]
+        registry = NodeRegistry(failure_threshold=failure_threshold, cooldown_s=60)
+        for i, url in enumerate(urls):
+            registry.register_or_update(node_id=f"worker-{i}", base_url=url, role="worker")
+        monitor = HealthMonitor(registry, interval_s=1, timeout_s=2)
+        monitor.check_all()
+        monitor.start()
+        balancer = LoadBalancer(strategy, sticky=sticky)
+        rng = random.Random(seed)
+        job_keys = [f"page-{rng.randrange(keys)}" if keys else None for _ in range(jobs)]
+
+        counts: Dict[str, int] = {f"worker-{i}": 0 for i in range(len(urls))}
+        key_nodes: Dict[str, set] = {}
+        errors = {"no_node": 0, "failed": 0, "refused": 0}
+        count_lock = threading.Lock()
+
+        def forward(key: Optional[str]) -> None:
+            node = balancer.select_node(registry.list_nodes(role="worker"), key=key)
+            if node is None:
+                with count_lock:
+                    errors["no_node"] += 1
+                return
+            registry.begin(node.node_id)
+            ok = False
+            try:
+                response = _post_json(node.base_url + "/webhook/process", {"key": key})
+                ok = True
+                registry.update_load(node.node_id, response.get("load"))
+                with count_lock:
+                    if response.get("ok"):
+                        counts[node.node_id] += 1
+                        if key:
+                            key_nodes.setdefault(key, set()).add(node.node_id)
+                    else:
+                        errors["refused"] += 1
+            except Exception:
+                with count_lock:
+                    errors["failed"] += 1
+            finally:
+                registry.end(node.node_id, ok=ok)
+
+        started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            for index, key in enumerate(job_keys):
+                if rate:
+                    time.sleep(max(0.0, started + index / rate - time.monotonic()))
+                pool.submit(forward, key)
+        dispatch_s = time.monotonic() - started
+        monitor.stop()
+
+        latencies: List[float] = []
+        per_node_latency: Dict[str, float] = {}
+        for i, (url, spec) in enumerate(zip(urls, specs)):
+            if spec.failing:
+                continue
+            deadline = time.monotonic() + 60
+            while time.monotonic() < deadline:
+                load = _get_json(url + "/health")["load"]
+                if not load["queue_depth"] and not load["in_flight"]:
+                    break
+                time.sleep(0.02)
+            node_latencies = _get_json(url + "/stats")["latencies"]
+            latencies.extend(node_latencies)
+            per_node_latency[f"worker-{i}"] = round(statistics.mean(node_latencies), 1) if node_latencies else 0.0
+
+        return {
+            "strategy": strategy,
+            "sticky": sticky,
+            "jobs": counts,
+            "errors": errors,
+            "split_keys": sum(1 for nodes in key_nodes.values() if len(nodes) > 1),
+            "dispatch_s": round(dispatch_s, 3),
+            "avg_latency_ms": per_node_latency,
+            "p50_ms": round(_percentile(latencies, 50), 1),
+            "p95_ms": round(_percentile(latencies, 95), 1),
+            "p99_ms": round(_percentile(latencies, 99), 1),
+        }
+    finally:
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.join(timeout=5)
+
+
+def _parse_factors(values: Sequence[str]) -> Dict[int, float]:
+    factors = {}
+    for value in values:
+        index, _, factor = value.partition(":")
+        factors[int(index)] = float(factor or 5)
+    return factors
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Simulate coordinator scheduling against local worker processes")
+    parser.add_argument("--workers", type=int, default=2, choices=[1, 2, 3, 4])
+    parser.add_argument("--strategies", nargs="+", default=list(STRATEGIES), choices=list(STRATEGIES))
+    parser.add_argument("--jobs", type=int, default=200)
+    parser.add_argument("--rate", type=float, default=150.0, help="Arrivals per second (0 = one burst)")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--service-ms", type=float, default=10.0)
+    parser.add_argument("--threads", type=int, default=2, help="Processing threads per worker")
+    parser.add_argument("--slow", nargs="*", default=["0:5"], help="INDEX:FACTOR service-time multipliers")
+    parser.add_argument("--failing", type=int, nargs="*", default=[], help="Worker indexes that return HTTP 500")
+    parser.add_argument("--keys", type=int, default=0, help="Distinct entity keys (0 = unkeyed jobs)")
+    parser.add_argument("--sticky", action="store_true", help="Route by key with rendezvous hashing")
+    args = parser.parse_args(argv)
+
+    slow = _parse_factors(args.slow)
+    specs = [
+        WorkerSpec(
+            service_ms=args.service_ms * slow.get(i, 1.0),
+            threads=args.threads,
+            failing=i in args.failing,
+        )
+        for i in range(args.workers)
+    ]
+    for strategy in args.strategies:
+        result = simulate(
+            strategy,
+            specs,
+            jobs=args.jobs,
+            rate=args.rate,
+            concurrency=args.concurrency,
+            keys=args.keys,
+            sticky=args.sticky,
+        )
+        print(json.dumps(result))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,6 +8,8 @@ Submodules:
 - notion: Notion API integration utilities
 - logging: Centralized logging utilities
 - notifications: macOS notification utilities
+- eagle: Persistent Eagle item index
+- audio: Single-decode audio analysis
 
 **MANDATORY USAGE:**
 All scripts that interact with Notion MUST use the token_manager:
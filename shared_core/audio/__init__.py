@@ -0,0 +1,52 @@
+"""
+Audio analysis utilities shared across workflows.
+"""
+
+from shared_core.audio.analysis import (
+    ANALYSIS_SAMPLE_RATE,
+    ANALYSIS_VERSION,
+    FEATURE_SAMPLE_RATE,
+    DecodedAudio,
+    decode_audio,
+    estimate_bpm,
+    estimate_key,
+    get_meter,
+    measure_loudness,
+    measure_true_peak,
+    spectral_hash,
+    spectral_signature,
+)
+from shared_core.audio.analysis_cache import AnalysisCache, CachedAnalysis, get_analysis_cache
+from shared_core.audio.fingerprint_service import (
+    FileFingerprintService,
+    FingerprintResult,
+    FingerprintStore,
+    get_fingerprint_service,
+    sha256_file,
+)
+from shared_core.audio.worker_pool import AnalysisWorkerPool, PooledAnalysis
+
+__all__ = [
+    "ANALYSIS_SAMPLE_RATE",
+    "ANALYSIS_VERSION",
+    "FEATURE_SAMPLE_RATE",
+    "DecodedAudio",
+    "decode_audio",
+    "estimate_bpm",
+    "estimate_key",
+    "get_meter",
+    "measure_loudness",
+    "measure_true_peak",
+    "spectral_hash",
+    "spectral_signature",
+    "AnalysisCache",
+    "CachedAnalysis",
+    "get_analysis_cache",
+    "FileFingerprintService",
+    "FingerprintResult",
+    "FingerprintStore",
+    "get_fingerprint_service",
+    "sha256_file",
+    "AnalysisWorkerPool",
+    "PooledAnalysis",
+]
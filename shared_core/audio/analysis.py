@@ -0,0 +1,319 @@
+"""
+Single-Decode Audio Analysis
+============================
+
+Decodes an audio file once into a mono float32 buffer and computes every
+per-track measurement from that buffer, so the download pipeline no longer
+re-reads the same file for tempo, key, loudness and normalization.
+``shared_core.audio.worker_pool`` runs the same stage in worker processes.
+
+Buffers:
+- ``DecodedAudio.samples``: mono float32 at ``ANALYSIS_SAMPLE_RATE`` (44.1 kHz),
+  the rate loudness measurement and normalization run at.
+- ``DecodedAudio.feature_samples()``: one cached downsample to
+  ``FEATURE_SAMPLE_RATE`` (22.05 kHz) for tempo, chroma and the spectral
+  signature; librosa's feature extractors are tuned for that rate.
+
+Usage:
+    from shared_core.audio import decode_audio, estimate_bpm, measure_loudness
+
+    decoded = decode_audio("track.wav")
+    y, sr = decoded.feature_samples()
+    bpm = estimate_bpm(y, sr)
+    loudness = measure_loudness(decoded.samples, decoded.sample_rate)
+
+Created: 2026-10-16
+"""
+
+import hashlib
+import logging
+import struct
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+import numpy as np
+
+try:
+    import librosa
+    LIBROSA_AVAILABLE = True
+except ImportError:
+    librosa = None
+    LIBROSA_AVAILABLE = False
+
+try:
+    import soundfile as sf
+except ImportError:
+    sf = None
+
+try:
+    import pyloudnorm as pyln
+    PYLOUDNORM_AVAILABLE = True
+except ImportError:
+    pyln = None
+    PYLOUDNORM_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+ANALYSIS_SAMPLE_RATE = 44100
+FEATURE_SAMPLE_RATE = 22050
+
+# Tracks longer than this use a middle excerpt for tempo estimation
+LONG_TRACK_SECONDS = 300
+BPM_EXCERPT_SECONDS = 120
+
+CLIPPING_THRESHOLD = 0.95
+TRUE_PEAK_OVERSAMPLING = 4
+
+# Bump the leading number when an algorithm changes; the parameters are
+# appended so cached results never outlive a configuration change.
+ANALYSIS_VERSION = (
+    f"1:{ANALYSIS_SAMPLE_RATE}:{FEATURE_SAMPLE_RATE}:{LONG_TRACK_SECONDS}:"
+    f"{BPM_EXCERPT_SECONDS}:{CLIPPING_THRESHOLD}:{TRUE_PEAK_OVERSAMPLING}"
+)
+
+_meter_cache: Dict[int, Any] = {}
+
+
+def get_meter(sample_rate: int):
+    """Return a cached pyloudnorm Meter for the given sample rate."""
+    if not PYLOUDNORM_AVAILABLE:
+        raise RuntimeError("pyloudnorm not available")
+    if sample_rate not in _meter_cache:
+        _meter_cache[sample_rate] = pyln.Meter(sample_rate)
+    return _meter_cache[sample_rate]
+
+
+def _require_librosa() -> None:
+    if not LIBROSA_AVAILABLE:
+        raise RuntimeError("librosa not available")
+
+
+@dataclass
+class DecodedAudio:
+    """A decoded track shared by every analysis step."""
+    samples: np.ndarray  # mono float32
+    sample_rate: int
+    channels: int  # channel count of the source file
+    path: Optional[str] = None
+    _feature: Optional[Tuple[np.ndarray, int]] = field(default=None, repr=False, compare=False)
+
+    @property
+    def duration(self) -> float:
+        """Duration in seconds."""
+        return len(self.samples) / float(self.sample_rate) if self.sample_rate else 0.0
+
+    def feature_samples(self, sample_rate: int = FEATURE_SAMPLE_RATE) -> Tuple[np.ndarray, int]:
+        """
+        Return the buffer at the feature-extraction rate.
+
+        The downsample happens once and is cached on the instance.
+        """
+        if self._feature is not None and self._feature[1] == sample_rate:
+            return self._feature
+        if sample_rate == self.sample_rate:
+            self._feature = (self.samples, sample_rate)
+        else:
+            _require_librosa()
+            resampled = librosa.resample(self.samples, orig_sr=self.sample_rate, target_sr=sample_rate)
+            self._feature = (np.ascontiguousarray(resampled, dtype=np.float32), sample_rate)
+        return self._feature
+
+
+def decode_audio(
+    path: Union[str, Path],
+    sample_rate: int = ANALYSIS_SAMPLE_RATE,
+) -> DecodedAudio:
+    """
+    Decode an audio file once to mono float32 at ``sample_rate``.
+
+    soundfile is used for formats it can read (WAV/AIFF/FLAC), with a
+    single resample when the native rate differs; everything else goes
+    through ``librosa.load``.
+
+    Args:
+        path: Audio file path
+        sample_rate: Target sample rate
+
+    Returns:
+        DecodedAudio
+    """
+    path = str(path)
+    data = None
+    native_rate = None
+
+    if sf is not None:
+        try:
+            data, native_rate = sf.read(path, dtype="float32", always_2d=True)
+        except Exception:
+            data = None
+
+    if data is not None:
+        channels = data.shape[1]
+        samples = data.mean(axis=1, dtype=np.float32) if channels > 1 else data[:, 0]
+        if native_rate != sample_rate:
+            _require_librosa()
+            samples = librosa.resample(samples, orig_sr=native_rate, target_sr=sample_rate)
+    else:
+        _require_librosa()
+        raw, _ = librosa.load(path, sr=sample_rate, mono=False)
+        channels = 1 if raw.ndim == 1 else raw.shape[0]
+        samples = raw if raw.ndim == 1 else raw.mean(axis=0)
+
+    samples = np.ascontiguousarray(samples, dtype=np.float32)
+    logger.debug(f"Decoded {path}: {len(samples)} samples at {sample_rate} Hz ({channels} ch source)")
+    return DecodedAudio(samples=samples, sample_rate=sample_rate, channels=channels, path=path)
+
+
+def measure_true_peak(samples: np.ndarray, oversampling: int = TRUE_PEAK_OVERSAMPLING) -> float:
+    """
+    Inter-sample (true) peak as a linear value, via polyphase oversampling.
+
+    Falls back to the sample peak when scipy is unavailable.
+    """
+    if samples.size == 0:
+        return 0.0
+    sample_peak = float(np.max(np.abs(samples)))
+    try:
+        from scipy.signal import resample_poly
+    except ImportError:
+        return sample_peak
+    oversampled = resample_poly(samples, oversampling, 1)
+    return max(sample_peak, float(np.max(np.abs(oversampled))))
+
+
+def measure_loudness(
+    samples: np.ndarray,
+    sample_rate: int = ANALYSIS_SAMPLE_RATE,
+    clipping_threshold: float = CLIPPING_THRESHOLD,
+) -> Dict[str, Any]:
+    """
+    Measure integrated loudness, peaks and clipping of a mono buffer.
+
+    Returns:
+        Dictionary with lufs_integrated, true_peak_db, peak, rms,
+        crest_factor, clipped_samples, clipping_percentage and
+        measurement_method (same keys as the monolith's loudness analysis)
+    """
+    samples = np.asarray(samples, dtype=np.float32).reshape(-1)
+    total = samples.size
+    if total == 0:
+        raise ValueError("empty audio buffer")
+
+    abs_samples = np.abs(samples)
+    peak = float(abs_samples.max())
+    rms = float(np.sqrt(np.mean(np.square(samples, dtype=np.float64))))
+    clipped = int(np.count_nonzero(abs_samples > clipping_threshold))
+    true_peak = measure_true_peak(samples)
+
+    lufs = None
+    method = "RMS approximation"
+    if PYLOUDNORM_AVAILABLE:
+        try:
+            lufs = float(get_meter(sample_rate).integrated_loudness(samples.reshape(-1, 1)))
+            method = "ITU-R BS.1770-4 (pyloudnorm)"
+        except ValueError as e:
+            # Clips shorter than one gating block
+            logger.debug(f"Integrated loudness unavailable: {e}")
+    if lufs is None or not np.isfinite(lufs):
+        lufs = 20 * np.log10(rms) - 16 if rms > 0 else -70.0
+
+    return {
+        "lufs_integrated": float(lufs),
+        "lufs_approx": float(lufs),
+        "true_peak_db": float(20 * np.log10(true_peak)) if true_peak > 0 else -70.0,
+        "peak": peak,
+        "rms": rms,
+        "crest_factor": peak / rms if rms > 0 else 0.0,
+        "clipped_samples": clipped,
+        "clipping_percentage": clipped / total * 100,
+        "measurement_method": method,
+    }
+
+
+def estimate_bpm(samples: np.ndarray, sample_rate: int) -> Optional[float]:
+    """
+    Estimate tempo with librosa's beat tracker.
+
+    Tracks longer than ``LONG_TRACK_SECONDS`` are analyzed on a
+    ``BPM_EXCERPT_SECONDS`` excerpt starting a quarter of the way in.
+
+    Returns:
+        Tempo in BPM, or None when no tempo could be estimated
+    """
+    _require_librosa()
+    if len(samples) == 0:
+        return None
+    if len(samples) > sample_rate * LONG_TRACK_SECONDS:
+        start = len(samples) // 4
+        samples = samples[start:start + min(len(samples) // 2, sample_rate * BPM_EXCERPT_SECONDS)]
+
+    try:
+        tempo, _ = librosa.beat.beat_track(y=samples, sr=sample_rate)
+    except AttributeError as exc:
+        # Older scipy releases lack signal.hann; estimate from the onset envelope
+        if "hann" not in str(exc):
+            raise
+        onset_env = librosa.onset.onset_strength(y=samples, sr=sample_rate)
+        tempo_fn = getattr(librosa.feature, "tempo", None) or librosa.beat.tempo
+        tempo = tempo_fn(onset_envelope=onset_env, sr=sample_rate)
+    tempo = float(np.atleast_1d(tempo)[0])
+    return tempo if tempo > 0 else None
+
+
+_PITCH_CLASSES = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
+_MAJOR_PROFILE = [6.35, 2.23, 3.48, 2.33, 4.38, 4.09, 2.52, 5.19, 2.39, 3.66, 2.29, 2.88]
+_MINOR_PROFILE = [6.33, 2.68, 3.52, 5.38, 2.60, 3.53, 2.54, 4.75, 3.98, 2.69, 3.34, 3.17]
+
+
+def estimate_key(samples: np.ndarray, sample_rate: int) -> Optional[str]:
+    """
+    Estimate the musical key from the mean chroma profile.
+
+    The strongest pitch class is taken as the tonic and the mode is chosen
+    by Krumhansl-Schmuckler profile correlation.
+
+    Returns:
+        Key such as "G Major" or "A Minor", or None without chroma energy
+    """
+    _require_librosa()
+    if len(samples) == 0:
+        return None
+    chroma = librosa.feature.chroma_cqt(y=samples, sr=sample_rate)
+    mean_chroma = np.mean(chroma, axis=1)
+    if np.all(mean_chroma == 0):
+        return None
+
+    key_index = int(np.argmax(mean_chroma))
+    major_profile = _MAJOR_PROFILE[key_index:] + _MAJOR_PROFILE[:key_index]
+    minor_profile = _MINOR_PROFILE[key_index:] + _MINOR_PROFILE[:key_index]
+    major_corr = np.corrcoef(mean_chroma, major_profile)[0, 1]
+    minor_corr = np.corrcoef(mean_chroma, minor_profile)[0, 1]
+    scale = "Major" if major_corr > minor_corr else "Minor"
+    return f"{_PITCH_CLASSES[key_index]} {scale}"
+
+
+def spectral_signature(samples: np.ndarray, sample_rate: int, time_bins: int = 32) -> bytes:
+    """
+    Compact log-mel signature (same layout as FingerprintGenerator's spectral hash).
+
+    Returns:
+        Packed float32 signature bytes
+    """
+    _require_librosa()
+    mel_spec = librosa.feature.melspectrogram(y=samples, sr=sample_rate, n_mels=128, fmax=8000)
+    log_mel = librosa.power_to_db(mel_spec, ref=np.max)
+
+    bin_size = log_mel.shape[1] // time_bins
+    signature = []
+    for i in range(time_bins):
+        start = i * bin_size
+        end = start + bin_size
+        if end <= log_mel.shape[1]:
+            signature.extend(np.mean(log_mel[:, start:end], axis=1).tolist())
+    return struct.pack(f"{len(signature)}f", *signature)
+
+
+def spectral_hash(signature: bytes) -> str:
+    """SHA-256 of a spectral signature."""
+    return hashlib.sha256(signature).hexdigest()
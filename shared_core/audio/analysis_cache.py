@@ -0,0 +1,284 @@
+"""
+Audio Analysis Cache
+====================
+
+Content-addressed cache of per-track analysis results. Entries are keyed
+by the file's SHA-256 fingerprint plus ``ANALYSIS_VERSION``, so reprocessing
+a track whose audio bytes have not changed skips the decode and the
+tempo/key/loudness passes entirely.
+
+Stored per entry: duration, channels, BPM, key, the loudness report
+(LUFS, true peak, clipping, ...) and the spectral signature.
+
+The cache is a WAL-mode SQLite file shared between processes and bounded
+by entry count and total payload size; the least recently used entries
+are evicted first.
+
+Usage:
+    from shared_core.audio.analysis_cache import get_analysis_cache
+
+    cache = get_analysis_cache()
+    entry = cache.get(sha256)
+    if entry is None:
+        ...analyze...
+        cache.put(sha256, duration=..., bpm=..., key=..., loudness=...)
+
+Created: 2026-10-16
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from shared_core.audio.analysis import ANALYSIS_VERSION
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS analysis (
+    fingerprint TEXT NOT NULL,
+    version TEXT NOT NULL,
+    duration REAL,
+    channels INTEGER,
+    bpm REAL,
+    key TEXT,
+    lufs REAL,
+    loudness TEXT,
+    signature BLOB,
+    size_bytes INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    last_access REAL NOT NULL,
+    PRIMARY KEY (fingerprint, version)
+);
+CREATE INDEX IF NOT EXISTS idx_analysis_access ON analysis(last_access);
+"""
+
+
+@dataclass
+class CachedAnalysis:
+    """Analysis results restored from the cache."""
+    fingerprint: str
+    duration: float
+    channels: Optional[int] = None
+    bpm: Optional[float] = None
+    key: Optional[str] = None
+    lufs: Optional[float] = None
+    loudness: Optional[Dict[str, Any]] = None
+    signature: Optional[bytes] = None
+
+
+class AnalysisCache:
+    """
+    Persistent LRU cache of audio analysis results.
+
+    Features:
+    - Keyed by file SHA-256 + analysis version
+    - LRU eviction bounded by entry count and payload bytes
+    - WAL-mode SQLite so several processes can share one cache
+    - Thread-safe operations
+    """
+
+    DEFAULT_PATH = "~/.local/share/audio-analysis-cache/analysis.sqlite3"
+    DEFAULT_MAX_ENTRIES = 100_000
+    DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        version: str = ANALYSIS_VERSION,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            path: SQLite file path. Defaults to $AUDIO_ANALYSIS_CACHE_PATH or
+                ~/.local/share/audio-analysis-cache/analysis.sqlite3
+            max_entries: Entry limit ($AUDIO_ANALYSIS_CACHE_MAX_ENTRIES)
+            max_bytes: Payload size limit ($AUDIO_ANALYSIS_CACHE_MAX_BYTES)
+            version: Analysis version entries must match
+        """
+        self.path = Path(path or os.getenv("AUDIO_ANALYSIS_CACHE_PATH") or self.DEFAULT_PATH).expanduser()
+        self.max_entries = max_entries or int(
+            os.getenv("AUDIO_ANALYSIS_CACHE_MAX_ENTRIES", self.DEFAULT_MAX_ENTRIES)
+        )
+        self.max_bytes = max_bytes or int(os.getenv("AUDIO_ANALYSIS_CACHE_MAX_BYTES", self.DEFAULT_MAX_BYTES))
+        self.version = version
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, fingerprint: str) -> Optional[CachedAnalysis]:
+        """
+        Look up the analysis for a file fingerprint.
+
+        Args:
+            fingerprint: SHA-256 of the audio file
+
+        Returns:
+            CachedAnalysis or None on a miss
+        """
+        fingerprint = fingerprint.lower()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM analysis WHERE fingerprint = ? AND version = ?",
+                (fingerprint, self.version),
+            ).fetchone()
+            if row is None:
+                self._misses += 1
+                return None
+            self._conn.execute(
+                "UPDATE analysis SET last_access = ? WHERE fingerprint = ? AND version = ?",
+                (time.time(), fingerprint, self.version),
+            )
+            self._conn.commit()
+            self._hits += 1
+
+        return CachedAnalysis(
+            fingerprint=fingerprint,
+            duration=row["duration"],
+            channels=row["channels"],
+            bpm=row["bpm"],
+            key=row["key"],
+            lufs=row["lufs"],
+            loudness=json.loads(row["loudness"]) if row["loudness"] else None,
+            signature=row["signature"],
+        )
+
+    def put(
+        self,
+        fingerprint: str,
+        duration: float,
+        bpm: Optional[float] = None,
+        key: Optional[str] = None,
+        loudness: Optional[Dict[str, Any]] = None,
+        signature: Optional[bytes] = None,
+        channels: Optional[int] = None,
+    ) -> None:
+        """
+        Store (or replace) the analysis for a file fingerprint.
+
+        Args:
+            fingerprint: SHA-256 of the audio file
+            duration: Duration in seconds
+            bpm: Detected tempo
+            key: Detected key
+            loudness: Loudness report (lufs_integrated, true_peak_db, ...)
+            signature: Spectral signature bytes
+            channels: Source channel count
+        """
+        loudness_json = json.dumps(loudness, default=float) if loudness else None
+        lufs = loudness.get("lufs_integrated") if loudness else None
+        size = len(signature or b"") + len(loudness_json or "") + 128
+        now = time.time()
+
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO analysis
+                    (fingerprint, version, duration, channels, bpm, key, lufs, loudness,
+                     signature, size_bytes, created_at, last_access)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (fingerprint.lower(), self.version, duration, channels, bpm, key, lufs,
+                 loudness_json, signature, size, now, now),
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self) -> int:
+        """Drop least recently used entries until both limits hold."""
+        count, total = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM analysis"
+        ).fetchone()
+        if count <= self.max_entries and total <= self.max_bytes:
+            return 0
+
+        evicted = 0
+        rows = self._conn.execute(
+            "SELECT fingerprint, version, size_bytes FROM analysis ORDER BY last_access ASC"
+        ).fetchall()
+        doomed = []
+        for row in rows:
+            if count <= self.max_entries and total <= self.max_bytes:
+                break
+            doomed.append((row["fingerprint"], row["version"]))
+            count -= 1
+            total -= row["size_bytes"]
+            evicted += 1
+        self._conn.executemany("DELETE FROM analysis WHERE fingerprint = ? AND version = ?", doomed)
+        logger.debug(f"Analysis cache evicted {evicted} entries")
+        return evicted
+
+    def invalidate(self, fingerprint: str) -> None:
+        """Remove every version of a fingerprint's entry."""
+        with self._lock:
+            self._conn.execute("DELETE FROM analysis WHERE fingerprint = ?", (fingerprint.lower(),))
+            self._conn.commit()
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._conn.execute("DELETE FROM analysis")
+            self._conn.commit()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            count, total = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM analysis"
+            ).fetchone()
+        lookups = self._hits + self._misses
+        return {
+            "path": str(self.path),
+            "version": self.version,
+            "entries": count,
+            "size_bytes": total,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": self._hits / lookups if lookups else 0.0,
+        }
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+_default_cache: Optional[AnalysisCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_analysis_cache(path: Optional[Union[str, Path]] = None) -> AnalysisCache:
+    """
+    Get or create the shared analysis cache.
+
+    Args:
+        path: Optional path override
+
+    Returns:
+        AnalysisCache instance
+    """
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None or path is not None:
+            _default_cache = AnalysisCache(path)
+        return _default_cache
@@ -0,0 +1,361 @@
+"""
+File Fingerprint Service
+========================
+
+SHA-256 file fingerprinting for whole music volumes.
+
+Components:
+- ``sha256_file()``: streaming hash using one reusable ``readinto`` buffer
+  (8 MiB by default) instead of allocating a new bytes object per chunk
+- ``FingerprintStore``: persisted ``(path, size, mtime, inode) -> hash``
+  table; a file whose stat signature is unchanged is never rehashed
+- ``FileFingerprintService``: bounded pool of hashing threads plus a
+  streaming ``iter_fingerprints()`` API that yields results as they
+  complete. ``hashlib`` and file reads release the GIL, so threads keep
+  several disks/SSD queues busy without process overhead.
+
+Usage:
+    from shared_core.audio.fingerprint_service import get_fingerprint_service
+
+    service = get_fingerprint_service()
+    for result in service.iter_fingerprints(paths):
+        print(result.path, result.fingerprint, result.cached)
+
+Created: 2026-10-16
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Deque, Dict, Iterable, Iterator, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BUFFER_SIZE = 8 * 1024 * 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS file_hashes (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    inode INTEGER NOT NULL,
+    sha256 TEXT NOT NULL,
+    hashed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_file_hashes_sha ON file_hashes(sha256);
+"""
+
+_thread_buffers = threading.local()
+
+StatKey = Tuple[int, int, int]
+
+
+def _stat_key(stat: os.stat_result) -> StatKey:
+    return (int(stat.st_size), int(stat.st_mtime_ns), int(stat.st_ino))
+
+
+def sha256_file(path: Union[str, Path], buffer_size: int = DEFAULT_BUFFER_SIZE) -> str:
+    """
+    Compute the SHA-256 of a file with a reusable per-thread read buffer.
+
+    Args:
+        path: File path
+        buffer_size: Read size in bytes
+
+    Returns:
+        Hex digest
+    """
+    buffer = getattr(_thread_buffers, "buffer", None)
+    if buffer is None or len(buffer) != buffer_size:
+        buffer = _thread_buffers.buffer = bytearray(buffer_size)
+    view = memoryview(buffer)
+
+    hasher = hashlib.sha256()
+    with open(path, "rb", buffering=0) as handle:
+        while True:
+            read = handle.readinto(buffer)
+            if not read:
+                break
+            hasher.update(view[:read])
+    return hasher.hexdigest()
+
+
+@dataclass
+class FingerprintResult:
+    """Fingerprint of one file."""
+    path: str
+    fingerprint: Optional[str]
+    size: int = 0
+    mtime: float = 0.0
+    cached: bool = False
+    error: Optional[str] = None
+
+
+class FingerprintStore:
+    """
+    Persisted stat-signature -> SHA-256 table.
+
+    An entry is valid while the file's size, mtime (ns) and inode match
+    the values recorded when it was hashed.
+    """
+
+    DEFAULT_PATH = "~/.local/share/file-fingerprints/hashes.sqlite3"
+
+    def __init__(self, path: Optional[Union[str, Path]] = None):
+        """
+        Initialize the store.
+
+        Args:
+            path: SQLite file path. Defaults to $FILE_FINGERPRINT_STORE_PATH or
+                ~/.local/share/file-fingerprints/hashes.sqlite3
+        """
+        self.path = Path(path or os.getenv("FILE_FINGERPRINT_STORE_PATH") or self.DEFAULT_PATH).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    def lookup(self, path: str, key: StatKey) -> Optional[str]:
+        """Return the stored hash if the stat signature still matches."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT size, mtime_ns, inode, sha256 FROM file_hashes WHERE path = ?", (path,)
+            ).fetchone()
+        if row is None or tuple(row[:3]) != key:
+            return None
+        return row[3]
+
+    def lookup_many(self, paths: Iterable[str]) -> Dict[str, Tuple[StatKey, str]]:
+        """Fetch stored entries for many paths in one query per 500 paths."""
+        paths = list(paths)
+        found: Dict[str, Tuple[StatKey, str]] = {}
+        with self._lock:
+            for start in range(0, len(paths), 500):
+                chunk = paths[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                for row in self._conn.execute(
+                    f"SELECT path, size, mtime_ns, inode, sha256 FROM file_hashes WHERE path IN ({placeholders})",
+                    chunk,
+                ):
+                    found[row[0]] = ((row[1], row[2], row[3]), row[4])
+        return found
+
+    def record_many(self, entries: Iterable[Tuple[str, StatKey, str]]) -> None:
+        """Store (path, stat key, hash) entries."""
+        now = time.time()
+        rows = [(path, key[0], key[1], key[2], digest, now) for path, key, digest in entries]
+        if not rows:
+            return
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO file_hashes (path, size, mtime_ns, inode, sha256, hashed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.commit()
+
+    def record(self, path: str, key: StatKey, digest: str) -> None:
+        """Store one entry."""
+        self.record_many([(path, key, digest)])
+
+    def forget(self, path: str) -> None:
+        """Drop the entry for a path."""
+        with self._lock:
+            self._conn.execute("DELETE FROM file_hashes WHERE path = ?", (path,))
+            self._conn.commit()
+
+    def prune_missing(self) -> int:
+        """Drop entries whose files no longer exist; returns the number removed."""
+        with self._lock:
+            paths = [row[0] for row in self._conn.execute("SELECT path FROM file_hashes")]
+        missing = [(path,) for path in paths if not os.path.exists(path)]
+        if missing:
+            with self._lock:
+                self._conn.executemany("DELETE FROM file_hashes WHERE path = ?", missing)
+                self._conn.commit()
+        return len(missing)
+
+    def count(self) -> int:
+        """Number of stored entries."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM file_hashes").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class FileFingerprintService:
+    """
+    Parallel, stat-cached SHA-256 fingerprinting.
+
+    Features:
+    - Bounded thread pool of hashing workers with large readinto buffers
+    - Persisted stat-signature skip table (FingerprintStore)
+    - Streaming iterator API with bounded in-flight work
+    - Thread-safe single-file fingerprint()
+    """
+
+    def __init__(
+        self,
+        store: Optional[FingerprintStore] = None,
+        workers: Optional[int] = None,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        use_store: bool = True,
+    ):
+        """
+        Initialize the service.
+
+        Args:
+            store: Skip table (default: FingerprintStore at its default path)
+            workers: Hashing threads ($FILE_FINGERPRINT_WORKERS, default min(8, CPU count))
+            buffer_size: Per-thread read buffer size
+            use_store: Disable to always hash (and never persist)
+        """
+        self.workers = workers or int(os.getenv("FILE_FINGERPRINT_WORKERS", "0")) or min(8, os.cpu_count() or 1)
+        self.buffer_size = buffer_size
+        self.store = (store or FingerprintStore()) if use_store else None
+        self.stats = {"hashed": 0, "cached": 0, "errors": 0, "bytes_hashed": 0}
+        self._stats_lock = threading.Lock()
+
+    def _count(self, key: str, amount: int = 1) -> None:
+        with self._stats_lock:
+            self.stats[key] += amount
+
+    def fingerprint(self, path: Union[str, Path]) -> str:
+        """
+        Fingerprint one file, reusing the stored hash if it is unchanged.
+
+        Raises:
+            OSError: If the file cannot be read
+        """
+        path = str(path)
+        key = _stat_key(os.stat(path))
+        if self.store is not None:
+            digest = self.store.lookup(path, key)
+            if digest:
+                self._count("cached")
+                return digest
+        digest = sha256_file(path, self.buffer_size)
+        self._count("hashed")
+        self._count("bytes_hashed", key[0])
+        if self.store is not None:
+            self.store.record(path, key, digest)
+        return digest
+
+    def _hash_job(self, path: str, key: StatKey) -> Tuple[Optional[str], Optional[str]]:
+        try:
+            return sha256_file(path, self.buffer_size), None
+        except OSError as e:
+            return None, str(e)
+
+    def iter_fingerprints(
+        self,
+        paths: Iterable[Union[str, Path]],
+        batch_size: int = 500,
+    ) -> Iterator[FingerprintResult]:
+        """
+        Stream fingerprints for many files.
+
+        Cached files are yielded immediately; the rest are hashed by the
+        worker pool with at most ``2 * workers`` files in flight. Results
+        for hashed files arrive in submission order.
+
+        Args:
+            paths: File paths (any iterable, consumed lazily in batches)
+            batch_size: Paths stat'ed and looked up per store query
+
+        Yields:
+            FingerprintResult per path
+        """
+        max_in_flight = self.workers * 2
+        pending: Deque[Tuple[str, StatKey, object]] = deque()
+        to_record = []
+
+        def finish_oldest() -> FingerprintResult:
+            path, key, future = pending.popleft()
+            digest, error = future.result()
+            if digest is None:
+                self._count("errors")
+                return FingerprintResult(path=path, fingerprint=None, size=key[0], error=error)
+            self._count("hashed")
+            self._count("bytes_hashed", key[0])
+            to_record.append((path, key, digest))
+            return FingerprintResult(path=path, fingerprint=digest, size=key[0], mtime=key[1] / 1e9)
+
+        def flush() -> None:
+            if self.store is not None and to_record:
+                self.store.record_many(to_record)
+            to_record.clear()
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="fingerprint") as executor:
+            iterator = iter(paths)
+            exhausted = False
+            while not exhausted:
+                batch = []
+                for raw in iterator:
+                    batch.append(str(raw))
+                    if len(batch) >= batch_size:
+                        break
+                else:
+                    exhausted = True
+
+                stored = self.store.lookup_many(batch) if self.store is not None else {}
+                for path in batch:
+                    try:
+                        key = _stat_key(os.stat(path))
+                    except OSError as e:
+                        self._count("errors")
+                        yield FingerprintResult(path=path, fingerprint=None, error=str(e))
+                        continue
+
+                    entry = stored.get(path)
+                    if entry is not None and tuple(entry[0]) == key:
+                        self._count("cached")
+                        yield FingerprintResult(
+                            path=path, fingerprint=entry[1], size=key[0], mtime=key[1] / 1e9, cached=True,
+                        )
+                        continue
+
+                    pending.append((path, key, executor.submit(self._hash_job, path, key)))
+                    while len(pending) >= max_in_flight:
+                        yield finish_oldest()
+                    if len(to_record) >= batch_size:
+                        flush()
+
+            while pending:
+                yield finish_oldest()
+            flush()
+
+    def fingerprint_many(self, paths: Iterable[Union[str, Path]]) -> Dict[str, Optional[str]]:
+        """Fingerprint many files; returns path -> hash (None on error)."""
+        return {result.path: result.fingerprint for result in self.iter_fingerprints(paths)}
+
+
+_default_service: Optional[FileFingerprintService] = None
+_default_service_lock = threading.Lock()
+
+
+def get_fingerprint_service() -> FileFingerprintService:
+    """
+    Get or create the shared fingerprint service.
+
+    Returns:
+        FileFingerprintService instance
+    """
+    global _default_service
+    with _default_service_lock:
+        if _default_service is None:
+            _default_service = FileFingerprintService()
+        return _default_service
@@ -0,0 +1,231 @@
+"""
+Audio Analysis Worker Pool
+==========================
+
+Process-pool tier for the CPU-bound part of track processing (decode,
+tempo, chroma/key, loudness, spectral signature). Batch modes keep network
+and Notion I/O on threads; each thread hands its file to this pool and
+blocks on the result, so analysis runs on all cores instead of serializing
+on the GIL.
+
+Features:
+- Warm workers: librosa is imported and the pyloudnorm meter cached once
+  per process by the pool initializer
+- Decoded buffers come back through ``multiprocessing.shared_memory``
+  instead of being pickled through the result pipe
+- Mix detection short-circuit: features are skipped for files longer than
+  ``max_duration``
+
+The pool uses the platform's default start method (override with
+``start_method`` or ``SC_ANALYSIS_START_METHOD``). With ``spawn`` (macOS)
+each worker re-imports the entry script once at startup.
+
+Usage:
+    from shared_core.audio.worker_pool import AnalysisWorkerPool
+
+    with AnalysisWorkerPool(max_workers=8) as pool:
+        result = pool.analyze("track.wav")
+        print(result.bpm, result.key, result.loudness["lufs_integrated"])
+
+Created: 2026-10-16
+"""
+
+import logging
+import multiprocessing
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+import numpy as np
+
+from shared_core.audio import analysis
+from shared_core.audio.analysis import ANALYSIS_SAMPLE_RATE
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PooledAnalysis:
+    """Analysis computed in a worker, with the decoded buffer attached."""
+    samples: np.ndarray  # mono float32 at sample_rate
+    sample_rate: int
+    channels: int
+    duration: float
+    bpm: Optional[float] = None
+    key: Optional[str] = None
+    loudness: Optional[Dict[str, Any]] = None
+    signature: Optional[bytes] = None  # spectral signature
+    errors: Dict[str, str] = field(default_factory=dict)
+
+
+# ----------------------------------------------------------------------
+# Worker side
+# ----------------------------------------------------------------------
+
+def _init_worker() -> None:
+    """Import heavy modules and build the loudness meter once per process."""
+    if analysis.LIBROSA_AVAILABLE:
+        # librosa loads submodules lazily; touch the ones analysis uses
+        analysis.librosa.beat.beat_track
+        analysis.librosa.feature.chroma_cqt
+    if analysis.PYLOUDNORM_AVAILABLE:
+        analysis.get_meter(ANALYSIS_SAMPLE_RATE)
+
+
+def _worker_pid() -> int:
+    return os.getpid()
+
+
+def _export_buffer(samples: np.ndarray) -> str:
+    """Copy samples into a new shared memory block owned by the parent."""
+    shm = shared_memory.SharedMemory(create=True, size=max(1, samples.nbytes))
+    np.ndarray(samples.shape, dtype=np.float32, buffer=shm.buf)[:] = samples
+    try:
+        # The parent unlinks the block; stop this process's tracker from doing it too
+        from multiprocessing import resource_tracker
+        resource_tracker.unregister(shm._name, "shared_memory")
+    except Exception:
+        pass
+    name = shm.name
+    shm.close()
+    return name
+
+
+def _analyze_file(path: str, sample_rate: int, max_duration: Optional[float]) -> Dict[str, Any]:
+    """Worker entry point: decode once and run every analysis step."""
+    decoded = analysis.decode_audio(path, sample_rate)
+    result: Dict[str, Any] = {
+        "sample_rate": decoded.sample_rate,
+        "channels": decoded.channels,
+        "duration": decoded.duration,
+        "length": len(decoded.samples),
+        "bpm": None,
+        "key": None,
+        "loudness": None,
+        "signature": None,
+        "errors": {},
+    }
+
+    if max_duration is None or decoded.duration <= max_duration:
+        y, sr = decoded.feature_samples()
+        for name, func, args in (
+            ("bpm", analysis.estimate_bpm, (y, sr)),
+            ("key", analysis.estimate_key, (y, sr)),
+            ("loudness", analysis.measure_loudness, (decoded.samples, decoded.sample_rate)),
+            ("signature", analysis.spectral_signature, (y, sr)),
+        ):
+            try:
+                result[name] = func(*args)
+            except Exception as e:
+                result["errors"][name] = f"{type(e).__name__}: {e}"
+
+    result["shm_name"] = _export_buffer(decoded.samples)
+    return result
+
+
+# ----------------------------------------------------------------------
+# Parent side
+# ----------------------------------------------------------------------
+
+def _import_buffer(name: str, length: int) -> np.ndarray:
+    """Copy a worker's buffer out of shared memory and release the block."""
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        samples = np.ndarray((length,), dtype=np.float32, buffer=shm.buf).copy()
+    finally:
+        shm.close()
+        shm.unlink()
+    return samples
+
+
+class AnalysisWorkerPool:
+    """
+    Warm process pool running the single-decode analysis stage.
+
+    Thread-safe: any number of I/O threads may call analyze() concurrently.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        sample_rate: int = ANALYSIS_SAMPLE_RATE,
+        start_method: Optional[str] = None,
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            max_workers: Worker processes (default: CPU count)
+            sample_rate: Rate buffers are decoded at
+            start_method: multiprocessing start method (default: platform default)
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.sample_rate = sample_rate
+        start_method = start_method or os.getenv("SC_ANALYSIS_START_METHOD") or None
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context(start_method),
+            initializer=_init_worker,
+        )
+
+    def warm(self) -> int:
+        """
+        Start every worker now rather than on first use.
+
+        Call before starting I/O threads so workers are forked from a
+        quiet parent.
+
+        Returns:
+            Number of distinct worker processes that answered
+        """
+        futures = [self._executor.submit(_worker_pid) for _ in range(self.max_workers)]
+        pids = {future.result() for future in futures}
+        logger.debug(f"Analysis pool warm: {len(pids)} workers")
+        return len(pids)
+
+    def submit(self, path: Union[str, Path], max_duration: Optional[float] = None) -> "Future[Dict[str, Any]]":
+        """Queue a file; pass the future to collect() for the result."""
+        return self._executor.submit(_analyze_file, str(path), self.sample_rate, max_duration)
+
+    @staticmethod
+    def collect(future: "Future[Dict[str, Any]]") -> PooledAnalysis:
+        """Wait for a submitted analysis and take ownership of its buffer."""
+        raw = future.result()
+        samples = _import_buffer(raw["shm_name"], raw["length"])
+        return PooledAnalysis(
+            samples=samples,
+            sample_rate=raw["sample_rate"],
+            channels=raw["channels"],
+            duration=raw["duration"],
+            bpm=raw["bpm"],
+            key=raw["key"],
+            loudness=raw["loudness"],
+            signature=raw["signature"],
+            errors=raw["errors"],
+        )
+
+    def analyze(self, path: Union[str, Path], max_duration: Optional[float] = None) -> PooledAnalysis:
+        """
+        Analyze a file in a worker process.
+
+        Args:
+            path: Audio file path
+            max_duration: Skip feature extraction above this duration (seconds)
+
+        Returns:
+            PooledAnalysis
+        """
+        return self.collect(self.submit(path, max_duration))
+
+    def close(self, wait: bool = True) -> None:
+        """Shut down the worker processes."""
+        self._executor.shutdown(wait=wait)
+
+    def __enter__(self) -> "AnalysisWorkerPool":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,208 @@
+"""
+Background Writer
+=================
+
+Moves best-effort side effects (CSV audit rows, notifications, dashboard
+posts) off latency-sensitive paths such as an async request handler.
+
+Features:
+- ``submit()`` / ``append_csv()`` only enqueue and return immediately
+- One daemon thread drains the queue in batches; CSV rows of a batch are
+  grouped per file, so each file is opened once per batch instead of once
+  per row
+- Bounded queue: when full, new work is dropped and counted rather than
+  blocking the caller
+- Failures are logged and never propagate to the caller
+
+Usage:
+    from shared_core.background_writer import get_background_writer
+
+    writer = get_background_writer()
+    writer.append_csv("/path/events.csv", ["timestamp", "event"], row)
+    writer.submit(send_notification, title, message)
+    writer.flush()  # e.g. at shutdown
+
+Created: 2026-10-16
+"""
+
+from __future__ import annotations
+
+import csv
+import logging
+import os
+import queue
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+_CSV = "csv"
+_CALL = "call"
+_FLUSH = "flush"
+
+
+class BackgroundWriter:
+    """
+    Single-thread batched executor for fire-and-forget side effects.
+    """
+
+    def __init__(self, max_queue: Optional[int] = None, max_batch: int = 256, name: str = "background-writer"):
+        """
+        Initialize the writer.
+
+        Args:
+            max_queue: Pending items before new work is dropped
+                (default: $BACKGROUND_WRITER_MAX_QUEUE or 10000)
+            max_batch: Items drained per batch
+            name: Thread name
+        """
+        self.max_queue = max_queue or int(os.getenv("BACKGROUND_WRITER_MAX_QUEUE", "10000"))
+        self.max_batch = max(1, max_batch)
+        self.name = name
+        self._queue: "queue.Queue[Tuple[str, Any]]" = queue.Queue(maxsize=self.max_queue)
+        self._thread: Optional[threading.Thread] = None
+        self._thread_lock = threading.Lock()
+        self.stats = {"submitted": 0, "dropped": 0, "batches": 0, "csv_rows": 0, "calls": 0, "errors": 0}
+
+    # ------------------------------------------------------------------
+    # Submission
+    # ------------------------------------------------------------------
+
+    def _ensure_thread(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._thread_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+                self._thread.start()
+
+    def _put(self, kind: str, item: Any) -> bool:
+        self._ensure_thread()
+        try:
+            self._queue.put_nowait((kind, item))
+        except queue.Full:
+            self.stats["dropped"] += 1
+            logger.warning(f"{self.name} queue full; dropped {kind} item")
+            return False
+        self.stats["submitted"] += 1
+        return True
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> bool:
+        """
+        Run ``fn(*args, **kwargs)`` on the writer thread.
+
+        Returns:
+            False if the queue was full and the call was dropped
+        """
+        return self._put(_CALL, (fn, args, kwargs))
+
+    def append_csv(self, path: str, fieldnames: Sequence[str], row: Dict[str, Any]) -> bool:
+        """
+        Append a row to a CSV file, writing the header if the file is new.
+
+        Returns:
+            False if the queue was full and the row was dropped
+        """
+        return self._put(_CSV, (path, tuple(fieldnames), row))
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """
+        Wait until everything submitted so far has been written.
+
+        Returns:
+            True if the writer caught up within the timeout
+        """
+        done = threading.Event()
+        self._ensure_thread()
+        try:
+            self._queue.put((_FLUSH, done), timeout=timeout)
+        except queue.Full:
+            return False
+        return done.wait(timeout)
+
+    def pending(self) -> int:
+        """Items waiting to be written."""
+        return self._queue.qsize()
+
+    # ------------------------------------------------------------------
+    # Writer thread
+    # ------------------------------------------------------------------
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            self._process(batch)
+
+    def _process(self, batch: List[Tuple[str, Any]]) -> None:
+        self.stats["batches"] += 1
+        rows: "OrderedDict[Tuple[str, Tuple[str, ...]], List[Dict[str, Any]]]" = OrderedDict()
+        flushes: List[threading.Event] = []
+        for kind, item in batch:
+            if kind == _CSV:
+                path, fieldnames, row = item
+                rows.setdefault((path, fieldnames), []).append(row)
+            elif kind == _FLUSH:
+                flushes.append(item)
+            else:
+                fn, args, kwargs = item
+                try:
+                    fn(*args, **kwargs)
+                    self.stats["calls"] += 1
+                except Exception as e:
+                    self.stats["errors"] += 1
+                    logger.error(f"{self.name} task {getattr(fn, '__name__', fn)} failed: {e}")
+
+        for (path, fieldnames), file_rows in rows.items():
+            try:
+                self._write_csv(path, fieldnames, file_rows)
+                self.stats["csv_rows"] += len(file_rows)
+            except Exception as e:
+                self.stats["errors"] += 1
+                logger.error(f"{self.name} failed to write {len(file_rows)} row(s) to {path}: {e}")
+
+        for done in flushes:
+            done.set()
+
+    @staticmethod
+    def _write_csv(path: str, fieldnames: Tuple[str, ...], rows: List[Dict[str, Any]]) -> None:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        new_file = not os.path.exists(path) or os.path.getsize(path) == 0
+        with open(path, "a", newline="", encoding="utf-8") as csvfile:
+            writer = csv.DictWriter(csvfile, fieldnames=list(fieldnames))
+            if new_file:
+                writer.writeheader()
+            writer.writerows(rows)
+
+    # ------------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------------
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Queue depth and throughput counters."""
+        return {"pending": self.pending(), "max_queue": self.max_queue, **self.stats}
+
+
+_default_writer: Optional[BackgroundWriter] = None
+_default_writer_lock = threading.Lock()
+
+
+def get_background_writer() -> BackgroundWriter:
+    """
+    Get or create the shared background writer.
+
+    Returns:
+        BackgroundWriter instance
+    """
+    global _default_writer
+    with _default_writer_lock:
+        if _default_writer is None:
+            _default_writer = BackgroundWriter()
+        return _default_writer
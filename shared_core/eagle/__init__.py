@@ -0,0 +1,15 @@
+"""
+Eagle library utilities shared across workflows.
+"""
+
+from shared_core.eagle.item_index import (
+    EagleItemIndex,
+    extract_fingerprint_tags,
+    get_eagle_item_index,
+)
+
+__all__ = [
+    "EagleItemIndex",
+    "extract_fingerprint_tags",
+    "get_eagle_item_index",
+]
@@ -0,0 +1,505 @@
+"""
+Persistent Eagle Item Index
+===========================
+
+SQLite-backed index of Eagle library items with name, path, fingerprint
+and tag lookups. The index lives on disk and is shared between processes,
+so a cron invocation starts with a warm index instead of downloading the
+whole ``/api/item/list`` and rebuilding lookup dicts.
+
+Refresh strategies:
+- ``refresh_from_library()``: walks ``<library>/images/*.info/metadata.json``
+  and only re-parses files whose stat mtime changed. Items are rewritten
+  only when their ``lastModified``/``modificationTime`` stamp moved.
+- ``sync_items()``: applies an ``/api/item/list`` response as a delta
+  (for hosts where the library folder is not mounted).
+
+Usage:
+    from shared_core.eagle import get_eagle_item_index
+
+    index = get_eagle_item_index()
+    index.refresh_from_library("/Volumes/VIBES/Music Library.library")
+    items = index.get_by_fingerprint("abc123...")
+
+Created: 2026-10-16
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+FINGERPRINT_TAG_PREFIX = "fingerprint:"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    id TEXT PRIMARY KEY,
+    name_lower TEXT NOT NULL DEFAULT '',
+    path TEXT,
+    ext TEXT,
+    change_stamp INTEGER NOT NULL DEFAULT 0,
+    meta_mtime_ns INTEGER,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_items_name ON items(name_lower);
+CREATE INDEX IF NOT EXISTS idx_items_path ON items(path);
+
+CREATE TABLE IF NOT EXISTS item_tags (
+    item_id TEXT NOT NULL,
+    tag TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_item_tags_tag ON item_tags(tag);
+CREATE INDEX IF NOT EXISTS idx_item_tags_item ON item_tags(item_id);
+
+CREATE TABLE IF NOT EXISTS item_fingerprints (
+    item_id TEXT NOT NULL,
+    fingerprint TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_item_fp_fp ON item_fingerprints(fingerprint);
+CREATE INDEX IF NOT EXISTS idx_item_fp_item ON item_fingerprints(item_id);
+
+CREATE TABLE IF NOT EXISTS index_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+def extract_fingerprint_tags(tags: Iterable[Any]) -> List[str]:
+    """
+    Extract lowercase fingerprint values from ``fingerprint:<hash>`` tags.
+
+    Args:
+        tags: Eagle item tags (non-string entries are ignored)
+
+    Returns:
+        List of fingerprint values in tag order
+    """
+    fingerprints = []
+    for tag in tags or []:
+        if not isinstance(tag, str):
+            continue
+        tag_lower = tag.lower()
+        if tag_lower.startswith(FINGERPRINT_TAG_PREFIX):
+            value = tag_lower.split(":", 1)[1].strip()
+            if value:
+                fingerprints.append(value)
+    return fingerprints
+
+
+def _change_stamp(item: Dict[str, Any]) -> int:
+    """Return the newest Eagle modification timestamp recorded on an item."""
+    stamp = 0
+    for key in ("lastModified", "modificationTime", "mtime"):
+        value = item.get(key)
+        if isinstance(value, (int, float)) and value > stamp:
+            stamp = int(value)
+    return stamp
+
+
+class EagleItemIndex:
+    """
+    Persistent, incrementally refreshed index of Eagle items.
+
+    Features:
+    - Name (case-insensitive), path, fingerprint tag and tag lookups
+    - Incremental refresh from metadata.json stat/modification deltas
+    - Delta application of API item lists
+    - WAL-mode SQLite so several processes can share one index
+    - Thread-safe operations
+
+    Usage:
+        index = EagleItemIndex()
+        stats = index.refresh_from_library(library_path)
+        item = index.get_by_path("/path/to/file.m4a")
+    """
+
+    DEFAULT_PATH = "~/.local/share/eagle-index/items.sqlite3"
+
+    def __init__(self, path: Optional[Union[str, Path]] = None):
+        """
+        Initialize the index.
+
+        Args:
+            path: SQLite file path. Defaults to $EAGLE_INDEX_PATH or
+                ~/.local/share/eagle-index/items.sqlite3
+        """
+        self.path = Path(path or os.getenv("EAGLE_INDEX_PATH") or self.DEFAULT_PATH).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+        # Decoded copy of all items, reused until the generation changes
+        self._items_cache: Optional[List[Dict[str, Any]]] = None
+        self._items_cache_generation = -1
+
+    # ------------------------------------------------------------------
+    # Metadata
+    # ------------------------------------------------------------------
+
+    def _get_meta(self, key: str) -> Optional[str]:
+        row = self._conn.execute("SELECT value FROM index_meta WHERE key = ?", (key,)).fetchone()
+        return row["value"] if row else None
+
+    def _set_meta(self, key: str, value: str) -> None:
+        self._conn.execute(
+            "INSERT INTO index_meta(key, value) VALUES (?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (key, value),
+        )
+
+    @property
+    def generation(self) -> int:
+        """Counter bumped on every change; shared across processes."""
+        with self._lock:
+            value = self._get_meta("generation")
+            return int(value) if value else 0
+
+    def _bump_generation(self) -> None:
+        self._set_meta("generation", str(self.generation + 1))
+
+    @property
+    def library_path(self) -> Optional[str]:
+        """Library the index was last refreshed from, if any."""
+        with self._lock:
+            return self._get_meta("library_path")
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def _write_items(self, rows: List[tuple], removed_ids: Iterable[str]) -> None:
+        """Replace index rows for the given items and drop removed ones."""
+        cur = self._conn.cursor()
+        stale_ids = [(row[0],) for row in rows] + [(item_id,) for item_id in removed_ids]
+        cur.executemany("DELETE FROM item_tags WHERE item_id = ?", stale_ids)
+        cur.executemany("DELETE FROM item_fingerprints WHERE item_id = ?", stale_ids)
+        cur.executemany("DELETE FROM items WHERE id = ?", stale_ids[len(rows):])
+
+        tag_rows = []
+        fp_rows = []
+        for item_id, _name, _path, _ext, _stamp, _mtime_ns, data in rows:
+            tags = json.loads(data).get("tags") or []
+            tag_rows.extend(
+                (item_id, tag.lower()) for tag in set(t for t in tags if isinstance(t, str))
+            )
+            fp_rows.extend((item_id, fp) for fp in set(extract_fingerprint_tags(tags)))
+
+        cur.executemany(
+            "INSERT INTO items(id, name_lower, path, ext, change_stamp, meta_mtime_ns, data) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(id) DO UPDATE SET name_lower = excluded.name_lower, "
+            "path = excluded.path, ext = excluded.ext, change_stamp = excluded.change_stamp, "
+            "meta_mtime_ns = excluded.meta_mtime_ns, data = excluded.data",
+            rows,
+        )
+        cur.executemany("INSERT INTO item_tags(item_id, tag) VALUES (?, ?)", tag_rows)
+        cur.executemany("INSERT INTO item_fingerprints(item_id, fingerprint) VALUES (?, ?)", fp_rows)
+
+    @staticmethod
+    def _make_row(item: Dict[str, Any], meta_mtime_ns: Optional[int] = None) -> tuple:
+        return (
+            item["id"],
+            (item.get("name") or "").lower(),
+            item.get("path") or None,
+            item.get("ext") or None,
+            _change_stamp(item),
+            meta_mtime_ns,
+            json.dumps(item, separators=(",", ":")),
+        )
+
+    def refresh_from_library(self, library_path: Union[str, Path]) -> Dict[str, int]:
+        """
+        Incrementally refresh from an Eagle library folder on disk.
+
+        Only metadata.json files whose stat mtime changed since the last
+        refresh are parsed; only items whose modification stamp moved are
+        rewritten. Items whose folders disappeared or that were moved to
+        the Eagle trash are removed.
+
+        Args:
+            library_path: Path to the .library folder
+
+        Returns:
+            Dict with scanned/updated/removed/unchanged counts
+
+        Raises:
+            FileNotFoundError: If the library has no images folder
+        """
+        library_path = Path(library_path).expanduser()
+        images_path = library_path / "images"
+        if not images_path.is_dir():
+            raise FileNotFoundError(f"No images folder in Eagle library: {library_path}")
+
+        with self._lock:
+            known = {
+                row["id"]: (row["meta_mtime_ns"], row["change_stamp"], row["path"])
+                for row in self._conn.execute("SELECT id, meta_mtime_ns, change_stamp, path FROM items")
+            }
+            if self._get_meta("library_path") not in (None, str(library_path)):
+                # Different library: nothing from the old one can be trusted
+                known = {item_id: (None, None, None) for item_id in known}
+
+            seen = set()
+            rows = []
+            touched = []
+            stats = {"scanned": 0, "updated": 0, "removed": 0, "unchanged": 0}
+
+            with os.scandir(images_path) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(".info") or not entry.is_dir():
+                        continue
+                    metadata_file = os.path.join(entry.path, "metadata.json")
+                    try:
+                        mtime_ns = os.stat(metadata_file).st_mtime_ns
+                    except OSError:
+                        continue
+
+                    stats["scanned"] += 1
+                    item_id = entry.name[:-len(".info")]
+                    previous = known.get(item_id)
+                    if previous is not None and previous[0] == mtime_ns:
+                        seen.add(item_id)
+                        stats["unchanged"] += 1
+                        continue
+
+                    try:
+                        with open(metadata_file, "r", encoding="utf-8") as f:
+                            item = json.load(f)
+                    except (OSError, json.JSONDecodeError) as e:
+                        logger.warning(f"Failed to read {metadata_file}: {e}")
+                        if previous is not None:
+                            seen.add(item_id)
+                        continue
+
+                    if item.get("isDeleted"):
+                        continue
+
+                    item_id = item.get("id") or item_id
+                    item["id"] = item_id
+                    seen.add(item_id)
+                    # Rows written by sync_items() have no path or metadata
+                    # mtime yet, so they are rewritten even when unchanged
+                    if (
+                        previous is not None
+                        and previous[0] is not None
+                        and previous[2] is not None
+                        and previous[1]
+                        and previous[1] == _change_stamp(item)
+                    ):
+                        touched.append((mtime_ns, item_id))
+                        stats["unchanged"] += 1
+                        continue
+
+                    name = item.get("name", "")
+                    ext = item.get("ext", "")
+                    item["path"] = os.path.join(entry.path, f"{name}.{ext}" if ext else name)
+                    rows.append(self._make_row(item, mtime_ns))
+
+            removed_ids = [item_id for item_id in known if item_id not in seen]
+            stats["updated"] = len(rows)
+            stats["removed"] = len(removed_ids)
+
+            with self._conn:
+                self._write_items(rows, removed_ids)
+                self._conn.executemany("UPDATE items SET meta_mtime_ns = ? WHERE id = ?", touched)
+                self._set_meta("library_path", str(library_path))
+                if rows or removed_ids:
+                    self._bump_generation()
+
+        logger.info(
+            f"Eagle index refreshed from {library_path.name}: {stats['updated']} updated, "
+            f"{stats['removed']} removed, {stats['unchanged']} unchanged"
+        )
+        return stats
+
+    def sync_items(self, items: List[Dict[str, Any]], complete: bool = True) -> Dict[str, int]:
+        """
+        Apply an Eagle API item list to the index as a delta.
+
+        Items whose modification stamp is unchanged are skipped; items
+        without any stamp are compared by content.
+
+        Args:
+            items: Item dicts as returned by /api/item/list
+            complete: Whether ``items`` is the whole library, in which case
+                indexed items missing from it are removed
+
+        Returns:
+            Dict with scanned/updated/removed/unchanged counts
+        """
+        with self._lock:
+            known = {
+                row["id"]: (row["change_stamp"], row["data"])
+                for row in self._conn.execute("SELECT id, change_stamp, data FROM items")
+            }
+            seen = set()
+            rows = []
+            stats = {"scanned": 0, "updated": 0, "removed": 0, "unchanged": 0}
+
+            for item in items:
+                item_id = item.get("id")
+                if not item_id:
+                    continue
+                stats["scanned"] += 1
+                seen.add(item_id)
+                row = self._make_row(item)
+                previous = known.get(item_id)
+                if previous is not None:
+                    stamp = row[4]
+                    if (stamp and previous[0] == stamp) or (not stamp and previous[1] == row[6]):
+                        stats["unchanged"] += 1
+                        continue
+                rows.append(row)
+
+            removed_ids = [item_id for item_id in known if item_id not in seen] if complete else []
+            stats["updated"] = len(rows)
+            stats["removed"] = len(removed_ids)
+
+            if rows or removed_ids:
+                with self._conn:
+                    self._write_items(rows, removed_ids)
+                    self._bump_generation()
+
+        logger.debug(
+            f"Eagle index synced: {stats['updated']} updated, {stats['removed']} removed, "
+            f"{stats['unchanged']} unchanged"
+        )
+        return stats
+
+    def upsert_item(self, item: Dict[str, Any]) -> None:
+        """Add or replace a single item (e.g. right after an import)."""
+        self.sync_items([item], complete=False)
+
+    def remove_items(self, item_ids: Iterable[str]) -> int:
+        """Remove items from the index. Returns the number of IDs processed."""
+        item_ids = list(item_ids)
+        if not item_ids:
+            return 0
+        with self._lock, self._conn:
+            self._write_items([], item_ids)
+            self._bump_generation()
+        return len(item_ids)
+
+    def clear(self) -> None:
+        """Remove every item from the index."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM items")
+            self._conn.execute("DELETE FROM item_tags")
+            self._conn.execute("DELETE FROM item_fingerprints")
+            self._conn.execute("DELETE FROM index_meta WHERE key = 'library_path'")
+            self._bump_generation()
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def _query_items(self, sql: str, params: tuple = ()) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [json.loads(row["data"]) for row in self._conn.execute(sql, params)]
+
+    def count(self) -> int:
+        """Return the number of indexed items."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+
+    def all_items(self) -> List[Dict[str, Any]]:
+        """
+        Return all indexed items.
+
+        The decoded list is cached and reused until the index generation
+        changes, so repeated calls are cheap. Treat it as read-only.
+        """
+        with self._lock:
+            generation = self.generation
+            if self._items_cache is None or self._items_cache_generation != generation:
+                self._items_cache = self._query_items("SELECT data FROM items")
+                self._items_cache_generation = generation
+            return self._items_cache
+
+    def get_by_id(self, item_id: str) -> Optional[Dict[str, Any]]:
+        """Lookup by Eagle item ID."""
+        items = self._query_items("SELECT data FROM items WHERE id = ?", (item_id,))
+        return items[0] if items else None
+
+    def get_by_name(self, name: str) -> List[Dict[str, Any]]:
+        """Case-insensitive lookup by item name."""
+        if not name:
+            return []
+        return self._query_items("SELECT data FROM items WHERE name_lower = ?", (name.lower(),))
+
+    def get_by_path(self, path: str) -> Optional[Dict[str, Any]]:
+        """Lookup by file path."""
+        if not path:
+            return None
+        items = self._query_items("SELECT data FROM items WHERE path = ? LIMIT 1", (str(path),))
+        return items[0] if items else None
+
+    def get_by_fingerprint(self, fingerprint: str) -> List[Dict[str, Any]]:
+        """Lookup by ``fingerprint:<hash>`` tag value."""
+        if not fingerprint:
+            return []
+        return self._query_items(
+            "SELECT i.data FROM items i JOIN item_fingerprints f ON f.item_id = i.id "
+            "WHERE f.fingerprint = ?",
+            (fingerprint.lower().strip(),),
+        )
+
+    def get_by_tag(self, tag: str) -> List[Dict[str, Any]]:
+        """Case-insensitive lookup by exact tag."""
+        if not tag:
+            return []
+        return self._query_items(
+            "SELECT i.data FROM items i JOIN item_tags t ON t.item_id = i.id WHERE t.tag = ?",
+            (tag.lower(),),
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get index statistics."""
+        with self._lock:
+            return {
+                "path": str(self.path),
+                "items": self.count(),
+                "fingerprints": self._conn.execute(
+                    "SELECT COUNT(DISTINCT fingerprint) FROM item_fingerprints"
+                ).fetchone()[0],
+                "generation": self.generation,
+                "library_path": self._get_meta("library_path"),
+            }
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+# Module-level singleton
+_default_index: Optional[EagleItemIndex] = None
+_default_index_lock = threading.Lock()
+
+
+def get_eagle_item_index(path: Optional[Union[str, Path]] = None) -> EagleItemIndex:
+    """
+    Get or create the shared Eagle item index.
+
+    Args:
+        path: Optional path override
+
+    Returns:
+        EagleItemIndex instance
+    """
+    global _default_index
+    with _default_index_lock:
+        if _default_index is None or path is not None:
+            _default_index = EagleItemIndex(path)
+        return _default_index
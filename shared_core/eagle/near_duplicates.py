@@ -0,0 +1,372 @@
+"""
+Near-Duplicate Name Clustering
+==============================
+
+Clusters item names whose similarity ratio meets a threshold without
+comparing every pair. Used by the Eagle library deduplication scan, where
+an all-pairs ``difflib.SequenceMatcher`` pass is O(n^2).
+
+Pipeline:
+1. Identical names are collapsed to one representative.
+2. Candidate blocking: names are grouped by blocking keys (token
+   prefix/suffix by default). Blocks up to ``brute_force_limit`` names are
+   scored all-pairs with a vectorized scorer.
+3. Blocks above that size (and, optionally, the whole library to catch
+   pairs whose prefixes differ) go through character n-gram MinHash/LSH;
+   only names sharing an LSH band are scored.
+4. Matches are merged with union-find; the output is the list of
+   connected components with more than one member.
+
+Matches are decided by ``difflib.SequenceMatcher.ratio`` like the legacy
+scan. ``rapidfuzz.fuzz.ratio`` (normalized Indel/LCS similarity) is never
+lower than that ratio, so when installed it only selects candidates in C;
+each one is then confirmed with ``SequenceMatcher``. Without rapidfuzz,
+``SequenceMatcher``'s cheap upper bounds guard the full ratio.
+
+Usage:
+    from shared_core.eagle.near_duplicates import NearDuplicateClusterer
+
+    clusterer = NearDuplicateClusterer(min_similarity=0.75)
+    groups = clusterer.cluster(["artist - track", "artist - track (1)", "other"])
+    # -> [[0, 1]]
+
+Created: 2026-10-16
+"""
+
+import difflib
+import logging
+import zlib
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    from rapidfuzz import fuzz, process
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Smallest prime above 2**32, modulus of the universal hash family
+_MINHASH_PRIME = np.uint64(4294967311)
+
+
+def token_prefix_key(normalized: str, token_count: int = 3) -> str:
+    """Blocking key made of the first ``token_count`` tokens."""
+    tokens = normalized.split()
+    if not tokens:
+        return ""
+    return " ".join(tokens[:token_count])
+
+
+def token_suffix_key(normalized: str, token_count: int = 3) -> str:
+    """Blocking key made of the last ``token_count`` tokens."""
+    tokens = normalized.split()
+    if not tokens:
+        return ""
+    return " ".join(tokens[-token_count:])
+
+
+class _UnionFind:
+    """Array-backed union-find with path halving."""
+
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+
+    def find(self, idx: int) -> int:
+        parent = self.parent
+        while parent[idx] != idx:
+            parent[idx] = parent[parent[idx]]
+            idx = parent[idx]
+        return idx
+
+    def union(self, a: int, b: int) -> None:
+        ra = self.find(a)
+        rb = self.find(b)
+        if ra != rb:
+            if ra < rb:
+                self.parent[rb] = ra
+            else:
+                self.parent[ra] = rb
+
+
+class NearDuplicateClusterer:
+    """
+    Blocked, vectorized near-duplicate clustering engine.
+
+    Features:
+    - Token prefix/suffix candidate blocking
+    - Character n-gram MinHash with LSH banding for large blocks
+    - Vectorized all-pairs scoring for small blocks
+    - Length filter identical to the legacy pairwise scan
+    - Union-find output (components with 2+ members)
+    """
+
+    def __init__(
+        self,
+        min_similarity: float = 0.75,
+        block_keys: Optional[Sequence[Callable[[str], str]]] = None,
+        lsh_across_blocks: bool = True,
+        brute_force_limit: int = 2000,
+        ngram_size: int = 3,
+        num_bands: int = 32,
+        rows_per_band: int = 3,
+        max_lsh_bucket: int = 5000,
+        seed: int = 1,
+    ):
+        """
+        Initialize the clusterer.
+
+        Args:
+            min_similarity: Minimum similarity ratio (0-1) for a match
+            block_keys: Blocking key functions. None treats the whole input
+                as one block (use when the caller already bucketed names).
+            lsh_across_blocks: With block_keys, also run LSH over all names
+                to catch near-duplicates that land in different blocks
+            brute_force_limit: Largest block scored all-pairs
+            ngram_size: Character n-gram size for MinHash shingles
+            num_bands: LSH bands
+            rows_per_band: MinHash rows per band
+            max_lsh_bucket: LSH buckets larger than this are skipped
+            seed: Seed for the MinHash permutations
+        """
+        self.min_similarity = min_similarity
+        self.block_keys = list(block_keys) if block_keys is not None else None
+        self.lsh_across_blocks = lsh_across_blocks
+        self.brute_force_limit = brute_force_limit
+        self.ngram_size = ngram_size
+        self.num_bands = num_bands
+        self.rows_per_band = rows_per_band
+        self.max_lsh_bucket = max_lsh_bucket
+
+        rng = np.random.RandomState(seed)
+        num_perm = num_bands * rows_per_band
+        self._perm_a = rng.randint(1, 2**32 - 1, size=num_perm, dtype=np.uint64)
+        self._perm_b = rng.randint(0, 2**32 - 1, size=num_perm, dtype=np.uint64)
+        self._cutoff = min_similarity * 100
+
+        self.stats: Dict[str, int] = {}
+
+    # ------------------------------------------------------------------
+    # Scoring
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _length_compatible(a: str, b: str) -> bool:
+        """Legacy pre-filter: skip pairs whose lengths differ by more than half."""
+        return abs(len(a) - len(b)) <= max(len(a), len(b)) * 0.5
+
+    def score(self, a: str, b: str) -> float:
+        """SequenceMatcher similarity ratio in 0-1 (0 if below the threshold)."""
+        if RAPIDFUZZ_AVAILABLE and not fuzz.ratio(a, b, score_cutoff=self._cutoff):
+            return 0.0
+        return self._confirm(a, b)
+
+    def _confirm(self, a: str, b: str) -> float:
+        """SequenceMatcher ratio of a pair, 0 if below the threshold."""
+        matcher = difflib.SequenceMatcher(None, a, b)
+        if matcher.real_quick_ratio() < self.min_similarity or matcher.quick_ratio() < self.min_similarity:
+            return 0.0
+        ratio = matcher.ratio()
+        return ratio if ratio >= self.min_similarity else 0.0
+
+    def _score_all_pairs(self, names: List[str], members: List[int], uf: _UnionFind) -> None:
+        """Score every pair inside a block and union the matches."""
+        if len(members) < 2:
+            return
+        block = [names[i] for i in members]
+        self.stats["scored_pairs"] += len(members) * (len(members) - 1) // 2
+
+        if RAPIDFUZZ_AVAILABLE:
+            matrix = process.cdist(
+                block, block, scorer=fuzz.ratio, score_cutoff=self._cutoff,
+                dtype=np.uint8, workers=-1,
+            )
+            # fuzz.ratio is only an upper bound: confirm each candidate pair
+            rows, cols = np.nonzero(np.triu(matrix, 1))
+            for r, c in zip(rows.tolist(), cols.tolist()):
+                i, j = members[r], members[c]
+                if uf.find(i) == uf.find(j):
+                    continue
+                if self._length_compatible(block[r], block[c]) and self._confirm(block[r], block[c]):
+                    uf.union(i, j)
+            return
+
+        for pos, i in enumerate(members):
+            for j in members[pos + 1:]:
+                if uf.find(i) == uf.find(j):
+                    continue
+                if self._length_compatible(names[i], names[j]) and self.score(names[i], names[j]):
+                    uf.union(i, j)
+
+    def _score_pairs(self, names: List[str], pairs: Iterable[Tuple[int, int]], uf: _UnionFind) -> None:
+        """Score candidate pairs, skipping pairs already in one component."""
+        for i, j in pairs:
+            if uf.find(i) == uf.find(j):
+                continue
+            self.stats["scored_pairs"] += 1
+            if self._length_compatible(names[i], names[j]) and self.score(names[i], names[j]):
+                uf.union(i, j)
+
+    # ------------------------------------------------------------------
+    # MinHash / LSH
+    # ------------------------------------------------------------------
+
+    def _shingle_hashes(self, name: str) -> List[int]:
+        padded = f" {name} "
+        n = self.ngram_size
+        if len(padded) <= n:
+            grams = {padded}
+        else:
+            grams = {padded[k:k + n] for k in range(len(padded) - n + 1)}
+        return [zlib.crc32(g.encode("utf-8")) for g in grams]
+
+    def minhash_signatures(self, names: Sequence[str], chunk_size: int = 1000) -> np.ndarray:
+        """
+        Compute MinHash signatures.
+
+        Returns:
+            uint64 array of shape (len(names), num_bands * rows_per_band)
+        """
+        num_perm = len(self._perm_a)
+        signatures = np.empty((len(names), num_perm), dtype=np.uint64)
+        a = self._perm_a[:, None]
+        b = self._perm_b[:, None]
+
+        for start in range(0, len(names), chunk_size):
+            chunk = names[start:start + chunk_size]
+            hashes = [self._shingle_hashes(name) for name in chunk]
+            offsets = np.zeros(len(chunk), dtype=np.int64)
+            np.cumsum([len(h) for h in hashes[:-1]], out=offsets[1:])
+            flat = np.fromiter((h for hs in hashes for h in hs), dtype=np.uint64)
+            permuted = (a * flat[None, :] + b) % _MINHASH_PRIME
+            signatures[start:start + len(chunk)] = np.minimum.reduceat(permuted, offsets, axis=1).T
+
+        return signatures
+
+    def _lsh(self, names: List[str], members: List[int], uf: _UnionFind) -> None:
+        """Score names that share at least one LSH band."""
+        if len(members) < 2:
+            return
+        signatures = self.minhash_signatures([names[i] for i in members])
+        member_arr = np.asarray(members, dtype=np.int64)
+        small_bucket = 32
+        pairs = set()
+
+        for band in range(self.num_bands):
+            # Fold the band's rows into one key; rare collisions only add candidates
+            start = band * self.rows_per_band
+            band_keys = signatures[:, start].copy()
+            for row in range(start + 1, start + self.rows_per_band):
+                band_keys = band_keys * np.uint64(1000003) ^ signatures[:, row]
+            _, inverse, counts = np.unique(band_keys, return_inverse=True, return_counts=True)
+            inverse = inverse.reshape(-1)
+            shared = counts[inverse] > 1
+            if not shared.any():
+                continue
+            order = np.argsort(inverse[shared], kind="stable")
+            bucket_ids = inverse[shared][order]
+            bucket_members = member_arr[shared][order]
+            bounds = np.flatnonzero(np.diff(bucket_ids)) + 1
+            for bucket in np.split(bucket_members, bounds):
+                size = len(bucket)
+                if size > self.max_lsh_bucket:
+                    self.stats["skipped_buckets"] += 1
+                    continue
+                bucket = bucket.tolist()
+                if size > small_bucket:
+                    self._score_all_pairs(names, bucket, uf)
+                    continue
+                for pos, i in enumerate(bucket):
+                    for j in bucket[pos + 1:]:
+                        pairs.add((i, j) if i < j else (j, i))
+
+        self.stats["lsh_candidates"] += len(pairs)
+        self._score_pairs(names, sorted(pairs), uf)
+
+    # ------------------------------------------------------------------
+    # Clustering
+    # ------------------------------------------------------------------
+
+    def _process_block(self, names: List[str], members: List[int], uf: _UnionFind) -> None:
+        if len(members) <= self.brute_force_limit:
+            self._score_all_pairs(names, members, uf)
+        else:
+            self._lsh(names, members, uf)
+
+    def cluster(self, names: Sequence[str]) -> List[List[int]]:
+        """
+        Cluster names by similarity.
+
+        Args:
+            names: Normalized names; empty names never match
+
+        Returns:
+            Groups of indices into ``names`` (2+ members each), ordered by
+            their first member, members in ascending order
+        """
+        self.stats = {"names": len(names), "scored_pairs": 0, "lsh_candidates": 0, "skipped_buckets": 0}
+
+        # Collapse identical names: they always match each other
+        rep_of: Dict[str, int] = {}
+        reps: List[str] = []
+        rep_index = [-1] * len(names)
+        for idx, name in enumerate(names):
+            if not name:
+                continue
+            rep = rep_of.get(name)
+            if rep is None:
+                rep = rep_of[name] = len(reps)
+                reps.append(name)
+            rep_index[idx] = rep
+
+        uf = _UnionFind(len(reps))
+        if self.block_keys is None:
+            self._process_block(reps, list(range(len(reps))), uf)
+        else:
+            for key_fn in self.block_keys:
+                blocks: Dict[str, List[int]] = {}
+                for rep, name in enumerate(reps):
+                    blocks.setdefault(key_fn(name), []).append(rep)
+                for members in blocks.values():
+                    if len(members) <= self.brute_force_limit:
+                        self._score_all_pairs(reps, members, uf)
+                    elif not self.lsh_across_blocks:
+                        self._lsh(reps, members, uf)
+            # Library-wide LSH also covers blocks too large to score all-pairs
+            if self.lsh_across_blocks:
+                self._lsh(reps, list(range(len(reps))), uf)
+
+        clusters: Dict[int, List[int]] = {}
+        for idx, rep in enumerate(rep_index):
+            if rep < 0:
+                continue
+            clusters.setdefault(uf.find(rep), []).append(idx)
+
+        groups = [group for group in clusters.values() if len(group) > 1]
+        groups.sort(key=lambda group: group[0])
+        logger.debug(
+            f"Clustered {len(names)} names: {len(groups)} groups, "
+            f"{self.stats['scored_pairs']} pairs scored, {self.stats['lsh_candidates']} LSH candidates"
+        )
+        return groups
+
+
+def cluster_similar_names(
+    names: Sequence[str],
+    min_similarity: float = 0.75,
+    **kwargs,
+) -> List[List[int]]:
+    """
+    Convenience wrapper around NearDuplicateClusterer.cluster().
+
+    Args:
+        names: Normalized names
+        min_similarity: Minimum similarity ratio (0-1)
+        **kwargs: Extra NearDuplicateClusterer options
+
+    Returns:
+        Groups of indices (2+ members each)
+    """
+    return NearDuplicateClusterer(min_similarity=min_similarity, **kwargs).cluster(names)
@@ -13,10 +13,15 @@ Usage:
 
     # Embeddings
     vectors = embed(["text1", "text2"])
+    vectors = embed_many(thousands_of_texts)  # deduped, cached, batched
 
     # Transcription
     transcript = transcribe("/path/to/audio.mp3")
 
+Sync wrappers run on one shared background event loop, so concurrent
+calls from different threads reach the gateway together and can be
+micro-batched (see ``services.local_llm.batching``).
+
 For async usage:
     from shared_core.local_llm import get_gateway
 
@@ -25,11 +30,16 @@ For async usage:
 """
 
 import asyncio
+import threading
 from typing import List, Optional, Union
 
 # Lazy import to avoid circular dependencies
 _gateway_instance = None
 
+# Background event loop shared by all sync wrappers
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
 
 def get_gateway():
     """Get or create the singleton gateway instance."""
@@ -40,22 +50,21 @@ def get_gateway():
     return _gateway_instance
 
 
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Get or start the background event loop used by the sync wrappers."""
+    global _loop
+    with _loop_lock:
+        if _loop is None or _loop.is_closed():
+            _loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_loop.run_forever, name="local-llm-loop", daemon=True
+            ).start()
+        return _loop
+
+
 def _run_async(coro):
-    """Run an async coroutine synchronously."""
-    try:
-        loop = asyncio.get_event_loop()
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-
-    if loop.is_running():
-        # If we're already in an async context, can't use run_until_complete
-        import concurrent.futures
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            future = executor.submit(asyncio.run, coro)
-            return future.result()
-    else:
-        return loop.run_until_complete(coro)
+    """Run an async coroutine synchronously on the shared background loop."""
+    return asyncio.run_coroutine_threadsafe(coro, _get_loop()).result()
 
 
 def complete(
@@ -114,6 +123,28 @@ def embed(
     return response.embeddings
 
 
+def embed_many(
+    texts: List[str],
+    model: Optional[str] = None,
+    normalize: bool = True,
+) -> List[List[float]]:
+    """
+    Embed a large list of texts synchronously (deduplicated, cached, batched).
+
+    Args:
+        texts: Texts to embed
+        model: Model ID (uses default if not specified)
+        normalize: Whether to normalize embeddings
+
+    Returns:
+        One embedding vector per text, in order
+    """
+    gateway = get_gateway()
+    return _run_async(
+        gateway.embed_many(texts=texts, model=model, normalize=normalize)
+    )
+
+
 def rerank(
     query: str,
     documents: List[str],
@@ -224,6 +255,7 @@ __all__ = [
     "get_gateway",
     "complete",
     "embed",
+    "embed_many",
     "rerank",
     "transcribe",
     "ocr",
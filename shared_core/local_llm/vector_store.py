@@ -1,36 +1,132 @@
 """
-Simple JSON-based Vector Store for MVP
-======================================
-
-A minimal vector store implementation for agent task deduplication.
-Stores embeddings in a JSON file with cosine similarity search.
-
-This is an MVP implementation - can be upgraded to a proper vector DB
-(e.g., ChromaDB, Qdrant, Milvus) once the pattern is validated.
+Memory-Mapped Vector Store
+==========================
+
+A vector store for agent task deduplication.
+
+Storage layout (next to the configured path, e.g. ``tasks.json``):
+- ``tasks.npy``: pre-normalized float32 matrix, memory-mapped; rows are
+  appended in place and capacity grows geometrically
+- ``tasks.meta.jsonl``: append-only metadata sidecar (one ``add`` or
+  ``remove`` record per line); replayed on load to rebuild the id → row map
+
+Removed and replaced rows become tombstones; the store is compacted
+(matrix and sidecar rewritten with live rows only) once tombstones exceed
+``compact_ratio`` of the rows, or on ``compact()``. A compacted matrix is
+written under a new generation name (``tasks.<n>.npy``) that the new
+sidecar's ``dim`` record names; replacing the sidecar is the single commit
+point, so a crash mid-compaction leaves the old matrix/sidecar pair intact
+and never pairs a compacted matrix with stale metadata.
+
+Exact search is a single matrix-vector product over the mapped rows. As an
+opt-in for large stores (``ann_min_rows``), an IVF (inverted file, k-means
+clustered) index is built and only the ``nprobe`` nearest clusters plus rows
+appended since the last build are scored. IVF is approximate, so duplicate
+checks (``check_duplicate_task``) always search exactly.
+
+A legacy JSON store (``{task_id: {embedding, metadata, added_at}}``) at the
+configured path is imported on first load and left in place.
 
 Author: Claude Cowork Agent
 Created: 2026-01-19
 """
 
 import json
+import os
+import threading
 import numpy as np
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Sequence
 from datetime import datetime
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+class _IVFIndex:
+    """
+    Inverted-file approximate index over normalized rows.
+
+    Rows are clustered with spherical k-means; a query scores only the rows
+    in its ``nprobe`` most similar clusters.
+    """
+
+    def __init__(self, centroids: np.ndarray, lists: List[np.ndarray], indexed_rows: int):
+        self.centroids = centroids
+        self.lists = lists
+        self.indexed_rows = indexed_rows
+
+    @classmethod
+    def build(
+        cls,
+        matrix: np.ndarray,
+        rows: np.ndarray,
+        n_lists: int,
+        iterations: int = 8,
+        sample_size: int = 50000,
+        seed: int = 0,
+    ) -> "_IVFIndex":
+        """
+        Cluster ``matrix[rows]`` into ``n_lists`` lists.
+
+        Centroids are trained on at most ``sample_size`` rows; every row is
+        then assigned in chunks.
+        """
+        rng = np.random.default_rng(seed)
+        sample = rows if len(rows) <= sample_size else rng.choice(rows, sample_size, replace=False)
+        data = np.asarray(matrix[np.sort(sample)])
+        centroids = data[rng.choice(len(data), n_lists, replace=False)].copy()
+        for _ in range(iterations):
+            assign = _argmax_chunked(data, centroids)
+            for c in range(n_lists):
+                members = data[assign == c]
+                if len(members):
+                    centroid = members.sum(axis=0)
+                    norm = np.linalg.norm(centroid)
+                    if norm > 0:
+                        centroids[c] = centroid / norm
+
+        assign = _argmax_chunked(matrix, centroids, rows)
+        order = np.argsort(assign, kind="stable")
+        bounds = np.searchsorted(assign[order], np.arange(n_lists + 1))
+        sorted_rows = rows[order]
+        lists = [sorted_rows[bounds[c]:bounds[c + 1]] for c in range(n_lists)]
+        indexed_rows = int(rows.max()) + 1 if len(rows) else 0
+        return cls(centroids, lists, indexed_rows)
+
+    def candidates(self, query: np.ndarray, nprobe: int) -> np.ndarray:
+        """Row numbers in the ``nprobe`` clusters closest to ``query``."""
+        scores = self.centroids @ query
+        nprobe = min(nprobe, len(self.lists))
+        probe = np.argpartition(-scores, nprobe - 1)[:nprobe]
+        return np.concatenate([self.lists[c] for c in probe])
+
+
+def _argmax_chunked(
+    matrix: np.ndarray,
+    centroids: np.ndarray,
+    rows: Optional[np.ndarray] = None,
+    chunk: int = 16384,
+) -> np.ndarray:
+    """Nearest centroid for each row, computed in chunks to bound memory."""
+    total = len(matrix) if rows is None else len(rows)
+    out = np.empty(total, dtype=np.int64)
+    for start in range(0, total, chunk):
+        block = matrix[start:start + chunk] if rows is None else matrix[rows[start:start + chunk]]
+        out[start:start + chunk] = np.argmax(block @ centroids.T, axis=1)
+    return out
+
+
 class SimpleVectorStore:
     """
-    JSON-based vector store for task embeddings.
+    Memory-mapped vector store for task embeddings.
 
     Features:
-    - Cosine similarity search
-    - Persistent storage to JSON file
+    - Cosine similarity search as one matrix-vector product
+    - Optional IVF approximate index for large stores
+    - Append-only writes with periodic compaction
     - Metadata support for each vector
-    - Thread-safe file operations
+    - Thread-safe operations
 
     Usage:
         store = SimpleVectorStore()
@@ -39,40 +135,207 @@ class SimpleVectorStore:
     """
 
     DEFAULT_PATH = "~/.local/share/agent-vectors/tasks.json"
+    INITIAL_CAPACITY = 1024
 
-    def __init__(self, path: Optional[str] = None):
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        ann_min_rows: Optional[int] = None,
+        nprobe: int = 8,
+        compact_ratio: float = 0.25,
+    ):
         """
         Initialize the vector store.
 
         Args:
-            path: Path to the JSON file. Defaults to ~/.local/share/agent-vectors/tasks.json
+            path: Store path. Defaults to ~/.local/share/agent-vectors/tasks.json
+                (the matrix and sidecar are stored next to it as .npy/.meta.jsonl)
+            ann_min_rows: Live rows at which searches switch to the approximate
+                IVF index (env VECTOR_STORE_ANN_MIN_ROWS; default 0, disabled)
+            nprobe: IVF clusters scored per query
+            compact_ratio: Tombstone fraction that triggers compaction
         """
         self.path = Path(path or self.DEFAULT_PATH).expanduser()
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        self.vectors: Dict[str, Dict[str, Any]] = self._load()
-
-    def _load(self) -> Dict[str, Dict[str, Any]]:
-        """Load vectors from JSON file."""
-        if self.path.exists():
-            try:
-                with open(self.path, 'r') as f:
-                    data = json.load(f)
-                    logger.info(f"Loaded {len(data)} vectors from {self.path}")
-                    return data
-            except (json.JSONDecodeError, IOError) as e:
-                logger.warning(f"Failed to load vector store: {e}")
-                return {}
-        return {}
-
-    def _save(self) -> None:
-        """Save vectors to JSON file."""
+        base = self.path.with_suffix("") if self.path.suffix == ".json" else self.path
+        self._base = base
+        self._generation = 0
+        self.meta_path = base.with_name(base.name + ".meta.jsonl")
+        if ann_min_rows is None:
+            ann_min_rows = int(os.environ.get("VECTOR_STORE_ANN_MIN_ROWS", "0"))
+        self.ann_min_rows = ann_min_rows
+        self.nprobe = max(1, nprobe)
+        self.compact_ratio = compact_ratio
+
+        self._lock = threading.RLock()
+        self._matrix: Optional[np.ndarray] = None
+        self._dim: Optional[int] = None
+        self._rows = 0
+        self._ids: List[Optional[str]] = []
+        self._row_of: Dict[str, int] = {}
+        self._records: Dict[str, Dict[str, Any]] = {}
+        self._searchable = np.zeros(0, dtype=bool)
+        self._index: Optional[_IVFIndex] = None
+        self._meta_file = None
+        self._load()
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def _matrix_file(self, generation: int) -> Path:
+        suffix = f".{generation}.npy" if generation else ".npy"
+        return self._base.with_name(self._base.name + suffix)
+
+    @property
+    def matrix_path(self) -> Path:
+        """Matrix file of the current generation."""
+        return self._matrix_file(self._generation)
+
+    def _remove_stale_matrices(self) -> None:
+        """Delete matrices of other generations (left by an interrupted compaction)."""
+        for candidate in self._base.parent.glob(self._base.name + ".*npy"):
+            generation = candidate.name[len(self._base.name):-len(".npy")].lstrip(".")
+            if (generation == "" or generation.isdigit()) and candidate != self.matrix_path:
+                try:
+                    candidate.unlink()
+                except OSError as e:
+                    logger.debug(f"Could not remove stale matrix {candidate}: {e}")
+
+    def _load(self) -> None:
+        """Replay the sidecar and map the matrix (importing legacy JSON if needed)."""
+        if not self.meta_path.exists():
+            self._import_legacy_json()
+            return
         try:
-            with open(self.path, 'w') as f:
-                json.dump(self.vectors, f, indent=2)
-            logger.debug(f"Saved {len(self.vectors)} vectors to {self.path}")
-        except IOError as e:
-            logger.error(f"Failed to save vector store: {e}")
-            raise
+            with open(self.meta_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        self._replay(json.loads(line))
+                    except (ValueError, KeyError, TypeError, AttributeError):
+                        logger.warning(f"Skipping corrupt vector store record in {self.meta_path}")
+                        continue
+            self._remove_stale_matrices()
+            if self._rows and self.matrix_path.exists():
+                self._matrix = np.load(self.matrix_path, mmap_mode="r+")
+                if self._matrix.shape[0] < self._rows:
+                    logger.warning(
+                        f"Vector matrix has {self._matrix.shape[0]} rows, sidecar expects {self._rows}; truncating"
+                    )
+                    self._truncate(self._matrix.shape[0])
+                self._dim = self._matrix.shape[1]
+                norms = np.linalg.norm(self._matrix[:self._rows], axis=1)
+                self._searchable = np.array([i is not None for i in self._ids], dtype=bool) & (norms > 0)
+            elif self._rows:
+                logger.warning(f"Vector matrix {self.matrix_path} missing; starting empty")
+                self._reset_state()
+            logger.info(f"Loaded {len(self._row_of)} vectors from {self.meta_path}")
+        except (OSError, ValueError) as e:
+            # Unreadable or corrupt matrix: start empty rather than fail startup
+            logger.warning(f"Failed to load vector store: {e}")
+            self._reset_state()
+
+    def _replay(self, record: Dict[str, Any]) -> None:
+        op = record.get("op")
+        task_id = record.get("id")
+        if op == "add":
+            row = int(record["row"])
+            self._tombstone(task_id)
+            while len(self._ids) <= row:
+                self._ids.append(None)
+            self._ids[row] = task_id
+            self._row_of[task_id] = row
+            self._records[task_id] = {
+                "metadata": record.get("metadata") or {},
+                "added_at": record.get("added_at"),
+            }
+            self._rows = max(self._rows, row + 1)
+        elif op == "remove":
+            self._tombstone(task_id)
+        elif op == "dim":
+            self._dim = int(record["dim"])
+            # Written by compact(): the matrix generation this sidecar belongs to
+            if "generation" in record:
+                self._generation = int(record["generation"])
+
+    def _truncate(self, rows: int) -> None:
+        for task_id in self._ids[rows:]:
+            if task_id is not None:
+                self._row_of.pop(task_id, None)
+                self._records.pop(task_id, None)
+        del self._ids[rows:]
+        self._rows = rows
+
+    def _reset_state(self) -> None:
+        self._matrix = None
+        self._rows = 0
+        self._ids = []
+        self._row_of = {}
+        self._records = {}
+        self._searchable = np.zeros(0, dtype=bool)
+        self._index = None
+
+    def _import_legacy_json(self) -> None:
+        """Import a legacy ``{task_id: {embedding, metadata, added_at}}`` JSON store."""
+        if self.path.suffix != ".json" or not self.path.exists():
+            return
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            logger.warning(f"Failed to load legacy vector store: {e}")
+            return
+        items = [(task_id, entry) for task_id, entry in data.items() if entry.get("embedding")]
+        if not items:
+            return
+        self.add_many(
+            [task_id for task_id, _ in items],
+            [entry["embedding"] for _, entry in items],
+            [entry.get("metadata") or {} for _, entry in items],
+            added_at=[entry.get("added_at") for _, entry in items],
+        )
+        logger.info(f"Imported {len(items)} vectors from legacy store {self.path}")
+
+    def _append_records(self, records: Sequence[Dict[str, Any]]) -> None:
+        if self._meta_file is None:
+            self._meta_file = open(self.meta_path, "a", encoding="utf-8")
+        self._meta_file.write("".join(json.dumps(r, default=str) + "\n" for r in records))
+        self._meta_file.flush()
+
+    def _ensure_capacity(self, rows: int) -> None:
+        """Grow the mapped matrix (doubling) so it can hold ``rows`` rows."""
+        capacity = 0 if self._matrix is None else self._matrix.shape[0]
+        if rows <= capacity:
+            return
+        new_capacity = max(self.INITIAL_CAPACITY, capacity)
+        while new_capacity < rows:
+            new_capacity *= 2
+        tmp = self.matrix_path.with_name(self.matrix_path.name + ".tmp")
+        grown = np.lib.format.open_memmap(tmp, mode="w+", dtype=np.float32, shape=(new_capacity, self._dim))
+        if self._rows:
+            grown[:self._rows] = self._matrix[:self._rows]
+        grown.flush()
+        del grown
+        self._matrix = None
+        os.replace(tmp, self.matrix_path)
+        self._matrix = np.load(self.matrix_path, mmap_mode="r+")
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def _tombstone(self, task_id: str) -> bool:
+        row = self._row_of.pop(task_id, None)
+        if row is None:
+            return False
+        self._ids[row] = None
+        self._records.pop(task_id, None)
+        if row < len(self._searchable):
+            self._searchable[row] = False
+        return True
 
     def add(
         self,
@@ -81,21 +344,69 @@ class SimpleVectorStore:
         metadata: Optional[Dict[str, Any]] = None
     ) -> None:
         """
-        Add a vector to the store.
+        Add a vector to the store (replacing any existing vector for the ID).
 
         Args:
             task_id: Unique identifier for the task
             embedding: Vector embedding as a list of floats
             metadata: Optional metadata dict (title, description, etc.)
         """
-        self.vectors[task_id] = {
-            'embedding': embedding,
-            'metadata': metadata or {},
-            'added_at': datetime.utcnow().isoformat()
-        }
-        self._save()
+        self.add_many([task_id], [embedding], [metadata or {}])
         logger.info(f"Added vector for task {task_id}")
 
+    def add_many(
+        self,
+        task_ids: Sequence[str],
+        embeddings: Sequence[Sequence[float]],
+        metadatas: Optional[Sequence[Optional[Dict[str, Any]]]] = None,
+        added_at: Optional[Sequence[Optional[str]]] = None,
+    ) -> None:
+        """
+        Append several vectors with one matrix write and one sidecar write.
+
+        Args:
+            task_ids: Unique identifiers
+            embeddings: One embedding per ID (all the same dimension)
+            metadatas: Optional metadata per ID
+            added_at: Optional original timestamps (used when importing)
+        """
+        if not task_ids:
+            return
+        vectors = np.asarray(embeddings, dtype=np.float32)
+        if vectors.ndim != 2 or len(vectors) != len(task_ids):
+            raise ValueError("embeddings must be one equal-length vector per task_id")
+        norms = np.linalg.norm(vectors, axis=1)
+        vectors = vectors / np.where(norms > 0, norms, 1.0)[:, None]
+        now = datetime.utcnow().isoformat()
+
+        with self._lock:
+            records = []
+            if self._dim is None:
+                self._dim = vectors.shape[1]
+                records.append({"op": "dim", "dim": self._dim})
+            elif vectors.shape[1] != self._dim:
+                raise ValueError(f"Embedding dimension {vectors.shape[1]} does not match store dimension {self._dim}")
+
+            start = self._rows
+            self._ensure_capacity(start + len(task_ids))
+            self._matrix[start:start + len(task_ids)] = vectors
+            self._searchable = np.concatenate([self._searchable, norms > 0])
+
+            for offset, task_id in enumerate(task_ids):
+                row = start + offset
+                self._tombstone(task_id)
+                self._ids.append(task_id)
+                self._row_of[task_id] = row
+                record = {
+                    "metadata": (metadatas[offset] if metadatas else None) or {},
+                    "added_at": (added_at[offset] if added_at else None) or now,
+                }
+                self._records[task_id] = record
+                records.append({"op": "add", "id": task_id, "row": row, **record})
+            self._rows = start + len(task_ids)
+            self._append_records(records)
+            self._maybe_compact()
+
     def get(self, task_id: str) -> Optional[Dict[str, Any]]:
         """
         Get a vector by task ID.
@@ -104,9 +415,13 @@ class SimpleVectorStore:
             task_id: The task identifier
 
         Returns:
-            Dict with embedding and metadata, or None if not found
+            Dict with the (normalized) embedding and metadata, or None if not found
         """
-        return self.vectors.get(task_id)
+        with self._lock:
+            row = self._row_of.get(task_id)
+            if row is None:
+                return None
+            return {"embedding": self._matrix[row].tolist(), **self._records[task_id]}
 
     def remove(self, task_id: str) -> bool:
         """
@@ -118,19 +433,123 @@ class SimpleVectorStore:
         Returns:
             True if removed, False if not found
         """
-        if task_id in self.vectors:
-            del self.vectors[task_id]
-            self._save()
-            logger.info(f"Removed vector for task {task_id}")
-            return True
-        return False
+        with self._lock:
+            if not self._tombstone(task_id):
+                return False
+            self._append_records([{"op": "remove", "id": task_id}])
+            self._maybe_compact()
+        logger.info(f"Removed vector for task {task_id}")
+        return True
+
+    def _maybe_compact(self) -> None:
+        dead = self._rows - len(self._row_of)
+        if dead >= 64 and dead > self.compact_ratio * self._rows:
+            self.compact()
+
+    def compact(self) -> None:
+        """Rewrite the matrix and sidecar with live rows only."""
+        with self._lock:
+            live = np.array(sorted(self._row_of.values()), dtype=np.int64)
+            ids = [self._ids[row] for row in live]
+            tmp_meta = self.meta_path.with_name(self.meta_path.name + ".tmp")
+            old_matrix = self.matrix_path
+            generation = self._generation + 1 if self._dim is not None else self._generation
+            new_matrix = self._matrix_file(generation)
+
+            if self._dim is not None:
+                capacity = max(self.INITIAL_CAPACITY, len(live))
+                compacted = np.lib.format.open_memmap(new_matrix, mode="w+", dtype=np.float32, shape=(capacity, self._dim))
+                if len(live):
+                    compacted[:len(live)] = self._matrix[live]
+                compacted.flush()
+                del compacted
+
+            with open(tmp_meta, "w", encoding="utf-8") as f:
+                if self._dim is not None:
+                    f.write(json.dumps({"op": "dim", "dim": self._dim, "generation": generation}) + "\n")
+                for row, task_id in enumerate(ids):
+                    f.write(json.dumps({"op": "add", "id": task_id, "row": row, **self._records[task_id]}, default=str) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+            if self._meta_file is not None:
+                self._meta_file.close()
+                self._meta_file = None
+            searchable = self._searchable[live] if len(live) else np.zeros(0, dtype=bool)
+            self._matrix = None
+            # Commit point: the new sidecar names the new matrix generation
+            os.replace(tmp_meta, self.meta_path)
+            self._generation = generation
+            if self._dim is not None:
+                if old_matrix != new_matrix:
+                    try:
+                        old_matrix.unlink()
+                    except OSError:
+                        pass
+                self._matrix = np.load(self.matrix_path, mmap_mode="r+")
+
+            self._ids = list(ids)
+            self._row_of = {task_id: row for row, task_id in enumerate(ids)}
+            self._rows = len(ids)
+            self._searchable = searchable
+            self._index = None
+            logger.info(f"Compacted vector store to {self._rows} vectors")
+
+    def flush(self) -> None:
+        """Flush the mapped matrix and sidecar to disk."""
+        with self._lock:
+            if self._matrix is not None:
+                self._matrix.flush()
+            if self._meta_file is not None:
+                self._meta_file.flush()
+                os.fsync(self._meta_file.fileno())
+
+    def close(self) -> None:
+        """Flush and release the matrix mapping and sidecar handle."""
+        with self._lock:
+            self.flush()
+            if self._meta_file is not None:
+                self._meta_file.close()
+                self._meta_file = None
+            self._matrix = None
+
+    # ------------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------------
+
+    def build_index(self, n_lists: Optional[int] = None) -> None:
+        """
+        Build (or rebuild) the IVF index over the current live rows.
+
+        Args:
+            n_lists: Number of clusters (default ~sqrt(live rows))
+        """
+        with self._lock:
+            rows = np.flatnonzero(self._searchable[:self._rows])
+            if len(rows) < 2:
+                self._index = None
+                return
+            n_lists = n_lists or max(1, int(np.sqrt(len(rows))))
+            self._index = _IVFIndex.build(self._matrix, rows, min(n_lists, len(rows)))
+            logger.info(f"Built IVF index with {len(self._index.lists)} lists over {len(rows)} vectors")
+
+    def _use_index(self, exact: Optional[bool]) -> bool:
+        if exact is not None:
+            return not exact and self._index is not None
+        if not self.ann_min_rows or len(self._row_of) < self.ann_min_rows:
+            return False
+        # Rebuild once rows appended since the last build exceed 10% of it
+        if self._index is None or self._rows - self._index.indexed_rows > 0.1 * self._index.indexed_rows:
+            self.build_index()
+        return self._index is not None
 
     def search(
         self,
         query_embedding: List[float],
         threshold: float = 0.85,
         top_k: int = 5,
-        exclude_ids: Optional[List[str]] = None
+        exclude_ids: Optional[List[str]] = None,
+        exact: Optional[bool] = None,
     ) -> List[Dict[str, Any]]:
         """
         Search for similar vectors using cosine similarity.
@@ -140,54 +559,72 @@ class SimpleVectorStore:
             threshold: Minimum similarity score (0-1)
             top_k: Maximum number of results
             exclude_ids: Task IDs to exclude from results
+            exact: Force exact (True) or IVF (False) search; by default the
+                index is used once the store has ``ann_min_rows`` vectors
+                (if that is set)
 
         Returns:
             List of dicts with task_id, similarity, and metadata
         """
-        if not self.vectors:
-            return []
-
-        exclude_ids = exclude_ids or []
-        query = np.array(query_embedding)
+        query = np.asarray(query_embedding, dtype=np.float32)
         query_norm = np.linalg.norm(query)
-
         if query_norm == 0:
             logger.warning("Query embedding has zero norm")
             return []
-
-        results = []
-        for task_id, data in self.vectors.items():
-            if task_id in exclude_ids:
-                continue
-
-            stored = np.array(data['embedding'])
-            stored_norm = np.linalg.norm(stored)
-
-            if stored_norm == 0:
-                continue
-
-            # Cosine similarity
-            similarity = float(np.dot(query, stored) / (query_norm * stored_norm))
-
-            if similarity >= threshold:
+        query = query / query_norm
+
+        with self._lock:
+            if not self._row_of:
+                return []
+            if query.shape[0] != self._dim:
+                raise ValueError(f"Query dimension {query.shape[0]} does not match store dimension {self._dim}")
+
+            if self._use_index(exact):
+                tail = np.arange(self._index.indexed_rows, self._rows)
+                rows = np.concatenate([self._index.candidates(query, self.nprobe), tail])
+                rows = np.sort(rows[self._searchable[rows]])
+                scores = np.asarray(self._matrix[rows] @ query)
+            else:
+                scores = np.asarray(self._matrix[:self._rows] @ query)
+                scores[~self._searchable[:self._rows]] = -np.inf
+                rows = None
+
+            for task_id in exclude_ids or []:
+                row = self._row_of.get(task_id)
+                if row is None:
+                    continue
+                if rows is None:
+                    scores[row] = -np.inf
+                else:
+                    scores[rows == row] = -np.inf
+
+            hits = np.flatnonzero(scores >= threshold)
+            if len(hits) > top_k:
+                hits = hits[np.argpartition(-scores[hits], top_k - 1)[:top_k]]
+            hits = hits[np.argsort(-scores[hits], kind="stable")]
+
+            results = []
+            for hit in hits:
+                task_id = self._ids[hit if rows is None else rows[hit]]
                 results.append({
                     'task_id': task_id,
-                    'similarity': round(similarity, 4),
-                    **data.get('metadata', {})
+                    'similarity': round(float(scores[hit]), 4),
+                    **self._records[task_id].get('metadata', {})
                 })
-
-        # Sort by similarity descending
-        results.sort(key=lambda x: x['similarity'], reverse=True)
-        return results[:top_k]
+            return results
 
     def count(self) -> int:
         """Return the number of vectors in the store."""
-        return len(self.vectors)
+        return len(self._row_of)
 
     def clear(self) -> None:
         """Clear all vectors from the store."""
-        self.vectors = {}
-        self._save()
+        with self._lock:
+            self._row_of = {}
+            self._records = {}
+            self._ids = [None] * self._rows
+            self._searchable[:] = False
+            self.compact()
         logger.info("Cleared vector store")
 
 
@@ -242,11 +679,12 @@ def check_duplicate_task(
     from . import embed
 
     try:
-        embedding = embed(description)
+        embedding = embed(description)[0]
         store = get_store()
 
         exclude_ids = [exclude_task_id] if exclude_task_id else None
-        similar = store.search(embedding, threshold=threshold, exclude_ids=exclude_ids)
+        # IVF can miss near-duplicates at the threshold; the check stays exact
+        similar = store.search(embedding, threshold=threshold, exclude_ids=exclude_ids, exact=True)
 
         if similar:
             logger.info(f"Found {len(similar)} similar tasks (threshold={threshold})")
@@ -282,10 +720,43 @@ def add_task_embedding(
     from . import embed
 
     try:
-        embedding = embed(description)
+        embedding = embed(description)[0]
         store = get_store()
         store.add(task_id, embedding, metadata)
         logger.info(f"Added embedding for task {task_id}")
     except Exception as e:
         logger.error(f"Failed to add task embedding: {e}")
         raise
+
+
+def add_task_embeddings(
+    tasks: Dict[str, str],
+    metadata: Optional[Dict[str, Dict[str, Any]]] = None
+) -> int:
+    """
+    Embed and store many tasks at once (e.g. a backfill of existing tasks).
+
+    Uses ``embed_many`` (deduplicated, cached, batched) and a single
+    ``add_many`` write.
+
+    Args:
+        tasks: Mapping of task ID to description
+        metadata: Optional mapping of task ID to metadata
+
+    Returns:
+        Number of tasks added
+    """
+    from . import embed_many
+
+    if not tasks:
+        return 0
+    task_ids = list(tasks)
+    try:
+        embeddings = embed_many([tasks[task_id] for task_id in task_ids])
+        store = get_store()
+        store.add_many(task_ids, embeddings, [(metadata or {}).get(task_id) for task_id in task_ids])
+        logger.info(f"Added embeddings for {len(task_ids)} tasks")
+        return len(task_ids)
+    except Exception as e:
+        logger.error(f"Failed to add task embeddings: {e}")
+        raise
@@ -13,6 +13,9 @@ Inspired by DriveSheetsSync GAS UnifiedLoggerGAS v2.5 architecture:
 - Canonical log path structure: logs/{script}/{env}/{YYYY}/{MM}/
 - Structured context logging with JSON serialization
 - Automatic buffer flushing (time-based and size-based)
+- Background file writer: handles stay open, encoding happens off the
+  calling thread, files rotate by size/age (see ``writer.LogFileWriter``)
+- Bounded in-memory history (ring buffer) so long runs use constant memory
 - Finalization with status update in filenames
 - Notion execution log page creation (when enabled)
 
@@ -40,10 +43,13 @@ import logging
 import os
 import time
 import uuid
+from collections import deque
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Union
 from datetime import datetime
 
+from .writer import LogFileWriter
+
 
 # Default configuration matching DriveSheetsSync
 DEFAULT_CONFIG = {
@@ -51,6 +57,10 @@ DEFAULT_CONFIG = {
     "FLUSH_LINES": 20,      # Flush after N log lines
     "FLUSH_MS": 10000,      # Flush after N milliseconds
     "MAX_CONTEXT_DEPTH": 5, # Max depth for context serialization
+    "MAX_RETAINED_ENTRIES": int(os.environ.get("LOG_MAX_RETAINED_ENTRIES", "1000")),   # In-memory ring buffer size
+    "MAX_RETAINED_MESSAGES": int(os.environ.get("LOG_MAX_RETAINED_MESSAGES", "200")),  # Error/warning messages kept for Notion
+    "ROTATE_BYTES": int(os.environ.get("LOG_ROTATE_BYTES", str(50 * 1024 * 1024))),   # Rotate files past this size (0 = never)
+    "ROTATE_SECONDS": int(os.environ.get("LOG_ROTATE_SECONDS", "0")),                  # Rotate files after N seconds (0 = never)
 }
 
 
@@ -179,14 +189,13 @@ class UnifiedLogger:
         self._execution_logs_db_id = execution_logs_db_id
         self._notion_log_page_id: Optional[str] = None
 
-        # Triple logging file handles
+        # Triple logging files (written by a background LogFileWriter)
         self._jsonl_file: Optional[Path] = None
         self._human_file: Optional[Path] = None
         self._log_folder: Optional[Path] = None
+        self._writer: Optional[LogFileWriter] = None
 
-        # Buffer for batch writing (matching DriveSheetsSync flush behavior)
-        self._buffer: List[Dict[str, Any]] = []
-        self._last_flush = time.time()
+        # Flush thresholds (matching DriveSheetsSync flush behavior)
         self._flush_lines = DEFAULT_CONFIG["FLUSH_LINES"]
         self._flush_ms = DEFAULT_CONFIG["FLUSH_MS"]
 
@@ -197,9 +206,13 @@ class UnifiedLogger:
         self._operation_count = 0
         self._error_count = 0
         self._warning_count = 0
+        self._entry_count = 0
+        self._level_counts: Dict[str, int] = {}
 
-        # Track all log entries for Notion page body
-        self._log_entries: List[Dict[str, Any]] = []
+        # Recent log entries (ring buffer) and the first N error/warning
+        # messages for the Notion page body; full history lives in the files
+        self._log_entries: deque = deque(maxlen=DEFAULT_CONFIG["MAX_RETAINED_ENTRIES"])
+        self._max_messages = DEFAULT_CONFIG["MAX_RETAINED_MESSAGES"]
         self._error_messages: List[str] = []
         self._warn_messages: List[str] = []
         self._database_results: List[Dict[str, Any]] = []
@@ -258,9 +271,16 @@ class UnifiedLogger:
             self._jsonl_file = self._log_folder / f"{base_name}.jsonl"
             self._human_file = self._log_folder / f"{base_name}.log"
 
-            # Create empty files
-            self._jsonl_file.touch()
-            self._human_file.touch()
+            # Opens (creates) both files and keeps them open for the run
+            self._writer = LogFileWriter(
+                self._jsonl_file,
+                self._human_file,
+                max_bytes=DEFAULT_CONFIG["ROTATE_BYTES"],
+                rotate_seconds=DEFAULT_CONFIG["ROTATE_SECONDS"],
+                flush_lines=self._flush_lines,
+                flush_ms=self._flush_ms,
+                on_error=lambda e: self._logger.warning(f"Failed to write log files: {e}"),
+            )
 
             # Log file creation info
             self._logger.info("=" * 80)
@@ -275,6 +295,7 @@ class UnifiedLogger:
             self._logger.warning(f"Could not initialize file logging: {e}")
             self._jsonl_file = None
             self._human_file = None
+            self._writer = None
 
     def _create_notion_execution_log(self) -> None:
         """Create a Notion execution log page."""
@@ -327,102 +348,70 @@ class UnifiedLogger:
             "session_id": self.session_id,
         }
 
-        # Store for metrics and Notion
+        # Store for metrics and Notion (bounded)
         self._log_entries.append(entry)
+        self._entry_count += 1
+        self._level_counts[entry["level"]] = self._level_counts.get(entry["level"], 0) + 1
 
         if level == "error":
-            self._error_messages.append(f"{timestamp}: {message}")
+            if len(self._error_messages) < self._max_messages:
+                self._error_messages.append(f"{timestamp}: {message}")
         elif level == "warning":
-            self._warn_messages.append(f"{timestamp}: {message}")
+            if len(self._warn_messages) < self._max_messages:
+                self._warn_messages.append(f"{timestamp}: {message}")
 
-        # Add to buffer for file writing
-        if self.enable_file_logging:
-            self._buffer.append(entry)
-            self._flush_if_needed()
+        # Hand off to the background writer (encodes, writes, rotates)
+        if self._writer is not None:
+            self._writer.write(entry)
 
     def _flush_if_needed(self, force: bool = False) -> None:
-        """Flush buffer to files if threshold reached or forced."""
-        if not self.enable_file_logging:
-            return
+        """
+        Flush log files.
 
-        elapsed_ms = (time.time() - self._last_flush) * 1000
-        should_flush = (
-            force or
-            len(self._buffer) >= self._flush_lines or
-            elapsed_ms >= self._flush_ms
-        )
+        The background writer flushes on the FLUSH_LINES/FLUSH_MS thresholds
+        by itself; ``force=True`` blocks until everything logged so far is
+        on disk.
+        """
+        if force and self._writer is not None:
+            self._writer.flush()
 
-        if not should_flush or not self._buffer:
+    def _console(self, level: str, message: str, context: Optional[Dict[str, Any]]) -> None:
+        """Emit to the stdlib logger, formatting context only if the level is enabled."""
+        if not self._logger.isEnabledFor(getattr(logging, level.upper())):
             return
-
-        try:
-            # Write to JSONL file
-            if self._jsonl_file:
-                with open(self._jsonl_file, "a", encoding="utf-8") as f:
-                    for entry in self._buffer:
-                        f.write(json.dumps(entry, default=str) + "\n")
-
-            # Write to human-readable file
-            if self._human_file:
-                with open(self._human_file, "a", encoding="utf-8") as f:
-                    for entry in self._buffer:
-                        ctx_str = ""
-                        if entry.get("context"):
-                            ctx_str = f" | {json.dumps(entry['context'], default=str)}"
-                        f.write(
-                            f"{entry['timestamp']} | {entry['level']} | {entry['message']}{ctx_str}\n"
-                        )
-
-            self._buffer.clear()
-            self._last_flush = time.time()
-
-        except Exception as e:
-            self._logger.warning(f"Failed to flush log buffer: {e}")
+        if context:
+            message = f"{message} | {json.dumps(context, default=str)}"
+        getattr(self._logger, level)(message)
 
     # Standard logging API with context support
     def debug(self, message: str, context: Optional[Dict[str, Any]] = None, **kwargs):
         """Log a debug message with optional context."""
         self._log("debug", message, context)
-        if context:
-            self._logger.debug(f"{message} | {json.dumps(context, default=str)}")
-        else:
-            self._logger.debug(message)
+        self._console("debug", message, context)
 
     def info(self, message: str, context: Optional[Dict[str, Any]] = None, **kwargs):
         """Log an info message with optional context."""
         self._operation_count += 1
         self._log("info", message, context)
-        if context:
-            self._logger.info(f"{message} | {json.dumps(context, default=str)}")
-        else:
-            self._logger.info(message)
+        self._console("info", message, context)
 
     def warning(self, message: str, context: Optional[Dict[str, Any]] = None, **kwargs):
         """Log a warning message with optional context."""
         self._warning_count += 1
         self._log("warning", message, context)
-        if context:
-            self._logger.warning(f"{message} | {json.dumps(context, default=str)}")
-        else:
-            self._logger.warning(message)
+        self._console("warning", message, context)
 
     def error(self, message: str, context: Optional[Dict[str, Any]] = None, **kwargs):
         """Log an error message with optional context."""
         self._error_count += 1
         self._log("error", message, context)
-        if context:
-            self._logger.error(f"{message} | {json.dumps(context, default=str)}")
-        else:
-            self._logger.error(message)
+        self._console("error", message, context)
 
     def critical(self, message: str, context: Optional[Dict[str, Any]] = None, **kwargs):
         """Log a critical message with optional context."""
         self._error_count += 1
         self._log("critical", message, context)
-        if context:
-            self._logger.critical(f"{message} | {json.dumps(context, default=str)}")
-        else:
-            self._logger.critical(message)
+        self._console("critical", message, context)
 
     def exception(self, message: str, context: Optional[Dict[str, Any]] = None, **kwargs):
         """Log an exception with traceback and optional context."""
@@ -452,10 +441,13 @@ class UnifiedLogger:
             - operation_count: Number of info-level log calls
             - error_count: Number of error/critical calls
             - warning_count: Number of warning calls
+            - entry_count: Number of entries logged (all levels)
+            - level_counts: Entries logged per level
             - session_id: Logger session identifier
             - run_id: Unique run identifier
             - start_time: ISO timestamp of session start
             - log_files: Paths to log files (if file logging enabled)
+            - file_writer: Background writer counters (if file logging enabled)
             - notion_log_page_id: Notion execution log page ID (if enabled)
         """
         metrics = {
@@ -463,6 +455,8 @@ class UnifiedLogger:
             "operation_count": self._operation_count,
             "error_count": self._error_count,
             "warning_count": self._warning_count,
+            "entry_count": self._entry_count,
+            "level_counts": dict(self._level_counts),
             "session_id": self.session_id,
             "run_id": self.run_id,
             "start_time": datetime.fromtimestamp(self._start_ts).isoformat(),
@@ -474,6 +468,9 @@ class UnifiedLogger:
                 "human": str(self._human_file) if self._human_file else None,
                 "folder": str(self._log_folder) if self._log_folder else None,
             }
+            if self._writer is not None:
+                metrics["log_files"]["segments"] = [str(p) for p in self._writer.segments()]
+                metrics["file_writer"] = self._writer.snapshot()
 
         if self._notion_log_page_id:
             metrics["notion_log_page_id"] = self._notion_log_page_id
@@ -521,18 +518,12 @@ class UnifiedLogger:
         # Flush remaining buffer
         self._flush_if_needed(force=True)
 
-        # Rename log files with final status
-        if self.enable_file_logging and self._jsonl_file and self._human_file:
+        # Rename log files (and rotated segments) with final status
+        if self._writer is not None:
             try:
-                for old_file in [self._jsonl_file, self._human_file]:
-                    if old_file and old_file.exists():
-                        new_name = old_file.name.replace(" — Running ", f" — {status} ")
-                        new_path = old_file.parent / new_name
-                        old_file.rename(new_path)
-                        if old_file == self._jsonl_file:
-                            self._jsonl_file = new_path
-                        else:
-                            self._human_file = new_path
+                self._writer.rename(lambda name: name.replace(" — Running ", f" — {status} "))
+                self._jsonl_file = self._writer.jsonl_path
+                self._human_file = self._writer.human_path
             except Exception as e:
                 self._logger.warning(f"Could not rename log files with final status: {e}")
 
@@ -637,8 +628,9 @@ class UnifiedLogger:
         if not self._finalized:
             self.finalize(ok=self._error_count == 0)
 
-        # Flush buffer
-        self._flush_if_needed(force=True)
+        # Drain and close the file writer
+        if self._writer is not None:
+            self._writer.close()
 
         for handler in list(self._logger.handlers):
             try:
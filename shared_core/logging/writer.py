@@ -0,0 +1,295 @@
+"""
+Log File Writer
+===============
+
+Background JSONL + human-readable log writer used by ``UnifiedLogger``.
+
+Features:
+- File handles stay open for the life of the run (no reopen per flush)
+- Entries are JSON-encoded and formatted on the writer thread, so the
+  logging caller only enqueues a dict
+- Buffered writes flushed every ``flush_lines`` entries or ``flush_ms``
+  milliseconds, and whenever the queue runs dry
+- Rotation by size (``max_bytes``) and/or age (``rotate_seconds``):
+  the active file is renamed to ``<name>.<n><suffix>`` and a fresh file is
+  opened under the original name
+- Entries still queued at interpreter exit are written by an ``atexit``
+  hook, so a run that never calls ``close()`` keeps its last lines
+- ``rename()`` re-labels the active file and every rotated segment (used
+  by ``UnifiedLogger.finalize()`` to swap "Running" for the final status)
+
+Usage:
+    from shared_core.logging.writer import LogFileWriter
+
+    writer = LogFileWriter(jsonl_path, human_path, max_bytes=50 * 1024 * 1024)
+    writer.write({"timestamp": ..., "level": "INFO", "message": "...", "context": {}})
+    writer.flush()
+    writer.close()
+
+Created: 2026-10-16
+"""
+
+import atexit
+import json
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, TextIO
+
+_FLUSH = object()
+_STOP = object()
+
+
+def format_human_line(entry: Dict[str, Any]) -> str:
+    """Human-readable log line for an entry."""
+    ctx_str = ""
+    if entry.get("context"):
+        ctx_str = f" | {json.dumps(entry['context'], default=str)}"
+    return f"{entry['timestamp']} | {entry['level']} | {entry['message']}{ctx_str}\n"
+
+
+class _RotatingFile:
+    """One open log file with size/time rotation."""
+
+    def __init__(self, path: Path, max_bytes: int, rotate_seconds: float):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.rotate_seconds = rotate_seconds
+        self.segments: List[Path] = []
+        self.rotations = 0
+        self._handle: Optional[TextIO] = None
+        self._size = 0
+        self._opened_at = 0.0
+        self._open()
+
+    def _open(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._handle = open(self.path, "a", encoding="utf-8")
+        self._size = self.path.stat().st_size
+        self._opened_at = time.time()
+
+    def _due(self, incoming: int) -> bool:
+        if self._size == 0:
+            return False
+        if self.max_bytes and self._size + incoming > self.max_bytes:
+            return True
+        return bool(self.rotate_seconds) and time.time() - self._opened_at >= self.rotate_seconds
+
+    def _rotate(self) -> None:
+        self.close()
+        self.rotations += 1
+        segment = self.path.with_name(f"{self.path.stem}.{self.rotations}{self.path.suffix}")
+        self.path.rename(segment)
+        self.segments.append(segment)
+        self._open()
+
+    def write(self, text: str) -> None:
+        size = len(text.encode("utf-8"))
+        if self._due(size):
+            self._rotate()
+        self._handle.write(text)
+        self._size += size
+
+    def flush(self) -> None:
+        if self._handle is not None:
+            self._handle.flush()
+
+    def close(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+    def rename(self, transform: Callable[[str], str]) -> None:
+        self.close()
+        renamed = []
+        for segment in self.segments:
+            target = segment.with_name(transform(segment.name))
+            if segment.exists():
+                segment.rename(target)
+            renamed.append(target)
+        self.segments = renamed
+        target = self.path.with_name(transform(self.path.name))
+        if self.path.exists():
+            self.path.rename(target)
+        self.path = target
+        self._open()
+
+
+class LogFileWriter:
+    """
+    Background writer for the JSONL and human-readable log files.
+    """
+
+    def __init__(
+        self,
+        jsonl_path: Optional[Path],
+        human_path: Optional[Path],
+        max_bytes: int = 50 * 1024 * 1024,
+        rotate_seconds: float = 0,
+        flush_lines: int = 20,
+        flush_ms: int = 10000,
+        max_queue: int = 100000,
+        on_error: Optional[Callable[[BaseException], None]] = None,
+    ):
+        """
+        Initialize the writer and start its thread.
+
+        Args:
+            jsonl_path: JSONL file (None to skip)
+            human_path: Human-readable .log file (None to skip)
+            max_bytes: Rotate a file before it grows past this size (0 = never)
+            rotate_seconds: Rotate a file after this many seconds (0 = never)
+            flush_lines: Flush OS buffers after this many entries
+            flush_ms: Flush OS buffers at least this often while busy
+            max_queue: Pending entries before ``write()`` blocks the caller
+            on_error: Called with write errors (default: ignore)
+        """
+        self.flush_lines = max(1, flush_lines)
+        self.flush_ms = max(1, flush_ms)
+        self.on_error = on_error
+        self._files: Dict[str, _RotatingFile] = {}
+        if jsonl_path:
+            self._files["jsonl"] = _RotatingFile(Path(jsonl_path), max_bytes, rotate_seconds)
+        if human_path:
+            self._files["human"] = _RotatingFile(Path(human_path), max_bytes, rotate_seconds)
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_queue)
+        self._lock = threading.Lock()
+        self._closed = False
+        self.stats = {"entries": 0, "bytes": 0, "flushes": 0, "errors": 0}
+        self._thread = threading.Thread(target=self._run, name="log-file-writer", daemon=True)
+        self._thread.start()
+        # The thread is a daemon; write what is still queued when the
+        # interpreter exits without close() being called.
+        atexit.register(self.close)
+
+    # ------------------------------------------------------------------
+    # Caller side
+    # ------------------------------------------------------------------
+
+    def write(self, entry: Dict[str, Any]) -> None:
+        """Queue an entry for encoding and writing."""
+        if not self._closed:
+            self._queue.put(entry)
+
+    def _sync(self, marker: Any, timeout: float) -> bool:
+        done = threading.Event()
+        self._queue.put((marker, done))
+        return done.wait(timeout)
+
+    def flush(self, timeout: float = 10.0) -> bool:
+        """
+        Write and flush everything queued so far.
+
+        Returns:
+            True if the writer caught up within the timeout
+        """
+        if self._closed or not self._thread.is_alive():
+            return False
+        return self._sync(_FLUSH, timeout)
+
+    def rename(self, transform: Callable[[str], str], timeout: float = 10.0) -> None:
+        """Flush, then rename every file and rotated segment via ``transform(name)``."""
+        self.flush(timeout)
+        with self._lock:
+            for handle in self._files.values():
+                handle.rename(transform)
+
+    def close(self, timeout: float = 10.0) -> None:
+        """Flush remaining entries, stop the thread and close the files."""
+        if self._closed:
+            return
+        atexit.unregister(self.close)
+        if self._thread.is_alive():
+            self._sync(_STOP, timeout)
+        self._closed = True
+        self._thread.join(timeout)
+        with self._lock:
+            for handle in self._files.values():
+                handle.close()
+
+    # ------------------------------------------------------------------
+    # Paths / metrics
+    # ------------------------------------------------------------------
+
+    @property
+    def jsonl_path(self) -> Optional[Path]:
+        handle = self._files.get("jsonl")
+        return handle.path if handle else None
+
+    @property
+    def human_path(self) -> Optional[Path]:
+        handle = self._files.get("human")
+        return handle.path if handle else None
+
+    def segments(self) -> List[Path]:
+        """Rotated (closed) segment files, oldest first."""
+        return [segment for handle in self._files.values() for segment in handle.segments]
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Write counters, queue depth and rotation count."""
+        return {
+            **self.stats,
+            "pending": self._queue.qsize(),
+            "rotations": sum(handle.rotations for handle in self._files.values()),
+        }
+
+    # ------------------------------------------------------------------
+    # Writer thread
+    # ------------------------------------------------------------------
+
+    def _flush_files(self) -> None:
+        for handle in self._files.values():
+            handle.flush()
+        self.stats["flushes"] += 1
+
+    def _write_entry(self, entry: Dict[str, Any]) -> None:
+        jsonl = self._files.get("jsonl")
+        human = self._files.get("human")
+        if jsonl is not None:
+            line = json.dumps(entry, default=str) + "\n"
+            jsonl.write(line)
+            self.stats["bytes"] += len(line)
+        if human is not None:
+            line = format_human_line(entry)
+            human.write(line)
+            self.stats["bytes"] += len(line)
+        self.stats["entries"] += 1
+
+    def _run(self) -> None:
+        unflushed = 0
+        last_flush = time.monotonic()
+        while True:
+            try:
+                item = self._queue.get(timeout=self.flush_ms / 1000.0)
+            except queue.Empty:
+                item = None
+
+            marker = item[0] if isinstance(item, tuple) else None
+            try:
+                with self._lock:
+                    if isinstance(item, dict):
+                        self._write_entry(item)
+                        unflushed += 1
+                    due = (
+                        marker is not None
+                        or unflushed >= self.flush_lines
+                        or (unflushed and (time.monotonic() - last_flush) * 1000 >= self.flush_ms)
+                        or (unflushed and self._queue.empty())
+                    )
+                    if due:
+                        self._flush_files()
+                        unflushed = 0
+                        last_flush = time.monotonic()
+            except Exception as e:
+                self.stats["errors"] += 1
+                if self.on_error is not None:
+                    try:
+                        self.on_error(e)
+                    except Exception:
+                        pass
+
+            if marker is not None:
+                item[1].set()
+                if marker is _STOP:
+                    return
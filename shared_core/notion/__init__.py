@@ -23,6 +23,16 @@ from shared_core.notion.task_creation import (
 
 # For issue/question creation with duplicate prevention
 from shared_core.notion.issues_questions import create_issue_or_question
+
+# For a client on the shared, rate-limited connection pool
+# (get_notion_client() already uses it)
+from shared_core.notion.rate_limiter import create_notion_client
+
+# For coalescing several property patches into one page update
+from shared_core.notion.write_buffer import PageWriteBuffer
+
+# For local index lookups against a synced copy of a database
+from shared_core.notion.mirror import get_notion_mirror
 ```
 """
 
@@ -67,6 +77,31 @@ from .db_id_resolver import (
     get_database_id,
 )
 
+from .mirror import (
+    NotionMirror,
+    get_notion_mirror,
+    mirror_enabled,
+    normalize_text,
+)
+
+from .paginator import (
+    aiter_paginated,
+    iter_database_rows,
+    iter_paginated,
+)
+
+from .rate_limiter import (
+    TokenBucket,
+    create_notion_client,
+    get_notion_http_session,
+    get_notion_rate_limiter,
+)
+
+from .write_buffer import (
+    PageWriteBuffer,
+    merge_properties,
+)
+
 __all__ = [
     "get_notion_token",
     "get_notion_client",
@@ -96,4 +131,21 @@ __all__ = [
     "get_issues_questions_db_id",
     "get_photo_library_db_id",
     "get_database_id",
+    # Mirror exports
+    "NotionMirror",
+    "get_notion_mirror",
+    "mirror_enabled",
+    "normalize_text",
+    # Paginator exports
+    "aiter_paginated",
+    "iter_database_rows",
+    "iter_paginated",
+    # Rate limiter / shared pool exports
+    "TokenBucket",
+    "create_notion_client",
+    "get_notion_http_session",
+    "get_notion_rate_limiter",
+    # Write buffer exports
+    "PageWriteBuffer",
+    "merge_properties",
 ]
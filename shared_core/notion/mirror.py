@@ -0,0 +1,472 @@
+"""
+Notion Database Mirror
+======================
+
+Local SQLite mirror of Notion databases (Tracks, Artists, Playlists) so
+duplicate checks and candidate selection are index lookups instead of
+several API queries per track.
+
+Components:
+- ``NotionMirror``: page store plus a ``(database, key, value) -> page``
+  index. Every short url/rich_text/title/email/phone property is indexed
+  under its property name (so "SoundCloud URL", "Spotify ID",
+  "AIFF Fingerprint", "Eagle File ID", "Name" ... are all lookups), plus
+  derived keys for the normalized title, artist and title|artist.
+- Incremental sync: after the first full pull, only pages with
+  ``last_edited_time`` on or after the stored watermark are requested.
+  A periodic full sync drops pages that were archived or deleted
+  elsewhere; writes made by this process can be recorded immediately
+  with ``upsert_page()`` / ``remove_page()``.
+
+Index values are stored lower-cased, so lookups are case-insensitive.
+
+Usage:
+    from shared_core.notion.mirror import get_notion_mirror
+
+    mirror = get_notion_mirror()
+    mirror.ensure_fresh(tracks_db_id, notion_client)
+    pages = mirror.find(tracks_db_id, "Spotify ID", spotify_id)
+    pages = mirror.find_title_artist(tracks_db_id, "Track Title", "Artist")
+
+Created: 2026-10-16
+"""
+
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .paginator import MAX_PAGE_SIZE, iter_paginated
+
+logger = logging.getLogger(__name__)
+
+# Derived index keys (property names never start with "@")
+TITLE_KEY = "@title"
+ARTIST_KEY = "@artist"
+TITLE_ARTIST_KEY = "@title_artist"
+
+ARTIST_PROPERTIES = ("Artist Name", "Artist", "Artists")
+INDEXED_TYPES = ("title", "rich_text", "url", "email", "phone_number")
+MAX_INDEXED_LENGTH = 512
+
+DEFAULT_MAX_STALENESS = 60.0
+DEFAULT_FULL_SYNC_INTERVAL = 24 * 3600.0
+
+QueryFn = Callable[[str, Dict[str, Any]], Dict[str, Any]]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    page_id TEXT PRIMARY KEY,
+    database_id TEXT NOT NULL,
+    last_edited_time TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_pages_db ON pages(database_id, last_edited_time);
+CREATE TABLE IF NOT EXISTS page_keys (
+    database_id TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    page_id TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_page_keys_lookup ON page_keys(database_id, key, value);
+CREATE INDEX IF NOT EXISTS idx_page_keys_page ON page_keys(page_id);
+CREATE TABLE IF NOT EXISTS sync_state (
+    database_id TEXT PRIMARY KEY,
+    watermark TEXT,
+    synced_at REAL NOT NULL,
+    full_synced_at REAL NOT NULL
+);
+"""
+
+_nonword = re.compile(r"[^0-9a-z]+")
+
+
+def mirror_enabled() -> bool:
+    """Whether callers should use the mirror ($NOTION_MIRROR, default on)."""
+    return os.getenv("NOTION_MIRROR", "1").strip().lower() not in ("0", "false", "no", "off")
+
+
+def normalize_text(value: Optional[str]) -> str:
+    """Case-fold, strip accents and collapse punctuation/whitespace to single spaces."""
+    if not value:
+        return ""
+    value = unicodedata.normalize("NFKD", value)
+    value = "".join(ch for ch in value if not unicodedata.combining(ch)).casefold()
+    return _nonword.sub(" ", value).strip()
+
+
+def client_query(client: Any) -> QueryFn:
+    """Adapt a ``notion_client.Client`` to the mirror's query function signature."""
+    return lambda database_id, body: client.databases.query(database_id=database_id, **body)
+
+
+def _as_query(query: Union[QueryFn, Any]) -> QueryFn:
+    if hasattr(query, "databases"):
+        return client_query(query)
+    return query
+
+
+def _db_key(database_id: str) -> str:
+    return (database_id or "").replace("-", "").lower()
+
+
+def property_text(prop: Optional[Dict[str, Any]]) -> str:
+    """Plain text of an indexable property value ("" for other types)."""
+    if not prop:
+        return ""
+    ptype = prop.get("type") or next((t for t in INDEXED_TYPES if t in prop), None)
+    if ptype in ("title", "rich_text"):
+        return "".join(
+            item.get("plain_text") or (item.get("text") or {}).get("content", "")
+            for item in prop.get(ptype) or []
+        ).strip()
+    if ptype in ("url", "email", "phone_number"):
+        return (prop.get(ptype) or "").strip()
+    return ""
+
+
+def index_entries(page: Dict[str, Any]) -> List[Tuple[str, str]]:
+    """(key, value) index entries for a page."""
+    entries: List[Tuple[str, str]] = []
+    title = artist = ""
+    for name, prop in (page.get("properties") or {}).items():
+        text = property_text(prop)
+        if not text or len(text) > MAX_INDEXED_LENGTH:
+            continue
+        entries.append((name, text.lower()))
+        if prop.get("type") == "title" and not title:
+            title = text
+    for name in ARTIST_PROPERTIES:
+        artist = property_text((page.get("properties") or {}).get(name))
+        if artist:
+            break
+
+    title_norm, artist_norm = normalize_text(title), normalize_text(artist)
+    if title_norm:
+        entries.append((TITLE_KEY, title_norm))
+    if artist_norm:
+        entries.append((ARTIST_KEY, artist_norm))
+    if title_norm and artist_norm:
+        entries.append((TITLE_ARTIST_KEY, f"{title_norm}|{artist_norm}"))
+    return entries
+
+
+class NotionMirror:
+    """
+    SQLite mirror of Notion database pages with lookup indexes.
+
+    Features:
+    - Incremental ``last_edited_time`` sync with a persisted watermark
+    - Periodic full sync that drops pages no longer returned by the API
+    - Case-insensitive exact and substring lookups on any indexed key
+    - Write-through ``upsert_page()`` for pages created/updated locally
+    - Thread-safe; concurrent ``ensure_fresh()`` calls share one sync
+    """
+
+    DEFAULT_PATH = "~/.local/share/notion-mirror/mirror.sqlite3"
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        max_staleness: Optional[float] = None,
+        full_sync_interval: Optional[float] = None,
+    ):
+        """
+        Initialize the mirror.
+
+        Args:
+            path: SQLite file path. Defaults to $NOTION_MIRROR_PATH or
+                ~/.local/share/notion-mirror/mirror.sqlite3
+            max_staleness: Seconds after which ``ensure_fresh()`` syncs again
+                (default: $NOTION_MIRROR_MAX_STALENESS or 60)
+            full_sync_interval: Seconds between full syncs
+                (default: $NOTION_MIRROR_FULL_SYNC_INTERVAL or 86400)
+        """
+        self.path = Path(path or os.getenv("NOTION_MIRROR_PATH") or self.DEFAULT_PATH).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_staleness = (
+            max_staleness if max_staleness is not None
+            else float(os.getenv("NOTION_MIRROR_MAX_STALENESS", DEFAULT_MAX_STALENESS))
+        )
+        self.full_sync_interval = (
+            full_sync_interval if full_sync_interval is not None
+            else float(os.getenv("NOTION_MIRROR_FULL_SYNC_INTERVAL", DEFAULT_FULL_SYNC_INTERVAL))
+        )
+        self._lock = threading.RLock()
+        self._sync_locks: Dict[str, threading.Lock] = {}
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+        self.stats = {"syncs": 0, "full_syncs": 0, "synced_pages": 0, "lookups": 0}
+
+    # ------------------------------------------------------------------
+    # Sync
+    # ------------------------------------------------------------------
+
+    def sync_state(self, database_id: str) -> Optional[Dict[str, Any]]:
+        """Stored watermark and sync times for a database, or None if never synced."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT watermark, synced_at, full_synced_at FROM sync_state WHERE database_id = ?",
+                (_db_key(database_id),),
+            ).fetchone()
+        if row is None:
+            return None
+        return {"watermark": row[0], "synced_at": row[1], "full_synced_at": row[2]}
+
+    def sync(
+        self,
+        database_id: str,
+        query: Union[QueryFn, Any],
+        full: bool = False,
+        page_size: int = MAX_PAGE_SIZE,
+    ) -> int:
+        """
+        Pull changed pages of a database into the mirror.
+
+        Args:
+            database_id: Database to sync
+            query: ``(database_id, body) -> response`` or a notion_client.Client
+            full: Pull every page and drop local pages the API no longer returns
+            page_size: Rows per request
+
+        Returns:
+            Number of pages received
+        """
+        query = _as_query(query)
+        db = _db_key(database_id)
+        state = self.sync_state(database_id)
+        watermark = state["watermark"] if state else None
+        full = full or watermark is None
+
+        body: Dict[str, Any] = {"sorts": [{"timestamp": "last_edited_time", "direction": "ascending"}]}
+        if not full:
+            # Notion rounds last_edited_time to the minute; on_or_after re-reads
+            # the boundary minute, and upserts make that harmless.
+            body["filter"] = {"timestamp": "last_edited_time", "last_edited_time": {"on_or_after": watermark}}
+
+        def fetch_page(cursor: Optional[str], size: int) -> Dict[str, Any]:
+            params = dict(body, page_size=size)
+            if cursor:
+                params["start_cursor"] = cursor
+            return query(database_id, params)
+
+        started = time.time()
+        seen = set()
+        batch: List[Dict[str, Any]] = []
+        for page in iter_paginated(fetch_page, page_size=page_size):
+            batch.append(page)
+            seen.add(page["id"])
+            edited = page.get("last_edited_time")
+            if edited and (watermark is None or edited > watermark):
+                watermark = edited
+            if len(batch) >= 500:
+                self._store(db, batch)
+                batch = []
+        self._store(db, batch)
+
+        with self._lock:
+            if full:
+                stale = [
+                    (row[0],) for row in self._conn.execute("SELECT page_id FROM pages WHERE database_id = ?", (db,))
+                    if row[0] not in seen
+                ]
+                self._conn.executemany("DELETE FROM page_keys WHERE page_id = ?", stale)
+                self._conn.executemany("DELETE FROM pages WHERE page_id = ?", stale)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sync_state (database_id, watermark, synced_at, full_synced_at) "
+                "VALUES (?, ?, ?, ?)",
+                (db, watermark, started, started if full or not state else state["full_synced_at"]),
+            )
+            self._conn.commit()
+            self.stats["syncs"] += 1
+            self.stats["full_syncs"] += int(full)
+            self.stats["synced_pages"] += len(seen)
+
+        logger.debug(f"Notion mirror {'full' if full else 'incremental'} sync of {database_id}: {len(seen)} page(s)")
+        return len(seen)
+
+    def ensure_fresh(
+        self,
+        database_id: str,
+        query: Union[QueryFn, Any],
+        max_staleness: Optional[float] = None,
+    ) -> bool:
+        """
+        Sync the database if its last sync is older than ``max_staleness``.
+
+        A full sync is done on first use and every ``full_sync_interval``.
+
+        Returns:
+            True if a sync ran
+        """
+        max_staleness = self.max_staleness if max_staleness is None else max_staleness
+        db = _db_key(database_id)
+        with self._lock:
+            sync_lock = self._sync_locks.setdefault(db, threading.Lock())
+        with sync_lock:
+            state = self.sync_state(database_id)
+            now = time.time()
+            if state and now - state["synced_at"] < max_staleness:
+                return False
+            full = state is None or now - state["full_synced_at"] >= self.full_sync_interval
+            self.sync(database_id, query, full=full)
+            return True
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def _store(self, db: str, pages: Iterable[Dict[str, Any]]) -> None:
+        pages = list(pages)
+        if not pages:
+            return
+        removed = [(page["id"],) for page in pages if page.get("archived") or page.get("in_trash")]
+        live = [page for page in pages if not (page.get("archived") or page.get("in_trash"))]
+        with self._lock:
+            self._conn.executemany("DELETE FROM page_keys WHERE page_id = ?", [(page["id"],) for page in pages])
+            self._conn.executemany("DELETE FROM pages WHERE page_id = ?", removed)
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO pages (page_id, database_id, last_edited_time, data) VALUES (?, ?, ?, ?)",
+                [(page["id"], db, page.get("last_edited_time"), json.dumps(page)) for page in live],
+            )
+            self._conn.executemany(
+                "INSERT INTO page_keys (database_id, key, value, page_id) VALUES (?, ?, ?, ?)",
+                [(db, key, value, page["id"]) for page in live for key, value in index_entries(page)],
+            )
+            self._conn.commit()
+
+    def upsert_page(self, page: Dict[str, Any], database_id: Optional[str] = None) -> bool:
+        """
+        Record a page returned by a create/update call.
+
+        Pages of databases that were never synced are ignored, so a partial
+        write-through never makes an unsynced database look complete.
+
+        Args:
+            page: Full page object
+            database_id: Owning database (default: the page's parent)
+
+        Returns:
+            True if the page was stored (or removed, if archived)
+        """
+        if not page or not page.get("id"):
+            return False
+        database_id = database_id or (page.get("parent") or {}).get("database_id")
+        if not database_id or self.sync_state(database_id) is None:
+            return False
+        self._store(_db_key(database_id), [page])
+        return True
+
+    def remove_page(self, page_id: str) -> None:
+        """Drop a page (e.g. after archiving it)."""
+        with self._lock:
+            self._conn.execute("DELETE FROM page_keys WHERE page_id = ?", (page_id,))
+            self._conn.execute("DELETE FROM pages WHERE page_id = ?", (page_id,))
+            self._conn.commit()
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def _select(self, sql: str, params: Tuple[Any, ...]) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+            self.stats["lookups"] += 1
+        return [json.loads(row[0]) for row in rows]
+
+    def find(self, database_id: str, key: str, value: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Pages whose indexed ``key`` equals ``value`` (case-insensitive).
+
+        Args:
+            database_id: Database to search
+            key: Property name, or TITLE_KEY / ARTIST_KEY / TITLE_ARTIST_KEY
+            value: Exact value (derived keys expect ``normalize_text`` output)
+            limit: Maximum pages, most recently edited first
+
+        Returns:
+            Page objects
+        """
+        value = (value or "").strip().lower()
+        if not value:
+            return []
+        return self._select(
+            "SELECT DISTINCT p.data, p.last_edited_time FROM page_keys k JOIN pages p ON p.page_id = k.page_id "
+            "WHERE k.database_id = ? AND k.key = ? AND k.value = ? ORDER BY p.last_edited_time DESC LIMIT ?",
+            (_db_key(database_id), key, value, -1 if limit is None else limit),
+        )
+
+    def search(self, database_id: str, key: str, fragment: str, limit: Optional[int] = 50) -> List[Dict[str, Any]]:
+        """Pages whose indexed ``key`` contains ``fragment`` (case-insensitive)."""
+        fragment = (fragment or "").strip().lower()
+        if not fragment:
+            return []
+        pattern = "%" + fragment.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+        return self._select(
+            "SELECT DISTINCT p.data, p.last_edited_time FROM page_keys k JOIN pages p ON p.page_id = k.page_id "
+            "WHERE k.database_id = ? AND k.key = ? AND k.value LIKE ? ESCAPE '\\' "
+            "ORDER BY p.last_edited_time DESC LIMIT ?",
+            (_db_key(database_id), key, pattern, -1 if limit is None else limit),
+        )
+
+    def find_title_artist(self, database_id: str, title: str, artist: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Pages matching a normalized title (and artist, when given)."""
+        title_norm, artist_norm = normalize_text(title), normalize_text(artist)
+        if artist_norm:
+            return self.find(database_id, TITLE_ARTIST_KEY, f"{title_norm}|{artist_norm}")
+        return self.find(database_id, TITLE_KEY, title_norm)
+
+    def get_page(self, page_id: str) -> Optional[Dict[str, Any]]:
+        """Stored page object, or None."""
+        pages = self._select("SELECT data FROM pages WHERE page_id = ?", (page_id,))
+        return pages[0] if pages else None
+
+    def iter_pages(self, database_id: str) -> Iterator[Dict[str, Any]]:
+        """Yield every stored page of a database."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT data FROM pages WHERE database_id = ?", (_db_key(database_id),)
+            ).fetchall()
+        for row in rows:
+            yield json.loads(row[0])
+
+    def count(self, database_id: Optional[str] = None) -> int:
+        """Number of stored pages (in one database, or overall)."""
+        with self._lock:
+            if database_id:
+                return self._conn.execute(
+                    "SELECT COUNT(*) FROM pages WHERE database_id = ?", (_db_key(database_id),)
+                ).fetchone()[0]
+            return self._conn.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+_default_mirror: Optional[NotionMirror] = None
+_default_mirror_lock = threading.Lock()
+
+
+def get_notion_mirror() -> NotionMirror:
+    """
+    Get or create the shared Notion mirror.
+
+    Returns:
+        NotionMirror instance
+    """
+    global _default_mirror
+    with _default_mirror_lock:
+        if _default_mirror is None:
+            _default_mirror = NotionMirror()
+        return _default_mirror
@@ -0,0 +1,182 @@
+"""
+Notion Database Paginator
+=========================
+
+Streaming pagination for Notion database queries. Rows are yielded as soon
+as their page arrives, and the request for the next cursor is issued
+before the caller starts on the current page, so network round-trips
+overlap with the caller's per-row work.
+
+Notion cursors are sequential (page N+1's cursor comes from page N), so
+one page of lookahead is the maximum useful prefetch.
+
+Usage:
+    from shared_core.notion.paginator import iter_database_rows
+
+    for page in iter_database_rows(client, database_id, {"filter": ...}, max_rows=500):
+        process(page)
+
+    # Any fetch function: (start_cursor, page_size) -> query response
+    for page in iter_paginated(lambda cursor, size: my_query(cursor, size)):
+        ...
+
+    # asyncio
+    async for page in aiter_paginated(fetch_page, max_rows=100):
+        ...
+
+Created: 2026-10-16
+"""
+
+import asyncio
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+MAX_PAGE_SIZE = 100
+
+FetchPage = Callable[[Optional[str], int], Dict[str, Any]]
+
+
+def _next_request(response: Dict[str, Any], fetched: int, max_rows: Optional[int], page_size: int):
+    """Return (cursor, size) for the next page, or None when done."""
+    if not response.get("has_more") or not response.get("next_cursor"):
+        return None
+    size = page_size if max_rows is None else min(page_size, max_rows - fetched)
+    if size <= 0:
+        return None
+    return response["next_cursor"], size
+
+
+def iter_paginated(
+    fetch_page: FetchPage,
+    max_rows: Optional[int] = None,
+    page_size: int = MAX_PAGE_SIZE,
+    prefetch: bool = True,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield rows from a paginated Notion query.
+
+    Args:
+        fetch_page: Called with (start_cursor or None, page_size); returns
+            the raw query response (results/has_more/next_cursor)
+        max_rows: Stop after this many rows (None for all)
+        page_size: Rows per request (at most 100)
+        prefetch: Request the next page on a background thread while the
+            caller consumes the current one
+
+    Yields:
+        Page objects in query order
+    """
+    page_size = max(1, min(MAX_PAGE_SIZE, page_size))
+    if max_rows is not None:
+        if max_rows <= 0:
+            return
+        page_size = min(page_size, max_rows)
+
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="notion-prefetch") if prefetch else None
+    pending: Optional[Future] = None
+    fetched = 0
+    try:
+        response = fetch_page(None, page_size)
+        while True:
+            results = response.get("results") or []
+            if max_rows is not None:
+                results = results[:max_rows - fetched]
+            fetched += len(results)
+
+            next_request = _next_request(response, fetched, max_rows, page_size) if results else None
+            if next_request and executor is not None:
+                pending = executor.submit(fetch_page, *next_request)
+
+            for row in results:
+                yield row
+
+            if not next_request:
+                return
+            if pending is not None:
+                response, pending = pending.result(), None
+            else:
+                response = fetch_page(*next_request)
+    finally:
+        if pending is not None:
+            pending.cancel()
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+async def aiter_paginated(
+    fetch_page: FetchPage,
+    max_rows: Optional[int] = None,
+    page_size: int = MAX_PAGE_SIZE,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Async variant of ``iter_paginated``.
+
+    ``fetch_page`` is a blocking function run in the default executor; the
+    next page is requested before rows of the current page are yielded.
+    """
+    page_size = max(1, min(MAX_PAGE_SIZE, page_size))
+    if max_rows is not None:
+        if max_rows <= 0:
+            return
+        page_size = min(page_size, max_rows)
+
+    loop = asyncio.get_running_loop()
+    pending: Optional[asyncio.Future] = None
+    fetched = 0
+    try:
+        response = await loop.run_in_executor(None, fetch_page, None, page_size)
+        while True:
+            results = response.get("results") or []
+            if max_rows is not None:
+                results = results[:max_rows - fetched]
+            fetched += len(results)
+
+            next_request = _next_request(response, fetched, max_rows, page_size) if results else None
+            if next_request:
+                pending = loop.run_in_executor(None, fetch_page, *next_request)
+
+            for row in results:
+                yield row
+
+            if not next_request:
+                return
+            response, pending = await pending, None
+    finally:
+        if pending is not None:
+            pending.cancel()
+
+
+def iter_database_rows(
+    client: Any,
+    database_id: str,
+    query: Optional[Dict[str, Any]] = None,
+    max_rows: Optional[int] = None,
+    page_size: int = MAX_PAGE_SIZE,
+    prefetch: bool = True,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream rows of a database query through a ``notion_client.Client``.
+
+    Args:
+        client: notion_client.Client
+        database_id: Database to query
+        query: Query body (filter, sorts); page_size/start_cursor are managed here
+        max_rows: Stop after this many rows
+        page_size: Rows per request
+        prefetch: Overlap the next request with consumption of the current page
+
+    Yields:
+        Page objects
+    """
+    body = {k: v for k, v in (query or {}).items() if k not in ("page_size", "start_cursor")}
+
+    def fetch_page(cursor: Optional[str], size: int) -> Dict[str, Any]:
+        params = dict(body, database_id=database_id, page_size=size)
+        if cursor:
+            params["start_cursor"] = cursor
+        return client.databases.query(**params)
+
+    return iter_paginated(fetch_page, max_rows=max_rows, page_size=page_size, prefetch=prefetch)
@@ -0,0 +1,388 @@
+"""
+Notion Rate Limiter & Shared HTTP Pool
+======================================
+
+One token bucket and one connection pool for every Notion client in the
+process, so the monolith, music_workflow, the sync adapters and the queue
+manager no longer pace themselves independently (and 429 each other).
+
+Components:
+- ``TokenBucket``: thread-safe token bucket with adaptive backoff. On a
+  429 it honours ``Retry-After`` and halves its rate, then recovers
+  additively on successes. With a ``state_path`` the bucket state lives in
+  a ``fcntl``-locked file and is shared by every process using that path
+  (webhook server + cron + batch).
+- ``RateLimitedTransport``: httpx transport used by every ``notion_client``
+  client; one pooled ``httpx.HTTPTransport`` underneath.
+- ``RateLimitedAdapter``: the same for ``requests`` sessions.
+
+Configuration (environment):
+- NOTION_RATE_LIMIT: requests/second (default 3)
+- NOTION_RATE_BURST: bucket size (default 3)
+- NOTION_RATE_LIMIT_STATE_FILE: enable cross-process limiting via this file
+- NOTION_RATE_LIMIT_MAX_RETRIES: 429 retries per request (default 5)
+
+Usage:
+    from shared_core.notion.rate_limiter import create_notion_client, get_notion_http_session
+
+    notion = create_notion_client(token)      # notion_client.Client
+    session = get_notion_http_session()      # requests.Session for raw calls
+
+Created: 2026-10-16
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:  # Windows
+    FCNTL_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+NOTION_API_HOST = "api.notion.com"
+DEFAULT_RATE = 3.0
+DEFAULT_BURST = 3
+DEFAULT_MAX_RETRIES = 5
+
+
+def parse_retry_after(value: Optional[str], default: float = 1.0) -> float:
+    """Parse a Retry-After header (seconds) into a delay."""
+    try:
+        return max(0.0, float(value)) if value else default
+    except (TypeError, ValueError):
+        return default
+
+
+class TokenBucket:
+    """
+    Token bucket with AIMD rate adaptation.
+
+    Features:
+    - ``acquire()`` blocks until a token is available
+    - ``penalize(retry_after)`` pauses all callers and halves the rate
+    - ``record_success()`` restores the rate additively
+    - Optional file-backed state shared across processes
+    """
+
+    MIN_SCALE = 0.1
+    RECOVERY_STEP = 0.05
+
+    def __init__(
+        self,
+        rate: float = DEFAULT_RATE,
+        burst: int = DEFAULT_BURST,
+        state_path: Optional[Union[str, Path]] = None,
+    ):
+        """
+        Initialize the bucket.
+
+        Args:
+            rate: Tokens added per second at full speed
+            burst: Maximum tokens held
+            state_path: File shared with other processes (requires fcntl)
+        """
+        self.rate = rate
+        self.burst = burst
+        self.state_path = Path(state_path).expanduser() if state_path and FCNTL_AVAILABLE else None
+        if state_path and not FCNTL_AVAILABLE:
+            logger.warning("fcntl unavailable; Notion rate limit is per-process only")
+        if self.state_path:
+            self.state_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._state = self._initial_state()
+        self.stats = {"acquired": 0, "waited_seconds": 0.0, "throttled": 0}
+
+    def _initial_state(self) -> Dict[str, float]:
+        return {"tokens": float(self.burst), "updated": time.time(), "blocked_until": 0.0, "scale": 1.0}
+
+    # ------------------------------------------------------------------
+    # State access (in memory or in the shared file)
+    # ------------------------------------------------------------------
+
+    def _update(self, func) -> Any:
+        """Run ``func(state)`` atomically; it mutates state and returns a value."""
+        with self._lock:
+            if self.state_path is None:
+                return func(self._state)
+            with open(self.state_path, "a+") as handle:
+                fcntl.flock(handle, fcntl.LOCK_EX)
+                try:
+                    handle.seek(0)
+                    try:
+                        state = json.loads(handle.read() or "{}")
+                    except ValueError:
+                        state = {}
+                    if not state:
+                        state = self._initial_state()
+                    result = func(state)
+                    handle.seek(0)
+                    handle.truncate()
+                    handle.write(json.dumps(state))
+                    handle.flush()
+                    return result
+                finally:
+                    fcntl.flock(handle, fcntl.LOCK_UN)
+
+    def _take(self, state: Dict[str, float]) -> float:
+        """Take a token if possible; return 0 or the seconds to wait."""
+        now = time.time()
+        if now < state["blocked_until"]:
+            return state["blocked_until"] - now
+        rate = self.rate * state["scale"]
+        state["tokens"] = min(float(self.burst), state["tokens"] + (now - state["updated"]) * rate)
+        state["updated"] = now
+        if state["tokens"] >= 1.0:
+            state["tokens"] -= 1.0
+            return 0.0
+        return (1.0 - state["tokens"]) / rate
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until a token is available.
+
+        Args:
+            timeout: Give up after this many seconds
+
+        Returns:
+            True if a token was taken, False on timeout
+        """
+        deadline = None if timeout is None else time.time() + timeout
+        waited = 0.0
+        while True:
+            wait = self._update(self._take)
+            if wait <= 0:
+                self.stats["acquired"] += 1
+                self.stats["waited_seconds"] += waited
+                return True
+            if deadline is not None and time.time() + wait > deadline:
+                return False
+            time.sleep(wait)
+            waited += wait
+
+    def penalize(self, retry_after: float) -> None:
+        """Pause every caller for ``retry_after`` seconds and halve the rate."""
+        def apply(state: Dict[str, float]) -> None:
+            state["blocked_until"] = max(state["blocked_until"], time.time() + retry_after)
+            state["scale"] = max(self.MIN_SCALE, state["scale"] * 0.5)
+            state["tokens"] = 0.0
+            state["updated"] = state["blocked_until"]  # refill resumes after the pause
+        self._update(apply)
+        self.stats["throttled"] += 1
+        logger.warning(f"Notion rate limited; pausing {retry_after:.1f}s and slowing to {self.current_rate():.2f} req/s")
+
+    def record_success(self) -> None:
+        """Recover the rate additively after a successful request."""
+        if self._state["scale"] >= 1.0 and self.state_path is None:
+            return
+
+        def apply(state: Dict[str, float]) -> None:
+            state["scale"] = min(1.0, state["scale"] + self.RECOVERY_STEP)
+        self._update(apply)
+
+    def current_rate(self) -> float:
+        """Current requests/second after backoff."""
+        return self._update(lambda state: self.rate * state["scale"])
+
+
+# ----------------------------------------------------------------------
+# httpx (notion_client) side
+# ----------------------------------------------------------------------
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+if HTTPX_AVAILABLE:
+    class RateLimitedTransport(httpx.BaseTransport):
+        """
+        httpx transport that paces Notion requests through a TokenBucket.
+
+        Shared by many ``httpx.Client`` instances; closing a client does not
+        close the pool (call ``shutdown()`` for that).
+        """
+
+        def __init__(
+            self,
+            limiter: TokenBucket,
+            max_retries: int = DEFAULT_MAX_RETRIES,
+            max_connections: int = 20,
+            transport: Optional["httpx.BaseTransport"] = None,
+        ):
+            self.limiter = limiter
+            self.max_retries = max_retries
+            self._transport = transport or httpx.HTTPTransport(
+                limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+            )
+
+        def handle_request(self, request: "httpx.Request") -> "httpx.Response":
+            limited = request.url.host == NOTION_API_HOST
+            for attempt in range(self.max_retries + 1):
+                if limited:
+                    self.limiter.acquire()
+                response = self._transport.handle_request(request)
+                if not limited:
+                    return response
+                if response.status_code != 429 or attempt == self.max_retries:
+                    if response.status_code < 400:
+                        self.limiter.record_success()
+                    return response
+                response.read()
+                response.close()
+                self.limiter.penalize(parse_retry_after(response.headers.get("Retry-After"), attempt + 1.0))
+            return response
+
+        def close(self) -> None:
+            """Keep the shared pool open when one client closes."""
+
+        def shutdown(self) -> None:
+            """Close the underlying connection pool."""
+            self._transport.close()
+
+
+# ----------------------------------------------------------------------
+# requests side
+# ----------------------------------------------------------------------
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    REQUESTS_AVAILABLE = True
+except ImportError:
+    REQUESTS_AVAILABLE = False
+
+if REQUESTS_AVAILABLE:
+    class RateLimitedAdapter(HTTPAdapter):
+        """requests adapter that paces requests through a TokenBucket."""
+
+        def __init__(self, limiter: TokenBucket, max_retries_429: int = DEFAULT_MAX_RETRIES, **kwargs):
+            # 5xx retries stay in urllib3; 429s are handled here so the bucket sees them
+            kwargs.setdefault("max_retries", Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[500, 502, 503, 504],
+                allowed_methods=frozenset(["HEAD", "GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"]),
+            ))
+            kwargs.setdefault("pool_connections", 10)
+            kwargs.setdefault("pool_maxsize", 20)
+            super().__init__(**kwargs)
+            self.limiter = limiter
+            self.max_retries_429 = max_retries_429
+
+        def send(self, request, **kwargs):
+            for attempt in range(self.max_retries_429 + 1):
+                self.limiter.acquire()
+                response = super().send(request, **kwargs)
+                if response.status_code != 429 or attempt == self.max_retries_429:
+                    if response.status_code < 400:
+                        self.limiter.record_success()
+                    return response
+                response.close()
+                self.limiter.penalize(parse_retry_after(response.headers.get("Retry-After"), attempt + 1.0))
+            return response
+
+
+# ----------------------------------------------------------------------
+# Process-wide singletons
+# ----------------------------------------------------------------------
+
+_limiter: Optional[TokenBucket] = None
+_transport = None
+_session = None
+_singleton_lock = threading.Lock()
+
+
+def get_notion_rate_limiter() -> TokenBucket:
+    """
+    Get or create the process-wide Notion token bucket.
+
+    Returns:
+        TokenBucket configured from the environment
+    """
+    global _limiter
+    with _singleton_lock:
+        if _limiter is None:
+            _limiter = TokenBucket(
+                rate=float(os.getenv("NOTION_RATE_LIMIT", DEFAULT_RATE)),
+                burst=int(os.getenv("NOTION_RATE_BURST", DEFAULT_BURST)),
+                state_path=os.getenv("NOTION_RATE_LIMIT_STATE_FILE") or None,
+            )
+        return _limiter
+
+
+def get_notion_transport() -> "RateLimitedTransport":
+    """
+    Get the shared rate-limited httpx transport.
+
+    Raises:
+        ImportError: If httpx is not installed
+    """
+    global _transport
+    if not HTTPX_AVAILABLE:
+        raise ImportError("httpx is required for the shared Notion transport")
+    limiter = get_notion_rate_limiter()
+    with _singleton_lock:
+        if _transport is None:
+            _transport = RateLimitedTransport(
+                limiter, max_retries=int(os.getenv("NOTION_RATE_LIMIT_MAX_RETRIES", DEFAULT_MAX_RETRIES)),
+            )
+        return _transport
+
+
+def get_notion_http_session() -> "requests.Session":
+    """
+    Get the shared rate-limited requests session for raw Notion API calls.
+
+    Raises:
+        ImportError: If requests is not installed
+    """
+    global _session
+    if not REQUESTS_AVAILABLE:
+        raise ImportError("requests is required for the shared Notion session")
+    limiter = get_notion_rate_limiter()
+    with _singleton_lock:
+        if _session is None:
+            session = requests.Session()
+            session.mount(
+                f"https://{NOTION_API_HOST}/",
+                RateLimitedAdapter(
+                    limiter, max_retries_429=int(os.getenv("NOTION_RATE_LIMIT_MAX_RETRIES", DEFAULT_MAX_RETRIES)),
+                ),
+            )
+            _session = session
+        return _session
+
+
+def create_notion_client(token: Optional[str] = None, **options: Any):
+    """
+    Create a ``notion_client.Client`` on the shared pool and rate limiter.
+
+    Each client gets its own ``httpx.Client`` (notion_client sets auth
+    headers on it) over the one shared transport.
+
+    Args:
+        token: Notion API token
+        **options: Extra ``notion_client.ClientOptions`` fields
+
+    Returns:
+        notion_client.Client
+    """
+    from notion_client import Client
+
+    http_client = httpx.Client(transport=get_notion_transport())
+    return Client(client=http_client, auth=token, **options)
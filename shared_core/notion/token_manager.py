@@ -208,7 +208,12 @@ def get_notion_client():
             "Please set NOTION_TOKEN environment variable or create ~/.notion_token_cache"
         )
 
-    return Client(auth=token)
+    # Shared connection pool + process-wide rate limiter
+    try:
+        from shared_core.notion.rate_limiter import create_notion_client
+        return create_notion_client(token)
+    except ImportError:
+        return Client(auth=token)
 
 
 def validate_token(token: Optional[str] = None) -> bool:
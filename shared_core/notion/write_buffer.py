@@ -0,0 +1,256 @@
+"""
+Notion Page Write Buffer
+========================
+
+Per-page buffer that coalesces property patches made while one unit of
+work (e.g. one track) is processed into a single ``PATCH /pages/{id}``.
+
+Merge rules when two patches touch the same property:
+- ``multi_select``: union of option names, first-seen order kept; an
+  explicit empty list clears the property
+- ``select`` / ``status``: the option with the higher precedence wins
+  (see ``DEFAULT_STATUS_PRECEDENCE``); equal ranks and unranked options
+  fall back to last write wins, so a step that fails and is retried
+  successfully ends up Done rather than Failed
+- everything else: last write wins
+
+Usage:
+    from shared_core.notion.write_buffer import PageWriteBuffer
+
+    buffer = PageWriteBuffer(lambda page_id, props: client.pages.update(page_id, properties=props))
+
+    with buffer.collect():
+        buffer.update(page_id, {"Audio Processing": {"multi_select": [{"name": "Analyzed"}]}})
+        buffer.update(page_id, {"Tempo": {"number": 128}})
+    # one PATCH sent here, on success or on exception
+
+Created: 2026-10-16
+"""
+
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+Properties = Dict[str, Dict[str, Any]]
+
+# Higher rank wins when two patches set the same select/status property;
+# terminal statuses share a rank so the newest outcome is kept
+DEFAULT_STATUS_PRECEDENCE: Dict[str, int] = {
+    "Not Started": 0,
+    "Queued": 1,
+    "Pending": 1,
+    "In Progress": 2,
+    "Processing": 2,
+    "Done": 3,
+    "Complete": 3,
+    "Completed": 3,
+    "Failed": 3,
+    "Error": 3,
+}
+
+
+def _option_name(value: Any) -> Optional[str]:
+    if isinstance(value, dict):
+        return value.get("name")
+    return None
+
+
+def merge_property(
+    old: Dict[str, Any],
+    new: Dict[str, Any],
+    precedence: Optional[Dict[str, int]] = None,
+) -> Dict[str, Any]:
+    """
+    Merge two patch values for the same property.
+
+    Args:
+        old: Earlier staged value
+        new: Later value
+        precedence: Option name -> rank for select/status properties
+
+    Returns:
+        Merged property value
+    """
+    precedence = DEFAULT_STATUS_PRECEDENCE if precedence is None else precedence
+
+    if "multi_select" in old and "multi_select" in new:
+        if not new["multi_select"]:
+            return new
+        merged: Dict[str, Dict[str, Any]] = {}
+        for option in list(old["multi_select"]) + list(new["multi_select"]):
+            name = _option_name(option)
+            if name is not None:
+                merged.setdefault(name, option)
+        return {"multi_select": list(merged.values())}
+
+    for kind in ("status", "select"):
+        if kind in old and kind in new:
+            old_rank = precedence.get(_option_name(old[kind]) or "")
+            new_rank = precedence.get(_option_name(new[kind]) or "")
+            if old_rank is not None and new_rank is not None and new_rank < old_rank:
+                return old
+            return new
+
+    return new
+
+
+def merge_properties(
+    old: Properties,
+    new: Properties,
+    precedence: Optional[Dict[str, int]] = None,
+) -> Properties:
+    """Merge a later patch into an earlier one (neither input is modified)."""
+    merged = dict(old)
+    for name, value in new.items():
+        merged[name] = merge_property(merged[name], value, precedence) if name in merged else value
+    return merged
+
+
+class PageWriteBuffer:
+    """
+    Coalescing buffer for Notion page property writes.
+
+    Features:
+    - Patches staged for a page are merged into one request
+    - ``collect()`` scopes are per thread; pages staged inside a scope are
+      flushed when it exits, whether it exits normally or by exception
+    - Outside a scope, ``update()`` writes through immediately
+    - A failed flush re-stages its patch so a retry sends it again
+    """
+
+    def __init__(
+        self,
+        write: Callable[[str, Properties], Any],
+        precedence: Optional[Dict[str, int]] = None,
+    ):
+        """
+        Initialize the buffer.
+
+        Args:
+            write: Function sending one properties PATCH for a page
+            precedence: Option name -> rank for select/status merges
+        """
+        self._write = write
+        self.precedence = DEFAULT_STATUS_PRECEDENCE if precedence is None else precedence
+        self._pending: Dict[str, Properties] = {}
+        self._lock = threading.RLock()
+        self._local = threading.local()
+        self.stats = {"patches": 0, "requests": 0, "failures": 0}
+
+    # ------------------------------------------------------------------
+    # Scopes
+    # ------------------------------------------------------------------
+
+    @property
+    def collecting(self) -> bool:
+        """Whether the calling thread is inside a collect() scope."""
+        return getattr(self._local, "depth", 0) > 0
+
+    @contextmanager
+    def collect(self) -> Iterator["PageWriteBuffer"]:
+        """
+        Buffer writes made by this thread until the scope exits.
+
+        Nested scopes join the outermost one.
+        """
+        depth = getattr(self._local, "depth", 0)
+        if depth == 0:
+            self._local.pages = []
+        self._local.depth = depth + 1
+        try:
+            yield self
+        finally:
+            self._local.depth = depth
+            if depth == 0:
+                pages, self._local.pages = self._local.pages, []
+                for page_id in pages:
+                    try:
+                        self.flush(page_id)
+                    except Exception as e:
+                        logger.error(f"Failed to flush buffered Notion writes for {page_id}: {e}")
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def stage(self, page_id: str, properties: Properties) -> None:
+        """Merge a patch into the page's pending write without sending it."""
+        if not page_id or not properties:
+            return
+        with self._lock:
+            pending = self._pending.get(page_id)
+            self._pending[page_id] = (
+                merge_properties(pending, properties, self.precedence) if pending else dict(properties)
+            )
+            self.stats["patches"] += 1
+        pages = getattr(self._local, "pages", None)
+        if self.collecting and page_id not in pages:
+            pages.append(page_id)
+
+    def update(self, page_id: str, properties: Properties) -> Any:
+        """
+        Stage a patch; write it now unless a collect() scope is active.
+
+        Returns:
+            The write result when sent immediately, otherwise None
+        """
+        self.stage(page_id, properties)
+        if self.collecting:
+            return None
+        return self.flush(page_id)
+
+    def flush(self, page_id: str) -> Any:
+        """
+        Send the page's pending patch, if any.
+
+        Raises:
+            Whatever ``write`` raises; the patch stays pending for a retry
+        """
+        with self._lock:
+            properties = self._pending.pop(page_id, None)
+        if not properties:
+            return None
+        try:
+            result = self._write(page_id, properties)
+        except Exception:
+            with self._lock:
+                later = self._pending.get(page_id)
+                self._pending[page_id] = (
+                    merge_properties(properties, later, self.precedence) if later else properties
+                )
+                self.stats["failures"] += 1
+            raise
+        with self._lock:
+            self.stats["requests"] += 1
+        return result
+
+    def flush_all(self) -> List[str]:
+        """
+        Flush every pending page.
+
+        Returns:
+            Page IDs whose flush failed
+        """
+        with self._lock:
+            page_ids = list(self._pending)
+        failed = []
+        for page_id in page_ids:
+            try:
+                self.flush(page_id)
+            except Exception as e:
+                logger.error(f"Failed to flush buffered Notion writes for {page_id}: {e}")
+                failed.append(page_id)
+        return failed
+
+    def discard(self, page_id: str) -> None:
+        """Drop the page's pending patch."""
+        with self._lock:
+            self._pending.pop(page_id, None)
+
+    def pending(self, page_id: str) -> Properties:
+        """Copy of the page's pending patch."""
+        with self._lock:
+            return dict(self._pending.get(page_id) or {})
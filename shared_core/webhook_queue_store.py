@@ -0,0 +1,454 @@
+"""
+Durable Webhook Queue Store
+===========================
+
+Write-ahead SQLite (WAL) log of received webhooks so a restart or a crash
+mid-processing never loses queued events.
+
+Delivery model (at-least-once):
+- ``enqueue()`` commits before returning, so an event is on disk before
+  the HTTP 200 goes back to the sender. WAL + ``synchronous=NORMAL``
+  keeps that commit in the low-millisecond range.
+- ``claim()`` starts a visibility timeout for the attempt; a job whose
+  claim expires (hung or crashed worker) becomes due again.
+- ``ack()`` / ``claim()`` writes are group-committed by a background
+  flusher (every ``commit_interval`` seconds or ``commit_batch`` writes).
+  A crash can lose the last few acks, which only means a redelivery.
+- ``nack()`` schedules a retry with exponential backoff, and moves the
+  job to the dead-letter state after ``max_attempts`` failures.
+- ``due()`` returns jobs oldest first, so deferred jobs of one entity are
+  redelivered in arrival order. A retried job is not held ahead of newer
+  jobs for its entity: those may be processed while it backs off.
+
+CLI:
+    python -m shared_core.webhook_queue_store stats
+    python -m shared_core.webhook_queue_store list --state dead
+    python -m shared_core.webhook_queue_store replay --dead
+    python -m shared_core.webhook_queue_store replay --id 42 --id 43
+    python -m shared_core.webhook_queue_store purge --days 7
+
+Usage:
+    from shared_core.webhook_queue_store import get_webhook_queue_store
+
+    store = get_webhook_queue_store()
+    job_id = store.enqueue(payload, request_id=run_id)
+    store.claim(job_id)
+    store.ack(job_id)            # or store.nack(job_id, str(error))
+
+Created: 2026-10-16
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import sqlite3
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+PENDING = "pending"
+DONE = "done"
+DEAD = "dead"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS webhook_jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    request_id TEXT,
+    payload TEXT NOT NULL,
+    lane INTEGER NOT NULL DEFAULT 3,
+    entity_key TEXT,
+    coalesce_key TEXT,
+    state TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    enqueued_at REAL NOT NULL,
+    visible_at REAL NOT NULL,
+    leased_until REAL,
+    finished_at REAL,
+    last_error TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_webhook_jobs_due ON webhook_jobs(state, visible_at);
+"""
+
+
+@dataclass
+class StoredWebhook:
+    """A persisted webhook job."""
+
+    id: int
+    request_id: Optional[str]
+    payload: Dict[str, Any]
+    lane: int
+    entity_key: Optional[str]
+    coalesce_key: Optional[str]
+    state: str
+    attempts: int
+    enqueued_at: float
+    last_error: Optional[str] = None
+
+
+_COLUMNS = "id, request_id, payload, lane, entity_key, coalesce_key, state, attempts, enqueued_at, last_error"
+
+
+def _row_to_job(row: Tuple[Any, ...]) -> StoredWebhook:
+    return StoredWebhook(
+        id=row[0],
+        request_id=row[1],
+        payload=json.loads(row[2]),
+        lane=row[3],
+        entity_key=row[4],
+        coalesce_key=row[5],
+        state=row[6],
+        attempts=row[7],
+        enqueued_at=row[8],
+        last_error=row[9],
+    )
+
+
+class WebhookQueueStore:
+    """
+    SQLite-backed durable webhook queue with visibility timeouts and dead-lettering.
+    """
+
+    DEFAULT_PATH = "~/.local/share/webhook-queue/queue.sqlite3"
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        max_attempts: Optional[int] = None,
+        visibility_timeout: Optional[float] = None,
+        retry_backoff: float = 5.0,
+        commit_interval: float = 0.05,
+        commit_batch: int = 100,
+    ):
+        """
+        Initialize the store.
+
+        Args:
+            path: SQLite file path. Defaults to $WEBHOOK_QUEUE_PATH or
+                ~/.local/share/webhook-queue/queue.sqlite3
+            max_attempts: Failures before dead-lettering
+                (default: $WEBHOOK_MAX_ATTEMPTS or 5)
+            visibility_timeout: Seconds a claimed job stays invisible
+                (default: $WEBHOOK_VISIBILITY_TIMEOUT or 300)
+            retry_backoff: Base retry delay; doubles per attempt
+            commit_interval: Seconds between group commits of acks/claims
+            commit_batch: Buffered writes that trigger an early commit
+        """
+        self.path = Path(path or os.getenv("WEBHOOK_QUEUE_PATH") or self.DEFAULT_PATH).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_attempts = max_attempts or int(os.getenv("WEBHOOK_MAX_ATTEMPTS", "5"))
+        self.visibility_timeout = (
+            visibility_timeout if visibility_timeout is not None
+            else float(os.getenv("WEBHOOK_VISIBILITY_TIMEOUT", "300"))
+        )
+        self.retry_backoff = retry_backoff
+        self.commit_interval = commit_interval
+        self.commit_batch = commit_batch
+
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+        self._buffer: List[Tuple[str, Tuple[Any, ...]]] = []
+        self._flush_wakeup = threading.Event()
+        self._closed = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+
+    # ------------------------------------------------------------------
+    # Group commit
+    # ------------------------------------------------------------------
+
+    def _buffer_write(self, sql: str, params: Tuple[Any, ...]) -> None:
+        with self._lock:
+            self._buffer.append((sql, params))
+            full = len(self._buffer) >= self.commit_batch
+            if self._flusher is None or not self._flusher.is_alive():
+                self._flusher = threading.Thread(target=self._flush_loop, name="webhook-queue-commit", daemon=True)
+                self._flusher.start()
+        if full:
+            self._flush_wakeup.set()
+
+    def _drain_buffer(self) -> None:
+        """Execute buffered writes; caller holds the lock and commits."""
+        buffered, self._buffer = self._buffer, []
+        for sql, params in buffered:
+            self._conn.execute(sql, params)
+
+    def flush(self) -> None:
+        """Commit buffered acks/claims now."""
+        with self._lock:
+            if self._buffer:
+                self._drain_buffer()
+                self._conn.commit()
+
+    def _flush_loop(self) -> None:
+        while not self._closed.is_set():
+            self._flush_wakeup.wait(self.commit_interval)
+            self._flush_wakeup.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Webhook queue group commit failed: {e}")
+
+    # ------------------------------------------------------------------
+    # Queue operations
+    # ------------------------------------------------------------------
+
+    def enqueue(
+        self,
+        payload: Dict[str, Any],
+        request_id: Optional[str] = None,
+        lane: int = 3,
+        entity_key: Optional[str] = None,
+        coalesce_key: Optional[str] = None,
+    ) -> int:
+        """
+        Persist a webhook; committed before returning.
+
+        Returns:
+            Job ID
+        """
+        now = time.time()
+        data = json.dumps(payload, default=str)
+        with self._lock:
+            self._drain_buffer()
+            cursor = self._conn.execute(
+                "INSERT INTO webhook_jobs (request_id, payload, lane, entity_key, coalesce_key, state, "
+                "enqueued_at, visible_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (request_id, data, int(lane), entity_key, coalesce_key, PENDING, now, now),
+            )
+            self._conn.commit()
+            return int(cursor.lastrowid)
+
+    def claim(self, job_id: int, visibility_timeout: Optional[float] = None) -> None:
+        """Start an attempt: hide the job until the visibility timeout passes."""
+        timeout = self.visibility_timeout if visibility_timeout is None else visibility_timeout
+        self._buffer_write(
+            "UPDATE webhook_jobs SET attempts = attempts + 1, leased_until = ? WHERE id = ? AND state = ?",
+            (time.time() + timeout, job_id, PENDING),
+        )
+
+    def ack(self, job_id: int) -> None:
+        """Mark a job done (group-committed)."""
+        self._buffer_write(
+            "UPDATE webhook_jobs SET state = ?, finished_at = ?, leased_until = NULL WHERE id = ?",
+            (DONE, time.time(), job_id),
+        )
+
+    def nack(self, job_id: int, error: str = "") -> str:
+        """
+        Record a failed attempt.
+
+        Returns:
+            PENDING if the job will be retried, DEAD if it was dead-lettered
+        """
+        with self._lock:
+            self._drain_buffer()
+            row = self._conn.execute("SELECT attempts FROM webhook_jobs WHERE id = ?", (job_id,)).fetchone()
+            attempts = row[0] if row else self.max_attempts
+            now = time.time()
+            if attempts >= self.max_attempts:
+                state = DEAD
+                self._conn.execute(
+                    "UPDATE webhook_jobs SET state = ?, finished_at = ?, leased_until = NULL, last_error = ? "
+                    "WHERE id = ?",
+                    (DEAD, now, error[:2000], job_id),
+                )
+            else:
+                state = PENDING
+                delay = self.retry_backoff * (2 ** max(0, attempts - 1))
+                self._conn.execute(
+                    "UPDATE webhook_jobs SET visible_at = ?, leased_until = NULL, last_error = ? WHERE id = ?",
+                    (now + delay, error[:2000], job_id),
+                )
+            self._conn.commit()
+        return state
+
+    def release_all(self) -> int:
+        """Make every claimed job due again (call at startup by the sole consumer)."""
+        with self._lock:
+            self._drain_buffer()
+            cursor = self._conn.execute(
+                "UPDATE webhook_jobs SET leased_until = NULL WHERE state = ? AND leased_until IS NOT NULL",
+                (PENDING,),
+            )
+            self._conn.commit()
+            return cursor.rowcount
+
+    def due(self, exclude: Iterable[int] = (), limit: int = 500) -> List[StoredWebhook]:
+        """
+        Pending jobs that are visible now, oldest first.
+
+        Args:
+            exclude: Job IDs the caller already holds in memory
+            limit: Maximum jobs
+        """
+        exclude = set(exclude)
+        now = time.time()
+        with self._lock:
+            self._drain_buffer()
+            self._conn.commit()
+            rows = self._conn.execute(
+                f"SELECT {_COLUMNS} FROM webhook_jobs WHERE state = ? AND visible_at <= ? "
+                "AND (leased_until IS NULL OR leased_until < ?) ORDER BY id LIMIT ?",
+                (PENDING, now, now, limit + len(exclude)),
+            ).fetchall()
+        return [_row_to_job(row) for row in rows if row[0] not in exclude][:limit]
+
+    def expired_claims(self) -> List[int]:
+        """IDs of pending jobs whose visibility timeout has passed while claimed."""
+        with self._lock:
+            self._drain_buffer()
+            self._conn.commit()
+            return [
+                row[0] for row in self._conn.execute(
+                    "SELECT id FROM webhook_jobs WHERE state = ? AND leased_until IS NOT NULL AND leased_until < ?",
+                    (PENDING, time.time()),
+                )
+            ]
+
+    # ------------------------------------------------------------------
+    # Inspection / replay
+    # ------------------------------------------------------------------
+
+    def jobs(self, state: Optional[str] = None, limit: int = 50) -> List[StoredWebhook]:
+        """Most recent jobs, optionally filtered by state."""
+        with self._lock:
+            self._drain_buffer()
+            self._conn.commit()
+            if state:
+                rows = self._conn.execute(
+                    f"SELECT {_COLUMNS} FROM webhook_jobs WHERE state = ? ORDER BY id DESC LIMIT ?", (state, limit)
+                ).fetchall()
+            else:
+                rows = self._conn.execute(
+                    f"SELECT {_COLUMNS} FROM webhook_jobs ORDER BY id DESC LIMIT ?", (limit,)
+                ).fetchall()
+        return [_row_to_job(row) for row in rows]
+
+    def replay(self, job_ids: Optional[Iterable[int]] = None, dead: bool = False) -> int:
+        """
+        Make jobs pending again with a fresh attempt budget.
+
+        Args:
+            job_ids: Specific jobs (any state)
+            dead: Replay every dead-lettered job
+
+        Returns:
+            Number of jobs re-queued
+        """
+        now = time.time()
+        with self._lock:
+            self._drain_buffer()
+            count = 0
+            if job_ids:
+                count += self._conn.executemany(
+                    "UPDATE webhook_jobs SET state = ?, attempts = 0, visible_at = ?, leased_until = NULL, "
+                    "finished_at = NULL WHERE id = ?",
+                    [(PENDING, now, int(job_id)) for job_id in job_ids],
+                ).rowcount
+            if dead:
+                count += self._conn.execute(
+                    "UPDATE webhook_jobs SET state = ?, attempts = 0, visible_at = ?, leased_until = NULL, "
+                    "finished_at = NULL WHERE state = ?",
+                    (PENDING, now, DEAD),
+                ).rowcount
+            self._conn.commit()
+        return count
+
+    def purge(self, older_than_days: float = 7.0) -> int:
+        """Delete finished (done) jobs older than the given age."""
+        cutoff = time.time() - older_than_days * 86400
+        with self._lock:
+            self._drain_buffer()
+            cursor = self._conn.execute(
+                "DELETE FROM webhook_jobs WHERE state = ? AND finished_at < ?", (DONE, cutoff)
+            )
+            self._conn.commit()
+            return cursor.rowcount
+
+    def counts(self) -> Dict[str, int]:
+        """Job counts by state."""
+        with self._lock:
+            self._drain_buffer()
+            self._conn.commit()
+            counts = {PENDING: 0, DONE: 0, DEAD: 0}
+            for state, count in self._conn.execute("SELECT state, COUNT(*) FROM webhook_jobs GROUP BY state"):
+                counts[state] = count
+            return counts
+
+    def close(self) -> None:
+        """Commit buffered writes and close the connection."""
+        self._closed.set()
+        self._flush_wakeup.set()
+        if self._flusher is not None:
+            self._flusher.join(timeout=1)
+        with self._lock:
+            self.flush()
+            self._conn.close()
+
+
+_default_store: Optional[WebhookQueueStore] = None
+_default_store_lock = threading.Lock()
+
+
+def get_webhook_queue_store() -> WebhookQueueStore:
+    """
+    Get or create the shared durable webhook queue.
+
+    Returns:
+        WebhookQueueStore instance
+    """
+    global _default_store
+    with _default_store_lock:
+        if _default_store is None:
+            _default_store = WebhookQueueStore()
+        return _default_store
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Inspect, replay and purge the durable webhook queue."""
+    parser = argparse.ArgumentParser(description="Durable webhook queue tool")
+    parser.add_argument("action", choices=["stats", "list", "replay", "purge"])
+    parser.add_argument("--path", help="Queue database (default: $WEBHOOK_QUEUE_PATH or ~/.local/share/webhook-queue)")
+    parser.add_argument("--state", choices=[PENDING, DONE, DEAD], help="Filter for list")
+    parser.add_argument("--limit", type=int, default=50, help="Rows for list")
+    parser.add_argument("--id", type=int, action="append", dest="ids", help="Job ID to replay (repeatable)")
+    parser.add_argument("--dead", action="store_true", help="Replay all dead-lettered jobs")
+    parser.add_argument("--days", type=float, default=7.0, help="Purge done jobs older than this")
+    args = parser.parse_args(argv)
+
+    store = WebhookQueueStore(path=args.path)
+    try:
+        if args.action == "stats":
+            print(json.dumps(store.counts(), indent=2))
+        elif args.action == "list":
+            for job in store.jobs(state=args.state, limit=args.limit):
+                event = job.payload.get("type") or job.payload.get("__source") or "automation"
+                error = f"  error={job.last_error[:80]}" if job.last_error else ""
+                print(f"{job.id:>8}  {job.state:<7}  attempts={job.attempts}  {event}  {job.request_id}{error}")
+        elif args.action == "replay":
+            if not args.ids and not args.dead:
+                print("Error: --id or --dead required for replay")
+                return 1
+            print(f"Re-queued {store.replay(job_ids=args.ids, dead=args.dead)} job(s)")
+        elif args.action == "purge":
+            print(f"Purged {store.purge(args.days)} job(s)")
+    finally:
+        store.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
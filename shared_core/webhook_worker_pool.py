@@ -0,0 +1,334 @@
+"""
+Webhook Worker Pool
+===================
+
+Concurrent, priority-aware executor for webhook events.
+
+Features:
+- N worker threads instead of one serial consumer
+- Per-entity ordering: jobs sharing a key (e.g. a Notion page ID) run one at
+  a time in arrival order, while different keys run in parallel
+- Priority lanes (``WebhookLane``): a free worker always takes the oldest
+  runnable job of the most urgent lane
+- Coalescing: a job whose coalesce key matches one still queued for the same
+  entity supersedes it; the older job is dropped and the new one queued at
+  the tail, so it still runs after that entity's jobs that arrived between
+- Bounded queue: ``submit()`` rejects work once ``max_queue`` jobs are
+  waiting (control-lane jobs are always accepted) and the rejection is
+  counted, so callers can shed load / signal a retry
+
+Usage:
+    from shared_core.webhook_worker_pool import WebhookLane, WebhookWorkerPool
+
+    pool = WebhookWorkerPool(handle_item, workers=4, max_queue=1000)
+    pool.start()
+    status = pool.submit(item, lane=WebhookLane.LEGACY, key=page_id,
+                         coalesce_key=f"page.updated:{page_id}")
+    print(pool.snapshot())
+
+Created: 2026-10-16
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, Callable, Deque, Dict, Hashable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+QUEUED = "queued"
+COALESCED = "coalesced"
+REJECTED = "rejected"
+
+LATENCY_EWMA_ALPHA = 0.2
+
+
+class WebhookLane(IntEnum):
+    """Priority lanes; lower values are served first."""
+
+    CONTROL = 0  # challenge / verification handshakes
+    SCRIPT_SYNC = 1
+    WORKFLOW = 2
+    LEGACY = 3
+
+
+@dataclass
+class _Job:
+    item: Any
+    lane: WebhookLane
+    key: Hashable
+    coalesce_key: Optional[Hashable]
+    seq: int
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+class WebhookWorkerPool:
+    """
+    Thread pool executing webhook items with per-key ordering and priority lanes.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[Any], Any],
+        workers: Optional[int] = None,
+        max_queue: Optional[int] = None,
+        coalesce: bool = True,
+        on_error: Optional[Callable[[Any, BaseException], None]] = None,
+        on_coalesce: Optional[Callable[[Any, Any], None]] = None,
+        name: str = "webhook-worker",
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            handler: Called with each item on a worker thread
+            workers: Worker threads (default: $WEBHOOK_WORKERS or 4)
+            max_queue: Waiting jobs before submit() rejects
+                (default: $WEBHOOK_QUEUE_MAX or 1000)
+            coalesce: Drop a queued job that has the same key and coalesce key
+                when a newer one is submitted
+            on_error: Called with (item, exception) when the handler raises
+            on_coalesce: Called with (replaced_item, new_item) when a queued
+                item is superseded
+            name: Thread name prefix
+        """
+        self.handler = handler
+        self.workers = max(1, workers or int(os.getenv("WEBHOOK_WORKERS", "4")))
+        self.max_queue = max(1, max_queue or int(os.getenv("WEBHOOK_QUEUE_MAX", "1000")))
+        self.coalesce = coalesce
+        self.on_error = on_error
+        self.on_coalesce = on_coalesce
+        self.name = name
+
+        self._cond = threading.Condition()
+        self._pending: Dict[Hashable, Deque[_Job]] = {}
+        self._ready: List[Tuple[int, int, Hashable]] = []
+        self._active: Set[Hashable] = set()
+        self._depth: Dict[WebhookLane, int] = {lane: 0 for lane in WebhookLane}
+        self._seq = itertools.count()
+        self._threads: List[threading.Thread] = []
+        self._stopping = False
+        self.stats: Dict[str, Any] = {
+            "submitted": 0,
+            "coalesced": 0,
+            "rejected": 0,
+            "processed": 0,
+            "failed": 0,
+            "max_depth": 0,
+            "wait_ms_total": 0.0,
+            "wait_ms_max": 0.0,
+            "latency_ms": 0.0,
+        }
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    @property
+    def running(self) -> bool:
+        """Whether worker threads are running."""
+        return any(thread.is_alive() for thread in self._threads)
+
+    def start(self) -> None:
+        """Start the worker threads (no-op if already running)."""
+        with self._cond:
+            if self.running:
+                return
+            self._stopping = False
+            self._threads = [
+                threading.Thread(target=self._worker, name=f"{self.name}-{i}", daemon=True)
+                for i in range(self.workers)
+            ]
+        for thread in self._threads:
+            thread.start()
+        logger.info(f"Webhook worker pool started ({self.workers} workers, max queue {self.max_queue})")
+
+    def stop(self, timeout: float = 5.0, drain: bool = False) -> None:
+        """
+        Stop the workers.
+
+        Args:
+            timeout: Seconds to wait for all threads together
+            drain: Let workers finish queued jobs before exiting
+        """
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            if drain:
+                while self._depth_total() and time.monotonic() < deadline:
+                    self._cond.wait(deadline - time.monotonic())
+            self._stopping = True
+            self._cond.notify_all()
+        for thread in self._threads:
+            thread.join(max(0.0, deadline - time.monotonic()))
+
+    # ------------------------------------------------------------------
+    # Submission
+    # ------------------------------------------------------------------
+
+    def _depth_total(self) -> int:
+        return sum(self._depth.values())
+
+    def submit(
+        self,
+        item: Any,
+        lane: WebhookLane = WebhookLane.LEGACY,
+        key: Optional[Hashable] = None,
+        coalesce_key: Optional[Hashable] = None,
+    ) -> str:
+        """
+        Queue an item.
+
+        Args:
+            item: Passed to the handler
+            lane: Priority lane
+            key: Ordering key; items with the same key never run concurrently.
+                None gives the item its own key.
+            coalesce_key: Items with the same key and coalesce key collapse
+                into the newest one while still queued, which is queued
+                behind everything already waiting for the key
+
+        Returns:
+            QUEUED, COALESCED or REJECTED
+        """
+        lane = WebhookLane(lane)
+        with self._cond:
+            seq = next(self._seq)
+            key = ("__job__", seq) if key is None else key
+            queued = self._pending.get(key)
+
+            replaced = None
+            if self.coalesce and coalesce_key is not None and queued:
+                replaced = next((job for job in queued if job.coalesce_key == coalesce_key), None)
+
+            if replaced is not None:
+                # Queued at the tail rather than in the old job's slot, so the
+                # newest event never overtakes events that arrived in between
+                was_head = queued[0] is replaced
+                queued.remove(replaced)
+                self._depth[replaced.lane] -= 1
+                self.stats["coalesced"] += 1
+                if self.on_coalesce is not None:
+                    self.on_coalesce(replaced.item, item)
+            elif lane != WebhookLane.CONTROL and self._depth_total() >= self.max_queue:
+                self.stats["rejected"] += 1
+                return REJECTED
+            else:
+                was_head = False
+                self.stats["submitted"] += 1
+
+            job = _Job(item=item, lane=lane, key=key, coalesce_key=coalesce_key, seq=seq)
+            if queued is None:
+                queued = self._pending[key] = deque()
+            queued.append(job)
+            if (len(queued) == 1 or was_head) and key not in self._active:
+                # An entry left for a dropped head is skipped by _next_job()
+                head = queued[0]
+                heapq.heappush(self._ready, (int(head.lane), head.seq, key))
+            self._depth[lane] += 1
+            self.stats["max_depth"] = max(self.stats["max_depth"], self._depth_total())
+            self._cond.notify()
+        return COALESCED if replaced is not None else QUEUED
+
+    # ------------------------------------------------------------------
+    # Workers
+    # ------------------------------------------------------------------
+
+    def _next_job(self) -> Optional[_Job]:
+        with self._cond:
+            while True:
+                while not self._ready and not self._stopping:
+                    self._cond.wait()
+                if self._stopping:
+                    return None
+                _, seq, key = heapq.heappop(self._ready)
+                queued = self._pending.get(key)
+                # Stale entry: its job was coalesced away
+                if queued and queued[0].seq == seq:
+                    break
+            job = queued.popleft()
+            if not queued:
+                del self._pending[key]
+            self._active.add(key)
+            self._depth[job.lane] -= 1
+            waited_ms = (time.monotonic() - job.enqueued_at) * 1000
+            self.stats["wait_ms_total"] += waited_ms
+            self.stats["wait_ms_max"] = max(self.stats["wait_ms_max"], waited_ms)
+            return job
+
+    def _finish(self, job: _Job, failed: bool) -> None:
+        with self._cond:
+            self._active.discard(job.key)
+            self.stats["failed" if failed else "processed"] += 1
+            # Rolling (EWMA) enqueue-to-completion latency, reported to the coordinator
+            latency_ms = (time.monotonic() - job.enqueued_at) * 1000
+            previous = self.stats["latency_ms"]
+            self.stats["latency_ms"] = latency_ms if not previous else previous + LATENCY_EWMA_ALPHA * (latency_ms - previous)
+            queued = self._pending.get(job.key)
+            if queued:
+                head = queued[0]
+                heapq.heappush(self._ready, (int(head.lane), head.seq, job.key))
+            self._cond.notify_all()
+
+    def _worker(self) -> None:
+        while True:
+            job = self._next_job()
+            if job is None:
+                return
+            failed = False
+            try:
+                self.handler(job.item)
+            except Exception as e:
+                failed = True
+                logger.error(f"Webhook handler failed: {e}")
+                if self.on_error is not None:
+                    try:
+                        self.on_error(job.item, e)
+                    except Exception:
+                        logger.exception("Webhook on_error callback failed")
+            finally:
+                self._finish(job, failed)
+
+    # ------------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------------
+
+    def pending(self) -> int:
+        """Jobs waiting to run."""
+        with self._cond:
+            return self._depth_total()
+
+    def in_flight(self) -> int:
+        """Jobs currently running."""
+        with self._cond:
+            return len(self._active)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Queue depth, backpressure and throughput metrics."""
+        with self._cond:
+            now = time.monotonic()
+            oldest = min(
+                (queued[0].enqueued_at for queued in self._pending.values() if queued),
+                default=None,
+            )
+            done = self.stats["processed"] + self.stats["failed"]
+            depth = self._depth_total()
+            return {
+                "workers": self.workers,
+                "running": self.running,
+                "queued": depth,
+                "in_flight": len(self._active),
+                "lanes": {lane.name.lower(): count for lane, count in self._depth.items()},
+                "max_queue": self.max_queue,
+                "utilization": round(depth / self.max_queue, 3),
+                "oldest_wait_ms": round((now - oldest) * 1000, 1) if oldest is not None else 0.0,
+                "avg_wait_ms": round(self.stats["wait_ms_total"] / done, 1) if done else 0.0,
+                **{k: v for k, v in self.stats.items() if k != "wait_ms_total"},
+            }
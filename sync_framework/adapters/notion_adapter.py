@@ -6,8 +6,9 @@ Notion Destination Adapter
 Handles batch operations, rate limiting, and error handling for Notion API.
 """
 
+import threading
 import time
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any
 import logging
 
 try:
@@ -36,8 +37,11 @@ class NotionAdapter:
             rate_limit_delay: Delay between requests in seconds
         """
         self.rate_limit_delay = rate_limit_delay
+        self._shared_pool = False
         self.notion_client = self._get_notion_client(notion_token)
         self._last_request_time = 0.0
+        # Pipelined syncs write from several threads
+        self._rate_lock = threading.Lock()
     
     def _get_notion_client(self, token: Optional[str] = None) -> Optional[Client]:
         """Get Notion client."""
@@ -57,6 +61,14 @@ class NotionAdapter:
             logger.warning("No Notion token available")
             return None
         
+        try:
+            from shared_core.notion.rate_limiter import create_notion_client
+            client = create_notion_client(token)
+            self._shared_pool = True
+            return client
+        except ImportError:
+            pass
+
         try:
             return Client(auth=token)
         except Exception as e:
@@ -65,11 +77,15 @@ class NotionAdapter:
     
     def _rate_limit(self) -> None:
         """Apply rate limiting."""
-        now = time.time()
-        elapsed = now - self._last_request_time
-        if elapsed < self.rate_limit_delay:
-            time.sleep(self.rate_limit_delay - elapsed)
-        self._last_request_time = time.time()
+        if self._shared_pool:
+            # Paced by the process-wide Notion token bucket
+            return
+        with self._rate_lock:
+            now = time.time()
+            elapsed = now - self._last_request_time
+            if elapsed < self.rate_limit_delay:
+                time.sleep(self.rate_limit_delay - elapsed)
+            self._last_request_time = time.time()
     
     def create_or_update_item(
         self,
@@ -159,7 +175,10 @@ class NotionAdapter:
     
     def get_existing_items(self, item_type: str) -> List[Dict[str, Any]]:
         """
-        Get existing items from Notion (for deduplication).
+        Get all existing items from Notion (for deduplication).
+        
+        Reads every page of the item type's database; the orchestrator calls
+        this once per sync run and indexes the result.
         
         Args:
             item_type: Item type name
@@ -179,20 +198,36 @@ class NotionAdapter:
             if not database_id:
                 return []
             
-            self._rate_limit()
-            response = self.notion_client.databases.query(database_id=database_id, page_size=100)
-            
-            items = []
-            for page in response.get("results", []):
-                item = self._convert_from_notion_page(page)
-                items.append(item)
-            
-            return items
+            return [self._convert_from_notion_page(page) for page in self._iter_database_pages(database_id)]
         
         except Exception as e:
             logger.warning(f"Failed to get existing items: {e}")
             return []
     
+    def _iter_database_pages(self, database_id: str) -> Iterator[Dict[str, Any]]:
+        """Yield every page of a database query."""
+        try:
+            from shared_core.notion.paginator import iter_database_rows
+        except ImportError:
+            iter_database_rows = None
+
+        if iter_database_rows is not None and self._shared_pool:
+            # Paced by the shared token bucket, with next-page prefetch
+            yield from iter_database_rows(self.notion_client, database_id)
+            return
+
+        cursor = None
+        while True:
+            self._rate_limit()
+            params = {"database_id": database_id, "page_size": 100}
+            if cursor:
+                params["start_cursor"] = cursor
+            response = self.notion_client.databases.query(**params)
+            yield from response.get("results", [])
+            cursor = response.get("next_cursor")
+            if not response.get("has_more") or not cursor:
+                return
+
     def _convert_from_notion_page(self, page: Dict[str, Any]) -> Dict[str, Any]:
         """Convert Notion page to item dictionary."""
         item = {
@@ -9,7 +9,7 @@ Parameterized by item-type to determine matching strategy.
 
 import re
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple, Callable
+from typing import Dict, List, Optional, Any, Tuple, Callable, Union
 from dataclasses import dataclass
 import logging
 
@@ -20,6 +20,7 @@ except ImportError:
     RAPIDFUZZ_AVAILABLE = False
 
 from sync_framework.core.fingerprinting import FingerprintEngine, FileFingerprint, get_fingerprint_engine
+from sync_framework.core.destination_index import DestinationIndex, field_value
 
 logger = logging.getLogger(__name__)
 
@@ -65,6 +66,8 @@ class DeduplicationEngine:
         self.fingerprint_threshold = validation_rules.get("fingerprint_threshold", 0.95)
         self.fuzzy_threshold = validation_rules.get("fuzzy_threshold", 0.85)
         self.metadata_threshold = validation_rules.get("metadata_threshold", 0.80)
+        self.key_fields = validation_rules.get("key_fields", ["title", "name"])
+        self.primary_field = validation_rules.get("primary_field", "title")
     
     def _determine_matching_strategy(self) -> str:
         """Determine matching strategy from item-type configuration."""
@@ -88,10 +91,25 @@ class DeduplicationEngine:
         else:
             return "fuzzy_metadata"
     
+    def build_index(self, existing_items: List[Dict[str, Any]]) -> DestinationIndex:
+        """
+        Index existing items for repeated duplicate checks.
+
+        Pass the result to ``find_duplicates``/``is_duplicate`` in place of
+        the list; ``add()`` newly created items to keep it current.
+
+        Args:
+            existing_items: Existing destination items
+
+        Returns:
+            DestinationIndex over this engine's key and primary fields
+        """
+        return DestinationIndex(existing_items, fields=list(self.key_fields) + [self.primary_field])
+
     def find_duplicates(
         self,
         item: Dict[str, Any],
-        existing_items: List[Dict[str, Any]],
+        existing_items: Union[List[Dict[str, Any]], DestinationIndex],
         file_path: Optional[Path] = None
     ) -> List[DuplicateMatch]:
         """
@@ -99,31 +117,54 @@ class DeduplicationEngine:
         
         Args:
             item: Item to check for duplicates
-            existing_items: List of existing items to check against
+            existing_items: Existing items to check against, as a list or a
+                DestinationIndex from ``build_index``. With an index only
+                candidates sharing a fingerprint, file path or (fuzzy) key
+                field value are scored.
             file_path: Optional file path for fingerprint matching
             
         Returns:
             List of DuplicateMatch objects sorted by similarity
         """
         matches = []
+        index = existing_items if isinstance(existing_items, DestinationIndex) else None
         
         # Strategy 1: Exact hash match (if fingerprint available)
         if file_path:
             fingerprint = self.fingerprint_engine.compute_fingerprint(
                 file_path, self.item_type
             )
+            candidates = (
+                index.fingerprint_candidates(fingerprint.hash, file_path)
+                if index is not None else existing_items
+            )
             fingerprint_matches = self._find_fingerprint_matches(
-                fingerprint, existing_items, file_path
+                fingerprint, candidates, file_path
             )
             matches.extend(fingerprint_matches)
         
         # Strategy 2: Metadata matching (title, name, etc.)
-        metadata_matches = self._find_metadata_matches(item, existing_items)
+        if index is not None:
+            # A weighted average can only reach the threshold if one field does
+            candidates = index.value_candidates(
+                {field: field_value(item, field) for field in self.key_fields},
+                self.metadata_threshold
+            )
+        else:
+            candidates = existing_items
+        metadata_matches = self._find_metadata_matches(item, candidates)
         matches.extend(metadata_matches)
         
         # Strategy 3: Fuzzy matching (if enabled)
         if self.matching_strategy in ["fuzzy_metadata", "audio_fingerprint"]:
-            fuzzy_matches = self._find_fuzzy_matches(item, existing_items)
+            candidates = (
+                index.value_candidates(
+                    {self.primary_field: field_value(item, self.primary_field)},
+                    self.fuzzy_threshold
+                )
+                if index is not None else existing_items
+            )
+            fuzzy_matches = self._find_fuzzy_matches(item, candidates)
             matches.extend(fuzzy_matches)
         
         # Remove duplicates and sort by similarity
@@ -187,9 +228,7 @@ class DeduplicationEngine:
         matches = []
         
         # Get key fields for matching (from item-type config or defaults)
-        key_fields = self.item_type_config.get("validation_rules", {}).get(
-            "key_fields", ["title", "name"]
-        )
+        key_fields = self.key_fields
         
         item_values = {}
         for field in key_fields:
@@ -238,9 +277,7 @@ class DeduplicationEngine:
         matches = []
         
         # Get primary field for fuzzy matching
-        primary_field = self.item_type_config.get("validation_rules", {}).get(
-            "primary_field", "title"
-        )
+        primary_field = self.primary_field
         
         item_value = item.get(primary_field) or item.get(primary_field.replace("_", "-"))
         if not item_value:
@@ -383,7 +420,7 @@ class DeduplicationEngine:
     def is_duplicate(
         self,
         item: Dict[str, Any],
-        existing_items: List[Dict[str, Any]],
+        existing_items: Union[List[Dict[str, Any]], DestinationIndex],
         file_path: Optional[Path] = None
     ) -> Tuple[bool, Optional[DuplicateMatch]]:
         """
@@ -391,7 +428,7 @@ class DeduplicationEngine:
         
         Args:
             item: Item to check
-            existing_items: Existing items to check against
+            existing_items: Existing items (list or DestinationIndex) to check against
             file_path: Optional file path for fingerprinting
             
         Returns:
@@ -414,3 +451,4 @@ class DeduplicationEngine:
             is_dup = best_match.similarity_score >= self.fuzzy_threshold
         
         return is_dup, best_match if is_dup else None
+
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Destination Index
+=================
+
+In-memory index of the items already in a sync destination, loaded once per
+run so deduplication no longer re-queries the destination for every item.
+
+Items are indexed by fingerprint, by normalized key-field value (title,
+name, ...) and by normalized file path. Exact lookups are dict probes; fuzzy
+candidates for a field come from one ``rapidfuzz.process.extract`` call over
+that field's values instead of a Python loop over every item.
+"""
+
+import os
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set
+import logging
+
+try:
+    from rapidfuzz import fuzz, process
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+def field_value(item: Dict[str, Any], field: str) -> Optional[str]:
+    """Normalized value of a key field, accepting ``a_b`` or ``a-b`` keys."""
+    value = item.get(field) or item.get(field.replace("_", "-"))
+    if not value:
+        return None
+    return str(value).lower().strip()
+
+
+def normalize_path(path: Any) -> str:
+    """Normalized absolute path used as an index key."""
+    return os.path.normcase(os.path.abspath(os.path.expanduser(str(path))))
+
+
+class DestinationIndex:
+    """
+    Index of existing destination items for deduplication lookups.
+
+    Positions are insertion order, and every lookup returns items in that
+    order, so match scoring sees candidates in the same order as a scan of
+    the original list.
+    """
+
+    def __init__(
+        self,
+        items: Optional[Iterable[Dict[str, Any]]] = None,
+        fields: Sequence[str] = ("title", "name")
+    ):
+        """
+        Build the index.
+
+        Args:
+            items: Existing destination items
+            fields: Fields to index by normalized value
+        """
+        self.fields = list(dict.fromkeys(fields))
+        self._items: List[Dict[str, Any]] = []
+        self._by_fingerprint: Dict[str, List[int]] = {}
+        self._by_path: Dict[str, List[int]] = {}
+        self._by_value: Dict[str, Dict[str, List[int]]] = {field: {} for field in self.fields}
+        # Parallel (value, position) lists per field for fuzzy extraction
+        self._values: Dict[str, List[str]] = {field: [] for field in self.fields}
+        self._value_positions: Dict[str, List[int]] = {field: [] for field in self.fields}
+        self._discarded: Set[int] = set()
+
+        for item in items or ():
+            self.add(item)
+
+    def __len__(self) -> int:
+        return len(self._items) - len(self._discarded)
+
+    @property
+    def items(self) -> List[Dict[str, Any]]:
+        """All indexed items in insertion order."""
+        return [item for pos, item in enumerate(self._items) if pos not in self._discarded]
+
+    def add(self, item: Dict[str, Any]) -> int:
+        """
+        Index one item (e.g. one just created in the destination).
+
+        Returns:
+            The item's position, for ``discard``
+        """
+        pos = len(self._items)
+        self._items.append(item)
+
+        for key in ("fingerprint", "fingerprint_hash"):
+            fingerprint = item.get(key)
+            if fingerprint:
+                positions = self._by_fingerprint.setdefault(str(fingerprint), [])
+                if not positions or positions[-1] != pos:
+                    positions.append(pos)
+
+        path = item.get("file_path") or item.get("path")
+        if path:
+            self._by_path.setdefault(normalize_path(path), []).append(pos)
+
+        for field in self.fields:
+            value = field_value(item, field)
+            if value:
+                self._by_value[field].setdefault(value, []).append(pos)
+                self._values[field].append(value)
+                self._value_positions[field].append(pos)
+
+        return pos
+
+    def discard(self, position: int) -> None:
+        """Stop returning the item at ``position`` (e.g. its write failed)."""
+        self._discarded.add(position)
+
+    def _resolve(self, positions: Iterable[int]) -> List[Dict[str, Any]]:
+        return [self._items[pos] for pos in sorted(set(positions) - self._discarded)]
+
+    def fingerprint_candidates(
+        self,
+        fingerprint: Optional[str],
+        file_path: Optional[Any] = None
+    ) -> List[Dict[str, Any]]:
+        """Items with the same stored fingerprint or the same file path."""
+        positions: List[int] = []
+        if fingerprint:
+            positions.extend(self._by_fingerprint.get(str(fingerprint), ()))
+        if file_path:
+            positions.extend(self._by_path.get(normalize_path(file_path), ()))
+        return self._resolve(positions)
+
+    def value_candidates(
+        self,
+        values: Dict[str, Optional[str]],
+        min_similarity: float = 1.0
+    ) -> List[Dict[str, Any]]:
+        """
+        Items whose value for any of ``values``' fields may score at least
+        ``min_similarity`` against the given value.
+
+        Exact matches are a dict probe. Below 1.0, ``rapidfuzz`` ratio
+        candidates are added; without rapidfuzz every item with a value is
+        returned so the caller's scorer still sees them all.
+
+        Args:
+            values: Field name -> normalized value to look up
+            min_similarity: Lowest ratio (0-1) worth returning
+
+        Returns:
+            Candidate items in insertion order
+        """
+        positions: List[int] = []
+        for field, value in values.items():
+            if not value or field not in self._by_value:
+                continue
+            positions.extend(self._by_value[field].get(value, ()))
+            if min_similarity >= 1.0:
+                continue
+            if RAPIDFUZZ_AVAILABLE:
+                for _, _, idx in process.extract(
+                    value,
+                    self._values[field],
+                    scorer=fuzz.ratio,
+                    # Slack for float error, e.g. 0.85 * 100 > 85.0
+                    score_cutoff=min_similarity * 100 - 1e-6,
+                    limit=None,
+                ):
+                    positions.append(self._value_positions[field][idx])
+            else:
+                positions.extend(self._value_positions[field])
+        return self._resolve(positions)
@@ -8,6 +8,11 @@ Provides comprehensive file verification including:
 - File integrity/corruption detection
 - File path resolution and validation
 - Batch verification with detailed reporting
+- Verification levels (stat-only, header signature, full hash)
+- Parallel batch checks on a thread pool sized for the storage type
+  (network mounts are latency bound and get more threads)
+- Persistent (path, size, mtime) -> last result cache, so unchanged files
+  are not re-read across runs
 
 This module ensures all sync operations work with verified, non-corrupt files.
 
@@ -17,20 +22,32 @@ Version: 2026-01-18
 import hashlib
 import logging
 import os
+import re
+import sqlite3
+import stat as stat_module
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple, Set
+from typing import Callable, Dict, Iterable, List, Optional, Any, Tuple, Set, TypeVar, Union
 
 __all__ = [
     "FileStatus",
+    "VerificationLevel",
     "FileVerificationResult",
     "BatchVerificationReport",
+    "VerificationCache",
     "FileVerifier",
     "EagleFileVerifier",
     "get_eagle_file_verifier",
     "reset_eagle_file_verifier",
     "verify_eagle_library_integrity",
+    "storage_type",
+    "default_verify_workers",
     "FILE_SIGNATURES",
     "MIN_FILE_SIZES",
     "COMPOUND_SIGNATURES",
@@ -38,6 +55,24 @@ __all__ = [
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+R = TypeVar("R")
+
+DEFAULT_HASH_BUFFER_SIZE = 1024 * 1024
+
+# Threads per batch by storage type; network mounts spend most of each
+# check waiting on round trips, so more requests in flight pay off
+STORAGE_WORKERS = {"network": 32, "local": 8}
+
+NETWORK_FILESYSTEMS = {
+    "nfs", "nfs4", "smbfs", "cifs", "smb3", "afpfs", "webdav", "davfs",
+    "sshfs", "fuse.sshfs", "fuse.rclone", "9p", "ceph", "glusterfs",
+}
+
+_thread_buffers = threading.local()
+
+_HASH_FAILED = "Failed to compute hash"
+
 
 class FileStatus(Enum):
     """Status of a file after verification."""
@@ -49,6 +84,20 @@ class FileStatus(Enum):
     UNKNOWN = "unknown"
 
 
+class VerificationLevel(Enum):
+    """How much of a file is read to verify it. Each level includes the ones before."""
+    STAT = "stat"            # existence, type, readability, size
+    HEADER = "header"        # + magic-byte signature
+    FULL_HASH = "full_hash"  # + content hash of the whole file
+
+    @property
+    def rank(self) -> int:
+        return _LEVEL_RANKS[self]
+
+
+_LEVEL_RANKS = {VerificationLevel.STAT: 0, VerificationLevel.HEADER: 1, VerificationLevel.FULL_HASH: 2}
+
+
 @dataclass
 class FileVerificationResult:
     """Result of file verification."""
@@ -58,6 +107,8 @@ class FileVerificationResult:
     error_message: Optional[str] = None
     content_hash: Optional[str] = None
     header_valid: bool = True
+    # True when reused from the verification cache
+    cached: bool = False
 
     @property
     def is_valid(self) -> bool:
@@ -79,6 +130,7 @@ class BatchVerificationReport:
     corrupt_count: int = 0
     empty_count: int = 0
     inaccessible_count: int = 0
+    cached_count: int = 0
     results: Dict[str, FileVerificationResult] = field(default_factory=dict)
     missing_items: List[Dict[str, Any]] = field(default_factory=list)
     corrupt_items: List[Dict[str, Any]] = field(default_factory=list)
@@ -95,6 +147,27 @@ class BatchVerificationReport:
         """Check if there are any file issues."""
         return self.missing_count > 0 or self.corrupt_count > 0
 
+    def record(self, item_id: str, item: Dict[str, Any], result: FileVerificationResult) -> None:
+        """Add one item's verification result to the counts."""
+        self.results[item_id] = result
+        if result.cached:
+            self.cached_count += 1
+
+        if result.status == FileStatus.VALID:
+            self.valid_count += 1
+        elif result.status == FileStatus.MISSING:
+            self.missing_count += 1
+            self.missing_items.append(item)
+        elif result.status == FileStatus.CORRUPT:
+            self.corrupt_count += 1
+            self.corrupt_items.append(item)
+        elif result.status == FileStatus.EMPTY:
+            self.empty_count += 1
+            self.corrupt_items.append(item)  # Treat empty as corrupt
+        elif result.status == FileStatus.INACCESSIBLE:
+            self.inaccessible_count += 1
+            self.missing_items.append(item)  # Treat inaccessible as missing
+
     def summary(self) -> str:
         """Generate human-readable summary."""
         lines = [
@@ -106,6 +179,7 @@ class BatchVerificationReport:
             f"Corrupt: {self.corrupt_count}",
             f"Empty: {self.empty_count}",
             f"Inaccessible: {self.inaccessible_count}",
+            f"From cache: {self.cached_count}",
         ]
         return "\n".join(lines)
 
@@ -195,6 +269,167 @@ MIN_FILE_SIZES = {
 }
 
 
+@lru_cache(maxsize=1)
+def _mount_table() -> Tuple[Tuple[str, str], ...]:
+    """(mount point, filesystem type) pairs, longest mount point first."""
+    mounts: List[Tuple[str, str]] = []
+    try:
+        with open("/proc/self/mounts") as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) >= 3:
+                    mounts.append((parts[1].replace("\\040", " "), parts[2]))
+    except OSError:
+        # macOS: "//user@nas/share on /Volumes/share (smbfs, nodev, ...)"
+        try:
+            output = subprocess.run(["mount"], capture_output=True, text=True, timeout=5).stdout
+        except (OSError, subprocess.SubprocessError):
+            output = ""
+        for line in output.splitlines():
+            match = re.match(r".+? on (.+) \(([^,)]+)", line)
+            if match:
+                mounts.append((match.group(1), match.group(2)))
+    return tuple(sorted(mounts, key=lambda mount: len(mount[0]), reverse=True))
+
+
+def storage_type(path: Union[str, Path]) -> str:
+    """Return "network" or "local" for the filesystem holding ``path``."""
+    path = os.path.abspath(os.path.expanduser(str(path)))
+    for mount_point, fs_type in _mount_table():
+        if path == mount_point or path.startswith(mount_point.rstrip("/") + "/"):
+            return "network" if fs_type.lower() in NETWORK_FILESYSTEMS else "local"
+    return "local"
+
+
+def default_verify_workers(path: Optional[Union[str, Path]] = None) -> int:
+    """Batch verification threads: $FILE_VERIFY_WORKERS, else by storage type."""
+    env = os.getenv("FILE_VERIFY_WORKERS")
+    if env:
+        return max(1, int(env))
+    return STORAGE_WORKERS[storage_type(path) if path else "local"]
+
+
+def _map_ordered(fn: Callable[[T], R], args: List[T], workers: int) -> Iterable[R]:
+    """``map`` on a thread pool (results in input order), inline for one worker."""
+    if workers <= 1 or len(args) <= 1:
+        yield from map(fn, args)
+        return
+    with ThreadPoolExecutor(max_workers=min(workers, len(args)), thread_name_prefix="file-verify") as executor:
+        yield from executor.map(fn, args)
+
+
+_CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS file_verifications (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    level TEXT NOT NULL,
+    min_size_check INTEGER NOT NULL DEFAULT 0,
+    status TEXT NOT NULL,
+    error_message TEXT,
+    content_hash TEXT,
+    header_valid INTEGER NOT NULL,
+    verified_at REAL NOT NULL
+);
+"""
+
+# (path, size, mtime_ns, level, min_size_check, result)
+CacheEntry = Tuple[str, int, int, VerificationLevel, bool, FileVerificationResult]
+
+
+class VerificationCache:
+    """
+    Persisted (path, size, mtime) -> last verification result.
+
+    An entry answers a check while the file's size and mtime (ns) match the
+    recorded values, it was verified at the requested level or deeper, and
+    with the same ``min_size_check`` setting (the cache file is shared by
+    all verifiers).
+    """
+
+    DEFAULT_PATH = "~/.local/share/sync-framework/file_verification.sqlite3"
+
+    def __init__(self, path: Optional[Union[str, Path]] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            path: SQLite file path. Defaults to $FILE_VERIFICATION_CACHE_PATH or
+                ~/.local/share/sync-framework/file_verification.sqlite3
+        """
+        self.path = Path(path or os.getenv("FILE_VERIFICATION_CACHE_PATH") or self.DEFAULT_PATH).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_CACHE_SCHEMA)
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(file_verifications)")}
+        if "min_size_check" not in columns:
+            # Caches written before the option was recorded; their rows are
+            # re-verified by verifiers that check minimum sizes.
+            self._conn.execute(
+                "ALTER TABLE file_verifications ADD COLUMN min_size_check INTEGER NOT NULL DEFAULT 0"
+            )
+        self._conn.commit()
+
+    def lookup(
+        self,
+        path: Path,
+        size: int,
+        mtime_ns: int,
+        level: VerificationLevel,
+        min_size_check: bool = True
+    ) -> Optional[FileVerificationResult]:
+        """Return the cached result if the file is unchanged and was checked deeply enough."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT size, mtime_ns, level, min_size_check, status, error_message, content_hash, "
+                "header_valid FROM file_verifications WHERE path = ?",
+                (str(path),),
+            ).fetchone()
+        if row is None or (row[0], row[1]) != (size, mtime_ns):
+            return None
+        if VerificationLevel(row[2]).rank < level.rank or bool(row[3]) != min_size_check:
+            return None
+        return FileVerificationResult(
+            path=path,
+            status=FileStatus(row[4]),
+            size=size,
+            error_message=row[5],
+            content_hash=row[6],
+            header_valid=bool(row[7]),
+            cached=True,
+        )
+
+    def record_many(self, entries: Iterable[CacheEntry]) -> None:
+        """Store fresh results."""
+        now = time.time()
+        rows = [
+            (str(path), size, mtime_ns, level.value, int(min_size_check), result.status.value,
+             result.error_message, result.content_hash, int(result.header_valid), now)
+            for path, size, mtime_ns, level, min_size_check, result in entries
+        ]
+        if not rows:
+            return
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO file_verifications (path, size, mtime_ns, level, min_size_check, "
+                "status, error_message, content_hash, header_valid, verified_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.commit()
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM file_verifications").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
 class FileVerifier:
     """
     Comprehensive file verification system.
@@ -206,7 +441,11 @@ class FileVerifier:
         self,
         check_headers: bool = True,
         compute_hash: bool = False,
-        min_size_check: bool = True
+        min_size_check: bool = True,
+        level: Optional[VerificationLevel] = None,
+        workers: Optional[int] = None,
+        cache: Union[bool, VerificationCache, None] = None,
+        hash_buffer_size: int = DEFAULT_HASH_BUFFER_SIZE
     ):
         """
         Initialize file verifier.
@@ -215,10 +454,35 @@ class FileVerifier:
             check_headers: Whether to verify file headers/magic bytes
             compute_hash: Whether to compute content hash (slower but more thorough)
             min_size_check: Whether to check minimum file sizes
+            level: Verification level; overrides check_headers/compute_hash
+            workers: Threads for batch verification (default: by storage type,
+                see default_verify_workers)
+            cache: VerificationCache, True for the default cache, False for
+                none (default: a cache only if $FILE_VERIFICATION_CACHE_PATH is set)
+            hash_buffer_size: Read size for content hashing
         """
+        if level is not None:
+            check_headers = level.rank >= VerificationLevel.HEADER.rank
+            compute_hash = level == VerificationLevel.FULL_HASH
+        elif compute_hash:
+            level = VerificationLevel.FULL_HASH
+        elif check_headers:
+            level = VerificationLevel.HEADER
+        else:
+            level = VerificationLevel.STAT
+
+        self.level = level
         self.check_headers = check_headers
         self.compute_hash = compute_hash
         self.min_size_check = min_size_check
+        self.workers = workers
+        self.hash_buffer_size = hash_buffer_size
+
+        if cache is None:
+            cache = bool(os.getenv("FILE_VERIFICATION_CACHE_PATH"))
+        if cache is True:
+            cache = VerificationCache()
+        self.cache: Optional[VerificationCache] = cache or None
 
     def verify_file(self, file_path: Optional[Path]) -> FileVerificationResult:
         """
@@ -230,37 +494,55 @@ class FileVerifier:
         Returns:
             FileVerificationResult with status and details
         """
+        result, entry = self._verify(file_path)
+        if entry and self.cache:
+            self.cache.record_many([entry])
+        return result
+
+    def _verify(
+        self,
+        file_path: Optional[Path]
+    ) -> Tuple[FileVerificationResult, Optional[CacheEntry]]:
+        """Verify a file; also return a cache entry for a fresh, cacheable result."""
         if file_path is None:
             return FileVerificationResult(
                 path=None,
                 status=FileStatus.MISSING,
                 error_message="No file path provided"
-            )
+            ), None
 
         path = Path(file_path) if not isinstance(file_path, Path) else file_path
 
-        # Check existence (handles broken symlinks correctly)
-        if not path.exists():
+        # One stat for existence, type and size (follows symlinks)
+        try:
+            st = path.stat()
+        except (FileNotFoundError, NotADirectoryError):
             # Check if it's a broken symlink
             if path.is_symlink():
                 return FileVerificationResult(
                     path=path,
                     status=FileStatus.MISSING,
                     error_message=f"Broken symlink: {path}"
-                )
+                ), None
             return FileVerificationResult(
                 path=path,
                 status=FileStatus.MISSING,
                 error_message=f"File does not exist: {path}"
-            )
+            ), None
+        except OSError as e:
+            return FileVerificationResult(
+                path=path,
+                status=FileStatus.INACCESSIBLE,
+                error_message=f"Cannot stat file: {e}"
+            ), None
 
         # Check if it's a regular file (not directory, etc.)
-        if not path.is_file():
+        if not stat_module.S_ISREG(st.st_mode):
             return FileVerificationResult(
                 path=path,
                 status=FileStatus.CORRUPT,
                 error_message=f"Not a regular file: {path}"
-            )
+            ), None
 
         # Check if accessible
         if not os.access(path, os.R_OK):
@@ -268,18 +550,24 @@ class FileVerifier:
                 path=path,
                 status=FileStatus.INACCESSIBLE,
                 error_message=f"File is not readable: {path}"
-            )
+            ), None
 
-        # Get file size
-        try:
-            file_size = path.stat().st_size
-        except OSError as e:
-            return FileVerificationResult(
-                path=path,
-                status=FileStatus.INACCESSIBLE,
-                error_message=f"Cannot stat file: {e}"
-            )
+        file_size = st.st_size
+        if self.cache:
+            cached = self.cache.lookup(path, file_size, st.st_mtime_ns, self.level, self.min_size_check)
+            if cached is not None:
+                return cached, None
 
+        result = self._verify_contents(path, file_size)
+
+        # Header mismatches and hash failures may be transient read errors
+        # (e.g. a dropped network mount), so only stable outcomes are cached
+        cacheable = result.header_valid and not (result.error_message or "").startswith(_HASH_FAILED)
+        entry = (path, file_size, st.st_mtime_ns, self.level, self.min_size_check, result) if cacheable else None
+        return result, entry
+
+    def _verify_contents(self, path: Path, file_size: int) -> FileVerificationResult:
+        """Size, header and hash checks for an existing, readable regular file."""
         # Check for empty file
         if file_size == 0:
             return FileVerificationResult(
@@ -324,7 +612,7 @@ class FileVerifier:
                     path=path,
                     status=FileStatus.CORRUPT,
                     size=file_size,
-                    error_message=f"Failed to compute hash: {e}"
+                    error_message=f"{_HASH_FAILED}: {e}"
                 )
 
         # File is valid
@@ -418,6 +706,9 @@ class FileVerifier:
         """
         Compute content hash of file.
 
+        Reads into one reusable per-thread buffer of ``hash_buffer_size``
+        bytes; large reads keep round trips down on network mounts.
+
         Args:
             path: Path to file
             algorithm: Hash algorithm to use
@@ -425,14 +716,30 @@ class FileVerifier:
         Returns:
             Hex digest of hash
         """
+        buffer = getattr(_thread_buffers, "buffer", None)
+        if buffer is None or len(buffer) != self.hash_buffer_size:
+            buffer = _thread_buffers.buffer = bytearray(self.hash_buffer_size)
+        view = memoryview(buffer)
+
         hasher = hashlib.new(algorithm)
 
-        with open(path, "rb") as f:
-            while chunk := f.read(8192):
-                hasher.update(chunk)
+        with open(path, "rb", buffering=0) as f:
+            while read := f.readinto(buffer):
+                hasher.update(view[:read])
 
         return hasher.hexdigest()
 
+    def _batch_workers(self, sample_path: Optional[Any]) -> int:
+        if self.workers is not None:
+            return max(1, self.workers)
+        return default_verify_workers(sample_path)
+
+    def _record_cache_entries(self, entries: List[CacheEntry], flush: bool = False) -> None:
+        """Write pending cache entries every 500, so an interrupted batch keeps its progress."""
+        if self.cache and entries and (flush or len(entries) >= 500):
+            self.cache.record_many(entries)
+            entries.clear()
+
     def verify_batch(
         self,
         items: List[Dict[str, Any]],
@@ -442,6 +749,9 @@ class FileVerifier:
         """
         Verify multiple items in batch.
 
+        Files are checked on a thread pool (see ``workers``); results are
+        recorded in item order.
+
         Args:
             items: List of item dictionaries
             path_key: Key for file path in item dict
@@ -452,32 +762,19 @@ class FileVerifier:
         """
         report = BatchVerificationReport(total_items=len(items))
 
+        paths = []
         for item in items:
-            item_id = item.get(id_key, "unknown")
             file_path = item.get(path_key) or item.get("path")
+            paths.append(Path(file_path) if file_path else None)
 
-            if file_path:
-                path = Path(file_path)
-            else:
-                path = None
-
-            result = self.verify_file(path)
-            report.results[item_id] = result
-
-            if result.status == FileStatus.VALID:
-                report.valid_count += 1
-            elif result.status == FileStatus.MISSING:
-                report.missing_count += 1
-                report.missing_items.append(item)
-            elif result.status == FileStatus.CORRUPT:
-                report.corrupt_count += 1
-                report.corrupt_items.append(item)
-            elif result.status == FileStatus.EMPTY:
-                report.empty_count += 1
-                report.corrupt_items.append(item)  # Treat empty as corrupt
-            elif result.status == FileStatus.INACCESSIBLE:
-                report.inaccessible_count += 1
-                report.missing_items.append(item)  # Treat inaccessible as missing
+        sample = next((path for path in paths if path is not None), None)
+        entries: List[CacheEntry] = []
+        for item, (result, entry) in zip(items, _map_ordered(self._verify, paths, self._batch_workers(sample))):
+            report.record(item.get(id_key, "unknown"), item, result)
+            if entry:
+                entries.append(entry)
+                self._record_cache_entries(entries)
+        self._record_cache_entries(entries, flush=True)
 
         return report
 
@@ -495,7 +792,8 @@ class EagleFileVerifier(FileVerifier):
         library_path: Optional[Path] = None,
         check_headers: bool = True,
         compute_hash: bool = False,
-        min_size_check: bool = True
+        min_size_check: bool = True,
+        **kwargs: Any
     ):
         """
         Initialize Eagle file verifier.
@@ -505,8 +803,9 @@ class EagleFileVerifier(FileVerifier):
             check_headers: Whether to verify file headers
             compute_hash: Whether to compute content hash
             min_size_check: Whether to check minimum file sizes
+            **kwargs: level, workers, cache, hash_buffer_size (see FileVerifier)
         """
-        super().__init__(check_headers, compute_hash, min_size_check)
+        super().__init__(check_headers, compute_hash, min_size_check, **kwargs)
         self._library_path = library_path
         self._path_cache: Dict[str, Optional[Path]] = {}
 
@@ -642,6 +941,15 @@ class EagleFileVerifier(FileVerifier):
         Returns:
             Tuple of (verification result, resolved path)
         """
+        result, resolved_path, entry = self._verify_eagle_item(item)
+        if entry and self.cache:
+            self.cache.record_many([entry])
+        return result, resolved_path
+
+    def _verify_eagle_item(
+        self,
+        item: Dict[str, Any]
+    ) -> Tuple[FileVerificationResult, Optional[Path], Optional[CacheEntry]]:
         item_id = item.get("id", "")
         ext = item.get("ext", "")
         name = item.get("name", "")
@@ -651,21 +959,21 @@ class EagleFileVerifier(FileVerifier):
         if existing_path:
             path = Path(existing_path)
             if path.exists():
-                result = self.verify_file(path)
-                return result, path
+                result, entry = self._verify(path)
+                return result, path, entry
 
         # Resolve path from Eagle structure
         resolved_path = self.resolve_eagle_path(item_id, ext, name)
         if resolved_path:
-            result = self.verify_file(resolved_path)
-            return result, resolved_path
+            result, entry = self._verify(resolved_path)
+            return result, resolved_path, entry
 
         # Could not resolve path
         return FileVerificationResult(
             path=None,
             status=FileStatus.MISSING,
             error_message=f"Cannot resolve path for item {item_id}"
-        ), None
+        ), None, None
 
     def verify_eagle_items(
         self,
@@ -674,6 +982,9 @@ class EagleFileVerifier(FileVerifier):
         """
         Verify multiple Eagle items with path resolution.
 
+        Path resolution and checks run on a thread pool sized for the
+        library's storage (see ``workers``).
+
         Args:
             items: List of Eagle item dictionaries
 
@@ -681,35 +992,23 @@ class EagleFileVerifier(FileVerifier):
             BatchVerificationReport with results and resolved paths
         """
         report = BatchVerificationReport(total_items=len(items))
-        resolved_paths: Dict[str, Optional[Path]] = {}
-
-        for item in items:
-            item_id = item.get("id", "unknown")
-
-            result, resolved_path = self.verify_eagle_item(item)
-            report.results[item_id] = result
-            resolved_paths[item_id] = resolved_path
+        workers = self._batch_workers(self.library_path)
+        entries: List[CacheEntry] = []
 
+        for item, (result, resolved_path, entry) in zip(
+            items, _map_ordered(self._verify_eagle_item, items, workers)
+        ):
             # Update item with resolved path for downstream use
             if resolved_path:
                 item["_resolved_path"] = str(resolved_path)
                 item["file_path"] = str(resolved_path)
                 item["path"] = str(resolved_path)
 
-            if result.status == FileStatus.VALID:
-                report.valid_count += 1
-            elif result.status == FileStatus.MISSING:
-                report.missing_count += 1
-                report.missing_items.append(item)
-            elif result.status == FileStatus.CORRUPT:
-                report.corrupt_count += 1
-                report.corrupt_items.append(item)
-            elif result.status == FileStatus.EMPTY:
-                report.empty_count += 1
-                report.corrupt_items.append(item)
-            elif result.status == FileStatus.INACCESSIBLE:
-                report.inaccessible_count += 1
-                report.missing_items.append(item)
+            report.record(item.get("id", "unknown"), item, result)
+            if entry:
+                entries.append(entry)
+                self._record_cache_entries(entries)
+        self._record_cache_entries(entries, flush=True)
 
         logger.info(report.summary())
 
@@ -748,6 +1047,8 @@ def get_eagle_file_verifier(
     )
 
     if needs_new_instance:
+        # The result cache stays opt-in ($FILE_VERIFICATION_CACHE_PATH); it pays
+        # off most for libraries on network mounts
         _eagle_verifier = EagleFileVerifier(library_path=library_path)
         _eagle_verifier_path = library_path
 
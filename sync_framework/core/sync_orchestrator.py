@@ -16,8 +16,9 @@ from dataclasses import dataclass
 from pathlib import Path
 import logging
 
-from sync_framework.core.fingerprinting import FingerprintEngine, get_fingerprint_engine
+from sync_framework.core.fingerprinting import FileFingerprint, FingerprintEngine, get_fingerprint_engine
 from sync_framework.core.deduplication import DeduplicationEngine, DuplicateMatch
+from sync_framework.core.destination_index import DestinationIndex
 from sync_framework.core.database_router import DatabaseRouter
 from sync_framework.core.schema_validator import SchemaValidator
 from sync_framework.core.file_verification import (
@@ -26,6 +27,7 @@ from sync_framework.core.file_verification import (
     FileStatus,
     BatchVerificationReport,
 )
+from sync_framework.core.sync_pipeline import PipelineConfig, SyncPipeline
 
 try:
     from sync_config.item_types_manager import get_item_types_manager
@@ -51,11 +53,28 @@ class SyncResult:
     items_corrupt_files: int = 0
     errors: List[str] = None
     verification_report: Optional[BatchVerificationReport] = None
+    # Per-stage throughput/queue-depth metrics from a pipelined run
+    stage_metrics: Optional[Dict[str, Dict[str, Any]]] = None
 
     def __post_init__(self):
         if self.errors is None:
             self.errors = []
 
+    def record(self, item_result: Dict[str, Any]) -> None:
+        """Count one processed item's outcome."""
+        self.items_processed += 1
+
+        if item_result["action"] == "created":
+            self.items_created += 1
+        elif item_result["action"] == "updated":
+            self.items_updated += 1
+        elif item_result["action"] == "skipped":
+            self.items_skipped += 1
+        elif item_result["action"] == "failed":
+            self.items_failed += 1
+            if item_result.get("error"):
+                self.errors.append(item_result["error"])
+
     def summary(self) -> str:
         """Generate human-readable summary."""
         lines = [
@@ -73,6 +92,15 @@ class SyncResult:
                 f"    Missing: {self.items_missing_files}",
                 f"    Corrupt: {self.items_corrupt_files}",
             ])
+        if self.stage_metrics:
+            lines.append("  Pipeline stages:")
+            for name, metrics in self.stage_metrics.items():
+                lines.append(
+                    f"    {name}: {metrics['processed']} items, "
+                    f"{metrics['throughput']:.1f}/s, "
+                    f"utilization {metrics['utilization']:.0%}, "
+                    f"max queue {metrics['max_queue_depth']}"
+                )
         if self.errors:
             lines.append(f"  Errors: {len(self.errors)}")
         return "\n".join(lines)
@@ -96,6 +124,7 @@ class SyncOrchestrator:
         verify_files: bool = True,
         skip_missing_files: bool = True,
         skip_corrupt_files: bool = True,
+        pipeline_config: Optional[PipelineConfig] = None,
     ):
         """
         Initialize sync orchestrator.
@@ -107,6 +136,8 @@ class SyncOrchestrator:
             verify_files: Whether to verify file existence and integrity (default: True)
             skip_missing_files: Whether to skip items with missing files (default: True)
             skip_corrupt_files: Whether to skip items with corrupt files (default: True)
+            pipeline_config: Run sync() as concurrent stages with these settings
+                (default: serial, one item at a time)
         """
         self.item_type = item_type
         self.source_adapter = source_adapter
@@ -116,6 +147,7 @@ class SyncOrchestrator:
         self.verify_files = verify_files
         self.skip_missing_files = skip_missing_files
         self.skip_corrupt_files = skip_corrupt_files
+        self.pipeline_config = pipeline_config
 
         # Get item-type configuration
         self.item_type_config = {}
@@ -140,11 +172,15 @@ class SyncOrchestrator:
         self.database_router = DatabaseRouter()
         self.schema_validator = SchemaValidator()
         self.file_verifier = FileVerifier(check_headers=True, min_size_check=True)
+
+        # Existing destination items, loaded once per sync() run
+        self._destination_index: Optional[DestinationIndex] = None
     
     def sync(
         self,
         items: Optional[List[Dict[str, Any]]] = None,
-        source_path: Optional[Path] = None
+        source_path: Optional[Path] = None,
+        pipelined: Optional[bool] = None
     ) -> SyncResult:
         """
         Execute full sync workflow with file verification.
@@ -154,6 +190,8 @@ class SyncOrchestrator:
         Args:
             items: Optional pre-discovered items (if None, will discover from source)
             source_path: Optional source path for discovery
+            pipelined: Run the steps as concurrent stages (see sync_pipeline);
+                defaults to True when a pipeline_config was given
 
         Returns:
             SyncResult with operation statistics including file verification results
@@ -183,6 +221,15 @@ class SyncOrchestrator:
             original_count = len(items)
             logger.info(f"Discovered {original_count} items")
 
+            if pipelined is None:
+                pipelined = self.pipeline_config is not None
+            if pipelined:
+                self._destination_index = self._load_destination_index()
+                SyncPipeline(self, self.pipeline_config).run(items, result)
+                result.success = result.items_failed == 0 and not result.errors
+                logger.info(result.summary())
+                return result
+
             # Step 2: FILE VERIFICATION (NEW MANDATORY STEP)
             if self.verify_files:
                 logger.info("Verifying file existence and integrity...")
@@ -210,22 +257,13 @@ class SyncOrchestrator:
 
             logger.info(f"Processing {len(items)} verified items")
 
+            # Load the destination once; _process_item keeps it current
+            self._destination_index = self._load_destination_index()
+
             # Step 3: Process each verified item
             for item in items:
                 try:
-                    item_result = self._process_item(item, source_path)
-                    result.items_processed += 1
-
-                    if item_result["action"] == "created":
-                        result.items_created += 1
-                    elif item_result["action"] == "updated":
-                        result.items_updated += 1
-                    elif item_result["action"] == "skipped":
-                        result.items_skipped += 1
-                    elif item_result["action"] == "failed":
-                        result.items_failed += 1
-                        if item_result.get("error"):
-                            result.errors.append(item_result["error"])
+                    result.record(self._process_item(item, source_path))
 
                 except Exception as e:
                     logger.error(f"Failed to process item: {e}")
@@ -273,25 +311,32 @@ class SyncOrchestrator:
                 verified_items.append(item)
                 continue
 
-            # Add verification status to item
-            item["_file_verified"] = True
-            item["_file_status"] = result.status.value
-            item["_file_valid"] = result.is_valid
-
-            # Check if we should skip this item
-            if result.status == FileStatus.MISSING and self.skip_missing_files:
-                logger.debug(f"Skipping item {item_id}: missing file")
-                continue
-            if result.status == FileStatus.CORRUPT and self.skip_corrupt_files:
-                logger.debug(f"Skipping item {item_id}: corrupt file")
-                continue
-            if result.status == FileStatus.EMPTY and self.skip_corrupt_files:
-                logger.debug(f"Skipping item {item_id}: empty file")
-                continue
-
-            verified_items.append(item)
+            if self._apply_verification(item, result):
+                verified_items.append(item)
 
         return verified_items, report
+
+    def _apply_verification(self, item: Dict[str, Any], result: FileVerificationResult) -> bool:
+        """Record the verification status on the item. Returns False to skip it."""
+        item_id = item.get("id", "unknown")
+
+        # Add verification status to item
+        item["_file_verified"] = True
+        item["_file_status"] = result.status.value
+        item["_file_valid"] = result.is_valid
+
+        # Check if we should skip this item
+        if result.status == FileStatus.MISSING and self.skip_missing_files:
+            logger.debug(f"Skipping item {item_id}: missing file")
+            return False
+        if result.status == FileStatus.CORRUPT and self.skip_corrupt_files:
+            logger.debug(f"Skipping item {item_id}: corrupt file")
+            return False
+        if result.status == FileStatus.EMPTY and self.skip_corrupt_files:
+            logger.debug(f"Skipping item {item_id}: empty file")
+            return False
+
+        return True
     
     def _discover_items(self, source_path: Optional[Path]) -> List[Dict[str, Any]]:
         """Discover items from source adapter."""
@@ -311,37 +356,62 @@ class SyncOrchestrator:
             logger.error(f"Discovery failed: {e}")
             return []
     
-    def _process_item(
+    def _load_destination_index(self) -> DestinationIndex:
+        """Fetch existing destination items once and index them for dedup."""
+        existing_items = []
+        if hasattr(self.destination_adapter, "get_existing_items"):
+            try:
+                existing_items = self.destination_adapter.get_existing_items(self.item_type)
+            except Exception as e:
+                logger.debug(f"Failed to get existing items: {e}")
+        logger.info(f"Indexed {len(existing_items)} existing destination items")
+        return self.deduplication_engine.build_index(existing_items)
+
+    def _index_created_item(
         self,
         item: Dict[str, Any],
-        source_path: Optional[Path]
-    ) -> Dict[str, Any]:
-        """Process a single item through the sync pipeline."""
-        # Step 1: Fingerprinting
+        item_id: Optional[str]
+    ) -> None:
+        """Add a just-created item so later items in the run dedupe against it."""
+        if self._destination_index is None:
+            return
+        indexed = dict(item)
+        if item_id:
+            indexed.update({"id": item_id, "page_id": item_id})
+        indexed["source"] = "destination"
+        self._destination_index.add(indexed)
+
+    def _fingerprint_item(self, item: Dict[str, Any]) -> Optional[str]:
+        """Fingerprint the item's file, if it has one. Returns the file path."""
         file_path = item.get("file_path") or item.get("path")
-        fingerprint = None
         if file_path:
             try:
                 fingerprint = self.fingerprint_engine.compute_fingerprint(
                     Path(file_path), self.item_type
                 )
-                item["fingerprint"] = fingerprint.hash
-                item["fingerprint_hash"] = fingerprint.hash
+                self._apply_fingerprint(item, fingerprint)
             except Exception as e:
                 logger.debug(f"Fingerprinting failed for {file_path}: {e}")
-        
-        # Step 2: Deduplication
-        existing_items = []
-        if hasattr(self.destination_adapter, "get_existing_items"):
-            try:
-                existing_items = self.destination_adapter.get_existing_items(self.item_type)
-            except Exception as e:
-                logger.debug(f"Failed to get existing items: {e}")
-        
+        return file_path
+
+    @staticmethod
+    def _apply_fingerprint(item: Dict[str, Any], fingerprint: FileFingerprint) -> None:
+        item["fingerprint"] = fingerprint.hash
+        item["fingerprint_hash"] = fingerprint.hash
+
+    def _check_duplicate(
+        self,
+        item: Dict[str, Any],
+        file_path: Optional[str]
+    ) -> Optional[Dict[str, Any]]:
+        """Dedup against the destination index. Returns a skip outcome or None."""
+        if self._destination_index is None:
+            self._destination_index = self._load_destination_index()
+
         is_duplicate, duplicate_match = self.deduplication_engine.is_duplicate(
-            item, existing_items, Path(file_path) if file_path else None
+            item, self._destination_index, Path(file_path) if file_path else None
         )
-        
+
         if is_duplicate and duplicate_match:
             logger.info(
                 f"Item is duplicate of {duplicate_match.source}:{duplicate_match.item_id} "
@@ -349,11 +419,23 @@ class SyncOrchestrator:
             )
             # Option: merge tags/metadata
             if duplicate_match.similarity_score < 0.98:  # Not exact match
-                return {"action": "skipped", "reason": "duplicate"}
+                reason = "duplicate"
             else:
-                return {"action": "skipped", "reason": "exact_duplicate"}
-        
-        # Step 3: Validation
+                reason = "exact_duplicate"
+            return {"action": "skipped", "reason": reason, "duplicate_of": duplicate_match.item_id}
+        return None
+
+    def _prepare_item(
+        self,
+        item: Dict[str, Any],
+        file_path: Optional[str]
+    ) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """
+        Validate the item (filling defaults) and route it.
+
+        Returns:
+            Tuple of (target database ID, failure outcome if routing failed)
+        """
         is_valid, errors = self.schema_validator.validate_item(item, self.item_type)
         if not is_valid:
             logger.warning(f"Item validation failed: {errors}")
@@ -362,35 +444,60 @@ class SyncOrchestrator:
             for key, value in defaults.items():
                 if key not in item or not item[key]:
                     item[key] = value
-        
-        # Step 4: Database routing
+
         database_ids = self.database_router.route_item(
             item, self.item_type, file_path
         )
-        
+
         if not database_ids:
             logger.warning(f"No database found for item type '{self.item_type}'")
-            return {"action": "failed", "error": "No target database"}
-        
-        primary_db_id = database_ids[0]
-        
-        # Step 5: Sync to destination
+            return None, {"action": "failed", "error": "No target database"}
+
+        return database_ids[0], None
+
+    def _write_item(self, item: Dict[str, Any], database_id: str) -> Dict[str, Any]:
+        """Create or update the item in the destination."""
         try:
             if hasattr(self.destination_adapter, "create_or_update_item"):
                 result = self.destination_adapter.create_or_update_item(
-                    item, primary_db_id, self.item_type
+                    item, database_id, self.item_type
                 )
                 if result.get("created"):
                     return {"action": "created", "item_id": result.get("item_id")}
                 else:
                     return {"action": "updated", "item_id": result.get("item_id")}
             elif hasattr(self.destination_adapter, "sync_item"):
-                self.destination_adapter.sync_item(item, primary_db_id)
+                self.destination_adapter.sync_item(item, database_id)
                 return {"action": "updated"}
             else:
                 logger.warning("Destination adapter does not support sync operations")
                 return {"action": "failed", "error": "Adapter not supported"}
-        
+
         except Exception as e:
             logger.error(f"Sync failed: {e}")
             return {"action": "failed", "error": str(e)}
+
+    def _process_item(
+        self,
+        item: Dict[str, Any],
+        source_path: Optional[Path]
+    ) -> Dict[str, Any]:
+        """Process a single item through the sync pipeline."""
+        # Step 1: Fingerprinting
+        file_path = self._fingerprint_item(item)
+
+        # Step 2: Deduplication (against the index loaded once per run)
+        duplicate = self._check_duplicate(item, file_path)
+        if duplicate:
+            return duplicate
+
+        # Steps 3-4: Validation and database routing
+        database_id, failure = self._prepare_item(item, file_path)
+        if failure:
+            return failure
+
+        # Step 5: Sync to destination
+        outcome = self._write_item(item, database_id)
+        if outcome["action"] == "created":
+            self._index_created_item(item, outcome.get("item_id"))
+        return outcome
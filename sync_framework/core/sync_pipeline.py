@@ -0,0 +1,454 @@
+#!/usr/bin/env python3
+"""
+Sync Pipeline
+=============
+
+Staged, concurrent execution of ``SyncOrchestrator.sync``:
+
+    feed → verify → fingerprint → dedup/validate/route → write
+
+Stages are connected by bounded queues, so a slow stage holds back the ones
+before it instead of buffering the whole run. Each stage has its own workers:
+
+- verify: threads (stat and header reads are I/O bound)
+- fingerprint: a process pool (hashing and media decoding are CPU bound)
+- dedup: one thread that takes items in source order, so the destination
+  index and "first item wins" duplicate handling match a serial run
+- write: an asyncio loop with a bounded number of writes in flight. Adapters
+  with an ``acreate_or_update_item`` coroutine are awaited directly; blocking
+  adapters run on the loop's thread pool.
+
+Outcomes are counted into the ``SyncResult`` as they complete, and each stage
+records throughput and queue depth (``SyncResult.stage_metrics``). Throughput
+is set by the slowest stage rather than the sum of all stages.
+
+Usage:
+    orchestrator = SyncOrchestrator(item_type, source, destination,
+                                    pipeline_config=PipelineConfig(write_concurrency=8))
+    result = orchestrator.sync(items)
+    print(result.stage_metrics["write"]["throughput"])
+"""
+
+import asyncio
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional
+import logging
+
+from sync_framework.core.file_verification import BatchVerificationReport
+from sync_framework.core.fingerprinting import FileFingerprint, get_fingerprint_engine
+
+if TYPE_CHECKING:
+    from sync_framework.core.sync_orchestrator import SyncOrchestrator, SyncResult
+
+logger = logging.getLogger(__name__)
+
+# End-of-stream marker passed between stages
+_DONE = object()
+
+
+@dataclass
+class PipelineConfig:
+    """Worker counts and queue bounds for a pipelined sync."""
+    queue_size: int = 64
+    verify_workers: int = 8
+    fingerprint_workers: int = field(default_factory=lambda: os.cpu_count() or 2)
+    # False fingerprints on threads with the orchestrator's own engine
+    fingerprint_processes: bool = True
+    write_concurrency: int = 4
+
+
+@dataclass
+class StageMetrics:
+    """Throughput and queue-depth counters for one pipeline stage."""
+    name: str
+    workers: int
+    processed: int = 0
+    busy_seconds: float = 0.0
+    elapsed_seconds: float = 0.0
+    max_queue_depth: int = 0
+    queue_depth_total: int = 0
+    queue_depth_samples: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def sample_queue(self, depth: int) -> None:
+        """Record the input queue depth seen when taking an item."""
+        with self._lock:
+            self.max_queue_depth = max(self.max_queue_depth, depth)
+            self.queue_depth_total += depth
+            self.queue_depth_samples += 1
+
+    def record(self, seconds: float) -> None:
+        """Record one item handled in ``seconds``."""
+        with self._lock:
+            self.processed += 1
+            self.busy_seconds += seconds
+
+    @property
+    def throughput(self) -> float:
+        """Items handled per second of the stage's run time."""
+        return self.processed / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    @property
+    def avg_queue_depth(self) -> float:
+        return self.queue_depth_total / self.queue_depth_samples if self.queue_depth_samples else 0.0
+
+    @property
+    def utilization(self) -> float:
+        """Fraction of worker time spent busy; the bottleneck stage is near 1."""
+        capacity = self.elapsed_seconds * self.workers
+        return self.busy_seconds / capacity if capacity else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "processed": self.processed,
+            "busy_seconds": round(self.busy_seconds, 3),
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "throughput": round(self.throughput, 2),
+            "utilization": round(self.utilization, 3),
+            "max_queue_depth": self.max_queue_depth,
+            "avg_queue_depth": round(self.avg_queue_depth, 2),
+        }
+
+
+@dataclass
+class _Job:
+    """One item moving through the stages."""
+    seq: int
+    item: Dict[str, Any]
+    file_path: Optional[str] = None
+    database_id: Optional[str] = None
+    indexed: Optional[Dict[str, Any]] = None
+    index_position: Optional[int] = None
+    # Set once the job has an outcome (or was dropped by verification)
+    done: bool = False
+
+
+def _compute_fingerprint(file_path: str, item_type: str) -> FileFingerprint:
+    """Process-pool entry point: fingerprint one file."""
+    return get_fingerprint_engine().compute_fingerprint(Path(file_path), item_type)
+
+
+class SyncPipeline:
+    """
+    Runs one sync through concurrent stages joined by bounded queues.
+
+    The orchestrator's destination index must already be loaded.
+    """
+
+    def __init__(self, orchestrator: "SyncOrchestrator", config: Optional[PipelineConfig] = None):
+        """
+        Initialize the pipeline.
+
+        Args:
+            orchestrator: Orchestrator whose stage methods and adapters to use
+            config: Worker counts and queue bounds (default: PipelineConfig())
+        """
+        self.orchestrator = orchestrator
+        self.config = config or PipelineConfig()
+        self.metrics: Dict[str, StageMetrics] = {}
+        self.report: Optional[BatchVerificationReport] = None
+        self._results: "queue.Queue[Any]" = queue.Queue()
+        self._report_lock = threading.Lock()
+        self._index_lock = threading.Lock()
+        # Reservation id -> set once that item's write has resolved
+        self._pending: Dict[str, threading.Event] = {}
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._errors: List[str] = []
+        self._started = 0.0
+
+    def run(
+        self,
+        items: Iterable[Dict[str, Any]],
+        result: "SyncResult",
+        on_result: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> "SyncResult":
+        """
+        Push ``items`` through the stages, counting outcomes into ``result``.
+
+        Args:
+            items: Items to sync (any iterable; consumed lazily)
+            result: SyncResult to update as outcomes arrive
+            on_result: Optional callback for each item outcome
+
+        Returns:
+            ``result``
+        """
+        cfg = self.config
+        orch = self.orchestrator
+        queue_size = max(1, cfg.queue_size)
+        fingerprint_threads = max(1, cfg.fingerprint_workers)
+        write_concurrency = max(1, cfg.write_concurrency)
+
+        self.metrics = {
+            "verify": StageMetrics("verify", max(1, cfg.verify_workers)),
+            "fingerprint": StageMetrics("fingerprint", fingerprint_threads),
+            "dedup": StageMetrics("dedup", 1),
+            "write": StageMetrics("write", write_concurrency),
+        }
+        self.report = BatchVerificationReport() if orch.verify_files else None
+        if cfg.fingerprint_processes and cfg.fingerprint_workers > 0:
+            # Workers start lazily from stage threads, where forking is unsafe
+            self._pool = ProcessPoolExecutor(
+                max_workers=cfg.fingerprint_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+
+        to_verify: "queue.Queue[Any]" = queue.Queue(queue_size)
+        to_fingerprint: "queue.Queue[Any]" = queue.Queue(queue_size)
+        to_dedup: "queue.Queue[Any]" = queue.Queue(queue_size)
+        to_write: "queue.Queue[Any]" = queue.Queue(queue_size)
+
+        self._started = time.perf_counter()
+        threads = [threading.Thread(target=self._feed, args=(items, to_verify),
+                                    name="sync-feed", daemon=True)]
+        threads += self._stage_threads("verify", self._verify, to_verify, to_fingerprint)
+        threads += self._stage_threads("fingerprint", self._fingerprint, to_fingerprint, to_dedup)
+        threads.append(threading.Thread(target=self._run_dedup, args=(to_dedup, to_write),
+                                        name="sync-dedup", daemon=True))
+        threads.append(threading.Thread(target=self._run_writes, args=(to_write,),
+                                        name="sync-write", daemon=True))
+
+        try:
+            for thread in threads:
+                thread.start()
+            while True:
+                outcome = self._results.get()
+                if outcome is _DONE:
+                    break
+                result.record(outcome)
+                if on_result:
+                    on_result(outcome)
+        finally:
+            if self._pool is not None:
+                self._pool.shutdown(wait=True, cancel_futures=True)
+                self._pool = None
+
+        if self.report is not None:
+            result.verification_report = self.report
+            result.items_verified = self.report.total_items
+            result.items_missing_files = self.report.missing_count
+            result.items_corrupt_files = self.report.corrupt_count
+        result.errors.extend(self._errors)
+        result.stage_metrics = {name: m.to_dict() for name, m in self.metrics.items()}
+        return result
+
+    # ------------------------------------------------------------------
+    # Plumbing
+    # ------------------------------------------------------------------
+
+    def _finish(self, job: _Job, outcome: Dict[str, Any]) -> None:
+        job.done = True
+        self._results.put(outcome)
+
+    def _handle(self, stage: str, handler: Callable[[_Job], None], job: _Job) -> None:
+        """Run a stage handler on a job; an exception fails just that item."""
+        start = time.perf_counter()
+        try:
+            handler(job)
+        except Exception as e:
+            logger.error(f"Sync {stage} stage failed: {e}")
+            self._finish(job, {"action": "failed", "error": str(e)})
+        finally:
+            self.metrics[stage].record(time.perf_counter() - start)
+
+    def _stage_done(self, stage: str) -> None:
+        self.metrics[stage].elapsed_seconds = time.perf_counter() - self._started
+
+    def _feed(self, items: Iterable[Dict[str, Any]], outbox: "queue.Queue[Any]") -> None:
+        try:
+            for seq, item in enumerate(items):
+                outbox.put(_Job(seq, item))
+        except Exception as e:
+            logger.error(f"Item discovery failed: {e}")
+            self._errors.append(str(e))
+        finally:
+            outbox.put(_DONE)
+
+    def _stage_threads(
+        self,
+        stage: str,
+        handler: Callable[[_Job], None],
+        inbox: "queue.Queue[Any]",
+        outbox: "queue.Queue[Any]"
+    ) -> List[threading.Thread]:
+        """Worker threads for a stage; the last one to finish closes ``outbox``."""
+        metrics = self.metrics[stage]
+        remaining = [metrics.workers]
+        lock = threading.Lock()
+
+        def work() -> None:
+            while True:
+                job = inbox.get()
+                metrics.sample_queue(inbox.qsize())
+                if job is _DONE:
+                    inbox.put(_DONE)  # wake the other workers
+                    break
+                if not job.done:
+                    self._handle(stage, handler, job)
+                outbox.put(job)
+            with lock:
+                remaining[0] -= 1
+                last = remaining[0] == 0
+            if last:
+                self._stage_done(stage)
+                outbox.put(_DONE)
+
+        return [
+            threading.Thread(target=work, name=f"sync-{stage}-{i}", daemon=True)
+            for i in range(metrics.workers)
+        ]
+
+    # ------------------------------------------------------------------
+    # Stages
+    # ------------------------------------------------------------------
+
+    def _verify(self, job: _Job) -> None:
+        orch = self.orchestrator
+        if self.report is None:
+            return
+        file_path = job.item.get("file_path") or job.item.get("path")
+        verification = orch.file_verifier.verify_file(Path(file_path) if file_path else None)
+        with self._report_lock:
+            self.report.total_items += 1
+            self.report.record(job.item.get("id", "unknown"), job.item, verification)
+        if not orch._apply_verification(job.item, verification):
+            # Filtered, not processed: passed on only to keep dedup's ordering
+            job.done = True
+
+    def _fingerprint(self, job: _Job) -> None:
+        orch = self.orchestrator
+        if self._pool is None:
+            job.file_path = orch._fingerprint_item(job.item)
+            return
+        job.file_path = job.item.get("file_path") or job.item.get("path")
+        if not job.file_path:
+            return
+        try:
+            fingerprint = self._pool.submit(
+                _compute_fingerprint, str(job.file_path), orch.item_type
+            ).result()
+            orch._apply_fingerprint(job.item, fingerprint)
+        except Exception as e:
+            logger.debug(f"Fingerprinting failed for {job.file_path}: {e}")
+
+    def _run_dedup(self, inbox: "queue.Queue[Any]", outbox: "queue.Queue[Any]") -> None:
+        """Dedup/validate/route in source order, reordering what earlier stages shuffled."""
+        metrics = self.metrics["dedup"]
+        pending: Dict[int, _Job] = {}
+        next_seq = 0
+        while True:
+            job = inbox.get()
+            metrics.sample_queue(inbox.qsize())
+            if job is _DONE:
+                break
+            pending[job.seq] = job
+            while next_seq in pending:
+                ready = pending.pop(next_seq)
+                next_seq += 1
+                if not ready.done:
+                    self._handle("dedup", self._dedup, ready)
+                if not ready.done:
+                    outbox.put(ready)
+        self._stage_done("dedup")
+        outbox.put(_DONE)
+
+    def _dedup(self, job: _Job) -> None:
+        orch = self.orchestrator
+        while True:
+            with self._index_lock:
+                duplicate = orch._check_duplicate(job.item, job.file_path)
+                pending = duplicate and self._pending.get(duplicate.get("duplicate_of"))
+            if not pending:
+                break
+            # Matched an item whose write is still in flight; if that write
+            # fails this copy must not be skipped, so wait and check again
+            pending.wait()
+        if duplicate:
+            self._finish(job, duplicate)
+            return
+
+        database_id, failure = orch._prepare_item(job.item, job.file_path)
+        if failure:
+            self._finish(job, failure)
+            return
+        job.database_id = database_id
+
+        # Index the item before its write lands, so a later copy in the same
+        # run is caught even while this write is still in flight
+        reservation = f"pending:{job.seq}"
+        job.indexed = dict(job.item)
+        job.indexed.update({"id": reservation, "source": "pending"})
+        with self._index_lock:
+            job.index_position = orch._destination_index.add(job.indexed)
+            self._pending[reservation] = threading.Event()
+
+    def _run_writes(self, inbox: "queue.Queue[Any]") -> None:
+        try:
+            asyncio.run(self._write_loop(inbox))
+        except Exception as e:
+            logger.error(f"Sync write stage failed: {e}")
+            self._errors.append(str(e))
+        finally:
+            self._stage_done("write")
+            self._results.put(_DONE)
+
+    async def _write_loop(self, inbox: "queue.Queue[Any]") -> None:
+        loop = asyncio.get_running_loop()
+        metrics = self.metrics["write"]
+        slots = asyncio.Semaphore(metrics.workers)
+        tasks = set()
+        with ThreadPoolExecutor(max_workers=metrics.workers + 1, thread_name_prefix="sync-write") as executor:
+            while True:
+                job = await loop.run_in_executor(executor, inbox.get)
+                metrics.sample_queue(inbox.qsize())
+                if job is _DONE:
+                    break
+                await slots.acquire()
+                task = loop.create_task(self._write(job, executor, slots))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks)
+
+    async def _write(self, job: _Job, executor: ThreadPoolExecutor, slots: asyncio.Semaphore) -> None:
+        orch = self.orchestrator
+        start = time.perf_counter()
+        try:
+            write_async = getattr(orch.destination_adapter, "acreate_or_update_item", None)
+            if write_async is not None:
+                try:
+                    response = await write_async(job.item, job.database_id, orch.item_type)
+                    action = "created" if response.get("created") else "updated"
+                    outcome = {"action": action, "item_id": response.get("item_id")}
+                except Exception as e:
+                    logger.error(f"Sync failed: {e}")
+                    outcome = {"action": "failed", "error": str(e)}
+            else:
+                outcome = await asyncio.get_running_loop().run_in_executor(
+                    executor, orch._write_item, job.item, job.database_id
+                )
+        finally:
+            slots.release()
+            self.metrics["write"].record(time.perf_counter() - start)
+
+        with self._index_lock:
+            if outcome["action"] == "created":
+                item_id = outcome.get("item_id")
+                if item_id:
+                    job.indexed.update({"id": item_id, "page_id": item_id})
+                else:
+                    job.indexed["id"] = job.item.get("id")
+                job.indexed["source"] = "destination"
+            else:
+                # Only created items stay indexed, as in a serial run
+                orch._destination_index.discard(job.index_position)
+            self._pending.pop(f"pending:{job.seq}").set()
+        self._finish(job, outcome)